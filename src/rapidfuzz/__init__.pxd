@@ -17,6 +17,9 @@ cdef extern from "rapidfuzz.h":
     uint32_t RF_SCORER_FLAG_SYMMETRIC
     uint32_t RF_SCORER_FLAG_TRIANGLE_INEQUALITY
     uint32_t RF_SCORER_NONE_IS_WORST_SCORE
+    uint32_t RF_SCORER_FLAG_LENGTH_DIFF_BOUND
+    uint32_t RF_SCORER_FLAG_LENGTH_RATIO_BOUND
+    uint32_t RF_SCORER_FLAG_LENGTH_SUM_RATIO_BOUND
 
     ctypedef struct RF_String:
         void (*dtor) (RF_String*) nogil
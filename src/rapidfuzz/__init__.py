@@ -8,9 +8,9 @@ __author__: str = "Max Bachmann"
 __license__: str = "MIT"
 __version__: str = "3.12.1"
 
-from rapidfuzz import distance, fuzz, process, utils
+from rapidfuzz import distance, fuzz, index, process, utils
 
-__all__ = ["distance", "fuzz", "process", "utils", "get_include"]
+__all__ = ["distance", "fuzz", "index", "process", "utils", "get_include"]
 
 
 def get_include():
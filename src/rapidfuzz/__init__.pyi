@@ -7,6 +7,7 @@ __version__: str
 from rapidfuzz import (
     distance as distance,
     fuzz as fuzz,
+    index as index,
     process as process,
     utils as utils,
 )
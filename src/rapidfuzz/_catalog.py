@@ -0,0 +1,259 @@
+# SPDX-License-Identifier: MIT
+# Copyright (C) 2025 Max Bachmann
+"""
+File format used by `process.PreparedChoices.save` and `process.PreparedChoices.load`.
+
+The file starts with a header followed by the tables of the choices, the keys (when the
+choices are a mapping) and the preprocessed choices. A table of strings stores the type of
+every string and the offsets and sizes of their buffers, followed by the buffers themselves.
+Strings are stored with the same character width Python uses for them, so the buffers can be
+used as ``RF_String`` without copying them. Tables of other objects are pickled and are only
+loaded when this is allowed explicitly, since unpickling a file can execute arbitrary code.
+
+All sections are 8 byte aligned and the arrays are stored in native byte order, so the
+file is memory mapped and read in place.
+"""
+
+from __future__ import annotations
+
+import mmap
+import pickle
+import struct
+import sys
+from array import array
+from typing import Any
+
+from rapidfuzz._utils import is_none
+
+MAGIC = b"RFCHOICE"
+VERSION = 1
+
+# magic, version, byte order, flags, count
+_HEADER = struct.Struct("<8sIBB2xQ")
+_FLAG_KEYS = 1
+# the choices are not preprocessed, so they are stored only once
+_FLAG_SHARED = 2
+# format, count, payload size
+_TABLE = struct.Struct("<B7xQQ")
+
+_TABLE_STRINGS = 0
+_TABLE_PICKLE = 1
+
+# types of the strings in a table. The types of str are the size of their characters
+STRING_NONE = 0
+STRING_UCS1 = 1
+STRING_UCS2 = 2
+STRING_UCS4 = 4
+STRING_BYTES = 5
+
+# size of the characters of every type
+_CHAR_SIZES = {STRING_NONE: 1, STRING_UCS1: 1, STRING_UCS2: 2, STRING_UCS4: 4, STRING_BYTES: 1}
+
+_BYTEORDER = 0 if sys.byteorder == "little" else 1
+_UTF16 = "utf-16-le" if sys.byteorder == "little" else "utf-16-be"
+_UTF32 = "utf-32-le" if sys.byteorder == "little" else "utf-32-be"
+
+
+def _padding(size: int) -> int:
+    return -size % 8
+
+
+_PADDING = [bytes(_padding(i)) for i in range(8)]
+
+
+def _encode_strings(values: list[Any]) -> tuple[array, array, array, list[bytes]] | None:
+    """
+    types, offsets, sizes and buffers of the strings or None when not all values are strings
+    """
+    types = array("B")
+    starts = array("Q")
+    sizes = array("Q")
+    buffers = []
+    data_size = 0
+    for value in values:
+        if isinstance(value, str):
+            max_char = ord(max(value)) if value else 0
+            if max_char < 0x100:
+                kind, buffer = STRING_UCS1, value.encode("latin-1")
+            elif max_char < 0x10000:
+                kind, buffer = STRING_UCS2, value.encode(_UTF16, "surrogatepass")
+            else:
+                kind, buffer = STRING_UCS4, value.encode(_UTF32, "surrogatepass")
+        elif isinstance(value, bytes):
+            kind, buffer = STRING_BYTES, value
+        elif is_none(value):
+            kind, buffer = STRING_NONE, b""
+        else:
+            return None
+
+        types.append(kind)
+        starts.append(data_size)
+        sizes.append(len(buffer))
+        buffers.append(buffer)
+        buffers.append(_PADDING[len(buffer) % 8])
+        data_size += len(buffer) + _padding(len(buffer))
+
+    # 8 bytes more, so empty strings at the end still point into the mapping
+    buffers.append(bytes(8))
+    return types, starts, sizes, buffers
+
+
+def _write_table(f: Any, values: Any, allow_pickle: bool) -> None:
+    values = list(values)
+    strings = _encode_strings(values)
+    if strings is None:
+        if not allow_pickle:
+            msg = "only preprocessed choices of type str or bytes can be saved"
+            raise TypeError(msg)
+
+        payload = pickle.dumps(values, protocol=pickle.HIGHEST_PROTOCOL)
+        f.write(_TABLE.pack(_TABLE_PICKLE, len(values), len(payload) + _padding(len(payload))))
+        f.write(payload)
+        f.write(_PADDING[len(payload) % 8])
+        return
+
+    types, starts, sizes, buffers = strings
+    types_size = len(types) + _padding(len(types))
+    data_size = sum(map(len, buffers))
+
+    f.write(_TABLE.pack(_TABLE_STRINGS, len(values), types_size + 16 * len(values) + data_size))
+    f.write(types.tobytes())
+    f.write(_PADDING[len(types) % 8])
+    f.write(starts.tobytes())
+    f.write(sizes.tobytes())
+    f.writelines(buffers)
+
+
+def save(path: Any, choices: Any, keys: Any, processed: Any) -> None:
+    """
+    write the choices, their keys or None and the preprocessed choices to path
+    """
+    flags = 0
+    if keys is not None:
+        flags |= _FLAG_KEYS
+    if processed is choices:
+        flags |= _FLAG_SHARED
+
+    with open(path, "wb") as f:
+        f.write(_HEADER.pack(MAGIC, VERSION, _BYTEORDER, flags, len(choices)))
+        _write_table(f, choices, allow_pickle=not flags & _FLAG_SHARED)
+        if keys is not None:
+            _write_table(f, keys, allow_pickle=True)
+        if not flags & _FLAG_SHARED:
+            _write_table(f, processed, allow_pickle=False)
+
+
+class StringTable:
+    """
+    read only sequence of the strings in a table of a memory mapped file.
+    The strings are only decoded and checked when they are accessed, so loading
+    a file does not have to iterate over all strings.
+    """
+
+    def __init__(self, buffer: memoryview, count: int):
+        types_size = count + _padding(count)
+        if types_size + 16 * count > len(buffer):
+            msg = "the file is corrupted"
+            raise ValueError(msg)
+
+        self.types = buffer[:count]
+        self.starts = buffer[types_size : types_size + 8 * count].cast("Q")
+        self.sizes = buffer[types_size + 8 * count : types_size + 16 * count].cast("Q")
+        self.data = buffer[types_size + 16 * count :]
+
+    def __len__(self) -> int:
+        return len(self.types)
+
+    def __getitem__(self, index: Any) -> Any:
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+
+        kind = self.types[index]
+        if kind == STRING_NONE:
+            return None
+
+        start = self.starts[index]
+        size = self.sizes[index]
+        char_size = _CHAR_SIZES.get(kind)
+        if char_size is None or start + size > len(self.data) or start % char_size or size % char_size:
+            msg = "the file is corrupted"
+            raise ValueError(msg)
+
+        buffer = self.data[start : start + size]
+        if kind == STRING_BYTES:
+            return bytes(buffer)
+        if kind == STRING_UCS1:
+            return str(buffer, "latin-1")
+        if kind == STRING_UCS2:
+            return str(buffer, _UTF16, "surrogatepass")
+        return str(buffer, _UTF32, "surrogatepass")
+
+    def __iter__(self) -> Any:
+        for i in range(len(self)):
+            yield self[i]
+
+
+def _read_table(buffer: memoryview, pos: int, allow_pickle: bool) -> tuple[Any, int]:
+    if pos + _TABLE.size > len(buffer):
+        msg = "the file is truncated"
+        raise ValueError(msg)
+
+    table_format, count, size = _TABLE.unpack_from(buffer, pos)
+    pos += _TABLE.size
+    if pos + size > len(buffer):
+        msg = "the file is truncated"
+        raise ValueError(msg)
+
+    payload = buffer[pos : pos + size]
+    if table_format == _TABLE_PICKLE:
+        if not allow_pickle:
+            msg = "the file contains pickled objects, which are only loaded with allow_pickle=True"
+            raise ValueError(msg)
+        return pickle.loads(payload), pos + size
+    if table_format != _TABLE_STRINGS:
+        msg = "the file is corrupted"
+        raise ValueError(msg)
+
+    return StringTable(payload, count), pos + size
+
+
+def load(path: Any, allow_pickle: bool = False) -> tuple[Any, Any, StringTable]:
+    """
+    memory map the file at path and return the choices, their keys or None and the
+    preprocessed choices. Tables of pickled objects are only loaded when allow_pickle is True.
+    The strings are only checked when they are accessed, so callers creating views on the
+    buffers of a `StringTable` have to check their offsets and sizes themselves
+    """
+    with open(path, "rb") as f:
+        mapping = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+    buffer = memoryview(mapping)
+    if len(buffer) < _HEADER.size:
+        msg = f"{path} is not a file saved by PreparedChoices.save"
+        raise ValueError(msg)
+
+    magic, version, byteorder, flags, count = _HEADER.unpack_from(buffer)
+    if magic != MAGIC:
+        msg = f"{path} is not a file saved by PreparedChoices.save"
+        raise ValueError(msg)
+    if version != VERSION:
+        msg = f"{path} uses the unsupported format version {version}"
+        raise ValueError(msg)
+    if byteorder != _BYTEORDER:
+        msg = f"{path} was saved on a system with a different byte order"
+        raise ValueError(msg)
+
+    choices, pos = _read_table(buffer, _HEADER.size, allow_pickle)
+    keys = None
+    if flags & _FLAG_KEYS:
+        keys, pos = _read_table(buffer, pos, allow_pickle)
+    processed = choices
+    if not flags & _FLAG_SHARED:
+        processed, pos = _read_table(buffer, pos, allow_pickle=False)
+
+    # every table has an element for every choice
+    lengths = {len(choices), len(processed), count if keys is None else len(keys)}
+    if lengths != {count} or not isinstance(processed, StringTable):
+        msg = f"{path} is not a file saved by PreparedChoices.save"
+        raise ValueError(msg)
+    return choices, keys, processed
@@ -0,0 +1,236 @@
+# SPDX-License-Identifier: MIT
+# Copyright (C) 2025 Max Bachmann
+"""
+Result cache shared by the C++ and the pure Python implementation of `process.PreparedChoices`.
+
+Entries are stored together with the version of the choices they were calculated for. Every
+modification of `process.MutablePreparedChoices` increases its version, so the whole cache is
+dropped on the next lookup and results calculated for an older version are never stored.
+"""
+
+from __future__ import annotations
+
+import sys
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable
+
+
+def _sizeof(obj: Any) -> int:
+    """
+    approximate size of a result. The elements of lists and tuples are included,
+    since the results of extract are lists of tuples
+    """
+    size = sys.getsizeof(obj)
+    if isinstance(obj, (list, tuple)):
+        size += sum(_sizeof(x) for x in obj)
+    return size
+
+
+def _copy(result: Any) -> Any:
+    # results of extract are lists, which could be modified by the caller
+    return list(result) if isinstance(result, list) else result
+
+
+class ResultCache:
+    """
+    Thread-safe cache for the results of `extract` and `extractOne` on `PreparedChoices`.
+    It is attached to the choices using the ``result_cache`` argument or attribute of
+    `PreparedChoices` and is invalidated automatically when the choices are modified.
+
+    Parameters
+    ----------
+    maxsize : int, optional
+        maximum amount of cached results. The least recently used result is evicted first.
+        Default is 1024.
+    ttl : float, optional
+        time in seconds after which a cached result expires. Default is None,
+        which deactivates this behaviour.
+    max_memory : int, optional
+        approximate maximum size of the cached queries and results in bytes. Default is None,
+        which deactivates this behaviour.
+    timer : Callable[[], float], optional
+        function returning the current time in seconds, which is used for ``ttl``.
+        Default is `time.monotonic`.
+
+    Raises
+    ------
+    ValueError
+        If maxsize is smaller than 1 or ttl / max_memory are not positive
+
+    Notes
+    -----
+    Results are looked up by the function, query, scorer, processor, score_cutoff, limit and
+    scorer_kwargs. Calls with an argument, which is not hashable, are not cached. The processor and
+    scorer are expected to be pure functions. A `ResultCache` should only be attached to a single
+    `PreparedChoices`. It can be shared by multiple threads.
+
+    Examples
+    --------
+
+    >>> from rapidfuzz.process import MutablePreparedChoices, ResultCache, extractOne
+    >>> cache = ResultCache(maxsize=256, ttl=60)
+    >>> choices = MutablePreparedChoices({"a": "new york mets"}, result_cache=cache)
+    >>> extractOne("new york", choices)
+    ('new york mets', 90.0, 'a')
+    >>> extractOne("new york", choices)
+    ('new york mets', 90.0, 'a')
+    >>> (cache.hits, cache.misses)
+    (1, 1)
+    >>> choices.add("b", "new york")
+    >>> extractOne("new york", choices)
+    ('new york', 100.0, 'b')
+    """
+
+    def __init__(
+        self,
+        maxsize: int = 1024,
+        *,
+        ttl: float | None = None,
+        max_memory: int | None = None,
+        timer: Callable[[], float] = time.monotonic,
+    ):
+        if maxsize < 1:
+            msg = "maxsize has to be a positive number"
+            raise ValueError(msg)
+        if ttl is not None and ttl <= 0:
+            msg = "ttl has to be a positive number or None"
+            raise ValueError(msg)
+        if max_memory is not None and max_memory <= 0:
+            msg = "max_memory has to be a positive number or None"
+            raise ValueError(msg)
+
+        self._maxsize = maxsize
+        self._ttl = ttl
+        self._max_memory = max_memory
+        self._timer = timer
+        self._lock = threading.Lock()
+        # key -> (result, size, expiry time)
+        self._entries: OrderedDict[Any, tuple[Any, int, float | None]] = OrderedDict()
+        self._memory = 0
+        self._version = 0
+        self._hits = 0
+        self._misses = 0
+
+    @property
+    def maxsize(self) -> int:
+        """maximum amount of cached results"""
+        return self._maxsize
+
+    @property
+    def ttl(self) -> float | None:
+        """time in seconds after which a cached result expires"""
+        return self._ttl
+
+    @property
+    def max_memory(self) -> int | None:
+        """approximate maximum size of the cached queries and results in bytes"""
+        return self._max_memory
+
+    @property
+    def memory(self) -> int:
+        """approximate size of the cached queries and results in bytes"""
+        return self._memory
+
+    @property
+    def hits(self) -> int:
+        """amount of calls, which returned a cached result"""
+        return self._hits
+
+    @property
+    def misses(self) -> int:
+        """amount of calls, which calculated the result"""
+        return self._misses
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def clear(self) -> None:
+        """
+        Remove all results from the cache and reset the hits and misses
+        """
+        with self._lock:
+            self._entries.clear()
+            self._memory = 0
+            self._hits = 0
+            self._misses = 0
+
+    def _pop(self, key: Any) -> None:
+        self._memory -= self._entries.pop(key)[1]
+
+    def _sync_version(self, version: int) -> bool:
+        """
+        drop the results of older versions of the choices. Returns False when
+        version is older than the cached results
+        """
+        if version < self._version:
+            return False
+
+        if version > self._version:
+            self._entries.clear()
+            self._memory = 0
+            self._version = version
+        return True
+
+    def _get(self, key: Any, version: int) -> tuple[bool, Any]:
+        with self._lock:
+            if not self._sync_version(version):
+                self._misses += 1
+                return False, None
+
+            entry = self._entries.get(key)
+            if entry is not None and entry[2] is not None and entry[2] <= self._timer():
+                self._pop(key)
+                entry = None
+
+            if entry is None:
+                self._misses += 1
+                return False, None
+
+            self._hits += 1
+            self._entries.move_to_end(key)
+            return True, _copy(entry[0])
+
+    def _put(self, key: Any, version: int, result: Any) -> None:
+        size = _sizeof(key[1]) + _sizeof(result)
+        if self._max_memory is not None and size > self._max_memory:
+            return
+
+        expires = None if self._ttl is None else self._timer() + self._ttl
+        with self._lock:
+            if not self._sync_version(version):
+                return
+
+            if key in self._entries:
+                self._pop(key)
+
+            self._entries[key] = (_copy(result), size, expires)
+            self._memory += size
+            while len(self._entries) > self._maxsize or (
+                self._max_memory is not None and self._memory > self._max_memory
+            ):
+                self._pop(next(iter(self._entries)))
+
+    def _call(self, version: int, key: tuple[Any, ...], func: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        """
+        result of func(*args, **kwargs), which is only calculated when it is not cached yet.
+        key[1] is expected to be the query
+        """
+        try:
+            found, result = self._get(key, version)
+        except TypeError:
+            return func(*args, **kwargs)
+
+        if found:
+            return result
+
+        result = func(*args, **kwargs)
+        self._put(key, version, result)
+        return result
+
+
+def result_cache_key(
+    func: str, query: Any, scorer: Any, processor: Any, score_cutoff: Any, limit: Any, scorer_kwargs: dict[str, Any]
+) -> tuple[Any, ...]:
+    return (func, query, scorer, processor, score_cutoff, limit, tuple(sorted(scorer_kwargs.items())))
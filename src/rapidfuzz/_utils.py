@@ -4,8 +4,12 @@
 from __future__ import annotations
 
 import sys
+from bisect import bisect_right
 from math import isnan
-from typing import Any, Callable
+from typing import TYPE_CHECKING, Any, Callable
+
+if TYPE_CHECKING:
+    from collections.abc import Generator
 
 pandas_NA = None
 
@@ -70,6 +74,177 @@ def is_none(s: Any) -> bool:
     return False
 
 
+class ArrowStrings:
+    """
+    read only sequence of the str / None values of a pyarrow string or large_string array.
+    Values are only converted to str when they are accessed.
+    """
+
+    def __init__(self, chunks: list[Any]):
+        self.chunks = chunks
+        self._starts = [0]
+        for chunk in chunks:
+            self._starts.append(self._starts[-1] + len(chunk))
+
+    def __len__(self) -> int:
+        return self._starts[-1]
+
+    def __getitem__(self, index: int) -> Any:
+        if index < 0:
+            index += len(self)
+        chunk = bisect_right(self._starts, index) - 1
+        if index < 0 or chunk >= len(self.chunks):
+            msg = "index out of range"
+            raise IndexError(msg)
+        return self.chunks[chunk][index - self._starts[chunk]].as_py()
+
+    def __iter__(self) -> Any:
+        for chunk in self.chunks:
+            yield from chunk.to_pylist()
+
+    def buffers(self) -> list[tuple[int, int, int, int, int, bool]]:
+        """
+        addresses of the validity bitmap (0 without nulls), offsets and data of every chunk
+        together with its offset, length and whether it uses 64 bit offsets
+        """
+        import pyarrow as pa
+
+        result = []
+        for chunk in self.chunks:
+            validity, offsets, data = chunk.buffers()
+            result.append(
+                (
+                    0 if validity is None or not chunk.null_count else validity.address,
+                    offsets.address,
+                    0 if data is None else data.address,
+                    chunk.offset,
+                    len(chunk),
+                    pa.types.is_large_string(chunk.type),
+                )
+            )
+        return result
+
+
+def as_arrow_strings(obj: Any) -> ArrowStrings | None:
+    """
+    wrap a pyarrow Array or ChunkedArray of the type string or large_string
+    """
+    pa = sys.modules.get("pyarrow")
+    if pa is None or not isinstance(obj, (pa.Array, pa.ChunkedArray)):
+        return None
+    if not (pa.types.is_string(obj.type) or pa.types.is_large_string(obj.type)):
+        return None
+    return ArrowStrings(obj.chunks if isinstance(obj, pa.ChunkedArray) else [obj])
+
+
+def numpy_string_buffer(obj: Any) -> tuple[int, int, int, int, bool] | None:
+    """
+    address, length, stride and itemsize of a 1-d numpy array with the dtype U or S and
+    whether the characters are UCS4. None is returned for any other object
+    """
+    dtype = getattr(obj, "dtype", None)
+    if getattr(dtype, "kind", None) not in ("U", "S") or getattr(obj, "ndim", None) != 1:
+        return None
+    if not dtype.isnative or not obj.flags.aligned:
+        return None
+    return (obj.__array_interface__["data"][0], len(obj), obj.strides[0], dtype.itemsize, dtype.kind == "U")
+
+
+def sparse_matrix_type() -> Any:
+    """
+    scipy.sparse.csr_matrix used for the sparse output of cdist. This is checked
+    before calculating the results, so a missing SciPy is reported immediately.
+    """
+    try:
+        from scipy.sparse import csr_matrix
+    except ImportError as e:
+        msg = "output='sparse' requires SciPy"
+        raise ImportError(msg) from e
+
+    return csr_matrix
+
+
+def to_sparse_matrix(rows: Any, cols: Any, scores: Any, shape: tuple[int, int]) -> Any:
+    """
+    convert the coordinate format results of cdist into a scipy.sparse.csr_matrix
+    """
+    return sparse_matrix_type()((scores, (rows, cols)), shape=shape)
+
+
+def as_output_buffer(out: Any, dtype: Any, shape: tuple[int, int]) -> Any:
+    """
+    validate the output buffer passed to cdist and return it as ndarray,
+    which shares the memory with the passed buffer.
+    """
+    import numpy as np
+
+    result = np.asarray(out)
+    if dtype is not None and result.dtype != np.dtype(dtype):
+        msg = f"out has the dtype {result.dtype}, but {np.dtype(dtype)} is required"
+        raise TypeError(msg)
+    if result.shape != shape:
+        msg = f"out has to be a matrix of shape {shape}"
+        raise ValueError(msg)
+    if not result.flags.c_contiguous or not result.flags.writeable:
+        msg = "out has to be a writable C-contiguous buffer"
+        raise ValueError(msg)
+
+    return result
+
+
+def iter_cdist_blocks(
+    cdist: Callable[..., Any], queries: Any, choices: Any, chunk_size: int, kwargs: dict[str, Any]
+) -> Generator[tuple[slice, Any], None, None]:
+    """
+    yield the results of cdist for blocks of chunk_size queries. The next block is
+    calculated in a background thread while the current one is consumed.
+    """
+    from collections.abc import Sequence
+    from concurrent.futures import ThreadPoolExecutor
+
+    if chunk_size < 1:
+        msg = "chunk_size has to be a positive number"
+        raise ValueError(msg)
+
+    if not isinstance(queries, Sequence):
+        queries = list(queries)
+    query_count = len(queries)
+
+    def calculate(start: int) -> tuple[slice, Any]:
+        rows = slice(start, min(start + chunk_size, query_count))
+        return rows, cdist(queries[rows], choices, **kwargs)
+
+    def iterate() -> Generator[tuple[slice, Any], None, None]:
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            future = executor.submit(calculate, 0) if query_count else None
+            try:
+                while future is not None:
+                    rows, block = future.result()
+                    future = executor.submit(calculate, rows.stop) if rows.stop < query_count else None
+                    yield rows, block
+            finally:
+                if future is not None:
+                    future.cancel()
+
+    return iterate()
+
+
+class ThreadPoolContext:
+    """
+    returned by set_thread_pool. When it is used as context manager the
+    previous configuration of the thread pool is restored on exit.
+    """
+
+    def __init__(self, restore: Callable[[], Any]):
+        self._restore = restore
+
+    def __enter__(self) -> ThreadPoolContext:
+        return self
+
+    def __exit__(self, *_args: Any) -> None:
+        self._restore()
+
+
 def add_scorer_attrs(func: Any, cached_scorer_call: dict[str, Callable[..., dict[str, Any]]]):
     func._RF_ScorerPy = cached_scorer_call
     # used to detect the function hasn't been wrapped afterwards
@@ -6,6 +6,9 @@ from ._initialize_cpp import Editops
 import sys
 
 from rapidfuzz cimport (
+    RF_SCORER_FLAG_LENGTH_DIFF_BOUND,
+    RF_SCORER_FLAG_LENGTH_RATIO_BOUND,
+    RF_SCORER_FLAG_LENGTH_SUM_RATIO_BOUND,
     RF_SCORER_FLAG_MULTI_STRING_CALL,
     RF_SCORER_FLAG_MULTI_STRING_INIT,
     RF_SCORER_FLAG_RESULT_F64,
@@ -333,6 +336,8 @@ cdef bool LevenshteinKwargsInit(RF_Kwargs* self, dict kwargs) except False:
 cdef bool GetScorerFlagsLevenshteinDistance(const RF_Kwargs* self, RF_ScorerFlags* scorer_flags) except False nogil:
     cdef LevenshteinWeightTable* weights = <LevenshteinWeightTable*>self.context
     scorer_flags.flags = RF_SCORER_FLAG_RESULT_SIZE_T
+    if weights.insert_cost and weights.delete_cost:
+        scorer_flags.flags |= RF_SCORER_FLAG_LENGTH_DIFF_BOUND
     if weights.insert_cost == weights.delete_cost:
         scorer_flags.flags |= RF_SCORER_FLAG_SYMMETRIC
     if LevenshteinMultiStringSupport(self):
@@ -357,6 +362,11 @@ cdef bool GetScorerFlagsLevenshteinSimilarity(const RF_Kwargs* self, RF_ScorerFl
 cdef bool GetScorerFlagsLevenshteinNormalizedDistance(const RF_Kwargs* self, RF_ScorerFlags* scorer_flags) except False nogil:
     cdef LevenshteinWeightTable* weights = <LevenshteinWeightTable*>self.context
     scorer_flags.flags = RF_SCORER_FLAG_RESULT_F64 | RF_SCORER_NONE_IS_WORST_SCORE
+    if weights.insert_cost and weights.insert_cost == weights.delete_cost:
+        if weights.replace_cost == weights.insert_cost:
+            scorer_flags.flags |= RF_SCORER_FLAG_LENGTH_RATIO_BOUND
+        elif weights.replace_cost >= 2 * weights.insert_cost:
+            scorer_flags.flags |= RF_SCORER_FLAG_LENGTH_SUM_RATIO_BOUND
     if weights.insert_cost == weights.delete_cost:
         scorer_flags.flags |= RF_SCORER_FLAG_SYMMETRIC
     if LevenshteinMultiStringSupport(self):
@@ -369,6 +379,11 @@ cdef bool GetScorerFlagsLevenshteinNormalizedDistance(const RF_Kwargs* self, RF_
 cdef bool GetScorerFlagsLevenshteinNormalizedSimilarity(const RF_Kwargs* self, RF_ScorerFlags* scorer_flags) except False nogil:
     cdef LevenshteinWeightTable* weights = <LevenshteinWeightTable*>self.context
     scorer_flags.flags = RF_SCORER_FLAG_RESULT_F64 | RF_SCORER_NONE_IS_WORST_SCORE
+    if weights.insert_cost and weights.insert_cost == weights.delete_cost:
+        if weights.replace_cost == weights.insert_cost:
+            scorer_flags.flags |= RF_SCORER_FLAG_LENGTH_RATIO_BOUND
+        elif weights.replace_cost >= 2 * weights.insert_cost:
+            scorer_flags.flags |= RF_SCORER_FLAG_LENGTH_SUM_RATIO_BOUND
     if weights.insert_cost == weights.delete_cost:
         scorer_flags.flags |= RF_SCORER_FLAG_SYMMETRIC
     if LevenshteinMultiStringSupport(self):
@@ -430,12 +445,14 @@ def damerau_levenshtein_normalized_similarity(s1, s2, *, processor=None, score_c
 
 cdef bool GetScorerFlagsDamerauLevenshteinDistance(const RF_Kwargs* self, RF_ScorerFlags* scorer_flags) except False nogil:
     scorer_flags.flags = RF_SCORER_FLAG_RESULT_SIZE_T | RF_SCORER_FLAG_SYMMETRIC
+    scorer_flags.flags |= RF_SCORER_FLAG_LENGTH_DIFF_BOUND
     scorer_flags.optimal_score.sizet = 0
     scorer_flags.worst_score.sizet = SIZE_MAX
     return True
 
 cdef bool GetScorerFlagsDamerauLevenshteinNormalizedDistance(const RF_Kwargs* self, RF_ScorerFlags* scorer_flags) except False nogil:
     scorer_flags.flags = RF_SCORER_FLAG_RESULT_F64 | RF_SCORER_FLAG_SYMMETRIC | RF_SCORER_NONE_IS_WORST_SCORE
+    scorer_flags.flags |= RF_SCORER_FLAG_LENGTH_RATIO_BOUND
     scorer_flags.optimal_score.f64 = 0.0
     scorer_flags.worst_score.f64 = 1
     return True
@@ -448,6 +465,7 @@ cdef bool GetScorerFlagsDamerauLevenshteinSimilarity(const RF_Kwargs* self, RF_S
 
 cdef bool GetScorerFlagsDamerauLevenshteinNormalizedSimilarity(const RF_Kwargs* self, RF_ScorerFlags* scorer_flags) except False nogil:
     scorer_flags.flags = RF_SCORER_FLAG_RESULT_F64 | RF_SCORER_FLAG_SYMMETRIC | RF_SCORER_NONE_IS_WORST_SCORE
+    scorer_flags.flags |= RF_SCORER_FLAG_LENGTH_RATIO_BOUND
     scorer_flags.optimal_score.f64 = 1.0
     scorer_flags.worst_score.f64 = 0
     return True
@@ -521,6 +539,7 @@ def lcs_seq_opcodes(s1, s2, *, processor=None):
 
 cdef bool GetScorerFlagsLCSseqDistance(const RF_Kwargs* self, RF_ScorerFlags* scorer_flags) except False nogil:
     scorer_flags.flags = RF_SCORER_FLAG_RESULT_SIZE_T | RF_SCORER_FLAG_SYMMETRIC
+    scorer_flags.flags |= RF_SCORER_FLAG_LENGTH_DIFF_BOUND
     if LCSseqMultiStringSupport(self):
         scorer_flags.flags |= RF_SCORER_FLAG_MULTI_STRING_INIT
 
@@ -530,6 +549,7 @@ cdef bool GetScorerFlagsLCSseqDistance(const RF_Kwargs* self, RF_ScorerFlags* sc
 
 cdef bool GetScorerFlagsLCSseqNormalizedDistance(const RF_Kwargs* self, RF_ScorerFlags* scorer_flags) except False nogil:
     scorer_flags.flags = RF_SCORER_FLAG_RESULT_F64 | RF_SCORER_FLAG_SYMMETRIC | RF_SCORER_NONE_IS_WORST_SCORE
+    scorer_flags.flags |= RF_SCORER_FLAG_LENGTH_RATIO_BOUND
     if LCSseqMultiStringSupport(self):
         scorer_flags.flags |= RF_SCORER_FLAG_MULTI_STRING_INIT
 
@@ -548,6 +568,7 @@ cdef bool GetScorerFlagsLCSseqSimilarity(const RF_Kwargs* self, RF_ScorerFlags*
 
 cdef bool GetScorerFlagsLCSseqNormalizedSimilarity(const RF_Kwargs* self, RF_ScorerFlags* scorer_flags) except False nogil:
     scorer_flags.flags = RF_SCORER_FLAG_RESULT_F64 | RF_SCORER_FLAG_SYMMETRIC | RF_SCORER_NONE_IS_WORST_SCORE
+    scorer_flags.flags |= RF_SCORER_FLAG_LENGTH_RATIO_BOUND
     if LCSseqMultiStringSupport(self):
         scorer_flags.flags |= RF_SCORER_FLAG_MULTI_STRING_INIT
 
@@ -626,6 +647,7 @@ def indel_opcodes(s1, s2, *, processor=None):
 
 cdef bool GetScorerFlagsIndelDistance(const RF_Kwargs* self, RF_ScorerFlags* scorer_flags) except False nogil:
     scorer_flags.flags = RF_SCORER_FLAG_RESULT_SIZE_T | RF_SCORER_FLAG_SYMMETRIC
+    scorer_flags.flags |= RF_SCORER_FLAG_LENGTH_DIFF_BOUND
     if IndelMultiStringSupport(self):
         scorer_flags.flags |= RF_SCORER_FLAG_MULTI_STRING_INIT
 
@@ -636,6 +658,7 @@ cdef bool GetScorerFlagsIndelDistance(const RF_Kwargs* self, RF_ScorerFlags* sco
 
 cdef bool GetScorerFlagsIndelNormalizedDistance(const RF_Kwargs* self, RF_ScorerFlags* scorer_flags) except False nogil:
     scorer_flags.flags = RF_SCORER_FLAG_RESULT_F64 | RF_SCORER_FLAG_SYMMETRIC | RF_SCORER_NONE_IS_WORST_SCORE
+    scorer_flags.flags |= RF_SCORER_FLAG_LENGTH_SUM_RATIO_BOUND
     if IndelMultiStringSupport(self):
         scorer_flags.flags |= RF_SCORER_FLAG_MULTI_STRING_INIT
 
@@ -655,6 +678,7 @@ cdef bool GetScorerFlagsIndelSimilarity(const RF_Kwargs* self, RF_ScorerFlags* s
 
 cdef bool GetScorerFlagsIndelNormalizedSimilarity(const RF_Kwargs* self, RF_ScorerFlags* scorer_flags) except False nogil:
     scorer_flags.flags = RF_SCORER_FLAG_RESULT_F64 | RF_SCORER_FLAG_SYMMETRIC | RF_SCORER_NONE_IS_WORST_SCORE
+    scorer_flags.flags |= RF_SCORER_FLAG_LENGTH_SUM_RATIO_BOUND
     if IndelMultiStringSupport(self):
         scorer_flags.flags |= RF_SCORER_FLAG_MULTI_STRING_INIT
 
@@ -744,12 +768,20 @@ cdef bool HammingKwargsInit(RF_Kwargs* self, dict kwargs) except False:
 
 cdef bool GetScorerFlagsHammingDistance(const RF_Kwargs* self, RF_ScorerFlags* scorer_flags) except False nogil:
     scorer_flags.flags = RF_SCORER_FLAG_RESULT_SIZE_T | RF_SCORER_FLAG_SYMMETRIC
+    # without padding strings of different length are rejected
+    if (<bool*>self.context)[0]:
+        scorer_flags.flags |= RF_SCORER_FLAG_LENGTH_DIFF_BOUND
+
     scorer_flags.optimal_score.sizet = 0
     scorer_flags.worst_score.sizet = SIZE_MAX
     return True
 
 cdef bool GetScorerFlagsHammingNormalizedDistance(const RF_Kwargs* self, RF_ScorerFlags* scorer_flags) except False nogil:
     scorer_flags.flags = RF_SCORER_FLAG_RESULT_F64 | RF_SCORER_FLAG_SYMMETRIC | RF_SCORER_NONE_IS_WORST_SCORE
+    # without padding strings of different length are rejected
+    if (<bool*>self.context)[0]:
+        scorer_flags.flags |= RF_SCORER_FLAG_LENGTH_RATIO_BOUND
+
     scorer_flags.optimal_score.f64 = 0.0
     scorer_flags.worst_score.f64 = 1.0
     return True
@@ -762,6 +794,10 @@ cdef bool GetScorerFlagsHammingSimilarity(const RF_Kwargs* self, RF_ScorerFlags*
 
 cdef bool GetScorerFlagsHammingNormalizedSimilarity(const RF_Kwargs* self, RF_ScorerFlags* scorer_flags) except False nogil:
     scorer_flags.flags = RF_SCORER_FLAG_RESULT_F64 | RF_SCORER_FLAG_SYMMETRIC | RF_SCORER_NONE_IS_WORST_SCORE
+    # without padding strings of different length are rejected
+    if (<bool*>self.context)[0]:
+        scorer_flags.flags |= RF_SCORER_FLAG_LENGTH_RATIO_BOUND
+
     scorer_flags.optimal_score.f64 = 1.0
     scorer_flags.worst_score.f64 = 0
     return True
@@ -819,6 +855,7 @@ def osa_normalized_similarity(s1, s2, *, processor=None, score_cutoff=None):
 
 cdef bool GetScorerFlagsOSADistance(const RF_Kwargs* self, RF_ScorerFlags* scorer_flags) except False nogil:
     scorer_flags.flags = RF_SCORER_FLAG_RESULT_SIZE_T | RF_SCORER_FLAG_SYMMETRIC
+    scorer_flags.flags |= RF_SCORER_FLAG_LENGTH_DIFF_BOUND
     if OSAMultiStringSupport(self):
         scorer_flags.flags |= RF_SCORER_FLAG_MULTI_STRING_INIT
 
@@ -828,6 +865,7 @@ cdef bool GetScorerFlagsOSADistance(const RF_Kwargs* self, RF_ScorerFlags* score
 
 cdef bool GetScorerFlagsOSANormalizedDistance(const RF_Kwargs* self, RF_ScorerFlags* scorer_flags) except False nogil:
     scorer_flags.flags = RF_SCORER_FLAG_RESULT_F64 | RF_SCORER_FLAG_SYMMETRIC | RF_SCORER_NONE_IS_WORST_SCORE
+    scorer_flags.flags |= RF_SCORER_FLAG_LENGTH_RATIO_BOUND
     if OSAMultiStringSupport(self):
         scorer_flags.flags |= RF_SCORER_FLAG_MULTI_STRING_INIT
 
@@ -846,6 +884,7 @@ cdef bool GetScorerFlagsOSASimilarity(const RF_Kwargs* self, RF_ScorerFlags* sco
 
 cdef bool GetScorerFlagsOSANormalizedSimilarity(const RF_Kwargs* self, RF_ScorerFlags* scorer_flags) except False nogil:
     scorer_flags.flags = RF_SCORER_FLAG_RESULT_F64 | RF_SCORER_FLAG_SYMMETRIC | RF_SCORER_NONE_IS_WORST_SCORE
+    scorer_flags.flags |= RF_SCORER_FLAG_LENGTH_RATIO_BOUND
     if OSAMultiStringSupport(self):
         scorer_flags.flags |= RF_SCORER_FLAG_MULTI_STRING_INIT
 
@@ -1080,12 +1119,14 @@ def postfix_normalized_similarity(s1, s2, *, processor=None, score_cutoff=None):
 
 cdef bool GetScorerFlagsPostfixDistance(const RF_Kwargs* self, RF_ScorerFlags* scorer_flags) except False nogil:
     scorer_flags.flags = RF_SCORER_FLAG_RESULT_SIZE_T | RF_SCORER_FLAG_SYMMETRIC
+    scorer_flags.flags |= RF_SCORER_FLAG_LENGTH_DIFF_BOUND
     scorer_flags.optimal_score.sizet = 0
     scorer_flags.worst_score.sizet = SIZE_MAX
     return True
 
 cdef bool GetScorerFlagsPostfixNormalizedDistance(const RF_Kwargs* self, RF_ScorerFlags* scorer_flags) except False nogil:
     scorer_flags.flags = RF_SCORER_FLAG_RESULT_F64 | RF_SCORER_FLAG_SYMMETRIC | RF_SCORER_NONE_IS_WORST_SCORE
+    scorer_flags.flags |= RF_SCORER_FLAG_LENGTH_RATIO_BOUND
     scorer_flags.optimal_score.f64 = 0.0
     scorer_flags.worst_score.f64 = 1.0
     return True
@@ -1098,6 +1139,7 @@ cdef bool GetScorerFlagsPostfixSimilarity(const RF_Kwargs* self, RF_ScorerFlags*
 
 cdef bool GetScorerFlagsPostfixNormalizedSimilarity(const RF_Kwargs* self, RF_ScorerFlags* scorer_flags) except False nogil:
     scorer_flags.flags = RF_SCORER_FLAG_RESULT_F64 | RF_SCORER_FLAG_SYMMETRIC | RF_SCORER_NONE_IS_WORST_SCORE
+    scorer_flags.flags |= RF_SCORER_FLAG_LENGTH_RATIO_BOUND
     scorer_flags.optimal_score.f64 = 1.0
     scorer_flags.worst_score.f64 = 0
     return True
@@ -1157,12 +1199,14 @@ def prefix_normalized_similarity(s1, s2, *, processor=None, score_cutoff=None):
 
 cdef bool GetScorerFlagsPrefixDistance(const RF_Kwargs* self, RF_ScorerFlags* scorer_flags) except False nogil:
     scorer_flags.flags = RF_SCORER_FLAG_RESULT_SIZE_T | RF_SCORER_FLAG_SYMMETRIC
+    scorer_flags.flags |= RF_SCORER_FLAG_LENGTH_DIFF_BOUND
     scorer_flags.optimal_score.sizet = 0
     scorer_flags.worst_score.sizet = SIZE_MAX
     return True
 
 cdef bool GetScorerFlagsPrefixNormalizedDistance(const RF_Kwargs* self, RF_ScorerFlags* scorer_flags) except False nogil:
     scorer_flags.flags = RF_SCORER_FLAG_RESULT_F64 | RF_SCORER_FLAG_SYMMETRIC | RF_SCORER_NONE_IS_WORST_SCORE
+    scorer_flags.flags |= RF_SCORER_FLAG_LENGTH_RATIO_BOUND
     scorer_flags.optimal_score.f64 = 0.0
     scorer_flags.worst_score.f64 = 1.0
     return True
@@ -1175,6 +1219,7 @@ cdef bool GetScorerFlagsPrefixSimilarity(const RF_Kwargs* self, RF_ScorerFlags*
 
 cdef bool GetScorerFlagsPrefixNormalizedSimilarity(const RF_Kwargs* self, RF_ScorerFlags* scorer_flags) except False nogil:
     scorer_flags.flags = RF_SCORER_FLAG_RESULT_F64 | RF_SCORER_FLAG_SYMMETRIC | RF_SCORER_NONE_IS_WORST_SCORE
+    scorer_flags.flags |= RF_SCORER_FLAG_LENGTH_RATIO_BOUND
     scorer_flags.optimal_score.f64 = 1.0
     scorer_flags.worst_score.f64 = 0
     return True
@@ -5,6 +5,7 @@ from . import fuzz_py
 from .distance._initialize_cpp import ScoreAlignment
 
 from rapidfuzz cimport (
+    RF_SCORER_FLAG_LENGTH_SUM_RATIO_BOUND,
     RF_SCORER_FLAG_MULTI_STRING_INIT,
     RF_SCORER_FLAG_RESULT_F64,
     RF_SCORER_FLAG_SYMMETRIC,
@@ -234,7 +235,13 @@ cdef bool GetScorerFlagsFuzzRatio(const RF_Kwargs* self, RF_ScorerFlags* scorer_
     scorer_flags.worst_score.f64 = 0
     return True
 
-cdef RF_Scorer RatioContext = CreateScorerContext(NoKwargsInit, GetScorerFlagsFuzzRatio, RatioInit, UncachedRatioFuncInit())
+# token_sort_ratio changes the length of the strings, so the bound only holds for ratio and QRatio
+cdef bool GetScorerFlagsFuzzRatioLengthBound(const RF_Kwargs* self, RF_ScorerFlags* scorer_flags) except False nogil:
+    GetScorerFlagsFuzzRatio(self, scorer_flags)
+    scorer_flags.flags |= RF_SCORER_FLAG_LENGTH_SUM_RATIO_BOUND
+    return True
+
+cdef RF_Scorer RatioContext = CreateScorerContext(NoKwargsInit, GetScorerFlagsFuzzRatioLengthBound, RatioInit, UncachedRatioFuncInit())
 SetScorerAttrs(ratio, fuzz_py.ratio, &RatioContext)
 
 cdef RF_Scorer PartialRatioContext = CreateScorerContext(NoKwargsInit, GetScorerFlagsFuzz, PartialRatioInit, UncachedPartialRatioFuncInit())
@@ -261,5 +268,5 @@ SetScorerAttrs(partial_token_ratio, fuzz_py.partial_token_ratio, &PartialTokenRa
 cdef RF_Scorer WRatioContext = CreateScorerContext(NoKwargsInit, GetScorerFlagsFuzz, WRatioInit, UncachedWRatioFuncInit())
 SetScorerAttrs(WRatio, fuzz_py.WRatio, &WRatioContext)
 
-cdef RF_Scorer QRatioContext = CreateScorerContext(NoKwargsInit, GetScorerFlagsFuzzRatio, QRatioInit, UncachedQRatioFuncInit())
+cdef RF_Scorer QRatioContext = CreateScorerContext(NoKwargsInit, GetScorerFlagsFuzzRatioLengthBound, QRatioInit, UncachedQRatioFuncInit())
 SetScorerAttrs(QRatio, fuzz_py.QRatio, &QRatioContext)
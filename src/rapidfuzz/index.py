@@ -0,0 +1,1894 @@
+# SPDX-License-Identifier: MIT
+# Copyright (C) 2025 Max Bachmann
+"""
+Indexes built once over a collection of choices, which only score the choices
+that can reach the requested score_cutoff.
+"""
+
+from __future__ import annotations
+
+import heapq
+import math
+from collections import Counter
+
+from rapidfuzz import process
+from rapidfuzz._utils import ScorerFlag, is_none, setupPandas
+from rapidfuzz.distance import (
+    OSA,
+    DamerauLevenshtein,
+    Indel,
+    Levenshtein,
+    Postfix,
+    Prefix,
+)
+from rapidfuzz.fuzz import WRatio, ratio, token_set_ratio
+
+__all__ = ["BKTree", "DeletionIndex", "MinHashIndex", "PrefixIndex", "QGramIndex", "TfidfIndex", "TokenIndex"]
+
+
+class _ChoiceIndex:
+    """
+    Stores the choices of an index. Choices which are None are skipped and the remaining
+    choices are referenced by their position in this storage.
+    """
+
+    def __init__(self, choices, processor):
+        setupPandas()
+
+        choices_iter = choices.items() if hasattr(choices, "items") else enumerate(choices)
+        self._keys = []
+        self._choices = []
+        for key, choice in choices_iter:
+            if is_none(choice):
+                continue
+
+            self._keys.append(key)
+            self._choices.append(choice)
+
+        self.processor = processor
+        if processor:
+            self._processed = [processor(x) for x in self._choices]
+        else:
+            self._processed = self._choices
+
+    def __len__(self):
+        return len(self._choices)
+
+    def _verify(self, query, candidates, scorer, limit, score_cutoff, score_hint, scorer_kwargs):
+        """
+        score the candidates against the preprocessed query with process.extract and
+        map the results back to the stored choices
+        """
+        candidates = list(candidates)
+        results = process.extract(
+            query,
+            [self._processed[i] for i in candidates],
+            scorer=scorer,
+            limit=limit,
+            score_cutoff=score_cutoff,
+            score_hint=score_hint,
+            scorer_kwargs=scorer_kwargs,
+        )
+        return [(self._choices[candidates[i]], score, self._keys[candidates[i]]) for _, score, i in results]
+
+
+def _qgrams(s, q):
+    if not isinstance(s, (str, bytes)):
+        s = tuple(s)
+    return Counter(s[i : i + q] for i in range(len(s) - q + 1))
+
+
+def _max_edits(scorer, score_cutoff, scorer_kwargs, query_len, lengths):
+    """
+    maximum Levenshtein distance between the query and choices of the given lengths,
+    which can still reach score_cutoff
+    """
+    import numpy as np
+
+    longest = np.maximum(lengths, query_len).astype(np.float64)
+    total = (lengths + query_len).astype(np.float64)
+
+    if scorer in (
+        Levenshtein.distance,
+        Levenshtein.similarity,
+        Levenshtein.normalized_distance,
+        Levenshtein.normalized_similarity,
+    ):
+        weights = tuple(scorer_kwargs.get("weights") or (1, 1, 1))
+        if scorer is Levenshtein.distance:
+            if min(weights) == 0:
+                return np.full(len(lengths), np.inf)
+            return np.full(len(lengths), score_cutoff / min(weights))
+
+        if weights != (1, 1, 1):
+            msg = "QGramIndex only supports the normalized Levenshtein scorers with weights=(1, 1, 1)"
+            raise ValueError(msg)
+
+        if scorer is Levenshtein.similarity:
+            return longest - score_cutoff
+        if scorer is Levenshtein.normalized_distance:
+            return longest * score_cutoff
+        return longest * (1 - score_cutoff)
+
+    # every Indel operation is a Levenshtein operation as well
+    if scorer is Indel.distance:
+        return np.full(len(lengths), float(score_cutoff))
+    if scorer is Indel.similarity:
+        return total - score_cutoff
+    if scorer is Indel.normalized_distance:
+        return total * score_cutoff
+    if scorer is Indel.normalized_similarity:
+        return total * (1 - score_cutoff)
+    if scorer is ratio:
+        return total * (1 - score_cutoff / 100)
+
+    msg = "QGramIndex only supports the Levenshtein and Indel scorers and fuzz.ratio"
+    raise ValueError(msg)
+
+
+class QGramIndex(_ChoiceIndex):
+    """
+    Inverted index from the q-grams of the choices to the choices containing them.
+
+    Two strings with a Levenshtein distance of k share at least ``max(len1, len2) - q + 1 - k * q``
+    q-grams, since every edit operation removes at most q of them. A search only counts the
+    q-grams shared with the choices containing any q-gram of the query and scores the choices,
+    which pass this bound for the given score_cutoff. This requires numpy.
+
+    Parameters
+    ----------
+    choices : Iterable[Sequence[Hashable]] | Mapping[Sequence[Hashable]]
+        list of all strings the queries should be compared with or dict with a mapping
+        {<result>: <string to compare>}
+    q : int, optional
+        length of the q-grams. Longer q-grams are more selective, but their bound allows
+        fewer edit operations. Default is 2.
+    processor : Callable, optional
+        Optional callable that is used to preprocess the choices. Default is None,
+        which deactivates this behaviour.
+
+    Notes
+    -----
+    Like for `process.PreparedChoices` the processor passed to `extract` and `extractOne`
+    is only applied to the query and not to the indexed choices. The search supports the
+    scorers of `Levenshtein` with the default weights, the scorers of `Indel` and `fuzz.ratio`.
+    `Levenshtein.distance` supports any weights. Without score_cutoff all choices are scored.
+
+    Examples
+    --------
+
+    >>> from rapidfuzz.index import QGramIndex
+    >>> from rapidfuzz.distance import Levenshtein
+    >>> index = QGramIndex(["apple", "apply", "banana", "pineapple"])
+    >>> index.extract("appel", scorer=Levenshtein.distance, score_cutoff=2)
+    [('apple', 2, 0), ('apply', 2, 1)]
+    """
+
+    def __init__(self, choices, *, q=2, processor=None):
+        import numpy as np
+
+        if q < 1:
+            msg = "q has to be at least 1"
+            raise ValueError(msg)
+
+        super().__init__(choices, processor)
+        self.q = q
+
+        postings = {}
+        for i, choice in enumerate(self._processed):
+            for gram, count in _qgrams(choice, q).items():
+                posting = postings.setdefault(gram, ([], []))
+                posting[0].append(i)
+                posting[1].append(count)
+
+        self._postings = {
+            gram: (np.array(rows, dtype=np.intp), np.array(counts, dtype=np.int64))
+            for gram, (rows, counts) in postings.items()
+        }
+
+        # choices grouped by length, so all choices of a length can be selected at once
+        self._lengths = np.array([len(x) for x in self._processed], dtype=np.int64)
+        self._length_order = np.argsort(self._lengths, kind="stable")
+        self._distinct_lengths, self._length_starts, counts = np.unique(
+            self._lengths[self._length_order], return_index=True, return_counts=True
+        )
+        self._length_ends = self._length_starts + counts
+
+    def _candidates(self, query, scorer, score_cutoff, scorer_kwargs):
+        """
+        positions of the choices, which can reach score_cutoff, in ascending order
+        """
+        import numpy as np
+
+        q = self.q
+        query_len = len(query)
+        query_grams = _qgrams(query, q)
+
+        rows = []
+        shared = []
+        for gram, count in query_grams.items():
+            posting = self._postings.get(gram)
+            if posting is not None:
+                rows.append(posting[0])
+                shared.append(np.minimum(posting[1], count))
+
+        if rows:
+            touched, inverse = np.unique(np.concatenate(rows), return_inverse=True)
+            shared_count = np.bincount(inverse, weights=np.concatenate(shared))
+        else:
+            touched = np.empty(0, dtype=np.intp)
+            shared_count = np.empty(0, dtype=np.float64)
+
+        def passes(lengths, shared):
+            # small tolerance, so rounding errors in the bound never remove a match
+            max_edits = np.floor(_max_edits(scorer, score_cutoff, scorer_kwargs, query_len, lengths) + 1e-9)
+            required = np.maximum(lengths, query_len) - q + 1 - max_edits * q
+            return (np.abs(lengths - query_len) <= max_edits) & (shared >= required)
+
+        candidates = [touched[passes(self._lengths[touched], shared_count)]]
+
+        # choices sharing no q-gram with the query are only candidates when the bound allows it
+        without_shared = passes(self._distinct_lengths, np.zeros(len(self._distinct_lengths)))
+        for start, end in zip(self._length_starts[without_shared], self._length_ends[without_shared]):
+            candidates.append(self._length_order[start:end])
+
+        return np.unique(np.concatenate(candidates))
+
+    def extract(
+        self,
+        query,
+        *,
+        scorer=ratio,
+        processor=None,
+        limit=5,
+        score_cutoff=None,
+        score_hint=None,
+        scorer_kwargs=None,
+    ):
+        """
+        Find the best matches in the index. The list is sorted by the similarity.
+        When multiple choices have the same similarity, they are sorted by their index.
+        The result is the same as for `process.extract` on the indexed choices.
+
+        Parameters
+        ----------
+        query : Sequence[Hashable]
+            string we want to find
+        scorer : Callable, optional
+            Optional callable that is used to calculate the matching score between
+            the query and each choice. This can be any of the scorers of `Levenshtein`
+            and `Indel` or `fuzz.ratio`, which is used by default.
+        processor : Callable, optional
+            Optional callable that is used to preprocess the query. Default is None,
+            which deactivates this behaviour.
+        limit : int, optional
+            maximum amount of results to return. None can be passed to disable this behavior.
+            Default is 5.
+        score_cutoff : Any, optional
+            Optional argument for a score threshold. When an edit distance is used this represents the maximum
+            edit distance and matches with a `distance > score_cutoff` are ignored. When a
+            normalized edit distance is used this represents the minimal similarity
+            and matches with a `similarity < score_cutoff` are ignored. Only choices which can
+            pass the score_cutoff are scored. Default is None, which deactivates this behaviour.
+        score_hint : Any, optional
+            Optional argument for an expected score to be passed to the scorer.
+            This is used to select a faster implementation. Default is None,
+            which deactivates this behaviour.
+        scorer_kwargs : dict[str, Any], optional
+            any other named parameters are passed to the scorer. This can be used to pass
+            e.g. weights to `Levenshtein.distance`
+
+        Returns
+        -------
+        list[tuple[Sequence[Hashable], Any, Any]]
+            The list of best matches in the same form as returned by `process.extract`
+        """
+        scorer_kwargs = scorer_kwargs or {}
+        setupPandas()
+        if is_none(query):
+            return []
+
+        if processor is not None:
+            query = processor(query)
+
+        candidates = range(len(self))
+        if score_cutoff is not None:
+            candidates = self._candidates(query, scorer, score_cutoff, scorer_kwargs)
+
+        return self._verify(query, candidates, scorer, limit, score_cutoff, score_hint, scorer_kwargs)
+
+    def extractOne(
+        self,
+        query,
+        *,
+        scorer=ratio,
+        processor=None,
+        score_cutoff=None,
+        score_hint=None,
+        scorer_kwargs=None,
+    ):
+        """
+        Find the best match in the index. When multiple choices have the same similarity,
+        the first one is returned. The arguments are the same as for `QGramIndex.extract`.
+
+        Returns
+        -------
+        tuple[Sequence[Hashable], Any, Any] | None
+            The best match in the same form as returned by `process.extractOne` or None
+            when no choice passes the score_cutoff
+        """
+        res = self.extract(
+            query,
+            scorer=scorer,
+            processor=processor,
+            limit=1,
+            score_cutoff=score_cutoff,
+            score_hint=score_hint,
+            scorer_kwargs=scorer_kwargs,
+        )
+        return res[0] if res else None
+
+
+class BKTree(_ChoiceIndex):
+    """
+    Burkhard-Keller tree over the choices using an edit distance as metric.
+
+    Every node stores the distance of its children to the node. By the triangle inequality a
+    choice within distance k of the query can only be found below children, which have a
+    distance within ``[d - k, d + k]`` to a node with distance d to the query, so all other
+    subtrees are skipped.
+
+    Parameters
+    ----------
+    choices : Iterable[Sequence[Hashable]] | Mapping[Sequence[Hashable]]
+        list of all strings the queries should be compared with or dict with a mapping
+        {<result>: <string to compare>}
+    scorer : Callable, optional
+        The distance used to build and search the tree. This can be `Levenshtein.distance`,
+        `OSA.distance`, `DamerauLevenshtein.distance` or `Indel.distance`.
+        Default is `Levenshtein.distance`.
+    processor : Callable, optional
+        Optional callable that is used to preprocess the choices. Default is None,
+        which deactivates this behaviour.
+    scorer_kwargs : dict[str, Any], optional
+        any other named parameters are passed to the scorer. Weights passed to
+        `Levenshtein.distance` need to use the same weight for insertions and deletions,
+        so the distance is symmetric.
+
+    Notes
+    -----
+    The OSA distance does not fulfill the triangle inequality, so the tree is built using
+    `DamerauLevenshtein.distance`, which is never larger than the OSA distance, and the
+    results are scored using `OSA.distance`.
+
+    Examples
+    --------
+
+    >>> from rapidfuzz.index import BKTree
+    >>> tree = BKTree(["apple", "apply", "banana", "pineapple"])
+    >>> tree.extract("appel", score_cutoff=2)
+    [('apple', 2, 0), ('apply', 2, 1)]
+    >>> tree.extractOne("bananas")
+    ('banana', 1, 2)
+    """
+
+    def __init__(self, choices, *, scorer=Levenshtein.distance, processor=None, scorer_kwargs=None):
+        scorer_kwargs = scorer_kwargs or {}
+        if scorer not in (Levenshtein.distance, OSA.distance, DamerauLevenshtein.distance, Indel.distance):
+            msg = "BKTree only supports Levenshtein, OSA, DamerauLevenshtein and Indel distances"
+            raise ValueError(msg)
+
+        if scorer is Levenshtein.distance:
+            weights = scorer_kwargs.get("weights") or (1, 1, 1)
+            if weights[0] != weights[1]:
+                msg = "BKTree requires the same weight for insertions and deletions"
+                raise ValueError(msg)
+
+        super().__init__(choices, processor)
+        self.scorer = scorer
+        self.scorer_kwargs = scorer_kwargs
+        self._metric = DamerauLevenshtein.distance if scorer is OSA.distance else scorer
+        self._build()
+
+    def _build(self):
+        import numpy as np
+
+        # every node is stored as [string, positions of choices equal to string, {distance: child}]
+        root = None
+        for pos, choice in enumerate(self._processed):
+            if root is None:
+                root = [choice, [pos], {}]
+                continue
+
+            node = root
+            while True:
+                dist = self._metric(choice, node[0], **self.scorer_kwargs)
+                if dist == 0 and choice == node[0]:
+                    node[1].append(pos)
+                    break
+
+                child = node[2].get(dist)
+                if child is None:
+                    node[2][dist] = [choice, [pos], {}]
+                    break
+                node = child
+
+        # store the nodes in breadth first order in flat arrays, so a search can process
+        # all nodes of a level at once
+        nodes = [root] if root is not None else []
+        positions = []
+        position_starts = [0]
+        child_starts = [0]
+        child_dists = []
+        child_nodes = []
+        for node in nodes:
+            positions += node[1]
+            position_starts.append(len(positions))
+            for dist, child in sorted(node[2].items()):
+                child_dists.append(dist)
+                child_nodes.append(len(nodes))
+                nodes.append(child)
+            child_starts.append(len(child_dists))
+
+        self._node_strings = [node[0] for node in nodes]
+        self._positions = positions
+        self._position_starts = position_starts
+        self._child_starts = np.array(child_starts, dtype=np.intp)
+        self._child_dists = np.array(child_dists, dtype=np.int64)
+        self._child_nodes = np.array(child_nodes, dtype=np.intp)
+        self._max_child_dists = np.array([max(node[2], default=0) for node in nodes], dtype=np.int64)
+        self._max_length = max((len(x) for x in self._node_strings), default=0)
+
+    def _search(self, query, limit, score_cutoff):
+        """
+        positions and scores of the choices within score_cutoff of the query sorted by
+        score and position. When limit is set, only the best limit choices are returned
+        and the search radius shrinks to the worst of them.
+        """
+        import numpy as np
+
+        radius = None if score_cutoff is None else score_cutoff
+
+        # max heap of (-score, -pos), so the worst result is removed first
+        results = []
+        frontier = np.zeros(min(len(self._node_strings), 1), dtype=np.intp)
+        while frontier.size:
+            strings = [self._node_strings[node] for node in frontier]
+            # distances beyond the largest child distance do not affect the search
+            cutoff = None if radius is None else radius + int(self._max_child_dists[frontier].max())
+            dists = process.cdist(
+                [query],
+                strings,
+                scorer=self._metric,
+                score_cutoff=cutoff,
+                dtype=np.int64,
+                scorer_kwargs=self.scorer_kwargs,
+            )[0]
+
+            hits = np.flatnonzero(dists <= radius) if radius is not None else np.arange(len(dists))
+            scores = dists[hits]
+            if self.scorer is not self._metric and hits.size:
+                scores = process.cdist(
+                    [query],
+                    [strings[i] for i in hits],
+                    scorer=self.scorer,
+                    dtype=np.int64,
+                    scorer_kwargs=self.scorer_kwargs,
+                )[0]
+
+            for node, score in zip(frontier[hits].tolist(), scores.tolist()):
+                for pos in self._positions[self._position_starts[node] : self._position_starts[node + 1]]:
+                    if radius is not None and score > radius:
+                        break
+                    heapq.heappush(results, (-score, -pos))
+                    if limit is not None and len(results) > limit:
+                        heapq.heappop(results)
+                    if limit is not None and len(results) == limit:
+                        radius = -results[0][0] if radius is None else min(radius, -results[0][0])
+
+            # children of a node with distance d to the query can only contain choices
+            # within the radius, when their distance to the node is within [d - radius, d + radius]
+            starts = self._child_starts[frontier]
+            counts = self._child_starts[frontier + 1] - starts
+            total = int(counts.sum())
+            if not total:
+                break
+
+            children = np.repeat(starts - np.cumsum(counts) + counts, counts) + np.arange(total)
+            if radius is not None:
+                children = children[np.abs(self._child_dists[children] - np.repeat(dists, counts)) <= radius]
+            frontier = self._child_nodes[children]
+
+        return sorted((-score, -pos) for score, pos in results)
+
+    def _search_nearest(self, query, limit):
+        """
+        the limit closest choices found using searches with a growing radius. Once a search
+        finds limit choices, no closer choice can exist outside of its radius.
+        """
+        weights = self.scorer_kwargs.get("weights") or (1, 1, 1)
+        max_dist = (len(query) + self._max_length) * max(weights)
+
+        radius = 0
+        while radius < max_dist:
+            results = self._search(query, limit, radius)
+            if len(results) >= limit:
+                return results
+            radius = max(1, radius * 2)
+
+        return self._search(query, limit, None)
+
+    def extract(self, query, *, processor=None, limit=5, score_cutoff=None):
+        """
+        Find the closest choices in the tree. The list is sorted by the distance.
+        When multiple choices have the same distance, they are sorted by their index.
+        The result is the same as for `process.extract` on the indexed choices using the scorer
+        of the tree.
+
+        Parameters
+        ----------
+        query : Sequence[Hashable]
+            string we want to find
+        processor : Callable, optional
+            Optional callable that is used to preprocess the query. Default is None,
+            which deactivates this behaviour.
+        limit : int, optional
+            maximum amount of results to return. None can be passed to disable this behavior.
+            Default is 5.
+        score_cutoff : int, optional
+            Maximum distance of the results. Default is None, which deactivates this behaviour.
+
+        Returns
+        -------
+        list[tuple[Sequence[Hashable], int, Any]]
+            The list of closest choices in the same form as returned by `process.extract`
+        """
+        setupPandas()
+        if is_none(query):
+            return []
+
+        if processor is not None:
+            query = processor(query)
+
+        if score_cutoff is None and limit is not None:
+            results = self._search_nearest(query, limit)
+        else:
+            results = self._search(query, limit, score_cutoff)
+
+        return [(self._choices[pos], score, self._keys[pos]) for score, pos in results]
+
+    def extractOne(self, query, *, processor=None, score_cutoff=None):
+        """
+        Find the closest choice in the tree. When multiple choices have the same distance,
+        the first one is returned. The arguments are the same as for `BKTree.extract`.
+
+        Returns
+        -------
+        tuple[Sequence[Hashable], int, Any] | None
+            The closest choice in the same form as returned by `process.extractOne` or None
+            when no choice is within score_cutoff
+        """
+        res = self.extract(query, processor=processor, limit=1, score_cutoff=score_cutoff)
+        return res[0] if res else None
+
+
+def _tokens(s):
+    """
+    distinct tokens of a string in the order of their first occurrence. Strings are split
+    at whitespace and every element of other sequences is a token.
+    """
+    return list(dict.fromkeys(s.split() if isinstance(s, (str, bytes)) else s))
+
+
+class TokenIndex(_ChoiceIndex):
+    """
+    Inverted index from the tokens of the choices to the choices containing them.
+
+    Tokens shared by many choices like "inc" or "ltd" say little about a match, so every token is
+    weighted by its inverse document frequency ``idf = ln((1 + n) / (1 + df)) + 1``, where n is the
+    amount of choices and df the amount of choices containing the token. A search only scores the
+    choices, which share tokens with the query that make up at least ``min_overlap`` of the idf weight
+    of the query. Only the posting lists of the rarest query tokens are needed to find these
+    choices, since a choice sharing none of them can not reach this bound with the remaining tokens.
+    This requires numpy.
+
+    Parameters
+    ----------
+    choices : Iterable[Sequence[Hashable]] | Mapping[Sequence[Hashable]]
+        list of all strings the queries should be compared with or dict with a mapping
+        {<result>: <string to compare>}
+    processor : Callable, optional
+        Optional callable that is used to preprocess the choices. Default is None,
+        which deactivates this behaviour.
+
+    Notes
+    -----
+    Strings are split into tokens at whitespace like in the token based scorers of `fuzz`.
+    Tokens only match when they are equal, so choices which share no token with the query are
+    not found, even when the scorer would rate them above score_cutoff. Like for
+    `process.PreparedChoices` the processor passed to `extract` and `extractOne` is only applied
+    to the query and not to the indexed choices.
+
+    Examples
+    --------
+
+    >>> from rapidfuzz.index import TokenIndex
+    >>> index = TokenIndex(["acme inc", "globex inc", "acme corporation inc"])
+    >>> index.extract("acme inc")
+    [('acme inc', 100.0, 0), ('acme corporation inc', 100.0, 2), ('globex inc', 55.55555555555556, 1)]
+    >>> index.extract("acme inc", min_overlap=0.5)
+    [('acme inc', 100.0, 0), ('acme corporation inc', 100.0, 2)]
+    """
+
+    def __init__(self, choices, *, processor=None):
+        import numpy as np
+
+        super().__init__(choices, processor)
+
+        postings = {}
+        for i, choice in enumerate(self._processed):
+            for token in _tokens(choice):
+                postings.setdefault(token, []).append(i)
+
+        # the rows are in ascending order, so they can be searched using np.searchsorted
+        self._postings = {token: np.array(rows, dtype=np.intp) for token, rows in postings.items()}
+
+    def _idf(self, token):
+        posting = self._postings.get(token)
+        df = 0 if posting is None else len(posting)
+        return math.log((1 + len(self)) / (1 + df)) + 1
+
+    def _candidates(self, query, min_overlap):
+        """
+        positions of the choices sharing at least min_overlap of the idf weight of the query
+        tokens in ascending order
+        """
+        import numpy as np
+
+        # rarest tokens first
+        tokens = sorted(_tokens(query), key=self._idf, reverse=True)
+        weights = [self._idf(token) for token in tokens]
+        total = sum(weights)
+        # small tolerance, so rounding errors in the sums never remove a match
+        required = min_overlap * total - 1e-9 * total
+
+        # a choice sharing none of the first prefix_len tokens can not reach the required weight
+        # with the remaining tokens
+        prefix_len = len(tokens)
+        remaining = 0.0
+        for i in range(len(tokens) - 1, -1, -1):
+            remaining += weights[i]
+            if remaining >= required:
+                prefix_len = i + 1
+                break
+
+        rows = [self._postings[token] for token in tokens[:prefix_len] if token in self._postings]
+        if not rows:
+            return np.empty(0, dtype=np.intp)
+
+        candidates = np.unique(np.concatenate(rows))
+        shared = np.zeros(len(candidates), dtype=np.float64)
+        for token, weight in zip(tokens, weights):
+            posting = self._postings.get(token)
+            if posting is None:
+                continue
+
+            pos = np.searchsorted(posting, candidates)
+            found = pos < len(posting)
+            found[found] = posting[pos[found]] == candidates[found]
+            shared += weight * found
+
+        return candidates[shared >= required]
+
+    def extract(
+        self,
+        query,
+        *,
+        scorer=token_set_ratio,
+        processor=None,
+        limit=5,
+        score_cutoff=None,
+        score_hint=None,
+        scorer_kwargs=None,
+        min_overlap=0.0,
+    ):
+        """
+        Find the best matches in the index. The list is sorted by the similarity.
+        When multiple choices have the same similarity, they are sorted by their index.
+        The result is the same as for `process.extract` on the indexed choices, which share
+        enough tokens with the query.
+
+        Parameters
+        ----------
+        query : Sequence[Hashable]
+            string we want to find
+        scorer : Callable, optional
+            Optional callable that is used to calculate the matching score between
+            the query and each choice. This can be any scorer supported by `process.extract`.
+            Default is `fuzz.token_set_ratio`.
+        processor : Callable, optional
+            Optional callable that is used to preprocess the query. Default is None,
+            which deactivates this behaviour.
+        limit : int, optional
+            maximum amount of results to return. None can be passed to disable this behavior.
+            Default is 5.
+        score_cutoff : Any, optional
+            Optional argument for a score threshold passed to the scorer.
+            Default is None, which deactivates this behaviour.
+        score_hint : Any, optional
+            Optional argument for an expected score to be passed to the scorer.
+            This is used to select a faster implementation. Default is None,
+            which deactivates this behaviour.
+        scorer_kwargs : dict[str, Any], optional
+            any other named parameters are passed to the scorer. This can be used to pass
+            e.g. weights to `Levenshtein.distance`
+        min_overlap : float, optional
+            minimum share of the idf weight of the query tokens, which has to be shared with
+            a choice for it to be scored. Larger values skip more choices, which only share
+            frequent tokens with the query. Default is 0, so every choice sharing a token with the
+            query is scored.
+
+        Returns
+        -------
+        list[tuple[Sequence[Hashable], Any, Any]]
+            The list of best matches in the same form as returned by `process.extract`
+        """
+        if not 0 <= min_overlap <= 1:
+            msg = "min_overlap has to be between 0 and 1"
+            raise ValueError(msg)
+
+        setupPandas()
+        if is_none(query):
+            return []
+
+        if processor is not None:
+            query = processor(query)
+
+        candidates = self._candidates(query, min_overlap)
+        return self._verify(query, candidates, scorer, limit, score_cutoff, score_hint, scorer_kwargs)
+
+    def extractOne(
+        self,
+        query,
+        *,
+        scorer=token_set_ratio,
+        processor=None,
+        score_cutoff=None,
+        score_hint=None,
+        scorer_kwargs=None,
+        min_overlap=0.0,
+    ):
+        """
+        Find the best match in the index. When multiple choices have the same similarity,
+        the first one is returned. The arguments are the same as for `TokenIndex.extract`.
+
+        Returns
+        -------
+        tuple[Sequence[Hashable], Any, Any] | None
+            The best match in the same form as returned by `process.extractOne` or None
+            when no choice passes the score_cutoff
+        """
+        res = self.extract(
+            query,
+            scorer=scorer,
+            processor=processor,
+            limit=1,
+            score_cutoff=score_cutoff,
+            score_hint=score_hint,
+            scorer_kwargs=scorer_kwargs,
+            min_overlap=min_overlap,
+        )
+        return res[0] if res else None
+
+
+def _deletes(s, max_deletes):
+    """
+    all strings, which can be created by deleting up to max_deletes elements of s
+    """
+    if not isinstance(s, (str, bytes)):
+        s = tuple(s)
+
+    variants = {s}
+    level = variants
+    for _ in range(max_deletes):
+        level = {x[:i] + x[i + 1 :] for x in level for i in range(len(x))} - variants
+        if not level:
+            break
+        variants |= level
+    return variants
+
+
+class DeletionIndex(_ChoiceIndex):
+    """
+    Index of the strings created by deleting up to ``max_distance`` elements of the choices,
+    similar to SymSpell.
+
+    When two strings have a Levenshtein distance of k, both can be turned into the same string
+    with at most k deletions: an insertion is a deletion in the other string and a substitution
+    or transposition deletes one element in both strings. A search only scores the choices
+    sharing such a deletion variant with the query. This is fast for short strings like codes,
+    SKUs or usernames with a low distance, but the amount of variants grows quickly with the
+    length of the strings and ``max_distance``. The variants are stored as sorted 64 bit hashes,
+    so a lookup is a binary search. This requires numpy.
+
+    Parameters
+    ----------
+    choices : Iterable[Sequence[Hashable]] | Mapping[Sequence[Hashable]]
+        list of all strings the queries should be compared with or dict with a mapping
+        {<result>: <string to compare>}
+    max_distance : int, optional
+        maximum amount of edit operations between the query and a match. Each choice stores
+        the variants with up to max_distance deletions. Default is 2.
+    prefix_length : int, optional
+        only create the variants of the first prefix_length elements of the choices. This
+        reduces the memory usage for longer choices, but returns more candidates, which
+        have to be scored. Default is None, which uses the whole string.
+    processor : Callable, optional
+        Optional callable that is used to preprocess the choices. Default is None,
+        which deactivates this behaviour.
+
+    Notes
+    -----
+    Like for `process.PreparedChoices` the processor passed to `extract` and `extractOne`
+    is only applied to the query and not to the indexed choices.
+
+    Examples
+    --------
+
+    >>> from rapidfuzz.index import DeletionIndex
+    >>> index = DeletionIndex(["A1B2", "A1B3", "X9Y8", "A1B2C"], max_distance=1)
+    >>> index.extract("A1B2")
+    [('A1B2', 0, 0), ('A1B3', 1, 1), ('A1B2C', 1, 3)]
+    """
+
+    def __init__(self, choices, *, max_distance=2, prefix_length=None, processor=None):
+        import numpy as np
+
+        if max_distance < 0:
+            msg = "max_distance has to be at least 0"
+            raise ValueError(msg)
+        if prefix_length is not None and prefix_length < 1:
+            msg = "prefix_length has to be at least 1"
+            raise ValueError(msg)
+
+        super().__init__(choices, processor)
+        self.max_distance = max_distance
+        self.prefix_length = prefix_length
+
+        hashes = []
+        rows = []
+        for i, choice in enumerate(self._processed):
+            variants = _deletes(choice[:prefix_length], max_distance)
+            hashes += map(hash, variants)
+            rows += [i] * len(variants)
+
+        hashes = np.array(hashes, dtype=np.int64)
+        rows = np.array(rows, dtype=np.intp)
+        order = np.lexsort((rows, hashes))
+        self._hashes = hashes[order]
+        self._rows = rows[order]
+
+    def _max_operations(self, scorer, score_cutoff, scorer_kwargs):
+        if scorer not in (Levenshtein.distance, OSA.distance, DamerauLevenshtein.distance, Indel.distance):
+            msg = "DeletionIndex only supports Levenshtein, OSA, DamerauLevenshtein and Indel distances"
+            raise ValueError(msg)
+
+        max_operations = score_cutoff
+        if scorer is Levenshtein.distance:
+            weights = scorer_kwargs.get("weights") or (1, 1, 1)
+            if min(weights) == 0:
+                msg = "DeletionIndex does not support weights of 0"
+                raise ValueError(msg)
+            max_operations = score_cutoff // min(weights)
+
+        if max_operations > self.max_distance:
+            msg = f"score_cutoff allows more than max_distance={self.max_distance} edit operations"
+            raise ValueError(msg)
+        return max_operations
+
+    def _candidates(self, query, max_operations):
+        """
+        positions of the choices sharing a deletion variant with the query in ascending order
+        """
+        import numpy as np
+
+        query = query[: self.prefix_length]
+        hashes = np.fromiter(map(hash, _deletes(query, max_operations)), dtype=np.int64)
+        starts = np.searchsorted(self._hashes, hashes, side="left")
+        ends = np.searchsorted(self._hashes, hashes, side="right")
+
+        rows = [self._rows[start:end] for start, end in zip(starts.tolist(), ends.tolist()) if start != end]
+        if not rows:
+            return np.empty(0, dtype=np.intp)
+        return np.unique(np.concatenate(rows))
+
+    def extract(
+        self,
+        query,
+        *,
+        scorer=Levenshtein.distance,
+        processor=None,
+        limit=5,
+        score_cutoff=None,
+        score_hint=None,
+        scorer_kwargs=None,
+    ):
+        """
+        Find the closest choices in the index. The list is sorted by the distance.
+        When multiple choices have the same distance, they are sorted by their index.
+        The result is the same as for `process.extract` on the indexed choices.
+
+        Parameters
+        ----------
+        query : Sequence[Hashable]
+            string we want to find
+        scorer : Callable, optional
+            The distance used to score the candidates. This can be `Levenshtein.distance`,
+            `OSA.distance`, `DamerauLevenshtein.distance` or `Indel.distance`.
+            Default is `Levenshtein.distance`.
+        processor : Callable, optional
+            Optional callable that is used to preprocess the query. Default is None,
+            which deactivates this behaviour.
+        limit : int, optional
+            maximum amount of results to return. None can be passed to disable this behavior.
+            Default is 5.
+        score_cutoff : int, optional
+            Maximum distance of the results. It can not allow more than max_distance edit
+            operations. Default is None, which allows max_distance edit operations.
+        score_hint : int, optional
+            Optional argument for an expected score to be passed to the scorer.
+            This is used to select a faster implementation. Default is None,
+            which deactivates this behaviour.
+        scorer_kwargs : dict[str, Any], optional
+            any other named parameters are passed to the scorer. This can be used to pass
+            e.g. weights to `Levenshtein.distance`
+
+        Returns
+        -------
+        list[tuple[Sequence[Hashable], int, Any]]
+            The list of closest choices in the same form as returned by `process.extract`
+
+        Raises
+        ------
+        ValueError
+            If the scorer is not supported or score_cutoff allows more than max_distance
+            edit operations
+        """
+        scorer_kwargs = scorer_kwargs or {}
+        if score_cutoff is None:
+            weights = scorer_kwargs.get("weights") or (1, 1, 1)
+            score_cutoff = self.max_distance * (min(weights) if scorer is Levenshtein.distance else 1)
+
+        max_operations = self._max_operations(scorer, score_cutoff, scorer_kwargs)
+
+        setupPandas()
+        if is_none(query):
+            return []
+
+        if processor is not None:
+            query = processor(query)
+
+        candidates = self._candidates(query, max_operations)
+        return self._verify(query, candidates, scorer, limit, score_cutoff, score_hint, scorer_kwargs)
+
+    def extractOne(
+        self,
+        query,
+        *,
+        scorer=Levenshtein.distance,
+        processor=None,
+        score_cutoff=None,
+        score_hint=None,
+        scorer_kwargs=None,
+    ):
+        """
+        Find the closest choice in the index. When multiple choices have the same distance,
+        the first one is returned. The arguments are the same as for `DeletionIndex.extract`.
+
+        Returns
+        -------
+        tuple[Sequence[Hashable], int, Any] | None
+            The closest choice in the same form as returned by `process.extractOne` or None
+            when no choice is within score_cutoff
+        """
+        res = self.extract(
+            query,
+            scorer=scorer,
+            processor=processor,
+            limit=1,
+            score_cutoff=score_cutoff,
+            score_hint=score_hint,
+            scorer_kwargs=scorer_kwargs,
+        )
+        return res[0] if res else None
+
+
+_PREFIX_SCORERS = (Prefix.distance, Prefix.similarity, Prefix.normalized_distance, Prefix.normalized_similarity)
+_POSTFIX_SCORERS = (Postfix.distance, Postfix.similarity, Postfix.normalized_distance, Postfix.normalized_similarity)
+
+
+def _prefix_range(keys, prefix):
+    """
+    range of the sorted keys starting with prefix
+    """
+    length = len(prefix)
+
+    lo, hi = 0, len(keys)
+    while lo < hi:
+        mid = (lo + hi) // 2
+        if keys[mid][:length] < prefix:
+            lo = mid + 1
+        else:
+            hi = mid
+    start = lo
+
+    hi = len(keys)
+    while lo < hi:
+        mid = (lo + hi) // 2
+        if keys[mid][:length] == prefix:
+            lo = mid + 1
+        else:
+            hi = mid
+    return start, lo
+
+
+class PrefixIndex(_ChoiceIndex):
+    """
+    Sorted array of the choices, which finds all choices sharing a prefix with the query
+    using a binary search. The choices sharing a longer prefix are a subrange of the choices
+    sharing a shorter one, so a search for the scorers of `Prefix` only scores the range,
+    which can reach the score_cutoff. Searches for the scorers of `Postfix` use a second array
+    of the reversed choices, which is created on the first search using them. This requires numpy.
+
+    Parameters
+    ----------
+    choices : Iterable[Sequence[Hashable]] | Mapping[Sequence[Hashable]]
+        list of all strings the queries should be compared with or dict with a mapping
+        {<result>: <string to compare>}
+    processor : Callable, optional
+        Optional callable that is used to preprocess the choices. Default is None,
+        which deactivates this behaviour.
+
+    Notes
+    -----
+    The choices have to be comparable with each other, so they can be sorted. Like for
+    `process.PreparedChoices` the processor passed to `extract` and `extractOne` is only applied
+    to the query and not to the indexed choices.
+
+    Examples
+    --------
+
+    >>> from rapidfuzz.index import PrefixIndex
+    >>> from rapidfuzz.distance import Postfix
+    >>> index = PrefixIndex(["new york", "new jersey", "newark", "york"])
+    >>> index.extract("new yo", limit=2)
+    [('new york', 6, 0), ('new jersey', 4, 1)]
+    >>> index.extract("york", scorer=Postfix.similarity, score_cutoff=4)
+    [('new york', 4, 0), ('york', 4, 3)]
+    """
+
+    def __init__(self, choices, *, processor=None):
+        super().__init__(choices, processor)
+        self._sorted = {}
+
+    def _sorted_keys(self, reverse):
+        """
+        keys sorted in lexicographical order and the positions of the choices they belong to
+        """
+        import numpy as np
+
+        if reverse not in self._sorted:
+            keys = [x if isinstance(x, (str, bytes)) else tuple(x) for x in self._processed]
+            if reverse:
+                keys = [x[::-1] for x in keys]
+            order = sorted(range(len(keys)), key=keys.__getitem__)
+            self._sorted[reverse] = ([keys[i] for i in order], np.array(order, dtype=np.intp))
+        return self._sorted[reverse]
+
+    @staticmethod
+    def _required_prefix(scorer, score_cutoff, query_len):
+        """
+        minimum length of the common prefix of the query and a choice reaching score_cutoff
+        """
+        if scorer in (Prefix.similarity, Postfix.similarity):
+            required = math.ceil(score_cutoff)
+        elif scorer in (Prefix.distance, Postfix.distance):
+            required = query_len - math.floor(score_cutoff)
+        elif scorer in (Prefix.normalized_similarity, Postfix.normalized_similarity):
+            required = math.ceil(score_cutoff * query_len - 1e-9)
+        else:
+            required = math.ceil((1 - score_cutoff) * query_len - 1e-9)
+        return min(max(required, 0), query_len)
+
+    @staticmethod
+    def _outside_bound(scorer, prefix_len, query_len):
+        """
+        best score of choices sharing a prefix shorter than prefix_len with the query
+        """
+        if scorer in (Prefix.similarity, Postfix.similarity):
+            return prefix_len - 1
+        if scorer in (Prefix.distance, Postfix.distance):
+            return query_len - prefix_len + 1
+        if scorer in (Prefix.normalized_similarity, Postfix.normalized_similarity):
+            return (prefix_len - 1) / query_len
+        return 1 - (prefix_len - 1) / query_len
+
+    def extract(
+        self,
+        query,
+        *,
+        scorer=Prefix.similarity,
+        processor=None,
+        limit=5,
+        score_cutoff=None,
+        score_hint=None,
+        scorer_kwargs=None,
+    ):
+        """
+        Find the best matches in the index. The list is sorted by the similarity.
+        When multiple choices have the same similarity, they are sorted by their index.
+        The result is the same as for `process.extract` on the indexed choices.
+
+        Parameters
+        ----------
+        query : Sequence[Hashable]
+            string we want to find
+        scorer : Callable, optional
+            Optional callable that is used to calculate the matching score between
+            the query and each choice. This can be any of the scorers of `Prefix` and
+            `Postfix`. Default is `Prefix.similarity`.
+        processor : Callable, optional
+            Optional callable that is used to preprocess the query. Default is None,
+            which deactivates this behaviour.
+        limit : int, optional
+            maximum amount of results to return. None can be passed to disable this behavior.
+            Default is 5.
+        score_cutoff : Any, optional
+            Optional argument for a score threshold. When a distance is used this represents the
+            maximum distance and matches with a `distance > score_cutoff` are ignored. When a
+            similarity is used this represents the minimal similarity and matches with a
+            `similarity < score_cutoff` are ignored. Default is None, which deactivates this behaviour.
+        score_hint : Any, optional
+            Optional argument for an expected score to be passed to the scorer.
+            This is used to select a faster implementation. Default is None,
+            which deactivates this behaviour.
+        scorer_kwargs : dict[str, Any], optional
+            any other named parameters are passed to the scorer.
+
+        Returns
+        -------
+        list[tuple[Sequence[Hashable], Any, Any]]
+            The list of best matches in the same form as returned by `process.extract`
+
+        Raises
+        ------
+        ValueError
+            If the scorer is not one of the scorers of `Prefix` and `Postfix`
+        """
+        import numpy as np
+
+        if scorer not in _PREFIX_SCORERS and scorer not in _POSTFIX_SCORERS:
+            msg = "PrefixIndex only supports the scorers of Prefix and Postfix"
+            raise ValueError(msg)
+
+        setupPandas()
+        if is_none(query):
+            return []
+
+        if processor is not None:
+            query = processor(query)
+
+        reverse = scorer in _POSTFIX_SCORERS
+        keys, rows = self._sorted_keys(reverse)
+        key = query if isinstance(query, (str, bytes)) else tuple(query)
+        if reverse:
+            key = key[::-1]
+
+        def verify(prefix_len, limit):
+            start, end = _prefix_range(keys, key[:prefix_len])
+            candidates = np.sort(rows[start:end])
+            return self._verify(query, candidates, scorer, limit, score_cutoff, score_hint, scorer_kwargs)
+
+        if score_cutoff is not None:
+            return verify(self._required_prefix(scorer, score_cutoff, len(key)), limit)
+        if limit is None:
+            return verify(0, limit)
+
+        # without score_cutoff the prefix is shortened until the range contains limit choices, which
+        # are better than any choice outside of it
+        lowest_score_worst = scorer in (
+            Prefix.similarity,
+            Prefix.normalized_similarity,
+            Postfix.similarity,
+            Postfix.normalized_similarity,
+        )
+        for prefix_len in range(len(key), 0, -1):
+            start, end = _prefix_range(keys, key[:prefix_len])
+            if end - start < limit:
+                continue
+
+            results = verify(prefix_len, limit)
+            if not results:
+                return results
+
+            worst = results[-1][1]
+            bound = self._outside_bound(scorer, prefix_len, len(key))
+            # small tolerance, so choices outside the range with the same score are never skipped
+            if (worst > bound + 1e-9) if lowest_score_worst else (worst < bound - 1e-9):
+                return results
+
+        return verify(0, limit)
+
+    def extractOne(
+        self,
+        query,
+        *,
+        scorer=Prefix.similarity,
+        processor=None,
+        score_cutoff=None,
+        score_hint=None,
+        scorer_kwargs=None,
+    ):
+        """
+        Find the best match in the index. When multiple choices have the same similarity,
+        the first one is returned. The arguments are the same as for `PrefixIndex.extract`.
+
+        Returns
+        -------
+        tuple[Sequence[Hashable], Any, Any] | None
+            The best match in the same form as returned by `process.extractOne` or None
+            when no choice passes the score_cutoff
+        """
+        res = self.extract(
+            query,
+            scorer=scorer,
+            processor=processor,
+            limit=1,
+            score_cutoff=score_cutoff,
+            score_hint=score_hint,
+            scorer_kwargs=scorer_kwargs,
+        )
+        return res[0] if res else None
+
+
+_MASK64 = 0xFFFFFFFFFFFFFFFF
+# multiplier of the polynomial hash of the q-grams
+_QGRAM_PRIME = 0x100000001B3
+
+
+def _element_code(x):
+    """
+    integer representing an element of a string. Characters are represented by their
+    code point like in the scorers.
+    """
+    if isinstance(x, int):
+        return x & _MASK64
+    if isinstance(x, str) and len(x) == 1:
+        return ord(x)
+    return hash(x) & _MASK64
+
+
+def _shingle_hashes(strings, q):
+    """
+    64 bit hashes of the q-grams of all strings and the position of the first hash
+    of each string. Strings shorter than q are a single shingle.
+    """
+    import numpy as np
+
+    lengths = np.fromiter(map(len, strings), dtype=np.intp, count=len(strings))
+    if all(isinstance(s, str) for s in strings):
+        codes = np.frombuffer("".join(strings).encode("utf-32-le", "surrogatepass"), dtype=np.uint32)
+    elif all(isinstance(s, bytes) for s in strings):
+        codes = np.frombuffer(b"".join(strings), dtype=np.uint8)
+    else:
+        codes = np.fromiter((_element_code(x) for s in strings for x in s), dtype=np.uint64, count=lengths.sum())
+    codes = codes.astype(np.uint64)
+
+    prime = np.uint64(_QGRAM_PRIME)
+    windows = np.zeros(max(len(codes) - q + 1, 0), dtype=np.uint64)
+    for k in range(q):
+        windows = windows * prime + codes[k : k + len(windows)]
+
+    counts = np.maximum(lengths - q + 1, 1)
+    offsets = np.cumsum(counts) - counts
+    code_offsets = np.cumsum(lengths) - lengths
+    positions = np.arange(counts.sum()) - np.repeat(offsets - code_offsets, counts)
+    hashes = windows[np.minimum(positions, len(windows) - 1)] if len(windows) else np.zeros(len(positions), np.uint64)
+
+    # the hash of short strings includes their length, so it differs from the q-grams of longer strings
+    for i in np.flatnonzero(lengths < q).tolist():
+        h = int(lengths[i])
+        for code in codes[code_offsets[i] : code_offsets[i] + lengths[i]].tolist():
+            h = (h * _QGRAM_PRIME + code) & _MASK64
+        hashes[offsets[i]] = h
+
+    return hashes, offsets
+
+
+class MinHashIndex(_ChoiceIndex):
+    """
+    Locality-sensitive hashing index over the q-grams of the choices for approximate
+    near-duplicate search in large collections.
+
+    Every choice is represented by the set of its q-grams and summarized by a MinHash signature
+    of ``bands * rows`` values. The probability that two choices have the same value at a position
+    of the signature is the Jaccard similarity ``s`` of their q-gram sets. The signature is split
+    into ``bands`` bands of ``rows`` values and a search only scores the choices, which share all
+    values of at least one band with the query. This happens with the probability
+    ``1 - (1 - s ** rows) ** bands``, which rises steeply around ``(1 / bands) ** (1 / rows)``.
+    More bands find more matches, while more rows skip more of the dissimilar choices.
+    Use `MinHashIndex.candidate_probability` and `MinHashIndex.evaluate` to tune the parameters.
+    This requires numpy.
+
+    Parameters
+    ----------
+    choices : Iterable[Sequence[Hashable]] | Mapping[Sequence[Hashable]]
+        list of all strings the queries should be compared with or dict with a mapping
+        {<result>: <string to compare>}
+    q : int, optional
+        length of the q-grams. Default is 3.
+    bands : int, optional
+        amount of bands of the signature. Default is 32.
+    rows : int, optional
+        amount of signature values in each band. Default is 3.
+    seed : int, optional
+        seed of the random hash functions of the signature. Default is 0.
+    processor : Callable, optional
+        Optional callable that is used to preprocess the choices. Default is None,
+        which deactivates this behaviour.
+
+    Notes
+    -----
+    The index is approximate: choices reaching the score_cutoff are only found with the
+    probability given above, while the scores of the found choices are exact. Identical
+    strings are always found. Like for `process.PreparedChoices` the processor passed to
+    `extract`, `extractOne` and `evaluate` is only applied to the query and not to the
+    indexed choices.
+
+    Examples
+    --------
+
+    >>> from rapidfuzz.index import MinHashIndex
+    >>> index = MinHashIndex(["john smith", "jon smith", "jane doe", "john smyth"])
+    >>> index.extract("john smith", score_cutoff=80)
+    [('john smith', 100.0, 0), ('jon smith', 94.73684210526316, 1), ('john smyth', 90.0, 3)]
+    >>> index.pairs(score_cutoff=90)
+    [(0, 1, 94.73684210526316), (0, 3, 90.0)]
+    """
+
+    def __init__(self, choices, *, q=3, bands=32, rows=3, seed=0, processor=None):
+        import numpy as np
+
+        if q < 1:
+            msg = "q has to be at least 1"
+            raise ValueError(msg)
+        if bands < 1 or rows < 1:
+            msg = "bands and rows have to be at least 1"
+            raise ValueError(msg)
+
+        super().__init__(choices, processor)
+        self.q = q
+        self.bands = bands
+        self.rows = rows
+        self.seed = seed
+
+        # random multiply-add-shift hash functions of the signature
+        rng = np.random.default_rng(seed)
+        self._a = rng.integers(0, 2**64, size=bands * rows, dtype=np.uint64)
+        self._b = rng.integers(0, 2**64, size=bands * rows, dtype=np.uint64)
+
+        keys = self._band_keys(self._processed)
+        order = np.argsort(keys, axis=0, kind="stable")
+        self._keys_sorted = np.ascontiguousarray(np.take_along_axis(keys, order, axis=0).T)
+        self._rows_sorted = np.ascontiguousarray(order.T)
+
+    def _band_keys(self, strings):
+        """
+        hash of the signature values in each band of the strings with the shape (len(strings), bands)
+        """
+        import numpy as np
+
+        if not strings:
+            return np.empty((0, self.bands), dtype=np.uint64)
+
+        hashes, offsets = _shingle_hashes(strings, self.q)
+        hashes = (hashes ^ (hashes >> np.uint64(32))) & np.uint64(0xFFFFFFFF)
+
+        signatures = np.empty((len(strings), self.bands * self.rows), dtype=np.uint64)
+        for i in range(self.bands * self.rows):
+            signatures[:, i] = np.minimum.reduceat((self._a[i] * hashes + self._b[i]) >> np.uint64(32), offsets)
+
+        signatures = signatures.reshape(len(strings), self.bands, self.rows)
+        prime = np.uint64(_QGRAM_PRIME)
+        keys = np.zeros((len(strings), self.bands), dtype=np.uint64)
+        for row in range(self.rows):
+            keys = keys * prime + signatures[:, :, row]
+        return keys
+
+    def _candidates(self, query):
+        """
+        positions of the choices sharing a band with the query in ascending order
+        """
+        import numpy as np
+
+        keys = self._band_keys([query])[0]
+        rows = []
+        for band, key in enumerate(keys):
+            band_keys = self._keys_sorted[band]
+            start = np.searchsorted(band_keys, key, side="left")
+            end = np.searchsorted(band_keys, key, side="right")
+            if start != end:
+                rows.append(self._rows_sorted[band, start:end])
+
+        if not rows:
+            return np.empty(0, dtype=np.intp)
+        return np.unique(np.concatenate(rows))
+
+    def candidate_probability(self, similarity):
+        """
+        Probability that a choice is scored in a search, when the Jaccard similarity
+        of its q-grams and the q-grams of the query is similarity.
+
+        Parameters
+        ----------
+        similarity : float
+            Jaccard similarity between 0 and 1
+
+        Returns
+        -------
+        float
+            probability between 0 and 1
+        """
+        return 1 - (1 - similarity**self.rows) ** self.bands
+
+    def extract(
+        self,
+        query,
+        *,
+        scorer=ratio,
+        processor=None,
+        limit=5,
+        score_cutoff=None,
+        score_hint=None,
+        scorer_kwargs=None,
+    ):
+        """
+        Find the best matches in the index. The list is sorted by the similarity.
+        When multiple choices have the same similarity, they are sorted by their index.
+        The result is the same as for `process.extract` on the indexed choices, which
+        share a band with the query.
+
+        Parameters
+        ----------
+        query : Sequence[Hashable]
+            string we want to find
+        scorer : Callable, optional
+            Optional callable that is used to calculate the matching score between
+            the query and each choice. This can be any scorer supported by `process.extract`,
+            but the index works best for scorers based on the characters like `fuzz.ratio` or
+            `Indel.normalized_similarity`. Default is `fuzz.ratio`.
+        processor : Callable, optional
+            Optional callable that is used to preprocess the query. Default is None,
+            which deactivates this behaviour.
+        limit : int, optional
+            maximum amount of results to return. None can be passed to disable this behavior.
+            Default is 5.
+        score_cutoff : Any, optional
+            Optional argument for a score threshold passed to the scorer.
+            Default is None, which deactivates this behaviour.
+        score_hint : Any, optional
+            Optional argument for an expected score to be passed to the scorer.
+            This is used to select a faster implementation. Default is None,
+            which deactivates this behaviour.
+        scorer_kwargs : dict[str, Any], optional
+            any other named parameters are passed to the scorer. This can be used to pass
+            e.g. weights to `Levenshtein.distance`
+
+        Returns
+        -------
+        list[tuple[Sequence[Hashable], Any, Any]]
+            The list of best matches in the same form as returned by `process.extract`
+        """
+        setupPandas()
+        if is_none(query):
+            return []
+
+        if processor is not None:
+            query = processor(query)
+
+        candidates = self._candidates(query)
+        return self._verify(query, candidates, scorer, limit, score_cutoff, score_hint, scorer_kwargs)
+
+    def extractOne(
+        self,
+        query,
+        *,
+        scorer=ratio,
+        processor=None,
+        score_cutoff=None,
+        score_hint=None,
+        scorer_kwargs=None,
+    ):
+        """
+        Find the best match in the index. When multiple choices have the same similarity,
+        the first one is returned. The arguments are the same as for `MinHashIndex.extract`.
+
+        Returns
+        -------
+        tuple[Sequence[Hashable], Any, Any] | None
+            The best match in the same form as returned by `process.extractOne` or None
+            when no choice passes the score_cutoff
+        """
+        res = self.extract(
+            query,
+            scorer=scorer,
+            processor=processor,
+            limit=1,
+            score_cutoff=score_cutoff,
+            score_hint=score_hint,
+            scorer_kwargs=scorer_kwargs,
+        )
+        return res[0] if res else None
+
+    def _candidate_pairs(self):
+        """
+        pairs of positions of the choices sharing a band. The first position of every pair
+        is the smaller one and the pairs are in ascending order.
+        """
+        import numpy as np
+
+        n = len(self)
+        codes = []
+        for keys, rows in zip(self._keys_sorted, self._rows_sorted):
+            # the keys are sorted, so the choices d positions apart share a bucket when their keys are
+            # equal and there are no such choices d + 1 positions apart when there are none d apart
+            for d in range(1, n):
+                same = keys[:-d] == keys[d:]
+                if not same.any():
+                    break
+                first = rows[:-d][same]
+                second = rows[d:][same]
+                codes.append(np.minimum(first, second).astype(np.int64) * n + np.maximum(first, second))
+
+        if not codes:
+            empty = np.empty(0, dtype=np.intp)
+            return empty, empty
+
+        codes = np.unique(np.concatenate(codes))
+        return (codes // n).astype(np.intp), (codes % n).astype(np.intp)
+
+    def pairs(self, *, scorer=ratio, score_cutoff=None, scorer_kwargs=None, workers=1):
+        """
+        Find the near-duplicates in the index by scoring all pairs of choices sharing a band.
+
+        Parameters
+        ----------
+        scorer : Callable, optional
+            Optional callable that is used to calculate the matching score between
+            the choices. This can be any scorer supported by `process.cpdist`.
+            Default is `fuzz.ratio`.
+        score_cutoff : Any, optional
+            Optional argument for a score threshold passed to the scorer.
+            Default is None, which deactivates this behaviour.
+        scorer_kwargs : dict[str, Any], optional
+            any other named parameters are passed to the scorer. This can be used to pass
+            e.g. weights to `Levenshtein.distance`
+        workers : int, optional
+            The pairs are scored in parallel by workers threads like in `process.cpdist`.
+            Supply -1 to use all available CPU cores. Default is 1.
+
+        Returns
+        -------
+        list[tuple[Any, Any, Any]]
+            The pairs reaching the score_cutoff as ``(key1, key2, score)``, where key1 is the
+            key of the earlier choice. The pairs are sorted by the positions of the choices.
+        """
+        import numpy as np
+
+        scorer_kwargs = scorer_kwargs or {}
+        first, second = self._candidate_pairs()
+
+        params = getattr(scorer, "_RF_ScorerPy", None)
+        flags = params["get_scorer_flags"](**scorer_kwargs) if params is not None else None
+        if flags is None or flags["flags"] & ScorerFlag.RESULT_F64:
+            dtype = np.float64
+        else:
+            dtype = np.int64
+
+        scores = process.cpdist(
+            [self._processed[i] for i in first.tolist()],
+            [self._processed[i] for i in second.tolist()],
+            scorer=scorer,
+            score_cutoff=score_cutoff,
+            dtype=dtype,
+            workers=workers,
+            scorer_kwargs=scorer_kwargs,
+        )
+
+        if score_cutoff is not None:
+            if flags is None or flags["optimal_score"] > flags["worst_score"]:
+                found = scores >= score_cutoff
+            else:
+                found = scores <= score_cutoff
+            first, second, scores = first[found], second[found], scores[found]
+
+        return [
+            (self._keys[i], self._keys[j], score)
+            for i, j, score in zip(first.tolist(), second.tolist(), scores.tolist())
+        ]
+
+    def evaluate(self, queries, *, scorer=ratio, processor=None, score_cutoff=None, scorer_kwargs=None):
+        """
+        Compare the searches for a sample of queries with a full scan of the choices to tune
+        q, bands and rows. This scores all choices for every query, so the sample should be small.
+
+        Parameters
+        ----------
+        queries : Iterable[Sequence[Hashable]]
+            sample of queries
+        scorer : Callable, optional
+            Optional callable that is used to calculate the matching score between
+            the query and each choice. Default is `fuzz.ratio`.
+        processor : Callable, optional
+            Optional callable that is used to preprocess the queries. Default is None,
+            which deactivates this behaviour.
+        score_cutoff : Any, optional
+            score threshold of the matches. Default is None, which counts every choice
+            as a match.
+        scorer_kwargs : dict[str, Any], optional
+            any other named parameters are passed to the scorer. This can be used to pass
+            e.g. weights to `Levenshtein.distance`
+
+        Returns
+        -------
+        dict[str, float]
+            statistics of the searches:
+
+            - queries: amount of queries
+            - candidates: average amount of choices scored per query
+            - candidate_ratio: average share of the choices scored per query
+            - matches: amount of choices reaching score_cutoff in a full scan
+            - recall: share of these matches found by the index
+        """
+        setupPandas()
+        query_count = 0
+        candidate_count = 0
+        match_count = 0
+        found_count = 0
+        for raw_query in queries:
+            if is_none(raw_query):
+                continue
+
+            query = processor(raw_query) if processor is not None else raw_query
+
+            query_count += 1
+            candidates = self._candidates(query)
+            candidate_count += len(candidates)
+            matches = process.extract(
+                query,
+                self._processed,
+                scorer=scorer,
+                limit=None,
+                score_cutoff=score_cutoff,
+                scorer_kwargs=scorer_kwargs,
+            )
+            match_count += len(matches)
+            found_count += len(self._verify(query, candidates, scorer, None, score_cutoff, None, scorer_kwargs))
+
+        return {
+            "queries": query_count,
+            "candidates": candidate_count / query_count if query_count else 0.0,
+            "candidate_ratio": candidate_count / (query_count * len(self)) if query_count and len(self) else 0.0,
+            "matches": match_count,
+            "recall": found_count / match_count if match_count else 1.0,
+        }
+
+
+class TfidfIndex(_ChoiceIndex):
+    """
+    Index of TF-IDF weighted q-gram vectors of the choices, which is used as fast pre-filter
+    for expensive scorers like `fuzz.WRatio`.
+
+    A search retrieves the ``candidates`` choices with the highest cosine similarity between
+    their q-gram vector and the q-gram vector of the query and only scores these candidates
+    with the scorer. Q-grams occurring in many choices have a low weight, so the candidates
+    are the choices sharing the rare parts of the query. The cosine similarities of all
+    choices are calculated as a single sparse matrix-vector product over the inverted lists
+    of the q-grams of the query. This requires numpy.
+
+    Parameters
+    ----------
+    choices : Iterable[Sequence[Hashable]] | Mapping[Sequence[Hashable]]
+        list of all strings the queries should be compared with or dict with a mapping
+        {<result>: <string to compare>}
+    q : int, optional
+        length of the q-grams. Default is 3.
+    processor : Callable, optional
+        Optional callable that is used to preprocess the choices. Default is None,
+        which deactivates this behaviour.
+
+    Notes
+    -----
+    The index is approximate: a choice with a high score is missed when it is not among the
+    candidates, while the scores of the returned choices are exact. Choices sharing no q-gram
+    with the query are never candidates. Like for `process.PreparedChoices` the processor
+    passed to `extract` and `extractOne` is only applied to the query and not to the
+    indexed choices.
+
+    Examples
+    --------
+
+    >>> from rapidfuzz.index import TfidfIndex
+    >>> index = TfidfIndex(["new york mets", "new york yankees", "atlanta braves", "mets new york"])
+    >>> index.extract("new york mets", candidates=2, limit=None)
+    [('new york mets', 100.0, 0), ('mets new york', 95.0, 3)]
+    """
+
+    def __init__(self, choices, *, q=3, processor=None):
+        import numpy as np
+
+        if q < 1:
+            msg = "q has to be at least 1"
+            raise ValueError(msg)
+
+        super().__init__(choices, processor)
+        self.q = q
+
+        choice_count = len(self._processed)
+        if not choice_count:
+            self._vocab = np.empty(0, dtype=np.uint64)
+            self._idf = np.empty(0, dtype=np.float64)
+            self._term_starts = np.zeros(1, dtype=np.intp)
+            self._docs = np.empty(0, dtype=np.intp)
+            self._weights = np.empty(0, dtype=np.float32)
+            return
+
+        hashes, offsets = _shingle_hashes(self._processed, q)
+        docs = np.repeat(np.arange(choice_count), np.diff(offsets, append=len(hashes)))
+        self._vocab, terms = np.unique(hashes, return_inverse=True)
+
+        # frequency of every q-gram in every choice, sorted by q-gram and choice
+        pairs, tf = np.unique(terms.astype(np.int64) * choice_count + docs, return_counts=True)
+        terms, docs = np.divmod(pairs, choice_count)
+        df = np.bincount(terms, minlength=len(self._vocab))
+        self._idf = np.log((1 + choice_count) / (1 + df)) + 1
+
+        weights = tf * self._idf[terms]
+        weights /= np.sqrt(np.bincount(docs, weights * weights, minlength=choice_count))[docs]
+        self._term_starts = np.concatenate(([0], np.cumsum(df)))
+        self._docs = docs.astype(np.int32 if choice_count < 2**31 else np.int64)
+        self._weights = weights.astype(np.float32)
+
+    def _candidates(self, query, candidates):
+        """
+        positions of the choices with the highest cosine similarity to the query in
+        ascending order. On equal similarity the first choices are selected.
+        """
+        import numpy as np
+
+        hashes, _ = _shingle_hashes([query], self.q)
+        terms, tf = np.unique(hashes, return_counts=True)
+        pos = np.searchsorted(self._vocab, terms)
+        known = pos < len(self._vocab)
+        known[known] = self._vocab[pos[known]] == terms[known]
+
+        # q-grams, which are not part of any choice, only contribute to the norm of the query
+        weights = tf * np.where(known, self._idf[np.minimum(pos, len(self._idf) - 1)], np.log(1 + len(self)) + 1)
+        weights /= np.sqrt(np.dot(weights, weights))
+
+        lists = [
+            (self._term_starts[term], self._term_starts[term + 1], weight)
+            for term, weight in zip(pos[known].tolist(), weights[known].tolist())
+        ]
+        if not lists:
+            return np.empty(0, dtype=np.intp)
+
+        docs = np.concatenate([self._docs[start:end] for start, end, _ in lists])
+        doc_weights = np.concatenate([self._weights[start:end] * weight for start, end, weight in lists])
+        similarity = np.bincount(docs, doc_weights, minlength=len(self))
+
+        matches = np.flatnonzero(similarity > 0)
+        if candidates is None or len(matches) <= candidates:
+            return matches
+
+        threshold = np.partition(similarity, len(similarity) - candidates)[len(similarity) - candidates]
+        better = np.flatnonzero(similarity > threshold)
+        equal = np.flatnonzero(similarity == threshold)[: candidates - len(better)]
+        return np.sort(np.concatenate((better, equal)))
+
+    def extract(
+        self,
+        query,
+        *,
+        scorer=WRatio,
+        processor=None,
+        limit=5,
+        candidates=100,
+        score_cutoff=None,
+        score_hint=None,
+        scorer_kwargs=None,
+    ):
+        """
+        Find the best matches in the index. The list is sorted by the similarity.
+        When multiple choices have the same similarity, they are sorted by their index.
+        The result is the same as for `process.extract` on the candidates of the query.
+
+        Parameters
+        ----------
+        query : Sequence[Hashable]
+            string we want to find
+        scorer : Callable, optional
+            Optional callable that is used to calculate the matching score between
+            the query and each candidate. This can be any scorer supported by `process.extract`.
+            Default is `fuzz.WRatio`.
+        processor : Callable, optional
+            Optional callable that is used to preprocess the query. Default is None,
+            which deactivates this behaviour.
+        limit : int, optional
+            maximum amount of results to return. None can be passed to disable this behavior.
+            Default is 5.
+        candidates : int, optional
+            amount of choices with the highest cosine similarity, which are scored.
+            None scores all choices sharing a q-gram with the query. Default is 100.
+        score_cutoff : Any, optional
+            Optional argument for a score threshold passed to the scorer.
+            Default is None, which deactivates this behaviour.
+        score_hint : Any, optional
+            Optional argument for an expected score to be passed to the scorer.
+            This is used to select a faster implementation. Default is None,
+            which deactivates this behaviour.
+        scorer_kwargs : dict[str, Any], optional
+            any other named parameters are passed to the scorer. This can be used to pass
+            e.g. weights to `Levenshtein.distance`
+
+        Returns
+        -------
+        list[tuple[Sequence[Hashable], Any, Any]]
+            The list of best matches in the same form as returned by `process.extract`
+        """
+        setupPandas()
+        if candidates is not None and candidates < 1:
+            msg = "candidates has to be at least 1"
+            raise ValueError(msg)
+
+        if is_none(query) or not len(self):
+            return []
+
+        if processor is not None:
+            query = processor(query)
+
+        candidates = self._candidates(query, candidates)
+        return self._verify(query, candidates, scorer, limit, score_cutoff, score_hint, scorer_kwargs)
+
+    def extractOne(
+        self,
+        query,
+        *,
+        scorer=WRatio,
+        processor=None,
+        candidates=100,
+        score_cutoff=None,
+        score_hint=None,
+        scorer_kwargs=None,
+    ):
+        """
+        Find the best match in the index. When multiple choices have the same similarity,
+        the first one is returned. The arguments are the same as for `TfidfIndex.extract`.
+
+        Returns
+        -------
+        tuple[Sequence[Hashable], Any, Any] | None
+            The best match in the same form as returned by `process.extractOne` or None
+            when no candidate passes the score_cutoff
+        """
+        res = self.extract(
+            query,
+            scorer=scorer,
+            processor=processor,
+            limit=1,
+            candidates=candidates,
+            score_cutoff=score_cutoff,
+            score_hint=score_hint,
+            scorer_kwargs=scorer_kwargs,
+        )
+        return res[0] if res else None
@@ -0,0 +1,260 @@
+from __future__ import annotations
+
+from collections.abc import Hashable, Iterable, Mapping, Sequence
+from typing import Any, Callable
+
+from rapidfuzz.distance import Levenshtein, Prefix
+from rapidfuzz.fuzz import WRatio, ratio, token_set_ratio
+
+class QGramIndex:
+    processor: Callable[..., Sequence[Hashable]] | None
+    q: int
+    def __init__(
+        self,
+        choices: Iterable[Any | None] | Mapping[Any, Any | None],
+        *,
+        q: int = 2,
+        processor: Callable[..., Sequence[Hashable]] | None = None,
+    ) -> None: ...
+    def __len__(self) -> int: ...
+    def extract(
+        self,
+        query: Any | None,
+        *,
+        scorer: Callable[..., float] = ratio,
+        processor: Callable[..., Sequence[Hashable]] | None = None,
+        limit: int | None = 5,
+        score_cutoff: float | None = None,
+        score_hint: float | None = None,
+        scorer_kwargs: dict[str, Any] | None = None,
+    ) -> list[tuple[Any, Any, Any]]: ...
+    def extractOne(
+        self,
+        query: Any | None,
+        *,
+        scorer: Callable[..., float] = ratio,
+        processor: Callable[..., Sequence[Hashable]] | None = None,
+        score_cutoff: float | None = None,
+        score_hint: float | None = None,
+        scorer_kwargs: dict[str, Any] | None = None,
+    ) -> tuple[Any, Any, Any] | None: ...
+
+class BKTree:
+    processor: Callable[..., Sequence[Hashable]] | None
+    scorer: Callable[..., int]
+    scorer_kwargs: dict[str, Any]
+    def __init__(
+        self,
+        choices: Iterable[Any | None] | Mapping[Any, Any | None],
+        *,
+        scorer: Callable[..., int] = Levenshtein.distance,
+        processor: Callable[..., Sequence[Hashable]] | None = None,
+        scorer_kwargs: dict[str, Any] | None = None,
+    ) -> None: ...
+    def __len__(self) -> int: ...
+    def extract(
+        self,
+        query: Any | None,
+        *,
+        processor: Callable[..., Sequence[Hashable]] | None = None,
+        limit: int | None = 5,
+        score_cutoff: int | None = None,
+    ) -> list[tuple[Any, int, Any]]: ...
+    def extractOne(
+        self,
+        query: Any | None,
+        *,
+        processor: Callable[..., Sequence[Hashable]] | None = None,
+        score_cutoff: int | None = None,
+    ) -> tuple[Any, int, Any] | None: ...
+
+class TokenIndex:
+    processor: Callable[..., Sequence[Hashable]] | None
+    def __init__(
+        self,
+        choices: Iterable[Any | None] | Mapping[Any, Any | None],
+        *,
+        processor: Callable[..., Sequence[Hashable]] | None = None,
+    ) -> None: ...
+    def __len__(self) -> int: ...
+    def extract(
+        self,
+        query: Any | None,
+        *,
+        scorer: Callable[..., float] = token_set_ratio,
+        processor: Callable[..., Sequence[Hashable]] | None = None,
+        limit: int | None = 5,
+        score_cutoff: float | None = None,
+        score_hint: float | None = None,
+        scorer_kwargs: dict[str, Any] | None = None,
+        min_overlap: float = 0.0,
+    ) -> list[tuple[Any, Any, Any]]: ...
+    def extractOne(
+        self,
+        query: Any | None,
+        *,
+        scorer: Callable[..., float] = token_set_ratio,
+        processor: Callable[..., Sequence[Hashable]] | None = None,
+        score_cutoff: float | None = None,
+        score_hint: float | None = None,
+        scorer_kwargs: dict[str, Any] | None = None,
+        min_overlap: float = 0.0,
+    ) -> tuple[Any, Any, Any] | None: ...
+
+class DeletionIndex:
+    processor: Callable[..., Sequence[Hashable]] | None
+    max_distance: int
+    prefix_length: int | None
+    def __init__(
+        self,
+        choices: Iterable[Any | None] | Mapping[Any, Any | None],
+        *,
+        max_distance: int = 2,
+        prefix_length: int | None = None,
+        processor: Callable[..., Sequence[Hashable]] | None = None,
+    ) -> None: ...
+    def __len__(self) -> int: ...
+    def extract(
+        self,
+        query: Any | None,
+        *,
+        scorer: Callable[..., int] = Levenshtein.distance,
+        processor: Callable[..., Sequence[Hashable]] | None = None,
+        limit: int | None = 5,
+        score_cutoff: int | None = None,
+        score_hint: int | None = None,
+        scorer_kwargs: dict[str, Any] | None = None,
+    ) -> list[tuple[Any, int, Any]]: ...
+    def extractOne(
+        self,
+        query: Any | None,
+        *,
+        scorer: Callable[..., int] = Levenshtein.distance,
+        processor: Callable[..., Sequence[Hashable]] | None = None,
+        score_cutoff: int | None = None,
+        score_hint: int | None = None,
+        scorer_kwargs: dict[str, Any] | None = None,
+    ) -> tuple[Any, int, Any] | None: ...
+
+class PrefixIndex:
+    processor: Callable[..., Sequence[Hashable]] | None
+    def __init__(
+        self,
+        choices: Iterable[Any | None] | Mapping[Any, Any | None],
+        *,
+        processor: Callable[..., Sequence[Hashable]] | None = None,
+    ) -> None: ...
+    def __len__(self) -> int: ...
+    def extract(
+        self,
+        query: Any | None,
+        *,
+        scorer: Callable[..., float] = Prefix.similarity,
+        processor: Callable[..., Sequence[Hashable]] | None = None,
+        limit: int | None = 5,
+        score_cutoff: float | None = None,
+        score_hint: float | None = None,
+        scorer_kwargs: dict[str, Any] | None = None,
+    ) -> list[tuple[Any, Any, Any]]: ...
+    def extractOne(
+        self,
+        query: Any | None,
+        *,
+        scorer: Callable[..., float] = Prefix.similarity,
+        processor: Callable[..., Sequence[Hashable]] | None = None,
+        score_cutoff: float | None = None,
+        score_hint: float | None = None,
+        scorer_kwargs: dict[str, Any] | None = None,
+    ) -> tuple[Any, Any, Any] | None: ...
+
+class MinHashIndex:
+    processor: Callable[..., Sequence[Hashable]] | None
+    q: int
+    bands: int
+    rows: int
+    seed: int
+    def __init__(
+        self,
+        choices: Iterable[Any | None] | Mapping[Any, Any | None],
+        *,
+        q: int = 3,
+        bands: int = 32,
+        rows: int = 3,
+        seed: int = 0,
+        processor: Callable[..., Sequence[Hashable]] | None = None,
+    ) -> None: ...
+    def __len__(self) -> int: ...
+    def candidate_probability(self, similarity: float) -> float: ...
+    def extract(
+        self,
+        query: Any | None,
+        *,
+        scorer: Callable[..., float] = ratio,
+        processor: Callable[..., Sequence[Hashable]] | None = None,
+        limit: int | None = 5,
+        score_cutoff: float | None = None,
+        score_hint: float | None = None,
+        scorer_kwargs: dict[str, Any] | None = None,
+    ) -> list[tuple[Any, Any, Any]]: ...
+    def extractOne(
+        self,
+        query: Any | None,
+        *,
+        scorer: Callable[..., float] = ratio,
+        processor: Callable[..., Sequence[Hashable]] | None = None,
+        score_cutoff: float | None = None,
+        score_hint: float | None = None,
+        scorer_kwargs: dict[str, Any] | None = None,
+    ) -> tuple[Any, Any, Any] | None: ...
+    def pairs(
+        self,
+        *,
+        scorer: Callable[..., float] = ratio,
+        score_cutoff: float | None = None,
+        scorer_kwargs: dict[str, Any] | None = None,
+        workers: int = 1,
+    ) -> list[tuple[Any, Any, Any]]: ...
+    def evaluate(
+        self,
+        queries: Iterable[Any | None],
+        *,
+        scorer: Callable[..., float] = ratio,
+        processor: Callable[..., Sequence[Hashable]] | None = None,
+        score_cutoff: float | None = None,
+        scorer_kwargs: dict[str, Any] | None = None,
+    ) -> dict[str, float]: ...
+
+class TfidfIndex:
+    processor: Callable[..., Sequence[Hashable]] | None
+    q: int
+    def __init__(
+        self,
+        choices: Iterable[Any | None] | Mapping[Any, Any | None],
+        *,
+        q: int = 3,
+        processor: Callable[..., Sequence[Hashable]] | None = None,
+    ) -> None: ...
+    def __len__(self) -> int: ...
+    def extract(
+        self,
+        query: Any | None,
+        *,
+        scorer: Callable[..., float] = WRatio,
+        processor: Callable[..., Sequence[Hashable]] | None = None,
+        limit: int | None = 5,
+        candidates: int | None = 100,
+        score_cutoff: float | None = None,
+        score_hint: float | None = None,
+        scorer_kwargs: dict[str, Any] | None = None,
+    ) -> list[tuple[Any, Any, Any]]: ...
+    def extractOne(
+        self,
+        query: Any | None,
+        *,
+        scorer: Callable[..., float] = WRatio,
+        processor: Callable[..., Sequence[Hashable]] | None = None,
+        candidates: int | None = 100,
+        score_cutoff: float | None = None,
+        score_hint: float | None = None,
+        scorer_kwargs: dict[str, Any] | None = None,
+    ) -> tuple[Any, Any, Any] | None: ...
@@ -8,7 +8,19 @@ import os
 
 from rapidfuzz._feature_detector import AVX2, SSE2, supports
 
-__all__ = ["cdist", "cpdist", "extract", "extractOne", "extract_iter"]
+__all__ = [
+    "MutablePreparedChoices",
+    "PreparedChoices",
+    "QueryCache",
+    "ResultCache",
+    "cdist",
+    "cdist_iter",
+    "cpdist",
+    "extract",
+    "extractOne",
+    "extract_iter",
+    "set_thread_pool",
+]
 
 _impl = os.environ.get("RAPIDFUZZ_IMPLEMENTATION")
 if _impl == "cpp":
@@ -16,11 +28,17 @@ if _impl == "cpp":
     if supports(AVX2):
         with contextlib.suppress(ImportError):
             from rapidfuzz.process_cpp_avx2 import (  # pyright: ignore[reportMissingImports]
+                MutablePreparedChoices,
+                PreparedChoices,
+                QueryCache,
+                ResultCache,
                 cdist,
+                cdist_iter,
                 cpdist,
                 extract,
                 extract_iter,
                 extractOne,
+                set_thread_pool,
             )
 
             imported = True
@@ -28,35 +46,65 @@ if _impl == "cpp":
     if not imported and supports(SSE2):
         with contextlib.suppress(ImportError):
             from rapidfuzz.process_cpp_sse2 import (  # pyright: ignore[reportMissingImports]
+                MutablePreparedChoices,
+                PreparedChoices,
+                QueryCache,
+                ResultCache,
                 cdist,
+                cdist_iter,
                 cpdist,
                 extract,
                 extract_iter,
                 extractOne,
+                set_thread_pool,
             )
 
             imported = True
 
     if not imported:
         from rapidfuzz.process_cpp import (  # pyright: ignore[reportMissingImports]
+            MutablePreparedChoices,
+            PreparedChoices,
+            QueryCache,
+            ResultCache,
             cdist,
+            cdist_iter,
             cpdist,
             extract,
             extract_iter,
             extractOne,
+            set_thread_pool,
         )
 elif _impl == "python":
-    from rapidfuzz.process_py import cdist, cpdist, extract, extract_iter, extractOne
+    from rapidfuzz.process_py import (
+        MutablePreparedChoices,
+        PreparedChoices,
+        QueryCache,
+        ResultCache,
+        cdist,
+        cdist_iter,
+        cpdist,
+        extract,
+        extract_iter,
+        extractOne,
+        set_thread_pool,
+    )
 else:
     imported = False
     if supports(AVX2):
         with contextlib.suppress(ImportError):
             from rapidfuzz.process_cpp_avx2 import (  # pyright: ignore[reportMissingImports]
+                MutablePreparedChoices,
+                PreparedChoices,
+                QueryCache,
+                ResultCache,
                 cdist,
+                cdist_iter,
                 cpdist,
                 extract,
                 extract_iter,
                 extractOne,
+                set_thread_pool,
             )
 
             imported = True
@@ -64,11 +112,17 @@ else:
     if not imported and supports(SSE2):
         with contextlib.suppress(ImportError):
             from rapidfuzz.process_cpp_sse2 import (  # pyright: ignore[reportMissingImports]
+                MutablePreparedChoices,
+                PreparedChoices,
+                QueryCache,
+                ResultCache,
                 cdist,
+                cdist_iter,
                 cpdist,
                 extract,
                 extract_iter,
                 extractOne,
+                set_thread_pool,
             )
 
             imported = True
@@ -76,20 +130,32 @@ else:
     if not imported:
         with contextlib.suppress(ImportError):
             from rapidfuzz.process_cpp import (  # pyright: ignore[reportMissingImports]
+                MutablePreparedChoices,
+                PreparedChoices,
+                QueryCache,
+                ResultCache,
                 cdist,
+                cdist_iter,
                 cpdist,
                 extract,
                 extract_iter,
                 extractOne,
+                set_thread_pool,
             )
 
             imported = True
 
     if not imported:
         from rapidfuzz.process_py import (
+            MutablePreparedChoices,
+            PreparedChoices,
+            QueryCache,
+            ResultCache,
             cdist,
+            cdist_iter,
             cpdist,
             extract,
             extract_iter,
             extractOne,
+            set_thread_pool,
         )
@@ -1,9 +1,11 @@
 from __future__ import annotations
 
+import os
 from collections.abc import Collection, Generator, Hashable, Iterable, Mapping, Sequence
 from typing import (
     Any,
     Callable,
+    Literal,
     Protocol,
     TypeVar,
     overload,
@@ -29,6 +31,73 @@ class _Scorer(Protocol[_StringType1_contra, _StringType2_contra, _ResultType_con
         self, __s1: _StringType1_contra, __s2: _StringType2_contra, *, score_cutoff: _ResultType_contra | None
     ) -> _ResultType_co: ...
 
+class ResultCache:
+    def __init__(
+        self,
+        maxsize: int = 1024,
+        *,
+        ttl: float | None = None,
+        max_memory: int | None = None,
+        timer: Callable[[], float] = ...,
+    ) -> None: ...
+    @property
+    def maxsize(self) -> int: ...
+    @property
+    def ttl(self) -> float | None: ...
+    @property
+    def max_memory(self) -> int | None: ...
+    @property
+    def memory(self) -> int: ...
+    @property
+    def hits(self) -> int: ...
+    @property
+    def misses(self) -> int: ...
+    def __len__(self) -> int: ...
+    def clear(self) -> None: ...
+
+class PreparedChoices:
+    processor: Callable[..., Sequence[Hashable]] | None
+    result_cache: ResultCache | None
+    def __init__(
+        self,
+        choices: Iterable[Any | None] | Mapping[Any, Any | None],
+        *,
+        processor: Callable[..., Sequence[Hashable]] | None = None,
+        result_cache: ResultCache | None = None,
+    ) -> None: ...
+    def __len__(self) -> int: ...
+    @property
+    def version(self) -> int: ...
+    def save(self, path: str | os.PathLike[str]) -> None: ...
+    @classmethod
+    def load(cls, path: str | os.PathLike[str], *, allow_pickle: bool = False) -> PreparedChoices: ...
+
+class MutablePreparedChoices(PreparedChoices):
+    def __init__(
+        self,
+        choices: Iterable[Any | None] | Mapping[Any, Any | None] = (),
+        *,
+        processor: Callable[..., Sequence[Hashable]] | None = None,
+        result_cache: ResultCache | None = None,
+    ) -> None: ...
+    def __contains__(self, key: Hashable) -> bool: ...
+    def __getitem__(self, key: Hashable) -> Any: ...
+    def add(self, key: Hashable, choice: Any | None) -> None: ...
+    def update(self, choices: Mapping[Any, Any | None] | Iterable[tuple[Any, Any | None]]) -> None: ...
+    def remove(self, key: Hashable) -> None: ...
+    def compact(self) -> None: ...
+
+class QueryCache:
+    def __init__(self, maxsize: int = 128) -> None: ...
+    @property
+    def maxsize(self) -> int: ...
+    @property
+    def hits(self) -> int: ...
+    @property
+    def misses(self) -> int: ...
+    def __len__(self) -> int: ...
+    def clear(self) -> None: ...
+
 # mypy wants defaults to be valid for every possible parameterization of a generic function
 # so add separate overloads for the default version
 @overload
@@ -40,7 +109,9 @@ def extractOne(
     processor: None = None,
     score_cutoff: float | None = None,
     score_hint: float | None = None,
+    workers: int = 1,
     scorer_kwargs: dict[str, Any] | None = None,
+    query_cache: QueryCache | None = None,
 ) -> tuple[_StringType2, float, _KeyType]: ...
 @overload
 def extractOne(
@@ -51,7 +122,9 @@ def extractOne(
     processor: None = None,
     score_cutoff: float | None = None,
     score_hint: float | None = None,
+    workers: int = 1,
     scorer_kwargs: dict[str, Any] | None = None,
+    query_cache: QueryCache | None = None,
 ) -> tuple[_StringType2, float, int]: ...
 @overload
 def extractOne(
@@ -62,7 +135,9 @@ def extractOne(
     processor: Callable[[_UnprocessedType1 | _UnprocessedType2], Sequence[Hashable]],
     score_cutoff: float | None = None,
     score_hint: float | None = None,
+    workers: int = 1,
     scorer_kwargs: dict[str, Any] | None = None,
+    query_cache: QueryCache | None = None,
 ) -> tuple[_UnprocessedType2, float, _KeyType]: ...
 @overload
 def extractOne(
@@ -73,7 +148,9 @@ def extractOne(
     processor: Callable[[_UnprocessedType1 | _UnprocessedType2], Sequence[Hashable]],
     score_cutoff: float | None = None,
     score_hint: float | None = None,
+    workers: int = 1,
     scorer_kwargs: dict[str, Any] | None = None,
+    query_cache: QueryCache | None = None,
 ) -> tuple[_UnprocessedType2, float, int]: ...
 @overload
 def extractOne(
@@ -84,7 +161,9 @@ def extractOne(
     processor: None = None,
     score_cutoff: _ResultType | None = None,
     score_hint: _ResultType | None = None,
+    workers: int = 1,
     scorer_kwargs: dict[str, Any] | None = None,
+    query_cache: QueryCache | None = None,
 ) -> tuple[_StringType2, _ResultType, _KeyType]: ...
 @overload
 def extractOne(
@@ -95,7 +174,9 @@ def extractOne(
     processor: None = None,
     score_cutoff: _ResultType | None = None,
     score_hint: _ResultType | None = None,
+    workers: int = 1,
     scorer_kwargs: dict[str, Any] | None = None,
+    query_cache: QueryCache | None = None,
 ) -> tuple[_StringType2, _ResultType, int]: ...
 @overload
 def extractOne(
@@ -106,7 +187,9 @@ def extractOne(
     processor: Callable[[_UnprocessedType1 | _UnprocessedType2], _StringType1],
     score_cutoff: _ResultType | None = None,
     score_hint: _ResultType | None = None,
+    workers: int = 1,
     scorer_kwargs: dict[str, Any] | None = None,
+    query_cache: QueryCache | None = None,
 ) -> tuple[_UnprocessedType2, _ResultType, _KeyType]: ...
 @overload
 def extractOne(
@@ -117,8 +200,23 @@ def extractOne(
     processor: Callable[[_UnprocessedType1 | _UnprocessedType2], _StringType1],
     score_cutoff: _ResultType | None = None,
     score_hint: _ResultType | None = None,
+    workers: int = 1,
     scorer_kwargs: dict[str, Any] | None = None,
+    query_cache: QueryCache | None = None,
 ) -> tuple[_UnprocessedType2, _ResultType, int]: ...
+@overload
+def extractOne(
+    query: Any | None,
+    choices: PreparedChoices,
+    *,
+    scorer: Callable[..., Any] = WRatio,
+    processor: Callable[..., Sequence[Hashable]] | None = None,
+    score_cutoff: Any | None = None,
+    score_hint: Any | None = None,
+    workers: int = 1,
+    scorer_kwargs: dict[str, Any] | None = None,
+    query_cache: QueryCache | None = None,
+) -> tuple[Any, Any, Any] | None: ...
 
 # mypy wants defaults to be valid for every possible parameterization of a generic function
 # so add separate overloads for the default version
@@ -132,7 +230,9 @@ def extract(
     limit: int | None = 5,
     score_cutoff: float | None = None,
     score_hint: float | None = None,
+    workers: int = 1,
     scorer_kwargs: dict[str, Any] | None = None,
+    query_cache: QueryCache | None = None,
 ) -> list[tuple[_StringType2, float, _KeyType]]: ...
 @overload
 def extract(
@@ -144,7 +244,9 @@ def extract(
     limit: int | None = 5,
     score_cutoff: float | None = None,
     score_hint: float | None = None,
+    workers: int = 1,
     scorer_kwargs: dict[str, Any] | None = None,
+    query_cache: QueryCache | None = None,
 ) -> list[tuple[_StringType2, float, int]]: ...
 @overload
 def extract(
@@ -156,7 +258,9 @@ def extract(
     limit: int | None = 5,
     score_cutoff: float | None = None,
     score_hint: float | None = None,
+    workers: int = 1,
     scorer_kwargs: dict[str, Any] | None = None,
+    query_cache: QueryCache | None = None,
 ) -> list[tuple[_UnprocessedType2, float, _KeyType]]: ...
 @overload
 def extract(
@@ -168,7 +272,9 @@ def extract(
     limit: int | None = 5,
     score_cutoff: float | None = None,
     score_hint: float | None = None,
+    workers: int = 1,
     scorer_kwargs: dict[str, Any] | None = None,
+    query_cache: QueryCache | None = None,
 ) -> list[tuple[_UnprocessedType2, float, int]]: ...
 @overload
 def extract(
@@ -180,7 +286,9 @@ def extract(
     limit: int | None = 5,
     score_cutoff: _ResultType | None = None,
     score_hint: _ResultType | None = None,
+    workers: int = 1,
     scorer_kwargs: dict[str, Any] | None = None,
+    query_cache: QueryCache | None = None,
 ) -> list[tuple[_StringType2, _ResultType, _KeyType]]: ...
 @overload
 def extract(
@@ -192,7 +300,9 @@ def extract(
     limit: int | None = 5,
     score_cutoff: _ResultType | None = None,
     score_hint: _ResultType | None = None,
+    workers: int = 1,
     scorer_kwargs: dict[str, Any] | None = None,
+    query_cache: QueryCache | None = None,
 ) -> list[tuple[_StringType2, _ResultType, int]]: ...
 @overload
 def extract(
@@ -204,7 +314,9 @@ def extract(
     limit: int | None = 5,
     score_cutoff: _ResultType | None = None,
     score_hint: _ResultType | None = None,
+    workers: int = 1,
     scorer_kwargs: dict[str, Any] | None = None,
+    query_cache: QueryCache | None = None,
 ) -> list[tuple[_UnprocessedType2, _ResultType, _KeyType]]: ...
 @overload
 def extract(
@@ -216,8 +328,24 @@ def extract(
     limit: int | None = 5,
     score_cutoff: _ResultType | None = None,
     score_hint: _ResultType | None = None,
+    workers: int = 1,
     scorer_kwargs: dict[str, Any] | None = None,
+    query_cache: QueryCache | None = None,
 ) -> list[tuple[_UnprocessedType2, _ResultType, int]]: ...
+@overload
+def extract(
+    query: Any | None,
+    choices: PreparedChoices,
+    *,
+    scorer: Callable[..., Any] = WRatio,
+    processor: Callable[..., Sequence[Hashable]] | None = None,
+    limit: int | None = 5,
+    score_cutoff: Any | None = None,
+    score_hint: Any | None = None,
+    workers: int = 1,
+    scorer_kwargs: dict[str, Any] | None = None,
+    query_cache: QueryCache | None = None,
+) -> list[tuple[Any, Any, Any]]: ...
 
 # mypy wants defaults to be valid for every possible parameterization of a generic function
 # so add separate overloads for the default version
@@ -231,6 +359,7 @@ def extract_iter(
     score_cutoff: float | None = None,
     score_hint: float | None = None,
     scorer_kwargs: dict[str, Any] | None = None,
+    query_cache: QueryCache | None = None,
 ) -> Generator[tuple[_StringType2, float, _KeyType], None, None]: ...
 @overload
 def extract_iter(
@@ -242,6 +371,7 @@ def extract_iter(
     score_cutoff: float | None = None,
     score_hint: float | None = None,
     scorer_kwargs: dict[str, Any] | None = None,
+    query_cache: QueryCache | None = None,
 ) -> Generator[tuple[_StringType2, float, int], None, None]: ...
 @overload
 def extract_iter(
@@ -253,6 +383,7 @@ def extract_iter(
     score_cutoff: float | None = None,
     score_hint: float | None = None,
     scorer_kwargs: dict[str, Any] | None = None,
+    query_cache: QueryCache | None = None,
 ) -> Generator[tuple[_UnprocessedType2, float, _KeyType], None, None]: ...
 @overload
 def extract_iter(
@@ -264,6 +395,7 @@ def extract_iter(
     score_cutoff: float | None = None,
     score_hint: float | None = None,
     scorer_kwargs: dict[str, Any] | None = None,
+    query_cache: QueryCache | None = None,
 ) -> Generator[tuple[_UnprocessedType2, float, int], None, None]: ...
 @overload
 def extract_iter(
@@ -275,6 +407,7 @@ def extract_iter(
     score_cutoff: _ResultType | None = None,
     score_hint: _ResultType | None = None,
     scorer_kwargs: dict[str, Any] | None = None,
+    query_cache: QueryCache | None = None,
 ) -> Generator[tuple[_StringType2, _ResultType, _KeyType], None, None]: ...
 @overload
 def extract_iter(
@@ -286,6 +419,7 @@ def extract_iter(
     score_cutoff: _ResultType | None = None,
     score_hint: _ResultType | None = None,
     scorer_kwargs: dict[str, Any] | None = None,
+    query_cache: QueryCache | None = None,
 ) -> Generator[tuple[_StringType2, _ResultType, int], None, None]: ...
 @overload
 def extract_iter(
@@ -297,6 +431,7 @@ def extract_iter(
     score_cutoff: _ResultType | None = None,
     score_hint: _ResultType | None = None,
     scorer_kwargs: dict[str, Any] | None = None,
+    query_cache: QueryCache | None = None,
 ) -> Generator[tuple[_UnprocessedType2, _ResultType, _KeyType], None, None]: ...
 @overload
 def extract_iter(
@@ -308,15 +443,34 @@ def extract_iter(
     score_cutoff: _ResultType | None = None,
     score_hint: _ResultType | None = None,
     scorer_kwargs: dict[str, Any] | None = None,
+    query_cache: QueryCache | None = None,
 ) -> Generator[tuple[_UnprocessedType2, _ResultType, int], None, None]: ...
+@overload
+def extract_iter(
+    query: Any | None,
+    choices: PreparedChoices,
+    *,
+    scorer: Callable[..., Any] = WRatio,
+    processor: Callable[..., Sequence[Hashable]] | None = None,
+    score_cutoff: Any | None = None,
+    score_hint: Any | None = None,
+    scorer_kwargs: dict[str, Any] | None = None,
+    query_cache: QueryCache | None = None,
+) -> Generator[tuple[Any, Any, Any], None, None]: ...
+
+class ThreadPoolContext:
+    def __enter__(self) -> ThreadPoolContext: ...
+    def __exit__(self, *args: object) -> None: ...
+
+def set_thread_pool(workers: int | None = None) -> ThreadPoolContext: ...
 
 try:
     import numpy as np
 
     @overload
     def cdist(
-        queries: Iterable[Sequence[Hashable] | None],
-        choices: Iterable[Sequence[Hashable] | None],
+        queries: Iterable[Sequence[Hashable] | None] | PreparedChoices,
+        choices: Iterable[Sequence[Hashable] | None] | PreparedChoices,
         *,
         scorer: _Scorer[Sequence[Hashable], Sequence[Hashable], float, float] = ratio,
         processor: None = None,
@@ -325,12 +479,15 @@ try:
         score_multiplier: float = 1,
         dtype: np.dtype | None = None,
         workers: int = 1,
+        limit: None = None,
+        output: Literal["dense"] = "dense",
+        out: np.ndarray | None = None,
         scorer_kwargs: dict[str, Any] | None = None,
     ) -> np.ndarray: ...
     @overload
     def cdist(
-        queries: Iterable[_UnprocessedType1 | None],
-        choices: Iterable[_UnprocessedType2 | None],
+        queries: Iterable[_UnprocessedType1 | None] | PreparedChoices,
+        choices: Iterable[_UnprocessedType2 | None] | PreparedChoices,
         *,
         scorer: _Scorer[Sequence[Hashable], Sequence[Hashable], float, float] = ratio,
         processor: Callable[[_UnprocessedType1 | _UnprocessedType2], Sequence[Hashable]],
@@ -339,12 +496,15 @@ try:
         score_multiplier: float = 1,
         dtype: np.dtype | None = None,
         workers: int = 1,
+        limit: None = None,
+        output: Literal["dense"] = "dense",
+        out: np.ndarray | None = None,
         scorer_kwargs: dict[str, Any] | None = None,
     ) -> np.ndarray: ...
     @overload
     def cdist(
-        queries: Iterable[_StringType1 | None],
-        choices: Iterable[_StringType2 | None],
+        queries: Iterable[_StringType1 | None] | PreparedChoices,
+        choices: Iterable[_StringType2 | None] | PreparedChoices,
         *,
         scorer: _Scorer[_StringType1, _StringType2, _ResultType, _ResultType],
         processor: None = None,
@@ -353,12 +513,15 @@ try:
         score_multiplier: _ResultType = 1,
         dtype: np.dtype | None = None,
         workers: int = 1,
+        limit: None = None,
+        output: Literal["dense"] = "dense",
+        out: np.ndarray | None = None,
         scorer_kwargs: dict[str, Any] | None = None,
     ) -> np.ndarray: ...
     @overload
     def cdist(
-        queries: Iterable[_UnprocessedType1 | None],
-        choices: Iterable[_UnprocessedType2 | None],
+        queries: Iterable[_UnprocessedType1 | None] | PreparedChoices,
+        choices: Iterable[_UnprocessedType2 | None] | PreparedChoices,
         *,
         scorer: _Scorer[_StringType1, _StringType1, _ResultType, _ResultType],
         processor: Callable[[_UnprocessedType1 | _UnprocessedType2], _StringType1],
@@ -367,12 +530,63 @@ try:
         score_multiplier: _ResultType = 1,
         dtype: np.dtype | None = None,
         workers: int = 1,
+        limit: None = None,
+        output: Literal["dense"] = "dense",
+        out: np.ndarray | None = None,
         scorer_kwargs: dict[str, Any] | None = None,
     ) -> np.ndarray: ...
     @overload
+    def cdist(
+        queries: Iterable[Any | None] | PreparedChoices,
+        choices: Iterable[Any | None] | PreparedChoices,
+        *,
+        scorer: Callable[..., Any] = ratio,
+        processor: Callable[..., Sequence[Hashable]] | None = None,
+        score_cutoff: Any | None = None,
+        score_hint: Any | None = None,
+        score_multiplier: Any = 1,
+        dtype: np.dtype | None = None,
+        workers: int = 1,
+        limit: int,
+        output: Literal["dense"] = "dense",
+        out: None = None,
+        scorer_kwargs: dict[str, Any] | None = None,
+    ) -> tuple[np.ndarray, np.ndarray]: ...
+    @overload
+    def cdist(
+        queries: Iterable[Any | None] | PreparedChoices,
+        choices: Iterable[Any | None] | PreparedChoices,
+        *,
+        scorer: Callable[..., Any] = ratio,
+        processor: Callable[..., Sequence[Hashable]] | None = None,
+        score_cutoff: Any | None = None,
+        score_hint: Any | None = None,
+        score_multiplier: Any = 1,
+        dtype: np.dtype | None = None,
+        workers: int = 1,
+        limit: None = None,
+        output: Literal["sparse"],
+        out: None = None,
+        scorer_kwargs: dict[str, Any] | None = None,
+    ) -> Any: ...
+    def cdist_iter(
+        queries: Iterable[Any | None],
+        choices: Iterable[Any | None] | PreparedChoices,
+        *,
+        scorer: Callable[..., Any] = ratio,
+        processor: Callable[..., Sequence[Hashable]] | None = None,
+        score_cutoff: Any | None = None,
+        score_hint: Any | None = None,
+        score_multiplier: Any = 1,
+        dtype: np.dtype | None = None,
+        workers: int = 1,
+        chunk_size: int = 1024,
+        scorer_kwargs: dict[str, Any] | None = None,
+    ) -> Generator[tuple[slice, np.ndarray], None, None]: ...
+    @overload
     def cpdist(
-        queries: Iterable[Sequence[Hashable] | None],
-        choices: Iterable[Sequence[Hashable] | None],
+        queries: Iterable[Sequence[Hashable] | None] | PreparedChoices,
+        choices: Iterable[Sequence[Hashable] | None] | PreparedChoices,
         *,
         scorer: _Scorer[Sequence[Hashable], Sequence[Hashable], float, float] = ratio,
         processor: None = None,
@@ -385,8 +599,8 @@ try:
     ) -> np.ndarray: ...
     @overload
     def cpdist(
-        queries: Iterable[_UnprocessedType1 | None],
-        choices: Iterable[_UnprocessedType2 | None],
+        queries: Iterable[_UnprocessedType1 | None] | PreparedChoices,
+        choices: Iterable[_UnprocessedType2 | None] | PreparedChoices,
         *,
         scorer: _Scorer[Sequence[Hashable], Sequence[Hashable], float, float] = ratio,
         processor: Callable[[_UnprocessedType1 | _UnprocessedType2], Sequence[Hashable]],
@@ -399,8 +613,8 @@ try:
     ) -> np.ndarray: ...
     @overload
     def cpdist(
-        queries: Iterable[_StringType1 | None],
-        choices: Iterable[_StringType2 | None],
+        queries: Iterable[_StringType1 | None] | PreparedChoices,
+        choices: Iterable[_StringType2 | None] | PreparedChoices,
         *,
         scorer: _Scorer[_StringType1, _StringType2, _ResultType, _ResultType],
         processor: None = None,
@@ -413,8 +627,8 @@ try:
     ) -> np.ndarray: ...
     @overload
     def cpdist(
-        queries: Iterable[_UnprocessedType1 | None],
-        choices: Iterable[_UnprocessedType2 | None],
+        queries: Iterable[_UnprocessedType1 | None] | PreparedChoices,
+        choices: Iterable[_UnprocessedType2 | None] | PreparedChoices,
         *,
         scorer: _Scorer[_StringType1, _StringType1, _ResultType, _ResultType],
         processor: Callable[[_UnprocessedType1 | _UnprocessedType2], _StringType1],
@@ -1,11 +1,16 @@
 #pragma once
 #include "cpp_common.hpp"
+#include "utils_cpp.hpp"
 #include "rapidfuzz.h"
 #include "taskflow/taskflow.hpp"
-#include "taskflow/algorithm/for_each.hpp"
+#include <algorithm>
 #include <atomic>
+#include <cstdlib>
 #include <exception>
+#include <limits>
+#include <memory>
 #include <stdexcept>
+#include <utility>
 #include <vector>
 using namespace std::chrono_literals;
 
@@ -61,6 +66,246 @@ struct ListStringElem {
     RF_StringWrapper proc_val;
 };
 
+static inline size_t get_char_size(RF_StringType kind)
+{
+    switch (kind) {
+    case RF_UINT8: return 1;
+    case RF_UINT16: return 2;
+    case RF_UINT32: return 4;
+    case RF_UINT64: return 8;
+    default: throw std::logic_error("Invalid string type");
+    }
+}
+
+/*
+ * copy the preprocessed choices into a single buffer and replace them with views into this buffer.
+ * This releases the memory of the individual strings and keeps all choices close together in memory
+ */
+template <typename StringElem>
+void compact_choices(std::vector<StringElem>& choices, std::vector<uint64_t>& buffer)
+{
+    /* one element more, so empty strings still have a valid data pointer */
+    size_t buffer_size = 1;
+    for (const auto& choice : choices)
+        buffer_size += (choice.proc_val.size() * get_char_size(choice.proc_val.string.kind) + 7) / 8;
+
+    buffer.resize(buffer_size);
+    uint64_t* pos = buffer.data();
+    for (auto& choice : choices) {
+        /* removed choices of a MutablePreparedChoices stay empty */
+        if (choice.proc_val.is_none()) continue;
+
+        size_t byte_count = choice.proc_val.size() * get_char_size(choice.proc_val.string.kind);
+        if (byte_count) memcpy(pos, choice.proc_val.string.data, byte_count);
+
+        RF_String view = choice.proc_val.string;
+        view.dtor = nullptr;
+        view.data = pos;
+        view.context = nullptr;
+        choice.proc_val = RF_StringWrapper(view);
+        pos += (byte_count + 7) / 8;
+    }
+}
+
+/*
+ * create views of the preprocessed choices at their original index.
+ * Choices which are not part of the vector (None) are represented by an empty wrapper
+ */
+template <typename StringElem>
+std::vector<RF_StringWrapper> get_choice_views(const std::vector<StringElem>& choices, size_t choice_count)
+{
+    std::vector<RF_StringWrapper> views(choice_count);
+    for (const auto& choice : choices) {
+        RF_String view = choice.proc_val.string;
+        view.dtor = nullptr;
+        views[static_cast<size_t>(choice.index)] = RF_StringWrapper(view);
+    }
+    return views;
+}
+
+static inline RF_String make_string_view(RF_StringType kind, const void* data, int64_t length)
+{
+    /* empty strings still require a valid data pointer */
+    static const uint64_t empty = 0;
+
+    RF_String view;
+    view.dtor = nullptr;
+    view.kind = kind;
+    view.data = const_cast<void*>(data ? data : &empty);
+    view.length = length;
+    view.context = nullptr;
+    return view;
+}
+
+/*
+ * create views of the elements of a 1-d numpy array with the dtype U or S. Numpy strips
+ * trailing null characters when the elements are accessed, so they are not part of the views
+ */
+template <typename CharT>
+static void numpy_string_choices_impl(std::vector<ListStringElem>& choices, const char* data, int64_t count,
+                                      int64_t stride, int64_t itemsize, RF_StringType kind)
+{
+    choices.reserve(choices.size() + static_cast<size_t>(count));
+    for (int64_t i = 0; i < count; ++i) {
+        const CharT* str = reinterpret_cast<const CharT*>(data + i * stride);
+        int64_t length = itemsize / static_cast<int64_t>(sizeof(CharT));
+        while (length && !str[length - 1])
+            --length;
+
+        choices.emplace_back(i, PyObjectWrapper(), RF_StringWrapper(make_string_view(kind, str, length)));
+    }
+}
+
+static inline void numpy_string_choices(std::vector<ListStringElem>& choices, const char* data, int64_t count,
+                                        int64_t stride, int64_t itemsize, bool ucs4)
+{
+    if (ucs4)
+        numpy_string_choices_impl<uint32_t>(choices, data, count, stride, itemsize, RF_UINT32);
+    else
+        numpy_string_choices_impl<uint8_t>(choices, data, count, stride, itemsize, RF_UINT8);
+}
+
+/* chunk of an Arrow string or large_string array */
+struct ArrowStringChunk {
+    /* NULL when the chunk has no nulls */
+    const uint8_t* validity;
+    const void* offsets;
+    const uint8_t* data;
+    int64_t offset;
+    int64_t length;
+    bool large_offsets;
+};
+
+/* decode a single code point. Invalid UTF-8 is replaced with U+FFFD */
+static inline uint32_t utf8_decode(const uint8_t*& pos, const uint8_t* end)
+{
+    uint32_t ch = *pos++;
+    if (ch < 0x80) return ch;
+
+    int extra;
+    uint32_t min_char;
+    if ((ch & 0xE0) == 0xC0) {
+        extra = 1;
+        ch &= 0x1F;
+        min_char = 0x80;
+    }
+    else if ((ch & 0xF0) == 0xE0) {
+        extra = 2;
+        ch &= 0x0F;
+        min_char = 0x800;
+    }
+    else if ((ch & 0xF8) == 0xF0) {
+        extra = 3;
+        ch &= 0x07;
+        min_char = 0x10000;
+    }
+    else {
+        return 0xFFFD;
+    }
+
+    for (; extra; --extra) {
+        if (pos == end || (*pos & 0xC0) != 0x80) return 0xFFFD;
+        ch = (ch << 6) | (*pos++ & 0x3F);
+    }
+
+    if (ch < min_char || ch > 0x10FFFF || (ch >= 0xD800 && ch <= 0xDFFF)) return 0xFFFD;
+    return ch;
+}
+
+/* character size Python would use for the decoded string, or 0 when it only consists of ASCII */
+static inline size_t utf8_char_size(const uint8_t* first, const uint8_t* last, int64_t& length)
+{
+    uint8_t ascii = 0;
+    for (const uint8_t* pos = first; pos != last; ++pos)
+        ascii |= *pos;
+
+    length = last - first;
+    if (ascii < 0x80) return 0;
+
+    uint32_t max_char = 0;
+    length = 0;
+    while (first != last) {
+        max_char = std::max(max_char, utf8_decode(first, last));
+        ++length;
+    }
+    return max_char < 0x100 ? 1 : (max_char < 0x10000 ? 2 : 4);
+}
+
+template <typename CharT>
+static void utf8_decode_into(const uint8_t* first, const uint8_t* last, CharT* out)
+{
+    while (first != last)
+        *out++ = static_cast<CharT>(utf8_decode(first, last));
+}
+
+template <typename Offset, typename Func>
+static void arrow_chunk_strings(const ArrowStringChunk& chunk, Func&& func)
+{
+    const Offset* offsets = static_cast<const Offset*>(chunk.offsets);
+    for (int64_t i = 0; i < chunk.length; ++i) {
+        int64_t pos = chunk.offset + i;
+        if (chunk.validity && !(chunk.validity[pos / 8] & (1 << (pos % 8)))) continue;
+
+        const uint8_t* first = chunk.data + offsets[pos];
+        func(i, first, chunk.data + offsets[pos + 1]);
+    }
+}
+
+template <typename Func>
+static void arrow_strings(const std::vector<ArrowStringChunk>& chunks, Func&& func)
+{
+    int64_t index = 0;
+    for (const auto& chunk : chunks) {
+        auto chunk_func = [&](int64_t i, const uint8_t* first, const uint8_t* last) { func(index + i, first, last); };
+        if (chunk.large_offsets)
+            arrow_chunk_strings<int64_t>(chunk, chunk_func);
+        else
+            arrow_chunk_strings<int32_t>(chunk, chunk_func);
+        index += chunk.length;
+    }
+}
+
+/*
+ * create views of the strings of an Arrow string or large_string array. Nulls are skipped.
+ * ASCII strings are used in place, while all other strings are decoded from UTF-8 into buffer
+ */
+static inline void arrow_string_choices(std::vector<ListStringElem>& choices, std::vector<uint64_t>& buffer,
+                                        const std::vector<ArrowStringChunk>& chunks)
+{
+    size_t buffer_size = 0;
+    arrow_strings(chunks, [&](int64_t, const uint8_t* first, const uint8_t* last) {
+        int64_t length;
+        size_t char_size = utf8_char_size(first, last, length);
+        buffer_size += (static_cast<size_t>(length) * char_size + 7) / 8;
+    });
+
+    buffer.resize(buffer_size);
+    uint64_t* out = buffer.data();
+    arrow_strings(chunks, [&](int64_t index, const uint8_t* first, const uint8_t* last) {
+        int64_t length;
+        size_t char_size = utf8_char_size(first, last, length);
+        RF_String view;
+        switch (char_size) {
+        case 0: view = make_string_view(RF_UINT8, first, length); break;
+        case 1:
+            utf8_decode_into(first, last, reinterpret_cast<uint8_t*>(out));
+            view = make_string_view(RF_UINT8, out, length);
+            break;
+        case 2:
+            utf8_decode_into(first, last, reinterpret_cast<uint16_t*>(out));
+            view = make_string_view(RF_UINT16, out, length);
+            break;
+        default:
+            utf8_decode_into(first, last, reinterpret_cast<uint32_t*>(out));
+            view = make_string_view(RF_UINT32, out, length);
+            break;
+        }
+
+        out += (static_cast<size_t>(length) * char_size + 7) / 8;
+        choices.emplace_back(index, PyObjectWrapper(), RF_StringWrapper(view));
+    });
+}
+
 struct ExtractComp {
     ExtractComp() : m_scorer_flags(nullptr)
     {}
@@ -227,78 +472,79 @@ T get_optimal_score(const RF_ScorerFlags* scorer_flags)
 }
 
 template <typename T>
-std::vector<DictMatchElem<T>> extract_dict_impl(const RF_Kwargs* kwargs, const RF_ScorerFlags* scorer_flags,
-                                                RF_Scorer* scorer, const RF_StringWrapper& query,
-                                                const std::vector<DictStringElem>& choices, T score_cutoff,
-                                                T score_hint)
+T get_worst_score(const RF_ScorerFlags* scorer_flags)
 {
-    std::vector<DictMatchElem<T>> results;
-    results.reserve(choices.size());
-
-    RF_ScorerFunc scorer_func;
-    PyErr2RuntimeExn(scorer->scorer_func_init(&scorer_func, kwargs, 1, &query.string));
-    RF_ScorerWrapper ScorerFunc(scorer_func);
-
-    bool lowest_score_worst = is_lowest_score_worst<T>(scorer_flags);
-
-    for (size_t i = 0; i < choices.size(); ++i) {
-        if (i % 1000 == 0)
-            if (PyErr_CheckSignals() != 0) throw std::runtime_error("");
-
-        T score;
-        ScorerFunc.call(&choices[i].proc_val.string, score_cutoff, score_hint, &score);
-
-        if (lowest_score_worst) {
-            if (score >= score_cutoff) {
-                results.emplace_back(score, choices[i].index, choices[i].val, choices[i].key);
-            }
-        }
-        else {
-            if (score <= score_cutoff) {
-                results.emplace_back(score, choices[i].index, choices[i].val, choices[i].key);
-            }
-        }
+    if (std::is_same<T, double>::value) {
+        return (T)scorer_flags->worst_score.f64;
+    }
+    else if (std::is_same<T, size_t>::value) {
+        return (T)scorer_flags->worst_score.sizet;
+    }
+    else {
+        return (T)scorer_flags->worst_score.i64;
     }
-
-    return results;
 }
 
+/*
+ * upper bound for the score of a choice derived from the lengths of the query and the choice.
+ * Scorers provide it using the RF_SCORER_FLAG_LENGTH_* flags. It allows skipping choices, which can
+ * not reach score_cutoff, without calling the scorer.
+ */
 template <typename T>
-std::vector<ListMatchElem<T>> extract_list_impl(const RF_Kwargs* kwargs, const RF_ScorerFlags* scorer_flags,
-                                                RF_Scorer* scorer, const RF_StringWrapper& query,
-                                                const std::vector<ListStringElem>& choices, T score_cutoff,
-                                                T score_hint)
-{
-    std::vector<ListMatchElem<T>> results;
-    results.reserve(choices.size());
-
-    RF_ScorerFunc scorer_func;
-    PyErr2RuntimeExn(scorer->scorer_func_init(&scorer_func, kwargs, 1, &query.string));
-    RF_ScorerWrapper ScorerFunc(scorer_func);
+class LengthBound {
+public:
+    LengthBound()
+        : m_flags(0), m_query_len(0), m_lowest_score_worst(true), m_optimal_score(0), m_worst_score(0)
+    {}
 
-    bool lowest_score_worst = is_lowest_score_worst<T>(scorer_flags);
+    LengthBound(const RF_ScorerFlags* scorer_flags, int64_t query_len)
+        : m_flags(scorer_flags->flags &
+                  (RF_SCORER_FLAG_LENGTH_DIFF_BOUND | RF_SCORER_FLAG_LENGTH_RATIO_BOUND |
+                   RF_SCORER_FLAG_LENGTH_SUM_RATIO_BOUND)),
+          m_query_len(query_len),
+          m_lowest_score_worst(is_lowest_score_worst<T>(scorer_flags)),
+          m_optimal_score(static_cast<double>(get_optimal_score<T>(scorer_flags))),
+          m_worst_score(static_cast<double>(get_worst_score<T>(scorer_flags)))
+    {}
 
-    for (size_t i = 0; i < choices.size(); ++i) {
-        if (i % 1000 == 0)
-            if (PyErr_CheckSignals() != 0) throw std::runtime_error("");
+    /* true when a choice of this length might reach score_cutoff */
+    bool possible(int64_t len, T score_cutoff) const
+    {
+        if (!m_flags) return true;
 
-        T score;
-        ScorerFunc.call(&choices[i].proc_val.string, score_cutoff, score_hint, &score);
+        int64_t min_len = std::min(len, m_query_len);
+        int64_t max_len = std::max(len, m_query_len);
+        if (m_flags & RF_SCORER_FLAG_LENGTH_DIFF_BOUND)
+            return static_cast<double>(max_len - min_len) <= static_cast<double>(score_cutoff);
 
-        if (lowest_score_worst) {
-            if (score >= score_cutoff) {
-                results.emplace_back(score, choices[i].index, choices[i].val);
-            }
+        double sim = 1.0;
+        if (m_flags & RF_SCORER_FLAG_LENGTH_RATIO_BOUND) {
+            if (max_len) sim = static_cast<double>(min_len) / static_cast<double>(max_len);
         }
-        else {
-            if (score <= score_cutoff) {
-                results.emplace_back(score, choices[i].index, choices[i].val);
-            }
+        else if (max_len) {
+            sim = 2.0 * static_cast<double>(min_len) / static_cast<double>(min_len + max_len);
         }
+
+        /* the tolerance covers rounding errors in the score calculation of the scorer */
+        double best_score = m_worst_score + sim * (m_optimal_score - m_worst_score);
+        double tolerance = 1e-9 * std::abs(m_optimal_score - m_worst_score);
+        if (m_lowest_score_worst) return best_score + tolerance >= static_cast<double>(score_cutoff);
+        return best_score - tolerance <= static_cast<double>(score_cutoff);
     }
 
-    return results;
-}
+    /* true when a choice with a length in [min_len, max_len] might reach score_cutoff */
+    bool possible(int64_t min_len, int64_t max_len, T score_cutoff) const
+    {
+        return possible(std::min(std::max(m_query_len, min_len), max_len), score_cutoff);
+    }
+
+private:
+    uint32_t m_flags;
+    int64_t m_query_len;
+    bool m_lowest_score_worst;
+    double m_optimal_score;
+    double m_worst_score;
+};
 
 int64_t any_round(double score)
 {
@@ -334,6 +580,8 @@ struct Matrix {
     size_t m_rows;
     size_t m_cols;
     void* m_matrix;
+    /* false when m_matrix is a buffer supplied by the caller */
+    bool m_owned = true;
 
     Matrix() : m_dtype(MatrixType::FLOAT32), m_rows(0), m_cols(0), m_matrix(nullptr)
     {}
@@ -345,6 +593,11 @@ struct Matrix {
         if (m_matrix == nullptr) throw std::bad_alloc();
     }
 
+    /* view on an existing buffer, which has to outlive the matrix */
+    Matrix(MatrixType dtype, size_t rows, size_t cols, void* data)
+        : m_dtype(dtype), m_rows(rows), m_cols(cols), m_matrix(data), m_owned(false)
+    {}
+
     Matrix(const Matrix& other) : m_dtype(other.m_dtype), m_rows(other.m_rows), m_cols(other.m_cols)
     {
         m_matrix = malloc(get_dtype_size() * m_rows * m_cols);
@@ -371,11 +624,12 @@ struct Matrix {
         swap(m_cols, rhs.m_cols);
         swap(m_dtype, rhs.m_dtype);
         swap(m_matrix, rhs.m_matrix);
+        swap(m_owned, rhs.m_owned);
     }
 
     ~Matrix()
     {
-        free(m_matrix);
+        if (m_owned) free(m_matrix);
     }
 
     int get_dtype_size()
@@ -432,6 +686,20 @@ struct Matrix {
     }
 };
 
+/* scores in coordinate format, which are stored as vectors of the same length */
+struct SparseMatrix {
+    SparseMatrix()
+    {}
+
+    SparseMatrix(MatrixType dtype, size_t count)
+        : rows(MatrixType::INT64, count, 1), cols(MatrixType::INT64, count, 1), scores(dtype, count, 1)
+    {}
+
+    Matrix rows;
+    Matrix cols;
+    Matrix scores;
+};
+
 bool KeyboardInterruptOccured(PyThreadState*& save)
 {
     PyEval_RestoreThread(save);
@@ -440,13 +708,96 @@ bool KeyboardInterruptOccured(PyThreadState*& save)
     return res;
 }
 
+static size_t hardware_thread_count()
+{
+    return std::max<size_t>(1, std::thread::hardware_concurrency());
+}
+
+/*
+ * thread pool shared by all calls using multiple workers. It is created lazily on first use and
+ * only accessed while holding the GIL, so it does not require any additional synchronisation.
+ * Every call keeps a reference to the executor it runs on, so replacing the executor does not
+ * affect calls running in other threads.
+ */
+struct ThreadPool {
+    ThreadPool() : configured_size(env_size())
+    {}
+
+    /* size set using RAPIDFUZZ_NUM_THREADS or 0 when it is not set */
+    static size_t env_size()
+    {
+        const char* env = std::getenv("RAPIDFUZZ_NUM_THREADS");
+        if (!env) return 0;
+
+        long long size = std::strtoll(env, nullptr, 10);
+        if (size < 0) return hardware_thread_count();
+        return static_cast<size_t>(size);
+    }
+
+    std::shared_ptr<tf::Executor> executor;
+    /* size requested by the user. When this is 0 the pool grows to the largest amount of workers requested */
+    size_t configured_size;
+};
+
+static ThreadPool& get_thread_pool_state()
+{
+    /* never destroyed, since joining the threads during interpreter shutdown is not safe */
+    static ThreadPool* pool = new ThreadPool();
+    return *pool;
+}
+
+static std::shared_ptr<tf::Executor> get_thread_pool(size_t workers)
+{
+    auto& pool = get_thread_pool_state();
+    if (pool.configured_size) {
+        if (!pool.executor) pool.executor = std::make_shared<tf::Executor>(pool.configured_size);
+    }
+    else {
+        size_t size = std::max(workers, hardware_thread_count());
+        if (!pool.executor || pool.executor->num_workers() < size)
+            pool.executor = std::make_shared<tf::Executor>(size);
+    }
+    return pool.executor;
+}
+
+/*
+ * change the size of the shared thread pool. A size of 0 shuts the pool down and returns to the default
+ * behaviour. A negative size uses the amount of cores. Returns the previously configured size.
+ */
+static int64_t set_thread_pool_size(int64_t workers)
+{
+    auto& pool = get_thread_pool_state();
+    int64_t previous = static_cast<int64_t>(pool.configured_size);
+
+    if (workers == 0) {
+        pool.configured_size = ThreadPool::env_size();
+        pool.executor.reset();
+        return previous;
+    }
+
+    pool.configured_size = (workers < 0) ? hardware_thread_count() : static_cast<size_t>(workers);
+    if (!pool.executor || pool.executor->num_workers() != pool.configured_size)
+        pool.executor = std::make_shared<tf::Executor>(pool.configured_size);
+    return previous;
+}
+
+/*
+ * the worker threads do not exist in a forked child, so the executor can not be destroyed there.
+ * It is leaked instead and a new one is created lazily on the next use.
+ */
+static void reset_thread_pool_after_fork()
+{
+    auto& pool = get_thread_pool_state();
+    new std::shared_ptr<tf::Executor>(std::move(pool.executor));
+    pool.executor = nullptr;
+}
+
 template <typename Func>
 void run_parallel(int workers, int64_t rows, int64_t step_size, Func&& func)
 {
-    PyThreadState* save = PyEval_SaveThread();
-
     /* for these cases spawning threads causes to much overhead to be worth it */
-    if (workers == 0 || workers == 1) {
+    if (workers == 0 || workers == 1 || rows <= step_size) {
+        PyThreadState* save = PyEval_SaveThread();
         for (int64_t row = 0; row < rows; row += step_size) {
             if (KeyboardInterruptOccured(save)) {
                 PyEval_RestoreThread(save);
@@ -466,57 +817,504 @@ void run_parallel(int workers, int64_t rows, int64_t step_size, Func&& func)
         return;
     }
 
-    if (workers < 0) {
-        workers = std::thread::hardware_concurrency();
-    }
+    size_t worker_count = (workers < 0) ? hardware_thread_count() : static_cast<size_t>(workers);
+    /* the thread pool is only accessed while holding the GIL */
+    std::shared_ptr<tf::Executor> executor = get_thread_pool(worker_count);
+    PyThreadState* save = PyEval_SaveThread();
+
+    int64_t task_count = (rows + step_size - 1) / step_size;
+    worker_count = std::min({worker_count, executor->num_workers(), static_cast<size_t>(task_count)});
 
     std::exception_ptr exception = nullptr;
     std::atomic<int> exceptions_occurred{0};
-    tf::Executor executor(workers);
+    std::atomic<int64_t> next_row{0};
     tf::Taskflow taskflow;
 
-    taskflow.for_each_index((int64_t)0, rows, step_size, [&](int64_t row) {
-        /* skip work after an exception occurred */
-        if (exceptions_occurred.load() > 0) {
-            return;
-        }
-        try {
-            int64_t row_end = std::min(row + step_size, rows);
-            func(row, row_end);
-        }
-        catch (...) {
-            /* only store first exception */
-            if (exceptions_occurred.fetch_add(1) == 0) {
-                exception = std::current_exception();
+    /* only schedule worker_count tasks, which take the next rows until all of them are processed */
+    for (size_t i = 0; i < worker_count; ++i) {
+        taskflow.emplace([&]() {
+            while (true) {
+                /* skip work after an exception occurred */
+                if (exceptions_occurred.load() > 0) {
+                    return;
+                }
+
+                int64_t row = next_row.fetch_add(step_size);
+                if (row >= rows) {
+                    return;
+                }
+
+                try {
+                    int64_t row_end = std::min(row + step_size, rows);
+                    func(row, row_end);
+                }
+                catch (...) {
+                    /* only store first exception */
+                    if (exceptions_occurred.fetch_add(1) == 0) {
+                        exception = std::current_exception();
+                    }
+                }
             }
-        }
-    });
+        });
+    }
 
-    auto future = executor.run(taskflow);
+    auto future = executor->run(taskflow);
     while (future.wait_for(1s) != std::future_status::ready) {
         if (KeyboardInterruptOccured(save)) {
             exceptions_occurred.fetch_add(1);
             future.wait();
+            executor.reset();
             PyEval_RestoreThread(save);
             /* exception already set */
             throw std::runtime_error("");
         }
     }
+    executor.reset();
     PyEval_RestoreThread(save);
 
     if (exception) std::rethrow_exception(exception);
 }
 
+/* amount of strings processed by a single task in default_process_batch */
+static constexpr int64_t default_process_step_size = 4096;
+
+template <typename CharT>
+static int64_t default_process_into(const RF_String& str, void* out)
+{
+    const CharT* data = static_cast<const CharT*>(str.data);
+    CharT* dest = static_cast<CharT*>(out);
+    std::copy(data, data + str.length, dest);
+    return default_process(dest, str.length);
+}
+
+/*
+ * apply default_process to the strings, which are distributed over the workers. The strings are
+ * processed into a single buffer and replaced with views into this buffer. Empty wrappers are skipped
+ * and strings, which are not changed by default_process, are replaced with empty wrappers
+ */
+static void default_process_strings(std::vector<RF_StringWrapper>& strings, std::vector<uint64_t>& buffer,
+                                    int workers)
+{
+    std::vector<size_t> offsets(strings.size());
+    size_t buffer_size = 0;
+    for (size_t i = 0; i < strings.size(); ++i) {
+        offsets[i] = buffer_size;
+        buffer_size += (strings[i].size() * get_char_size(strings[i].string.kind) + 7) / 8;
+    }
+    buffer.resize(buffer_size);
+
+    run_parallel(workers, static_cast<int64_t>(strings.size()), default_process_step_size,
+                 [&](int64_t row, int64_t row_end) {
+                     for (; row < row_end; ++row) {
+                         auto& str = strings[static_cast<size_t>(row)];
+                         if (str.is_none() || !str.string.length) continue;
+
+                         RF_String view = str.string;
+                         view.data = buffer.data() + offsets[static_cast<size_t>(row)];
+                         switch (view.kind) {
+                         case RF_UINT8: view.length = default_process_into<uint8_t>(str.string, view.data); break;
+                         case RF_UINT16: view.length = default_process_into<uint16_t>(str.string, view.data); break;
+                         case RF_UINT32: view.length = default_process_into<uint32_t>(str.string, view.data); break;
+                         default: throw std::logic_error("Reached end of control flow in default_process_strings");
+                         }
+
+                         /* the Python string is reused, when it is not changed */
+                         size_t byte_count = static_cast<size_t>(view.length) * get_char_size(view.kind);
+                         if (view.length == str.string.length && !memcmp(view.data, str.string.data, byte_count))
+                             str = RF_StringWrapper();
+                         else
+                             str = RF_StringWrapper(view);
+                     }
+                 });
+}
+
+/* Python str of a string processed by default_process_strings */
+static PyObject* processed_string_to_unicode(const RF_String& str)
+{
+    switch (str.kind) {
+    case RF_UINT8: return PyUnicode_FromKindAndData(PyUnicode_1BYTE_KIND, str.data, (Py_ssize_t)str.length);
+    case RF_UINT16: return PyUnicode_FromKindAndData(PyUnicode_2BYTE_KIND, str.data, (Py_ssize_t)str.length);
+    case RF_UINT32: return PyUnicode_FromKindAndData(PyUnicode_4BYTE_KIND, str.data, (Py_ssize_t)str.length);
+    default: throw std::logic_error("Reached end of control flow in processed_string_to_unicode");
+    }
+}
+
+/* amount of strings processed by a single task of a utils.Processor */
+static constexpr int64_t processor_step_size = 1024;
+
+/*
+ * apply the steps of a utils.Processor to the strings, which are distributed over the workers.
+ * Only strings, which are views into a Python string, are processed. They are replaced with
+ * the processed string unless the processor does not change them
+ */
+template <typename T, typename Proj>
+static void processor_strings_impl(std::vector<T>& elems, Proj proj, uint32_t steps, int workers)
+{
+    run_parallel(workers, static_cast<int64_t>(elems.size()), processor_step_size,
+                 [&](int64_t row, int64_t row_end) {
+                     for (; row < row_end; ++row) {
+                         RF_String& str = proj(elems[static_cast<size_t>(row)]);
+                         if (str.data == nullptr || str.dtor) continue;
+
+                         RF_String proc_str = processor_func(steps, str);
+                         size_t byte_count = static_cast<size_t>(str.length) * get_char_size(str.kind);
+                         if (proc_str.kind == str.kind && proc_str.length == str.length &&
+                             !memcmp(proc_str.data, str.data, byte_count))
+                             proc_str.dtor(&proc_str);
+                         else
+                             str = proc_str;
+                     }
+                 });
+}
+
+static void processor_strings(std::vector<RF_StringWrapper>& strings, uint32_t steps, int workers)
+{
+    processor_strings_impl(
+        strings, [](RF_StringWrapper& elem) -> RF_String& { return elem.string; }, steps, workers);
+}
+
+static void processor_choices(std::vector<ListStringElem>& choices, uint32_t steps, int workers)
+{
+    processor_strings_impl(
+        choices, [](ListStringElem& elem) -> RF_String& { return elem.proc_val.string; }, steps, workers);
+}
+
+static void processor_choices(std::vector<DictStringElem>& choices, uint32_t steps, int workers)
+{
+    processor_strings_impl(
+        choices, [](DictStringElem& elem) -> RF_String& { return elem.proc_val.string; }, steps, workers);
+}
+
+/*
+ * scorer of a query cached by process.QueryCache. The kwargs passed to it point to the RF_ScorerFunc
+ * initialized for the query, which is shared by all tasks instead of being initialized again
+ */
+static bool cached_scorer_func_init(RF_ScorerFunc* self, const RF_Kwargs* kwargs, int64_t, const RF_String*)
+{
+    *self = *static_cast<const RF_ScorerFunc*>(kwargs->context);
+    /* the RF_ScorerFunc is owned by the cache */
+    self->dtor = nullptr;
+    return true;
+}
+
+static RF_Scorer CachedScorerContext = {SCORER_STRUCT_VERSION, nullptr, nullptr, cached_scorer_func_init, nullptr};
+
+/* amount of choices scored by a single task in extract / extractOne */
+static constexpr int64_t extract_step_size = 1024;
+
+/* shortest and longest choice in a block of extract_step_size choices */
+struct LengthRange {
+    int64_t min_len;
+    int64_t max_len;
+};
+
+/*
+ * add the length of the choice at pos to the length range of its block. Empty choices
+ * are removed choices of a MutablePreparedChoices, which are never scored
+ */
+static inline void extend_block_lengths(std::vector<LengthRange>& block_lengths, size_t pos,
+                                        const RF_StringWrapper& proc_val)
+{
+    size_t block = pos / static_cast<size_t>(extract_step_size);
+    if (block == block_lengths.size()) block_lengths.push_back({std::numeric_limits<int64_t>::max(), 0});
+    if (proc_val.is_none()) return;
+
+    auto& range = block_lengths[block];
+    range.min_len = std::min(range.min_len, proc_val.string.length);
+    range.max_len = std::max(range.max_len, proc_val.string.length);
+}
+
+/*
+ * length range of the choices in every block scored by extract / extractOne.
+ * Blocks where no length can reach score_cutoff are skipped as a whole
+ */
+template <typename StringElem>
+std::vector<LengthRange> get_block_lengths(const std::vector<StringElem>& choices)
+{
+    std::vector<LengthRange> block_lengths;
+    block_lengths.reserve((choices.size() + extract_step_size - 1) / extract_step_size);
+
+    for (size_t i = 0; i < choices.size(); ++i)
+        extend_block_lengths(block_lengths, i, choices[i].proc_val);
+    return block_lengths;
+}
+
+template <typename T>
+struct ExtractScore {
+    ExtractScore(size_t pos_, T score_) : pos(pos_), score(score_)
+    {}
+
+    size_t pos;
+    T score;
+};
+
+/*
+ * score all choices in blocks of extract_step_size, which are distributed over the workers.
+ * Every block keeps the position and score of its best limit matches in a bounded heap, so they can
+ * be merged in the original order of the choices, once the Python GIL is held again.
+ * As soon as a block found limit matches, the worst of them is used as score_cutoff for the remaining
+ * choices. This cutoff is shared with the other blocks, since the final result can not include matches
+ * with a worse score either.
+ */
+template <typename T, typename StringElem>
+static std::vector<std::vector<ExtractScore<T>>>
+extract_blocks_impl(const RF_Kwargs* kwargs, const RF_ScorerFlags* scorer_flags, RF_Scorer* scorer,
+                    const RF_StringWrapper& query, const std::vector<StringElem>& choices, T score_cutoff,
+                    T score_hint, size_t limit, int workers, const std::vector<LengthRange>* block_lengths)
+{
+    int64_t choice_count = static_cast<int64_t>(choices.size());
+    std::vector<std::vector<ExtractScore<T>>> blocks(
+        static_cast<size_t>((choice_count + extract_step_size - 1) / extract_step_size));
+    if (limit == 0) return blocks;
+
+    bool lowest_score_worst = is_lowest_score_worst<T>(scorer_flags);
+    LengthBound<T> length_bound(scorer_flags, query.string.length);
+    std::atomic<T> shared_cutoff{score_cutoff};
+
+    auto is_better = [&](T a, T b) {
+        return lowest_score_worst ? a > b : a < b;
+    };
+
+    /* orders the heap, so the worst match is at the front */
+    auto heap_comp = [&](const ExtractScore<T>& a, const ExtractScore<T>& b) {
+        if (a.score != b.score) return is_better(a.score, b.score);
+        return a.pos < b.pos;
+    };
+
+    run_parallel(workers, choice_count, extract_step_size, [&](int64_t row, int64_t row_end) {
+        size_t block_idx = static_cast<size_t>(row / extract_step_size);
+        auto& block = blocks[block_idx];
+
+        T c_score_cutoff = score_cutoff;
+        if (block_lengths) {
+            T shared = shared_cutoff.load();
+            if (is_better(shared, c_score_cutoff)) c_score_cutoff = shared;
+
+            const auto& range = (*block_lengths)[block_idx];
+            if (!length_bound.possible(range.min_len, range.max_len, c_score_cutoff)) return;
+        }
+
+        RF_ScorerFunc scorer_func;
+        PyErr2RuntimeExn(scorer->scorer_func_init(&scorer_func, kwargs, 1, &query.string));
+        RF_ScorerWrapper ScorerFunc(scorer_func);
+
+        for (; row < row_end; ++row) {
+            T shared = shared_cutoff.load();
+            if (is_better(shared, c_score_cutoff)) c_score_cutoff = shared;
+
+            if (choices[row].proc_val.is_none()) continue;
+            if (!length_bound.possible(choices[row].proc_val.string.length, c_score_cutoff)) continue;
+
+            T score;
+            ScorerFunc.call(&choices[row].proc_val.string, c_score_cutoff, score_hint, &score);
+
+            bool found = lowest_score_worst ? score >= c_score_cutoff : score <= c_score_cutoff;
+            if (!found) continue;
+
+            if (block.size() < limit) {
+                block.emplace_back(static_cast<size_t>(row), score);
+                std::push_heap(block.begin(), block.end(), heap_comp);
+            }
+            /* on equal scores the match found first is kept */
+            else if (is_better(score, block.front().score)) {
+                std::pop_heap(block.begin(), block.end(), heap_comp);
+                block.back() = ExtractScore<T>(static_cast<size_t>(row), score);
+                std::push_heap(block.begin(), block.end(), heap_comp);
+            }
+            else {
+                continue;
+            }
+
+            if (block.size() == limit) {
+                c_score_cutoff = block.front().score;
+                while (is_better(c_score_cutoff, shared) &&
+                       !shared_cutoff.compare_exchange_weak(shared, c_score_cutoff))
+                {}
+            }
+        }
+    });
+
+    return blocks;
+}
+
+template <typename T>
+std::vector<DictMatchElem<T>> extract_dict_impl(const RF_Kwargs* kwargs, const RF_ScorerFlags* scorer_flags,
+                                                RF_Scorer* scorer, const RF_StringWrapper& query,
+                                                const std::vector<DictStringElem>& choices, T score_cutoff,
+                                                T score_hint, size_t limit, int workers)
+{
+    auto blocks = extract_blocks_impl<T>(kwargs, scorer_flags, scorer, query, choices, score_cutoff,
+                                         score_hint, limit, workers, nullptr);
+
+    size_t result_count = 0;
+    for (const auto& block : blocks)
+        result_count += block.size();
+
+    std::vector<DictMatchElem<T>> results;
+    results.reserve(result_count);
+
+    for (const auto& block : blocks)
+        for (const auto& match : block) {
+            const auto& choice = choices[match.pos];
+            results.emplace_back(match.score, choice.index, choice.val, choice.key);
+        }
+
+    return results;
+}
+
+template <typename T>
+std::vector<ListMatchElem<T>> extract_list_impl(const RF_Kwargs* kwargs, const RF_ScorerFlags* scorer_flags,
+                                                RF_Scorer* scorer, const RF_StringWrapper& query,
+                                                const std::vector<ListStringElem>& choices, T score_cutoff,
+                                                T score_hint, size_t limit, int workers,
+                                                const std::vector<LengthRange>* block_lengths)
+{
+    auto blocks = extract_blocks_impl<T>(kwargs, scorer_flags, scorer, query, choices, score_cutoff,
+                                         score_hint, limit, workers, block_lengths);
+
+    size_t result_count = 0;
+    for (const auto& block : blocks)
+        result_count += block.size();
+
+    std::vector<ListMatchElem<T>> results;
+    results.reserve(result_count);
+
+    for (const auto& block : blocks)
+        for (const auto& match : block) {
+            const auto& choice = choices[match.pos];
+            results.emplace_back(match.score, choice.index, choice.val);
+        }
+
+    return results;
+}
+
+/*
+ * find the best match in the choices. The blocks are searched in parallel and share the best score
+ * found so far as score_cutoff. When multiple blocks find the same score, the match in the first
+ * block is used, so the result is the same as for a sequential search.
+ * Returns the position of the best match or -1 when no match was found.
+ */
+template <typename T, typename StringElem>
+static int64_t extractOne_blocks_impl(const RF_Kwargs* kwargs, const RF_ScorerFlags* scorer_flags,
+                                      RF_Scorer* scorer, const RF_StringWrapper& query,
+                                      const std::vector<StringElem>& choices, T score_cutoff, T score_hint,
+                                      int workers, const std::vector<LengthRange>* block_lengths,
+                                      T& result_score)
+{
+    int64_t choice_count = static_cast<int64_t>(choices.size());
+    size_t block_count = static_cast<size_t>((choice_count + extract_step_size - 1) / extract_step_size);
+    std::vector<int64_t> block_pos(block_count, -1);
+    std::vector<T> block_score(block_count);
+
+    bool lowest_score_worst = is_lowest_score_worst<T>(scorer_flags);
+    T optimal_score = get_optimal_score<T>(scorer_flags);
+    LengthBound<T> length_bound(scorer_flags, query.string.length);
+    std::atomic<T> shared_cutoff{score_cutoff};
+    /* position of the first optimal match. Blocks behind it can be skipped */
+    std::atomic<int64_t> optimal_pos{choice_count};
+
+    auto is_better = [&](T a, T b) {
+        return lowest_score_worst ? a > b : a < b;
+    };
+
+    run_parallel(workers, choice_count, extract_step_size, [&](int64_t row, int64_t row_end) {
+        if (row >= optimal_pos.load()) return;
+
+        size_t block = static_cast<size_t>(row / extract_step_size);
+        T c_score_cutoff = score_cutoff;
+        if (block_lengths) {
+            T shared = shared_cutoff.load();
+            if (is_better(shared, c_score_cutoff)) c_score_cutoff = shared;
+
+            const auto& range = (*block_lengths)[block];
+            if (!length_bound.possible(range.min_len, range.max_len, c_score_cutoff)) return;
+        }
+
+        RF_ScorerFunc scorer_func;
+        PyErr2RuntimeExn(scorer->scorer_func_init(&scorer_func, kwargs, 1, &query.string));
+        RF_ScorerWrapper ScorerFunc(scorer_func);
+
+        for (; row < row_end; ++row) {
+            T shared = shared_cutoff.load();
+            if (is_better(shared, c_score_cutoff)) c_score_cutoff = shared;
+
+            if (choices[row].proc_val.is_none()) continue;
+            if (!length_bound.possible(choices[row].proc_val.string.length, c_score_cutoff)) continue;
+
+            T score;
+            ScorerFunc.call(&choices[row].proc_val.string, c_score_cutoff, score_hint, &score);
+
+            bool found = lowest_score_worst ? score >= c_score_cutoff : score <= c_score_cutoff;
+            if (!found || (block_pos[block] != -1 && !is_better(score, block_score[block]))) continue;
+
+            block_pos[block] = row;
+            block_score[block] = c_score_cutoff = score;
+
+            while (is_better(score, shared) && !shared_cutoff.compare_exchange_weak(shared, score)) {}
+
+            if (score == optimal_score) {
+                int64_t pos = optimal_pos.load();
+                while (row < pos && !optimal_pos.compare_exchange_weak(pos, row)) {}
+                break;
+            }
+        }
+    });
+
+    int64_t result_pos = -1;
+    for (size_t block = 0; block < block_count; ++block) {
+        if (block_pos[block] == -1) continue;
+
+        if (result_pos == -1 || is_better(block_score[block], result_score)) {
+            result_pos = block_pos[block];
+            result_score = block_score[block];
+        }
+    }
+
+    return result_pos;
+}
+
+template <typename T>
+DictMatchElem<T> extractOne_dict_impl(const RF_Kwargs* kwargs, const RF_ScorerFlags* scorer_flags,
+                                      RF_Scorer* scorer, const RF_StringWrapper& query,
+                                      const std::vector<DictStringElem>& choices, T score_cutoff,
+                                      T score_hint, int workers)
+{
+    T score = T();
+    int64_t pos = extractOne_blocks_impl<T>(kwargs, scorer_flags, scorer, query, choices, score_cutoff,
+                                            score_hint, workers, nullptr, score);
+    if (pos == -1) return DictMatchElem<T>(score, -1, PyObjectWrapper(), PyObjectWrapper());
+
+    const auto& choice = choices[static_cast<size_t>(pos)];
+    return DictMatchElem<T>(score, choice.index, choice.val, choice.key);
+}
+
+template <typename T>
+ListMatchElem<T> extractOne_list_impl(const RF_Kwargs* kwargs, const RF_ScorerFlags* scorer_flags,
+                                      RF_Scorer* scorer, const RF_StringWrapper& query,
+                                      const std::vector<ListStringElem>& choices, T score_cutoff,
+                                      T score_hint, int workers,
+                                      const std::vector<LengthRange>* block_lengths)
+{
+    T score = T();
+    int64_t pos = extractOne_blocks_impl<T>(kwargs, scorer_flags, scorer, query, choices, score_cutoff,
+                                            score_hint, workers, block_lengths, score);
+    if (pos == -1) return ListMatchElem<T>(score, -1, PyObjectWrapper());
+
+    const auto& choice = choices[static_cast<size_t>(pos)];
+    return ListMatchElem<T>(score, choice.index, choice.val);
+}
+
 template <typename T>
 static Matrix cdist_single_list_impl(const RF_ScorerFlags* scorer_flags, const RF_Kwargs* kwargs,
                                      RF_Scorer* scorer, const std::vector<RF_StringWrapper>& queries,
                                      MatrixType dtype, int workers, T score_cutoff, T score_hint,
-                                     T score_multiplier, T worst_score)
+                                     T score_multiplier, T worst_score, void* out = nullptr)
 {
     (void)scorer_flags;
     int64_t rows = queries.size();
     int64_t cols = queries.size();
-    Matrix matrix(dtype, static_cast<size_t>(rows), static_cast<size_t>(cols));
+    Matrix matrix = out ? Matrix(dtype, static_cast<size_t>(rows), static_cast<size_t>(cols), out)
+                        : Matrix(dtype, static_cast<size_t>(rows), static_cast<size_t>(cols));
 
     run_parallel(workers, rows, 1, [&](int64_t row, int64_t row_end) {
         for (; row < row_end; ++row) {
@@ -547,19 +1345,193 @@ static Matrix cdist_single_list_impl(const RF_ScorerFlags* scorer_flags, const R
     return matrix;
 }
 
+/*
+ * length buckets of the simd implementations used for scorers supporting RF_SCORER_FLAG_MULTI_STRING_INIT.
+ * They support strings with up to 8, 16, 32 and 64 characters.
+ */
+static inline size_t simd_length_bucket(size_t len)
+{
+    if (len <= 8) return 0;
+    if (len <= 16) return 1;
+    if (len <= 32) return 2;
+    if (len <= 64) return 3;
+    return 4;
+}
+
+/* output of cdist_two_lists_run, which stores all scores in a dense matrix */
 template <typename T>
-static Matrix cdist_two_lists_impl(const RF_ScorerFlags* scorer_flags, const RF_Kwargs* kwargs,
-                                   RF_Scorer* scorer, const std::vector<RF_StringWrapper>& queries,
-                                   const std::vector<RF_StringWrapper>& choices, MatrixType dtype,
-                                   int workers, T score_cutoff, T score_hint, T score_multiplier,
-                                   T worst_score)
+struct DenseOutput {
+    static constexpr bool dynamic_score_cutoff = false;
+
+    DenseOutput(Matrix& matrix_, T score_cutoff_, T score_multiplier_)
+        : matrix(matrix_), score_cutoff(score_cutoff_), score_multiplier(score_multiplier_)
+    {}
+
+    T get_score_cutoff(size_t) const
+    {
+        return score_cutoff;
+    }
+
+    void set(size_t row, size_t col, T score)
+    {
+        matrix.set(row, col, score * score_multiplier);
+    }
+
+    Matrix& matrix;
+    T score_cutoff;
+    T score_multiplier;
+};
+
+/*
+ * output of cdist_two_lists_run, which only keeps the best limit scores of each row in a bounded heap.
+ * Once the heap of a row is full, the worst score in it is used as score_cutoff for the row.
+ * Every row is only written by a single worker, so no synchronisation is required.
+ */
+template <typename T>
+struct TopKOutput {
+    static constexpr bool dynamic_score_cutoff = true;
+
+    TopKOutput(const RF_ScorerFlags* scorer_flags, size_t rows, size_t limit_, T score_cutoff)
+        : lowest_score_worst(is_lowest_score_worst<T>(scorer_flags)),
+          limit(limit_),
+          heaps(rows),
+          score_cutoffs(rows, score_cutoff)
+    {}
+
+    bool is_better(T a, T b) const
+    {
+        return lowest_score_worst ? a > b : a < b;
+    }
+
+    /* orders the heap, so the worst match is at the front */
+    bool heap_comp(const ExtractScore<T>& a, const ExtractScore<T>& b) const
+    {
+        if (a.score != b.score) return is_better(a.score, b.score);
+        return a.pos < b.pos;
+    }
+
+    T get_score_cutoff(size_t row) const
+    {
+        return score_cutoffs[row];
+    }
+
+    void set(size_t row, size_t col, T score)
+    {
+        auto& heap = heaps[row];
+        auto comp = [this](const ExtractScore<T>& a, const ExtractScore<T>& b) {
+            return heap_comp(a, b);
+        };
+
+        if (heap.size() < limit) {
+            if (heap.empty()) heap.reserve(limit);
+            heap.emplace_back(col, score);
+            std::push_heap(heap.begin(), heap.end(), comp);
+        }
+        /* the columns are visited in order, so on equal scores the existing match is kept */
+        else if (is_better(score, heap.front().score)) {
+            std::pop_heap(heap.begin(), heap.end(), comp);
+            heap.back() = ExtractScore<T>(col, score);
+            std::push_heap(heap.begin(), heap.end(), comp);
+        }
+        else {
+            return;
+        }
+
+        if (heap.size() == limit && is_better(heap.front().score, score_cutoffs[row]))
+            score_cutoffs[row] = heap.front().score;
+    }
+
+    /* write the results sorted from the best to the worst match */
+    void write(Matrix& indices, Matrix& scores, T score_multiplier)
+    {
+        auto comp = [this](const ExtractScore<T>& a, const ExtractScore<T>& b) {
+            return heap_comp(a, b);
+        };
+
+        for (size_t row = 0; row < heaps.size(); ++row) {
+            auto& heap = heaps[row];
+            std::sort_heap(heap.begin(), heap.end(), comp);
+            for (size_t i = 0; i < heap.size(); ++i) {
+                indices.set(row, i, static_cast<int64_t>(heap[i].pos));
+                scores.set(row, i, heap[i].score * score_multiplier);
+            }
+            std::vector<ExtractScore<T>>().swap(heap);
+        }
+    }
+
+    bool lowest_score_worst;
+    size_t limit;
+    std::vector<std::vector<ExtractScore<T>>> heaps;
+    std::vector<T> score_cutoffs;
+};
+
+/*
+ * output of cdist_two_lists_run, which only keeps the scores passing the score_cutoff.
+ * Every row is only written by a single worker, so every row has its own buffer.
+ */
+template <typename T>
+struct SparseOutput {
+    static constexpr bool dynamic_score_cutoff = false;
+
+    SparseOutput(const RF_ScorerFlags* scorer_flags, size_t rows, T score_cutoff_)
+        : lowest_score_worst(is_lowest_score_worst<T>(scorer_flags)),
+          score_cutoff(score_cutoff_),
+          buffers(rows)
+    {}
+
+    T get_score_cutoff(size_t) const
+    {
+        return score_cutoff;
+    }
+
+    void set(size_t row, size_t col, T score)
+    {
+        if (lowest_score_worst ? score >= score_cutoff : score <= score_cutoff)
+            buffers[row].emplace_back(col, score);
+    }
+
+    /* write the results in coordinate format sorted by row and column */
+    SparseMatrix write(MatrixType dtype, T score_multiplier)
+    {
+        size_t count = 0;
+        for (const auto& buffer : buffers)
+            count += buffer.size();
+
+        SparseMatrix result(dtype, count);
+        size_t pos = 0;
+        for (size_t row = 0; row < buffers.size(); ++row) {
+            for (const auto& elem : buffers[row]) {
+                result.rows.set(pos, 0, static_cast<int64_t>(row));
+                result.cols.set(pos, 0, static_cast<int64_t>(elem.pos));
+                result.scores.set(pos, 0, elem.score * score_multiplier);
+                ++pos;
+            }
+            std::vector<ExtractScore<T>>().swap(buffers[row]);
+        }
+        return result;
+    }
+
+    bool lowest_score_worst;
+    T score_cutoff;
+    std::vector<std::vector<ExtractScore<T>>> buffers;
+};
+
+/*
+ * calculate the scores between all queries and choices and pass them to the output.
+ * Every row is only calculated by a single worker
+ */
+template <typename T, typename Output>
+static void cdist_two_lists_run(const RF_ScorerFlags* scorer_flags, const RF_Kwargs* kwargs, RF_Scorer* scorer,
+                                const std::vector<RF_StringWrapper>& queries,
+                                const std::vector<RF_StringWrapper>& choices, int workers, T score_hint,
+                                T worst_score, Output& output)
 {
     int64_t rows = queries.size();
     int64_t cols = choices.size();
-    Matrix matrix(dtype, static_cast<size_t>(rows), static_cast<size_t>(cols));
     bool multiStringInit = scorer_flags->flags & RF_SCORER_FLAG_MULTI_STRING_INIT;
+    bool lowest_score_worst = is_lowest_score_worst<T>(scorer_flags);
 
-    if (queries.empty() || choices.empty()) return matrix;
+    if (queries.empty() || choices.empty()) return;
 
     if (multiStringInit) {
         std::vector<size_t> row_idx(rows);
@@ -570,88 +1542,100 @@ static Matrix cdist_two_lists_impl(const RF_ScorerFlags* scorer_flags, const RF_
 
         for (auto it = none_begin; it != row_idx.end(); it++)
             for (int64_t col = 0; col < cols; ++col)
-                matrix.set(*it, col, worst_score * score_multiplier);
+                output.set(*it, col, worst_score);
 
         row_idx.erase(none_begin, row_idx.end());
 
         /* all elements are None */
-        if (row_idx.empty()) return matrix;
+        if (row_idx.empty()) return;
 
-        /* sort into blocks fitting simd vectors */
+        /* sort into blocks fitting simd vectors, longest strings first, since they take the longest */
         std::stable_sort(row_idx.begin(), row_idx.end(), [&queries](size_t i1, size_t i2) {
             size_t len1 = queries[i1].size();
-            if (len1 <= 64)
-                len1 = len1 / 8;
-            else
-                len1 = (64 / 8) + len1 / 64;
-
             size_t len2 = queries[i2].size();
-            if (len2 <= 64)
-                len2 = len2 / 8;
-            else
-                len2 = (64 / 8) + len2 / 64;
-
-            return len1 > len2;
+            size_t key1 = (len1 <= 64) ? simd_length_bucket(len1) : 4 + len1 / 64;
+            size_t key2 = (len2 <= 64) ? simd_length_bucket(len2) : 4 + len2 / 64;
+            return key1 > key2;
         });
 
-        size_t smallest_size = queries[row_idx.back()].size();
-        size_t step_size;
-        if (smallest_size <= 8)
-            step_size = 256 / 8;
-        else if (smallest_size <= 16)
-            step_size = 256 / 16;
-        else if (smallest_size <= 32)
-            step_size = 256 / 32;
-        else
-            step_size = 256 / 64;
+        /*
+         * split the rows into blocks of up to 32 strings of a single length bucket, so the simd vectors are
+         * filled with strings of a similar length. Strings longer than 64 characters are not supported by
+         * the simd implementation and are processed one at a time.
+         */
+        std::vector<std::pair<size_t, size_t>> blocks;
+        for (size_t begin = 0; begin < row_idx.size();) {
+            size_t len = queries[row_idx[begin]].size();
+            size_t block_size = (len <= 64) ? 256 / 8 : 1;
+            size_t end = begin + 1;
+            while (end < row_idx.size() && end - begin < block_size &&
+                   simd_length_bucket(queries[row_idx[end]].size()) == simd_length_bucket(len))
+                ++end;
+
+            blocks.emplace_back(begin, end);
+            begin = end;
+        }
 
-        run_parallel(workers, row_idx.size(), step_size, [&](int64_t row, int64_t row_end) {
-            /* todo add simd support for long sequences */
-            for (; row < row_end; ++row) {
-                if (queries[row_idx[row]].size() <= 64) break;
+        run_parallel(workers, blocks.size(), 1, [&](int64_t block, int64_t block_end) {
+            for (; block < block_end; ++block) {
+                size_t row = blocks[block].first;
+                size_t row_count = blocks[block].second - row;
+
+                /* todo add simd support for long sequences once the multi string scorers provide it */
+                if (queries[row_idx[row]].size() > 64) {
+                    RF_ScorerFunc scorer_func;
+                    PyErr2RuntimeExn(
+                        scorer->scorer_func_init(&scorer_func, kwargs, 1, &queries[row_idx[row]].string));
+                    RF_ScorerWrapper ScorerFunc(scorer_func);
+
+                    for (int64_t col = 0; col < cols; ++col) {
+                        T score;
+                        if (choices[col].is_none())
+                            score = worst_score;
+                        else
+                            ScorerFunc.call(&choices[col].string, output.get_score_cutoff(row_idx[row]),
+                                            score_hint, &score);
+
+                        output.set(row_idx[row], col, score);
+                    }
+                    continue;
+                }
+
+                assert(row_count <= 256 / 8);
+                T scores[256 / 8];
+                RF_String strings[256 / 8];
+
+                for (size_t i = 0; i < row_count; ++i)
+                    strings[i] = queries[row_idx[row + i]].string;
 
                 RF_ScorerFunc scorer_func;
                 PyErr2RuntimeExn(
-                    scorer->scorer_func_init(&scorer_func, kwargs, 1, &queries[row_idx[row]].string));
+                    scorer->scorer_func_init(&scorer_func, kwargs, static_cast<int64_t>(row_count), strings));
                 RF_ScorerWrapper ScorerFunc(scorer_func);
 
                 for (int64_t col = 0; col < cols; ++col) {
-                    T score;
-                    if (choices[col].is_none())
-                        score = worst_score;
-                    else
-                        ScorerFunc.call(&choices[col].string, score_cutoff, score_hint, &score);
-
-                    matrix.set(row_idx[row], col, score * score_multiplier);
+                    if (choices[col].is_none()) {
+                        for (size_t i = 0; i < row_count; ++i)
+                            scores[i] = worst_score;
+                    }
+                    else {
+                        /* the strings are scored together, so the least strict score_cutoff has to be used */
+                        T score_cutoff = output.get_score_cutoff(row_idx[row]);
+                        if (Output::dynamic_score_cutoff) {
+                            for (size_t i = 1; i < row_count; ++i) {
+                                T row_cutoff = output.get_score_cutoff(row_idx[row + i]);
+                                if (lowest_score_worst ? row_cutoff < score_cutoff : row_cutoff > score_cutoff)
+                                    score_cutoff = row_cutoff;
+                            }
+                        }
+
+                        ScorerFunc.call(&choices[col].string, score_cutoff, score_hint, scores);
+                    }
+
+                    for (size_t i = 0; i < row_count; ++i)
+                        output.set(row_idx[row + i], col, scores[i]);
                 }
             }
-
-            int64_t row_count = row_end - row;
-            if (row_count == 0) return;
-
-            assert(row_count <= 256 / 8);
-            T scores[256 / 8];
-            RF_String strings[256 / 8];
-
-            for (int64_t i = 0; i < row_count; ++i)
-                strings[i] = queries[row_idx[row + i]].string;
-
-            RF_ScorerFunc scorer_func;
-            PyErr2RuntimeExn(scorer->scorer_func_init(&scorer_func, kwargs, row_count, strings));
-            RF_ScorerWrapper ScorerFunc(scorer_func);
-
-            for (int64_t col = 0; col < cols; ++col) {
-                if (choices[col].is_none()) {
-                    for (int64_t i = 0; i < row_count; ++i)
-                        scores[i] = worst_score;
-                }
-                else {
-                    ScorerFunc.call(&choices[col].string, score_cutoff, score_hint, scores);
-                }
-
-                for (int64_t i = 0; i < row_count; ++i)
-                    matrix.set(row_idx[row + i], col, scores[i] * score_multiplier);
-            }
         });
     }
     else {
@@ -659,7 +1643,7 @@ static Matrix cdist_two_lists_impl(const RF_ScorerFlags* scorer_flags, const RF_
             for (; row < row_end; ++row) {
                 if (queries[row].is_none()) {
                     for (int64_t col = 0; col < cols; ++col)
-                        matrix.set(row, col, worst_score * score_multiplier);
+                        output.set(row, col, worst_score);
 
                     continue;
                 }
@@ -673,43 +1657,257 @@ static Matrix cdist_two_lists_impl(const RF_ScorerFlags* scorer_flags, const RF_
                     if (choices[col].is_none())
                         score = worst_score;
                     else
-                        ScorerFunc.call(&choices[col].string, score_cutoff, score_hint, &score);
+                        ScorerFunc.call(&choices[col].string, output.get_score_cutoff(row), score_hint,
+                                        &score);
 
-                    matrix.set(row, col, score * score_multiplier);
+                    output.set(row, col, score);
                 }
             }
         });
     }
+}
 
+template <typename T>
+static Matrix cdist_two_lists_impl(const RF_ScorerFlags* scorer_flags, const RF_Kwargs* kwargs,
+                                   RF_Scorer* scorer, const std::vector<RF_StringWrapper>& queries,
+                                   const std::vector<RF_StringWrapper>& choices, MatrixType dtype,
+                                   int workers, T score_cutoff, T score_hint, T score_multiplier,
+                                   T worst_score, void* out = nullptr)
+{
+    Matrix matrix = out ? Matrix(dtype, queries.size(), choices.size(), out)
+                        : Matrix(dtype, queries.size(), choices.size());
+    DenseOutput<T> output(matrix, score_cutoff, score_multiplier);
+    cdist_two_lists_run<T>(scorer_flags, kwargs, scorer, queries, choices, workers, score_hint, worst_score,
+                           output);
     return matrix;
 }
 
+/*
+ * calculate the best limit choices for each query. Returns a matrix with the indices of these choices
+ * and a matrix with the corresponding scores. Both are sorted from the best to the worst match.
+ */
+template <typename T>
+static std::pair<Matrix, Matrix>
+cdist_topk_impl(const RF_ScorerFlags* scorer_flags, const RF_Kwargs* kwargs, RF_Scorer* scorer,
+                const std::vector<RF_StringWrapper>& queries, const std::vector<RF_StringWrapper>& choices,
+                MatrixType dtype, int workers, size_t limit, T score_cutoff, T score_hint, T score_multiplier,
+                T worst_score)
+{
+    limit = std::min(limit, choices.size());
+    std::pair<Matrix, Matrix> result(Matrix(MatrixType::INT64, queries.size(), limit),
+                                     Matrix(dtype, queries.size(), limit));
+    if (limit == 0) return result;
+
+    TopKOutput<T> output(scorer_flags, queries.size(), limit, score_cutoff);
+    cdist_two_lists_run<T>(scorer_flags, kwargs, scorer, queries, choices, workers, score_hint, worst_score,
+                           output);
+    output.write(result.first, result.second, score_multiplier);
+    return result;
+}
+
+/*
+ * calculate the scores between all queries and choices, but only keep the scores passing the score_cutoff
+ */
 template <typename T>
-static Matrix cpdist_cpp_impl(const RF_Kwargs* kwargs, RF_Scorer* scorer,
+static SparseMatrix cdist_sparse_impl(const RF_ScorerFlags* scorer_flags, const RF_Kwargs* kwargs,
+                                      RF_Scorer* scorer, const std::vector<RF_StringWrapper>& queries,
+                                      const std::vector<RF_StringWrapper>& choices, MatrixType dtype,
+                                      int workers, T score_cutoff, T score_hint, T score_multiplier,
+                                      T worst_score)
+{
+    SparseOutput<T> output(scorer_flags, queries.size(), score_cutoff);
+    cdist_two_lists_run<T>(scorer_flags, kwargs, scorer, queries, choices, workers, score_hint, worst_score,
+                           output);
+    return output.write(dtype, score_multiplier);
+}
+
+static inline bool string_equal(const RF_String& a, const RF_String& b)
+{
+    if (a.kind != b.kind || a.length != b.length) return false;
+    return a.data == b.data ||
+           memcmp(a.data, b.data, static_cast<size_t>(a.length) * get_char_size(a.kind)) == 0;
+}
+
+/*
+ * amount of rows processed by a single task in cpdist. Every task should perform a similar
+ * amount of work and every worker should receive multiple tasks to balance the load.
+ * The average string length is estimated from a sample of the rows.
+ */
+static size_t cpdist_batch_size(const std::vector<RF_StringWrapper>& queries,
+                                const std::vector<RF_StringWrapper>& choices, int workers)
+{
+    size_t rows = queries.size();
+    size_t step = std::max<size_t>(1, rows / 1024);
+    size_t sampled = 0;
+    size_t total_length = 0;
+    for (size_t row = 0; row < rows; row += step) {
+        total_length += queries[row].size() + choices[row].size();
+        ++sampled;
+    }
+
+    size_t worker_count = (workers < 0) ? hardware_thread_count() : static_cast<size_t>(std::max(workers, 1));
+    size_t average_length = std::max<size_t>(1, total_length / std::max<size_t>(1, sampled));
+    size_t batch_size = std::max<size_t>(1, 4096 / average_length);
+    if (worker_count > 1) batch_size = std::min(batch_size, std::max<size_t>(1, rows / (worker_count * 4)));
+    return batch_size;
+}
+
+/* consecutive rows of cpdist, which are processed together by a single task */
+struct CpdistBlock {
+    enum class Mode {
+        /* every pair is scored separately */
+        UNCACHED,
+        /* all rows share the same query, so a cached scorer is created once for the query */
+        CACHED_QUERY,
+        /* all rows share the same choice, so the queries are scored together using simd */
+        MULTI_QUERY
+    };
+
+    CpdistBlock(Mode mode_, size_t begin_, size_t end_) : mode(mode_), begin(begin_), end(end_)
+    {}
+
+    Mode mode;
+    size_t begin;
+    size_t end;
+};
+
+template <typename T>
+static Matrix cpdist_cpp_impl(const RF_ScorerFlags* scorer_flags, const RF_Kwargs* kwargs, RF_Scorer* scorer,
                               const std::vector<RF_StringWrapper>& queries,
                               const std::vector<RF_StringWrapper>& choices, MatrixType dtype, int workers,
                               T score_cutoff, T score_hint, T score_multiplier, T worst_score)
 {
-    int64_t rows = queries.size();
-    int64_t cols = 1;
-    Matrix matrix(dtype, static_cast<size_t>(rows), static_cast<size_t>(cols));
+    size_t rows = queries.size();
+    Matrix matrix(dtype, rows, 1);
 
     if (queries.empty() || choices.empty()) return matrix;
 
-    // TODO: Adjust the batch size based on the query, choices & hardware available
-    const int batchSize = 16;
+    size_t batch_size = cpdist_batch_size(queries, choices, workers);
+    std::vector<CpdistBlock> blocks;
+    auto add_blocks = [&](CpdistBlock::Mode mode, size_t begin, size_t end) {
+        for (; begin < end; begin += batch_size)
+            blocks.emplace_back(mode, begin, std::min(begin + batch_size, end));
+    };
 
-    run_parallel(workers, rows, batchSize, [&](int64_t row, int64_t row_end) {
-        for (; row < row_end; ++row) {
-            T score;
-            if (choices[row].is_none() || queries[row].is_none())
-                score = worst_score;
-            else
-                RF_UncachedScorerWrapper(scorer->uncached_scorer_func)
-                    .call(&queries[row].string, &choices[row].string, kwargs, score_cutoff, score_hint,
-                          &score);
+    auto same_string = [](const RF_StringWrapper& a, const RF_StringWrapper& b) {
+        return !a.is_none() && !b.is_none() && string_equal(a.string, b.string);
+    };
+
+    /*
+     * Only rows following each other are grouped. Moving rows with equal strings next to each other
+     * costs more than it saves for cheap scorers, since the rows are no longer processed in the
+     * order they are stored in memory.
+     */
+    bool multi_string = scorer_flags->flags & RF_SCORER_FLAG_MULTI_STRING_INIT;
+    size_t uncached_begin = 0;
+    for (size_t begin = 0; begin < rows;) {
+        size_t end = begin + 1;
+        CpdistBlock::Mode mode = CpdistBlock::Mode::CACHED_QUERY;
+
+        /* rows including None are scored as worst_score by the uncached path */
+        if (queries[begin].is_none() || choices[begin].is_none()) {
+            begin = end;
+            continue;
+        }
+
+        /* rows sharing the same query reuse a cached scorer */
+        while (end < rows && same_string(queries[end], queries[begin]) && !choices[end].is_none())
+            ++end;
+
+        /* rows sharing the same choice are scored together using simd */
+        if (end - begin == 1 && multi_string) {
+            mode = CpdistBlock::Mode::MULTI_QUERY;
+            while (end < rows && same_string(choices[end], choices[begin]) && !queries[end].is_none())
+                ++end;
+        }
+
+        if (end - begin > 1) {
+            add_blocks(CpdistBlock::Mode::UNCACHED, uncached_begin, begin);
+            add_blocks(mode, begin, end);
+            uncached_begin = end;
+        }
+        begin = end;
+    }
+    add_blocks(CpdistBlock::Mode::UNCACHED, uncached_begin, rows);
+
+    auto score_uncached = [&](size_t row) {
+        T score;
+        if (choices[row].is_none() || queries[row].is_none())
+            score = worst_score;
+        else
+            RF_UncachedScorerWrapper(scorer->uncached_scorer_func)
+                .call(&queries[row].string, &choices[row].string, kwargs, score_cutoff, score_hint, &score);
+
+        matrix.set(row, 0, score * score_multiplier);
+    };
+
+    run_parallel(workers, static_cast<int64_t>(blocks.size()), 1, [&](int64_t block_idx, int64_t block_end) {
+        for (; block_idx < block_end; ++block_idx) {
+            const auto& block = blocks[static_cast<size_t>(block_idx)];
+
+            switch (block.mode) {
+            case CpdistBlock::Mode::UNCACHED:
+                for (size_t row = block.begin; row < block.end; ++row)
+                    score_uncached(row);
+                break;
+            case CpdistBlock::Mode::CACHED_QUERY:
+            {
+                RF_ScorerFunc scorer_func;
+                PyErr2RuntimeExn(
+                    scorer->scorer_func_init(&scorer_func, kwargs, 1, &queries[block.begin].string));
+                RF_ScorerWrapper ScorerFunc(scorer_func);
 
-            matrix.set(row, 0, score * score_multiplier);
+                for (size_t row = block.begin; row < block.end; ++row) {
+                    T score;
+                    ScorerFunc.call(&choices[row].string, score_cutoff, score_hint, &score);
+                    matrix.set(row, 0, score * score_multiplier);
+                }
+                break;
+            }
+            case CpdistBlock::Mode::MULTI_QUERY:
+            {
+                /* the queries are grouped by length, since the simd implementation uses the longest query */
+                constexpr size_t max_count = 256 / 8;
+                size_t bucket_rows[4][max_count];
+                size_t bucket_counts[4] = {0, 0, 0, 0};
+
+                auto score_bucket = [&](size_t bucket) {
+                    size_t count = bucket_counts[bucket];
+                    bucket_counts[bucket] = 0;
+                    if (count == 1) return score_uncached(bucket_rows[bucket][0]);
+
+                    T scores[max_count];
+                    RF_String strings[max_count];
+                    for (size_t i = 0; i < count; ++i)
+                        strings[i] = queries[bucket_rows[bucket][i]].string;
+
+                    RF_ScorerFunc scorer_func;
+                    PyErr2RuntimeExn(
+                        scorer->scorer_func_init(&scorer_func, kwargs, static_cast<int64_t>(count), strings));
+                    RF_ScorerWrapper ScorerFunc(scorer_func);
+                    ScorerFunc.call(&choices[block.begin].string, score_cutoff, score_hint, scores);
+
+                    for (size_t i = 0; i < count; ++i)
+                        matrix.set(bucket_rows[bucket][i], 0, scores[i] * score_multiplier);
+                };
+
+                for (size_t row = block.begin; row < block.end; ++row) {
+                    size_t bucket = simd_length_bucket(queries[row].size());
+                    /* strings longer than 64 characters are not supported by the simd implementation */
+                    if (bucket >= 4) {
+                        score_uncached(row);
+                        continue;
+                    }
+
+                    bucket_rows[bucket][bucket_counts[bucket]++] = row;
+                    if (bucket_counts[bucket] == max_count) score_bucket(bucket);
+                }
+
+                for (size_t bucket = 0; bucket < 4; ++bucket)
+                    if (bucket_counts[bucket]) score_bucket(bucket);
+                break;
+            }
+            }
         }
     });
 
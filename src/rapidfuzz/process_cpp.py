@@ -2,6 +2,14 @@
 # Copyright (C) 2022 Max Bachmann
 from __future__ import annotations
 
+from rapidfuzz._result_cache import ResultCache
+from rapidfuzz._utils import (
+    ThreadPoolContext,
+    as_output_buffer,
+    iter_cdist_blocks,
+    sparse_matrix_type,
+    to_sparse_matrix,
+)
 from rapidfuzz.fuzz import ratio
 from rapidfuzz.process_cpp_impl import (
     FLOAT32 as _FLOAT32,
@@ -14,6 +22,10 @@ from rapidfuzz.process_cpp_impl import (
     UINT16 as _UINT16,
     UINT32 as _UINT32,
     UINT64 as _UINT64,
+    MutablePreparedChoices,
+    PreparedChoices,
+    QueryCache,
+    _set_thread_pool_size,
     cdist as _cdist,
     cpdist as _cpdist,
     extract,
@@ -21,7 +33,30 @@ from rapidfuzz.process_cpp_impl import (
     extractOne,
 )
 
-__all__ = ["extract", "extract_iter", "extractOne", "cdist", "cpdist"]
+__all__ = [
+    "MutablePreparedChoices",
+    "PreparedChoices",
+    "QueryCache",
+    "ResultCache",
+    "cdist",
+    "cdist_iter",
+    "cpdist",
+    "extract",
+    "extractOne",
+    "extract_iter",
+    "set_thread_pool",
+]
+
+
+def set_thread_pool(workers=None):
+    if workers is None:
+        workers = 0
+    elif workers == 0 or workers < -1:
+        msg = "workers has to be a positive number, -1 or None"
+        raise ValueError(msg)
+
+    previous = _set_thread_pool_size(workers)
+    return ThreadPoolContext(lambda: _set_thread_pool_size(previous))
 
 
 def _dtype_to_type_num(dtype):
@@ -65,25 +100,82 @@ def cdist(
     score_multiplier=1,
     dtype=None,
     workers=1,
+    limit=None,
+    output="dense",
+    out=None,
     **kwargs,
 ):
     import numpy as np
 
+    out_array = None
+    if out is not None:
+        out_array = as_output_buffer(out, dtype, (len(queries), len(choices)))
+        dtype = out_array.dtype.type
+
+    if output == "sparse":
+        sparse_matrix_type()
+
     dtype = _dtype_to_type_num(dtype)
-    return np.asarray(
-        _cdist(
-            queries,
-            choices,
-            scorer=scorer,
-            processor=processor,
-            score_cutoff=score_cutoff,
-            score_hint=score_hint,
-            score_multiplier=score_multiplier,
-            dtype=dtype,
-            workers=workers,
-            **kwargs,
+    result = _cdist(
+        queries,
+        choices,
+        scorer=scorer,
+        processor=processor,
+        score_cutoff=score_cutoff,
+        score_hint=score_hint,
+        score_multiplier=score_multiplier,
+        dtype=dtype,
+        workers=workers,
+        limit=limit,
+        output=output,
+        out=out_array,
+        **kwargs,
+    )
+
+    if output == "sparse":
+        rows, cols, scores = result
+        return to_sparse_matrix(
+            np.asarray(rows), np.asarray(cols), np.asarray(scores), shape=(len(queries), len(choices))
         )
+    if limit is not None:
+        indices, scores = result
+        return np.asarray(indices), np.asarray(scores)
+    if out is not None:
+        return out
+    return np.asarray(result)
+
+
+def cdist_iter(
+    queries,
+    choices,
+    *,
+    scorer=ratio,
+    processor=None,
+    score_cutoff=None,
+    score_hint=None,
+    score_multiplier=1,
+    dtype=None,
+    workers=1,
+    chunk_size=1024,
+    **kwargs,
+):
+    if isinstance(queries, PreparedChoices):
+        msg = "queries can not be PreparedChoices, since they are split into blocks"
+        raise TypeError(msg)
+
+    if not isinstance(choices, PreparedChoices):
+        choices = PreparedChoices(choices, processor=processor)
+
+    kwargs.update(
+        scorer=scorer,
+        processor=processor,
+        score_cutoff=score_cutoff,
+        score_hint=score_hint,
+        score_multiplier=score_multiplier,
+        dtype=dtype,
+        workers=workers,
     )
+    return iter_cdist_blocks(cdist, queries, choices, chunk_size, kwargs)
 
 
 def cpdist(
@@ -1,6 +1,9 @@
 # distutils: language=c++
 # cython: language_level=3, binding=True, linetrace=True
 
+from rapidfuzz import _catalog
+from rapidfuzz._result_cache import result_cache_key
+from rapidfuzz._utils import as_arrow_strings, numpy_string_buffer
 from rapidfuzz.fuzz import WRatio, ratio
 
 cimport cython
@@ -16,18 +19,28 @@ from cpp_common cimport (
     is_none
 )
 from cpython cimport Py_buffer
-from cpython.buffer cimport PyBUF_F_CONTIGUOUS, PyBUF_ND, PyBUF_SIMPLE
+from cpython.buffer cimport (
+    PyBUF_C_CONTIGUOUS,
+    PyBUF_F_CONTIGUOUS,
+    PyBUF_ND,
+    PyBUF_SIMPLE,
+    PyBUF_WRITABLE,
+    PyBuffer_Release,
+    PyObject_GetBuffer,
+)
 from cpython.exc cimport PyErr_CheckSignals
 from cpython.list cimport PyList_New, PyList_SET_ITEM
 from cpython.object cimport PyObject
 from cpython.ref cimport Py_INCREF
 from libcpp.cmath cimport floor, isnan
-from libc.stdint cimport int32_t, int64_t, uint8_t, uint64_t
+from libc.stdint cimport int32_t, int64_t, uint8_t, uint32_t, uint64_t, uintptr_t
 from libcpp cimport algorithm, bool
-from libcpp.utility cimport move
+from libcpp.utility cimport move, pair
 from libcpp.vector cimport vector
 
 import heapq
+from collections import OrderedDict
+import os
 from array import array
 import sys
 
@@ -48,6 +61,7 @@ from rapidfuzz cimport (
     RF_ScorerFlags,
     RF_ScorerFunc,
     RF_String,
+    RF_StringType,
 )
 
 pandas_NA = None
@@ -94,6 +108,14 @@ cdef extern from "process_cpp.hpp":
         PyObjectWrapper val
         RF_StringWrapper proc_val
 
+    cdef cppclass LengthRange:
+        pass
+
+    cdef cppclass LengthBound[T]:
+        LengthBound()
+        LengthBound(const RF_ScorerFlags*, int64_t)
+        bool possible(int64_t, T)
+
     cdef cppclass RF_ScorerWrapper:
         RF_ScorerFunc scorer_func
 
@@ -106,11 +128,26 @@ cdef extern from "process_cpp.hpp":
 
     cdef vector[DictMatchElem[T]] extract_dict_impl[T](
         const RF_Kwargs*, const RF_ScorerFlags*, RF_Scorer*,
-        const RF_StringWrapper&, const vector[DictStringElem]&, T, T) except +
+        const RF_StringWrapper&, const vector[DictStringElem]&, T, T, size_t, int) except +
 
     cdef vector[ListMatchElem[T]] extract_list_impl[T](
         const RF_Kwargs*, const RF_ScorerFlags*, RF_Scorer*,
-        const RF_StringWrapper&, const vector[ListStringElem]&, T, T) except +
+        const RF_StringWrapper&, const vector[ListStringElem]&, T, T, size_t, int,
+        const vector[LengthRange]*) except +
+
+    cdef DictMatchElem[T] extractOne_dict_impl[T](
+        const RF_Kwargs*, const RF_ScorerFlags*, RF_Scorer*,
+        const RF_StringWrapper&, const vector[DictStringElem]&, T, T, int) except +
+
+    cdef ListMatchElem[T] extractOne_list_impl[T](
+        const RF_Kwargs*, const RF_ScorerFlags*, RF_Scorer*,
+        const RF_StringWrapper&, const vector[ListStringElem]&, T, T, int,
+        const vector[LengthRange]*) except +
+
+    cdef void compact_choices[StringElem](vector[StringElem]&, vector[uint64_t]&) except +
+    cdef vector[RF_StringWrapper] get_choice_views[StringElem](const vector[StringElem]&, size_t) except +
+    cdef vector[LengthRange] get_block_lengths[StringElem](const vector[StringElem]&) except +
+    cdef void extend_block_lengths(vector[LengthRange]&, size_t, const RF_StringWrapper&) except +
 
     cdef bool is_lowest_score_worst[T](const RF_ScorerFlags* scorer_flags)
     cdef T get_optimal_score[T](const RF_ScorerFlags* scorer_flags)
@@ -131,6 +168,7 @@ cdef extern from "process_cpp.hpp":
     cdef cppclass RfMatrix "Matrix":
         RfMatrix() except +
         RfMatrix(MatrixType, size_t, size_t) except +
+        RfMatrix(MatrixType, size_t, size_t, void*) except +
         int get_dtype_size() except +
         const char* get_format() except +
         void set[T](size_t, size_t, T) except +
@@ -142,18 +180,153 @@ cdef extern from "process_cpp.hpp":
         bool vector_output
 
     RfMatrix cdist_single_list_impl[T](  const RF_ScorerFlags* scorer_flags, const RF_Kwargs*, RF_Scorer*,
-        const vector[RF_StringWrapper]&, MatrixType, int, T, T, T) except +
+        const vector[RF_StringWrapper]&, MatrixType, int, T, T, T, T, void*) except +
     RfMatrix cdist_two_lists_impl[T](    const RF_ScorerFlags* scorer_flags, const RF_Kwargs*, RF_Scorer*,
-        const vector[RF_StringWrapper]&, const vector[RF_StringWrapper]&, MatrixType, int, T, T, T) except +
-    RfMatrix cpdist_cpp_impl[T](    const RF_Kwargs*, RF_Scorer*,
-        const vector[RF_StringWrapper]&, const vector[RF_StringWrapper]&, MatrixType, int, T, T, T) except +
+        const vector[RF_StringWrapper]&, const vector[RF_StringWrapper]&, MatrixType, int, T, T, T, T, void*) except +
+    pair[RfMatrix, RfMatrix] cdist_topk_impl[T](const RF_ScorerFlags* scorer_flags, const RF_Kwargs*, RF_Scorer*,
+        const vector[RF_StringWrapper]&, const vector[RF_StringWrapper]&, MatrixType, int, size_t, T, T, T, T) except +
+    cdef cppclass SparseMatrix:
+        RfMatrix rows
+        RfMatrix cols
+        RfMatrix scores
+
+    SparseMatrix cdist_sparse_impl[T](const RF_ScorerFlags* scorer_flags, const RF_Kwargs*, RF_Scorer*,
+        const vector[RF_StringWrapper]&, const vector[RF_StringWrapper]&, MatrixType, int, T, T, T, T) except +
+    RfMatrix cpdist_cpp_impl[T](const RF_ScorerFlags* scorer_flags, const RF_Kwargs*, RF_Scorer*,
+        const vector[RF_StringWrapper]&, const vector[RF_StringWrapper]&, MatrixType, int, T, T, T, T) except +
+
+
+cdef extern from "process_cpp.hpp":
+    int64_t set_thread_pool_size(int64_t) except +
+    void reset_thread_pool_after_fork()
+    void default_process_strings(vector[RF_StringWrapper]&, vector[uint64_t]&, int) except +
+    void processor_strings(vector[RF_StringWrapper]&, uint32_t, int) except +
+    void processor_choices(vector[ListStringElem]&, uint32_t, int) except +
+    void processor_choices(vector[DictStringElem]&, uint32_t, int) except +
+    object processed_string_to_unicode(const RF_String&) except +
+    RF_Scorer CachedScorerContext
+
+    cdef struct ArrowStringChunk:
+        const uint8_t* validity
+        const void* offsets
+        const uint8_t* data
+        int64_t offset
+        int64_t length
+        bool large_offsets
+
+    void numpy_string_choices(vector[ListStringElem]&, const char*, int64_t, int64_t, int64_t, bool) except +
+    void arrow_string_choices(vector[ListStringElem]&, vector[uint64_t]&, const vector[ArrowStringChunk]&) except +
+
+
+def _set_thread_pool_size(int64_t workers):
+    return set_thread_pool_size(workers)
+
+
+def _reset_thread_pool_after_fork():
+    reset_thread_pool_after_fork()
+
+
+# the threads of the pool do not exist in the child process
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_thread_pool_after_fork)
+
+
+# amount of strings converted to Python strings at once by default_process_batch. The
+# processed strings of a chunk are still cached, when their Python strings are created
+cdef Py_ssize_t default_process_chunk_size = 65536
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def _default_process_batch(list sentences, int workers, default_process):
+    """
+    implementation of utils.default_process_batch. Strings of type str are processed without
+    holding the GIL using the thread pool. None is kept and other sequences are processed
+    by the passed default_process.
+    """
+    cdef vector[RF_StringWrapper] strings
+    cdef vector[uint64_t] buffer
+    cdef Py_ssize_t i, chunk_start, chunk_end
+    cdef RF_String* proc_str
+    cdef Py_ssize_t sentence_count = len(sentences)
+    results = PyList_New(sentence_count)
+
+    for chunk_start in range(0, sentence_count, default_process_chunk_size):
+        chunk_end = min(chunk_start + default_process_chunk_size, sentence_count)
+        strings.clear()
+        strings.resize(chunk_end - chunk_start)
+        for i in range(chunk_start, chunk_end):
+            sentence = sentences[i]
+            if type(sentence) is str:
+                strings[i - chunk_start] = RF_StringWrapper(conv_sequence(sentence))
+
+        default_process_strings(strings, buffer, workers)
+
+        for i in range(chunk_start, chunk_end):
+            sentence = sentences[i]
+            if type(sentence) is str:
+                proc_str = &strings[i - chunk_start].string
+                result = sentence if proc_str.data == NULL else processed_string_to_unicode(proc_str[0])
+            elif is_none(sentence):
+                result = sentence
+            else:
+                result = default_process(sentence)
+
+            Py_INCREF(result)
+            PyList_SET_ITEM(results, i, result)
 
+    return results
 
-cdef inline vector[DictStringElem] preprocess_dict(queries, processor) except *:
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def _processor_batch(list sentences, int workers, processor):
+    """
+    implementation of utils.Processor.batch. Strings of type str are processed without
+    holding the GIL using the thread pool. None is kept and other objects are passed
+    to the processor.
+    """
+    cdef vector[RF_StringWrapper] strings
+    cdef Py_ssize_t i, chunk_start, chunk_end
+    cdef RF_String* proc_str
+    cdef uint32_t steps = processor._RF_ProcessorSteps
+    cdef Py_ssize_t sentence_count = len(sentences)
+    results = PyList_New(sentence_count)
+
+    for chunk_start in range(0, sentence_count, default_process_chunk_size):
+        chunk_end = min(chunk_start + default_process_chunk_size, sentence_count)
+        strings.clear()
+        strings.resize(chunk_end - chunk_start)
+        for i in range(chunk_start, chunk_end):
+            sentence = sentences[i]
+            if type(sentence) is str:
+                strings[i - chunk_start] = RF_StringWrapper(conv_sequence(sentence))
+
+        processor_strings(strings, steps, workers)
+
+        for i in range(chunk_start, chunk_end):
+            sentence = sentences[i]
+            if type(sentence) is str:
+                # strings, which are not changed by the processor, are still views into the sentence
+                proc_str = &strings[i - chunk_start].string
+                result = sentence if proc_str.dtor == NULL else processed_string_to_unicode(proc_str[0])
+            elif is_none(sentence):
+                result = sentence
+            else:
+                result = processor(sentence)
+
+            Py_INCREF(result)
+            PyList_SET_ITEM(results, i, result)
+
+    return results
+
+
+cdef inline vector[DictStringElem] preprocess_dict(queries, processor, int workers=1) except *:
     cdef vector[DictStringElem] proc_queries
     cdef int64_t queries_len = <int64_t>len(queries)
     cdef RF_String proc_str
     cdef RF_Preprocessor* processor_context = NULL
+    cdef bool parallel = False
     proc_queries.reserve(queries_len)
     cdef int64_t i
 
@@ -174,13 +347,18 @@ cdef inline vector[DictStringElem] preprocess_dict(queries, processor) except *:
         processor_capsule = getattr(processor, '_RF_Preprocess', processor)
         if PyCapsule_IsValid(processor_capsule, NULL):
             processor_context = <RF_Preprocessor*>PyCapsule_GetPointer(processor_capsule, NULL)
+        parallel = workers != 1 and hasattr(processor, '_RF_ProcessorSteps')
 
         # use RapidFuzz C-Api
         if processor_context != NULL and processor_context.version == PREPROCESSOR_STRUCT_VERSION:
             for i, (query_key, query) in enumerate(queries.items()):
                 if is_none(query):
                     continue
-                processor_context.preprocess(query, &proc_str)
+                # strings are processed by the thread pool afterwards
+                if parallel and type(query) is str:
+                    proc_str = conv_sequence(query)
+                else:
+                    processor_context.preprocess(query, &proc_str)
                 proc_queries.emplace_back(
                     i,
                     move(PyObjectWrapper(query_key)),
@@ -188,6 +366,9 @@ cdef inline vector[DictStringElem] preprocess_dict(queries, processor) except *:
                     move(RF_StringWrapper(proc_str))
                 )
 
+            if parallel:
+                processor_choices(proc_queries, <uint32_t>processor._RF_ProcessorSteps, workers)
+
         # Call Processor through Python
         else:
             for i, (query_key, query) in enumerate(queries.items()):
@@ -204,11 +385,12 @@ cdef inline vector[DictStringElem] preprocess_dict(queries, processor) except *:
     return move(proc_queries)
 
 
-cdef inline vector[ListStringElem] preprocess_list(queries, processor) except *:
+cdef inline vector[ListStringElem] preprocess_list(queries, processor, int workers=1) except *:
     cdef vector[ListStringElem] proc_queries
     cdef int64_t queries_len = <int64_t>len(queries)
     cdef RF_String proc_str
     cdef RF_Preprocessor* processor_context = NULL
+    cdef bool parallel = False
     proc_queries.reserve(queries_len)
     cdef int64_t i
 
@@ -228,19 +410,27 @@ cdef inline vector[ListStringElem] preprocess_list(queries, processor) except *:
         processor_capsule = getattr(processor, '_RF_Preprocess', processor)
         if PyCapsule_IsValid(processor_capsule, NULL):
             processor_context = <RF_Preprocessor*>PyCapsule_GetPointer(processor_capsule, NULL)
+        parallel = workers != 1 and hasattr(processor, '_RF_ProcessorSteps')
 
         # use RapidFuzz C-Api
         if processor_context != NULL and processor_context.version == PREPROCESSOR_STRUCT_VERSION:
             for i, query in enumerate(queries):
                 if is_none(query):
                     continue
-                processor_context.preprocess(query, &proc_str)
+                # strings are processed by the thread pool afterwards
+                if parallel and type(query) is str:
+                    proc_str = conv_sequence(query)
+                else:
+                    processor_context.preprocess(query, &proc_str)
                 proc_queries.emplace_back(
                     i,
                     move(PyObjectWrapper(query)),
                     move(RF_StringWrapper(proc_str))
                 )
 
+            if parallel:
+                processor_choices(proc_queries, <uint32_t>processor._RF_ProcessorSteps, workers)
+
         # Call Processor through Python
         else:
             for i, query in enumerate(queries):
@@ -256,6 +446,409 @@ cdef inline vector[ListStringElem] preprocess_list(queries, processor) except *:
     return move(proc_queries)
 
 
+cdef class PreparedChoices:
+    cdef vector[ListStringElem] proc_choices
+    cdef vector[uint64_t] buffer
+    cdef vector[LengthRange] block_lengths
+    # lists or the sequences of a loaded file, which are decoded on access
+    cdef object _choices
+    cdef object _keys
+    cdef object _processed
+    cdef readonly object processor
+    cdef public object result_cache
+    cdef readonly size_t version
+
+    def __init__(self, choices, *, processor=None, result_cache=None):
+        setupPandas()
+
+        self.processor = processor
+        self.result_cache = result_cache
+        if hasattr(choices, "items"):
+            self._keys = list(choices.keys())
+            self._choices = list(choices.values())
+        elif self.init_string_array(choices, processor):
+            self.block_lengths = move(get_block_lengths[ListStringElem](self.proc_choices))
+            return
+        else:
+            self._keys = None
+            arrow_strings = as_arrow_strings(choices)
+            self._choices = list(choices if arrow_strings is None else arrow_strings)
+
+        self.proc_choices = move(preprocess_list(self._choices, processor))
+        compact_choices[ListStringElem](self.proc_choices, self.buffer)
+        self.block_lengths = move(get_block_lengths[ListStringElem](self.proc_choices))
+
+    cdef bool init_string_array(self, choices, processor) except *:
+        """
+        read the buffers of numpy arrays with the dtype U / S and Arrow string arrays in place,
+        so no Python object is created for their elements. Returns False for all other choices
+        """
+        cdef vector[ArrowStringChunk] chunks
+        cdef ArrowStringChunk chunk
+        if processor and not hasattr(processor, "_RF_ProcessorSteps"):
+            return False
+
+        arrow_strings = as_arrow_strings(choices)
+        numpy_buffer = numpy_string_buffer(choices) if arrow_strings is None else None
+        if arrow_strings is not None:
+            for validity, offsets, data, offset, length, large_offsets in arrow_strings.buffers():
+                chunk.validity = <const uint8_t*><uintptr_t>validity
+                chunk.offsets = <const void*><uintptr_t>offsets
+                chunk.data = <const uint8_t*><uintptr_t>data
+                chunk.offset = offset
+                chunk.length = length
+                chunk.large_offsets = large_offsets
+                chunks.push_back(chunk)
+
+            arrow_string_choices(self.proc_choices, self.buffer, chunks)
+            self._choices = arrow_strings
+        # utils.Processor only accepts str
+        elif numpy_buffer is not None and (not processor or numpy_buffer[4]):
+            data, length, stride, itemsize, ucs4 = numpy_buffer
+            numpy_string_choices(self.proc_choices, <const char*><uintptr_t>data, length, stride, itemsize, ucs4)
+            self._choices = choices
+        else:
+            return False
+
+        self._keys = None
+        if processor:
+            processor_choices(self.proc_choices, <uint32_t>processor._RF_ProcessorSteps, 1)
+        return True
+
+    def __len__(self):
+        return len(self._choices)
+
+    def save(self, path):
+        _catalog.save(path, self._choices, self._keys, self.get_processed())
+
+    @classmethod
+    def load(cls, path, *, allow_pickle=False):
+        cdef PreparedChoices prepared = cls.__new__(cls)
+        cdef RF_String view
+        cdef size_t i
+        cdef uint8_t kind
+        cdef uint64_t char_size
+        cdef uint8_t string_none = _catalog.STRING_NONE
+        cdef uint8_t string_ucs1 = _catalog.STRING_UCS1
+        cdef uint8_t string_ucs2 = _catalog.STRING_UCS2
+        cdef uint8_t string_ucs4 = _catalog.STRING_UCS4
+        cdef uint8_t string_bytes = _catalog.STRING_BYTES
+
+        # the offsets and sizes of the preprocessed choices are checked while creating the views
+        prepared._choices, prepared._keys, prepared._processed = _catalog.load(path, allow_pickle)
+        prepared.processor = None
+
+        # the preprocessed choices are views into the memory mapped file
+        cdef const uint8_t[::1] types = prepared._processed.types
+        cdef const uint64_t[::1] starts = prepared._processed.starts
+        cdef const uint64_t[::1] sizes = prepared._processed.sizes
+        cdef const uint8_t[::1] data = prepared._processed.data
+        prepared.proc_choices.reserve(types.shape[0])
+        for i in range(<size_t>types.shape[0]):
+            kind = types[i]
+            if kind == string_none:
+                continue
+
+            if kind == string_ucs2:
+                view.kind = RF_StringType.RF_UINT16
+                char_size = 2
+            elif kind == string_ucs4:
+                view.kind = RF_StringType.RF_UINT32
+                char_size = 4
+            elif kind == string_ucs1 or kind == string_bytes:
+                view.kind = RF_StringType.RF_UINT8
+                char_size = 1
+            else:
+                raise ValueError("the file is corrupted")
+
+            # files written by save always end with padding, so data is never empty
+            if (
+                data.shape[0] == 0 or sizes[i] > <uint64_t>data.shape[0] or starts[i] > <uint64_t>data.shape[0] - sizes[i]
+                or starts[i] % char_size or sizes[i] % char_size
+            ):
+                raise ValueError("the file is corrupted")
+
+            view.dtor = NULL
+            view.context = NULL
+            view.data = <void*>(&data[0] + starts[i])
+            view.length = <int64_t>(sizes[i] // char_size)
+
+            prepared.proc_choices.emplace_back(<int64_t>i, move(PyObjectWrapper()), move(RF_StringWrapper(view)))
+
+        prepared.block_lengths = move(get_block_lengths[ListStringElem](prepared.proc_choices))
+        return prepared
+
+    cdef object get_processed(self):
+        """
+        preprocessed choices as Python objects. These are only required for scorers,
+        which do not support the RapidFuzz C-API
+        """
+        if self._processed is None:
+            if self.processor:
+                self._processed = [x if is_none(x) else self.processor(x) for x in self._choices]
+            else:
+                self._processed = self._choices
+        return self._processed
+
+    cdef vector[RF_StringWrapper] get_views(self, const RF_ScorerFlags* scorer_flags) except *:
+        # only None is skipped during preprocessing
+        if not scorer_flags.flags & RF_SCORER_NONE_IS_WORST_SCORE and self.proc_choices.size() != <size_t>len(self._choices):
+            for choice in self._choices:
+                if is_none(choice):
+                    raise ValueError(f"passed unsupported element {choice}")
+
+        return move(get_choice_views[ListStringElem](self.proc_choices, len(self._choices)))
+
+    cdef convert_result(self, result):
+        """
+        map a result calculated on the preprocessed choices back to the original choice
+        """
+        index = result[2]
+        return (self._choices[index], result[1], index if self._keys is None else self._keys[index])
+
+
+# key of removed choices in a MutablePreparedChoices until it is compacted
+cdef object _REMOVED = object()
+
+
+cdef class MutablePreparedChoices(PreparedChoices):
+    # position of the choice of every key
+    cdef dict _slots
+    cdef size_t _removed_count
+
+    def __init__(self, choices=(), *, processor=None, result_cache=None):
+        cdef vector[ListStringElem] proc_choices
+        cdef size_t i
+        cdef size_t pos = 0
+        setupPandas()
+
+        if hasattr(choices, "items"):
+            self._keys = list(choices.keys())
+            self._choices = list(choices.values())
+        else:
+            self._choices = list(choices)
+            self._keys = list(range(len(self._choices)))
+
+        self._slots = {key: i for i, key in enumerate(self._keys)}
+        self._removed_count = 0
+        self.processor = processor
+        self.result_cache = result_cache
+
+        # every choice has an element, so the element of a choice is found at its index
+        proc_choices = move(preprocess_list(self._choices, processor))
+        self.proc_choices.reserve(len(self._choices))
+        for i in range(<size_t>len(self._choices)):
+            if pos < proc_choices.size() and <size_t>proc_choices[pos].index == i:
+                self.proc_choices.push_back(move(proc_choices[pos]))
+                pos += 1
+            else:
+                self.proc_choices.emplace_back(<int64_t>i, move(PyObjectWrapper()), move(RF_StringWrapper()))
+
+        compact_choices[ListStringElem](self.proc_choices, self.buffer)
+        self.block_lengths = move(get_block_lengths[ListStringElem](self.proc_choices))
+
+    def __len__(self):
+        return len(self._slots)
+
+    def __contains__(self, key):
+        return key in self._slots
+
+    def __getitem__(self, key):
+        return self._choices[self._slots[key]]
+
+    def add(self, key, choice):
+        cdef vector[ListStringElem] proc_choice
+        cdef int64_t index
+        separate_processed = self._processed is not None and self._processed is not self._choices
+        if separate_processed:
+            # the choice is only processed once. The string is a view into the processed choice,
+            # which is kept alive by _processed
+            proc_value = None if is_none(choice) else self.processor(choice)
+            proc_choice = move(preprocess_list((proc_value,), None))
+        else:
+            proc_choice = move(preprocess_list((choice,), self.processor))
+
+        self.version += 1
+        slot = self._slots.get(key)
+        if slot is None:
+            index = len(self._keys)
+            self._slots[key] = index
+            self._keys.append(key)
+            self._choices.append(choice)
+            if separate_processed:
+                self._processed.append(proc_value)
+            self.proc_choices.emplace_back(index, move(PyObjectWrapper()), move(RF_StringWrapper()))
+        else:
+            index = slot
+            self._choices[index] = choice
+            if separate_processed:
+                self._processed[index] = proc_value
+
+        # without a processor the string is a view into the choice, which is kept alive by _choices
+        if proc_choice.size():
+            self.proc_choices[index].proc_val = move(proc_choice[0].proc_val)
+        else:
+            self.proc_choices[index].proc_val = RF_StringWrapper()
+        extend_block_lengths(self.block_lengths, <size_t>index, self.proc_choices[index].proc_val)
+
+    def update(self, choices):
+        items = choices.items() if hasattr(choices, "items") else choices
+        for key, choice in items:
+            self.add(key, choice)
+
+    def remove(self, key):
+        cdef int64_t index = self._slots.pop(key)
+        self.version += 1
+        self._keys[index] = _REMOVED
+        self._choices[index] = None
+        if self._processed is not None and self._processed is not self._choices:
+            self._processed[index] = None
+        self.proc_choices[index].proc_val = RF_StringWrapper()
+
+        self._removed_count += 1
+        if self._removed_count * 4 > <size_t>len(self._keys):
+            self.compact()
+
+    def compact(self):
+        cdef vector[ListStringElem] proc_choices
+        cdef vector[uint64_t] buffer
+        cdef size_t i
+        if not self._removed_count:
+            return
+
+        keys = []
+        choices = []
+        separate_processed = self._processed is not None and self._processed is not self._choices
+        processed = [] if separate_processed else None
+        proc_choices.reserve(len(self._slots))
+        for i in range(self.proc_choices.size()):
+            key = self._keys[i]
+            if key is _REMOVED:
+                continue
+
+            self.proc_choices[i].index = len(keys)
+            proc_choices.push_back(move(self.proc_choices[i]))
+            keys.append(key)
+            choices.append(self._choices[i])
+            if separate_processed:
+                processed.append(self._processed[i])
+
+        # copy the choices into a new buffer, which releases the memory of the removed choices
+        compact_choices[ListStringElem](proc_choices, buffer)
+        self.proc_choices.swap(proc_choices)
+        self.buffer.swap(buffer)
+        self.block_lengths = move(get_block_lengths[ListStringElem](self.proc_choices))
+
+        if self._processed is self._choices:
+            processed = choices
+        self._keys = keys
+        self._choices = choices
+        self._processed = processed
+        self._slots = {key: i for i, key in enumerate(keys)}
+        self._removed_count = 0
+
+    def save(self, path):
+        self.compact()
+        PreparedChoices.save(self, path)
+
+    @classmethod
+    def load(cls, path, *, allow_pickle=False):
+        raise TypeError("MutablePreparedChoices can not be loaded, load them using PreparedChoices.load instead")
+
+    cdef vector[RF_StringWrapper] get_views(self, const RF_ScorerFlags* scorer_flags) except *:
+        # cdist creates a column for every choice, so the removed choices have to be dropped
+        self.compact()
+        if not scorer_flags.flags & RF_SCORER_NONE_IS_WORST_SCORE:
+            for choice in self._choices:
+                if is_none(choice):
+                    raise ValueError(f"passed unsupported element {choice}")
+
+        return move(get_choice_views[ListStringElem](self.proc_choices, len(self._choices)))
+
+
+cdef prepare_string_arrays(choices, processor):
+    """
+    numpy arrays with the dtype U / S and Arrow string arrays are wrapped in PreparedChoices,
+    which read their buffers in place instead of creating a Python object for every element
+    """
+    if not isinstance(choices, PreparedChoices) and (
+        numpy_string_buffer(choices) is not None or as_arrow_strings(choices) is not None
+    ):
+        return PreparedChoices(choices, processor=processor)
+    return choices
+
+
+cdef class _QueryCacheEntry:
+    cdef object proc_query
+    cdef RF_StringWrapper proc_str
+    cdef RF_ScorerFunc scorer_func
+    cdef bool scorer_initialized
+
+    def __dealloc__(self):
+        if self.scorer_initialized and self.scorer_func.dtor:
+            self.scorer_func.dtor(&self.scorer_func)
+
+    cdef RF_Scorer* get_scorer(self, RF_Scorer* scorer, const RF_Kwargs* kwargs, RF_Kwargs* cached_kwargs) except NULL:
+        """
+        scorer reusing the RF_ScorerFunc initialized for the query. It has to be called with cached_kwargs
+        """
+        if not self.scorer_initialized:
+            self.proc_str = move(RF_StringWrapper(conv_sequence(self.proc_query)))
+            scorer.scorer_func_init(&self.scorer_func, kwargs, 1, &self.proc_str.string)
+            self.scorer_initialized = True
+
+        cached_kwargs.context = &self.scorer_func
+        cached_kwargs.dtor = NULL
+        return &CachedScorerContext
+
+
+cdef class QueryCache:
+    cdef readonly Py_ssize_t maxsize
+    cdef readonly Py_ssize_t hits
+    cdef readonly Py_ssize_t misses
+    cdef object _entries
+
+    def __init__(self, maxsize=128):
+        if maxsize < 1:
+            raise ValueError("maxsize has to be a positive number")
+
+        self.maxsize = maxsize
+        self._entries = OrderedDict()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def clear(self):
+        self._entries.clear()
+        self.hits = 0
+        self.misses = 0
+
+    cdef _QueryCacheEntry lookup(self, query, processor, scorer, dict scorer_kwargs):
+        """
+        entry of the query, which is created when the query is not cached yet. None is returned
+        when the query or the scorer_kwargs are not hashable
+        """
+        cdef _QueryCacheEntry entry
+        key = (query, processor, scorer, tuple(sorted(scorer_kwargs.items())))
+        try:
+            entry = self._entries.get(key)
+        except TypeError:
+            return None
+
+        if entry is not None:
+            self.hits += 1
+            self._entries.move_to_end(key)
+            return entry
+
+        self.misses += 1
+        entry = _QueryCacheEntry()
+        entry.proc_query = processor(query) if callable(processor) else query
+        self._entries[key] = entry
+        if len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+        return entry
+
+
 cdef inline extractOne_dict_f64(
     query, choices, RF_Scorer* scorer, const RF_ScorerFlags* scorer_flags,
     processor,
@@ -281,6 +874,7 @@ cdef inline extractOne_dict_f64(
     cdef RF_ScorerWrapper ScorerFunc = RF_ScorerWrapper(scorer_func)
 
     cdef bool lowest_score_worst = is_lowest_score_worst[double](scorer_flags)
+    cdef LengthBound[double] length_bound = LengthBound[double](scorer_flags, proc_query.string.length)
     cdef double optimal_score = get_optimal_score[double](scorer_flags)
 
     cdef bool result_found = False
@@ -304,6 +898,9 @@ cdef inline extractOne_dict_f64(
             py_proc_choice = processor(choice)
             proc_choice = move(RF_StringWrapper(conv_sequence(py_proc_choice)))
 
+        if not length_bound.possible(proc_choice.string.length, c_score_cutoff):
+            continue
+
         ScorerFunc.call(&proc_choice.string, c_score_cutoff, c_score_hint, &score)
 
         if lowest_score_worst:
@@ -352,6 +949,7 @@ cdef inline extractOne_dict_i64(
     cdef RF_ScorerWrapper ScorerFunc = RF_ScorerWrapper(scorer_func)
 
     cdef bool lowest_score_worst = is_lowest_score_worst[int64_t](scorer_flags)
+    cdef LengthBound[int64_t] length_bound = LengthBound[int64_t](scorer_flags, proc_query.string.length)
     cdef int64_t optimal_score = get_optimal_score[int64_t](scorer_flags)
 
     cdef bool result_found = False
@@ -375,6 +973,9 @@ cdef inline extractOne_dict_i64(
             py_proc_choice = processor(choice)
             proc_choice = move(RF_StringWrapper(conv_sequence(py_proc_choice)))
 
+        if not length_bound.possible(proc_choice.string.length, c_score_cutoff):
+            continue
+
         ScorerFunc.call(&proc_choice.string, c_score_cutoff, c_score_hint, &score)
 
         if lowest_score_worst:
@@ -423,6 +1024,7 @@ cdef inline extractOne_dict_size_t(
     cdef RF_ScorerWrapper ScorerFunc = RF_ScorerWrapper(scorer_func)
 
     cdef bool lowest_score_worst = is_lowest_score_worst[size_t](scorer_flags)
+    cdef LengthBound[size_t] length_bound = LengthBound[size_t](scorer_flags, proc_query.string.length)
     cdef size_t optimal_score = get_optimal_score[size_t](scorer_flags)
 
     cdef bool result_found = False
@@ -446,6 +1048,9 @@ cdef inline extractOne_dict_size_t(
             py_proc_choice = processor(choice)
             proc_choice = move(RF_StringWrapper(conv_sequence(py_proc_choice)))
 
+        if not length_bound.possible(proc_choice.string.length, c_score_cutoff):
+            continue
+
         ScorerFunc.call(&proc_choice.string, c_score_cutoff, c_score_hint, &score)
 
         if lowest_score_worst:
@@ -520,6 +1125,7 @@ cdef inline extractOne_list_f64(
     cdef RF_ScorerWrapper ScorerFunc = RF_ScorerWrapper(scorer_func)
 
     cdef bool lowest_score_worst = is_lowest_score_worst[double](scorer_flags)
+    cdef LengthBound[double] length_bound = LengthBound[double](scorer_flags, proc_query.string.length)
     cdef double optimal_score = get_optimal_score[double](scorer_flags)
 
     cdef bool result_found = False
@@ -542,6 +1148,9 @@ cdef inline extractOne_list_f64(
             py_proc_choice = processor(choice)
             proc_choice = move(RF_StringWrapper(conv_sequence(py_proc_choice)))
 
+        if not length_bound.possible(proc_choice.string.length, c_score_cutoff):
+            continue
+
         ScorerFunc.call(&proc_choice.string, c_score_cutoff, c_score_hint, &score)
 
         if lowest_score_worst:
@@ -589,6 +1198,7 @@ cdef inline extractOne_list_i64(
     cdef RF_ScorerWrapper ScorerFunc = RF_ScorerWrapper(scorer_func)
 
     cdef bool lowest_score_worst = is_lowest_score_worst[int64_t](scorer_flags)
+    cdef LengthBound[int64_t] length_bound = LengthBound[int64_t](scorer_flags, proc_query.string.length)
     cdef int64_t optimal_score = get_optimal_score[int64_t](scorer_flags)
 
     cdef bool result_found = False
@@ -611,6 +1221,9 @@ cdef inline extractOne_list_i64(
             py_proc_choice = processor(choice)
             proc_choice = move(RF_StringWrapper(conv_sequence(py_proc_choice)))
 
+        if not length_bound.possible(proc_choice.string.length, c_score_cutoff):
+            continue
+
         ScorerFunc.call(&proc_choice.string, c_score_cutoff, c_score_hint, &score)
 
         if lowest_score_worst:
@@ -658,6 +1271,7 @@ cdef inline extractOne_list_size_t(
     cdef RF_ScorerWrapper ScorerFunc = RF_ScorerWrapper(scorer_func)
 
     cdef bool lowest_score_worst = is_lowest_score_worst[size_t](scorer_flags)
+    cdef LengthBound[size_t] length_bound = LengthBound[size_t](scorer_flags, proc_query.string.length)
     cdef size_t optimal_score = get_optimal_score[size_t](scorer_flags)
 
     cdef bool result_found = False
@@ -680,6 +1294,9 @@ cdef inline extractOne_list_size_t(
             py_proc_choice = processor(choice)
             proc_choice = move(RF_StringWrapper(conv_sequence(py_proc_choice)))
 
+        if not length_bound.possible(proc_choice.string.length, c_score_cutoff):
+            continue
+
         ScorerFunc.call(&proc_choice.string, c_score_cutoff, c_score_hint, &score)
 
         if lowest_score_worst:
@@ -727,6 +1344,116 @@ cdef inline extractOne_list(
     raise ValueError("scorer does not properly use the C-API")
 
 
+cdef inline extractOne_dict_preprocessed(
+    query, const vector[DictStringElem]& proc_choices,
+    RF_Scorer* scorer,
+    const RF_ScorerFlags* scorer_flags,
+    score_cutoff,
+    score_hint,
+    int c_workers,
+    const RF_Kwargs* scorer_kwargs
+):
+    cdef DictMatchElem[double] result_f64
+    cdef DictMatchElem[int64_t] result_i64
+    cdef DictMatchElem[size_t] result_size_t
+    flags = scorer_flags.flags
+
+    proc_query = move(RF_StringWrapper(conv_sequence(query)))
+
+    if flags & RF_SCORER_FLAG_RESULT_F64:
+        result_f64 = extractOne_dict_impl[double](
+            scorer_kwargs, scorer_flags, scorer, proc_query, proc_choices,
+            get_score_cutoff_f64(score_cutoff, scorer_flags.worst_score.f64, scorer_flags.optimal_score.f64),
+            get_score_cutoff_f64(score_hint, scorer_flags.worst_score.f64, scorer_flags.optimal_score.f64),
+            c_workers
+        )
+        if result_f64.index == -1:
+            return None
+        return (<object>result_f64.choice.obj, result_f64.score, <object>result_f64.key.obj)
+    elif flags & RF_SCORER_FLAG_RESULT_SIZE_T:
+        result_size_t = extractOne_dict_impl[size_t](
+            scorer_kwargs, scorer_flags, scorer, proc_query, proc_choices,
+            get_score_cutoff_size_t(score_cutoff, scorer_flags.worst_score.sizet, scorer_flags.optimal_score.sizet),
+            get_score_cutoff_size_t(score_hint, scorer_flags.worst_score.sizet, scorer_flags.optimal_score.sizet),
+            c_workers
+        )
+        if result_size_t.index == -1:
+            return None
+        return (<object>result_size_t.choice.obj, result_size_t.score, <object>result_size_t.key.obj)
+    elif flags & RF_SCORER_FLAG_RESULT_I64:
+        result_i64 = extractOne_dict_impl[int64_t](
+            scorer_kwargs, scorer_flags, scorer, proc_query, proc_choices,
+            get_score_cutoff_i64(score_cutoff, scorer_flags.worst_score.i64, scorer_flags.optimal_score.i64),
+            get_score_cutoff_i64(score_hint, scorer_flags.worst_score.i64, scorer_flags.optimal_score.i64),
+            c_workers
+        )
+        if result_i64.index == -1:
+            return None
+        return (<object>result_i64.choice.obj, result_i64.score, <object>result_i64.key.obj)
+
+    raise ValueError("scorer does not properly use the C-API")
+
+
+cdef inline extractOne_list_preprocessed(
+    query, const vector[ListStringElem]& proc_choices, choices, keys,
+    RF_Scorer* scorer,
+    const RF_ScorerFlags* scorer_flags,
+    score_cutoff,
+    score_hint,
+    int c_workers,
+    const RF_Kwargs* scorer_kwargs,
+    const vector[LengthRange]* block_lengths
+):
+    cdef ListMatchElem[double] result_f64
+    cdef ListMatchElem[int64_t] result_i64
+    cdef ListMatchElem[size_t] result_size_t
+    flags = scorer_flags.flags
+
+    proc_query = move(RF_StringWrapper(conv_sequence(query)))
+
+    if flags & RF_SCORER_FLAG_RESULT_F64:
+        result_f64 = extractOne_list_impl[double](
+            scorer_kwargs, scorer_flags, scorer, proc_query, proc_choices,
+            get_score_cutoff_f64(score_cutoff, scorer_flags.worst_score.f64, scorer_flags.optimal_score.f64),
+            get_score_cutoff_f64(score_hint, scorer_flags.worst_score.f64, scorer_flags.optimal_score.f64),
+            c_workers,
+            block_lengths
+        )
+        if result_f64.index == -1:
+            return None
+        index = result_f64.index
+        return (<object>result_f64.choice.obj if choices is None else choices[index], result_f64.score,
+            index if keys is None else keys[index])
+    elif flags & RF_SCORER_FLAG_RESULT_SIZE_T:
+        result_size_t = extractOne_list_impl[size_t](
+            scorer_kwargs, scorer_flags, scorer, proc_query, proc_choices,
+            get_score_cutoff_size_t(score_cutoff, scorer_flags.worst_score.sizet, scorer_flags.optimal_score.sizet),
+            get_score_cutoff_size_t(score_hint, scorer_flags.worst_score.sizet, scorer_flags.optimal_score.sizet),
+            c_workers,
+            block_lengths
+        )
+        if result_size_t.index == -1:
+            return None
+        index = result_size_t.index
+        return (<object>result_size_t.choice.obj if choices is None else choices[index], result_size_t.score,
+            index if keys is None else keys[index])
+    elif flags & RF_SCORER_FLAG_RESULT_I64:
+        result_i64 = extractOne_list_impl[int64_t](
+            scorer_kwargs, scorer_flags, scorer, proc_query, proc_choices,
+            get_score_cutoff_i64(score_cutoff, scorer_flags.worst_score.i64, scorer_flags.optimal_score.i64),
+            get_score_cutoff_i64(score_hint, scorer_flags.worst_score.i64, scorer_flags.optimal_score.i64),
+            c_workers,
+            block_lengths
+        )
+        if result_i64.index == -1:
+            return None
+        index = result_i64.index
+        return (<object>result_i64.choice.obj if choices is None else choices[index], result_i64.score,
+            index if keys is None else keys[index])
+
+    raise ValueError("scorer does not properly use the C-API")
+
+
 cdef inline get_scorer_flags_py(scorer, dict scorer_kwargs):
     params = getattr(scorer, '_RF_ScorerPy', None)
     if params is not None:
@@ -813,19 +1540,38 @@ cdef inline py_extractOne_list(query, choices, scorer, processor, double score_c
     return (result_choice, result_score, result_index) if result_choice is not None else None
 
 
-def extractOne(query, choices, *, scorer=WRatio, processor=None, score_cutoff=None, score_hint=None, scorer_kwargs=None):
+def extractOne(query, choices, *, scorer=WRatio, processor=None, score_cutoff=None, score_hint=None, workers=1, scorer_kwargs=None, query_cache=None):
+    cdef PreparedChoices prepared
+    args = (query, choices, scorer, processor, score_cutoff, score_hint, workers, scorer_kwargs, query_cache)
+    if isinstance(choices, PreparedChoices) and (<PreparedChoices>choices).result_cache is not None:
+        prepared = <PreparedChoices>choices
+        key = result_cache_key("extractOne", query, scorer, processor, score_cutoff, None, scorer_kwargs or {})
+        return prepared.result_cache._call(prepared.version, key, _extractOne, *args)
+    return _extractOne(*args)
+
+
+def _extractOne(query, choices, scorer, processor, score_cutoff, score_hint, workers, scorer_kwargs, query_cache):
     cdef RF_Scorer* scorer_context = NULL
     cdef RF_ScorerFlags scorer_flags
+    cdef _QueryCacheEntry cache_entry = None
+    cdef RF_Kwargs cached_kwargs
+    cdef const RF_Kwargs* c_kwargs = NULL
 
     scorer_kwargs = scorer_kwargs.copy() if scorer_kwargs else {}
 
     setupPandas()
+    choices = prepare_string_arrays(choices, processor)
 
     if is_none(query):
         return None
 
     # preprocess the query
-    if callable(processor):
+    if query_cache is not None:
+        cache_entry = (<QueryCache?>query_cache).lookup(query, processor, scorer, scorer_kwargs)
+
+    if cache_entry is not None:
+        query = cache_entry.proc_query
+    elif callable(processor):
         query = processor(query)
 
 
@@ -837,13 +1583,36 @@ def extractOne(query, choices, *, scorer=WRatio, processor=None, score_cutoff=No
         kwargs_context = RF_KwargsWrapper()
         scorer_context.kwargs_init(&kwargs_context.kwargs, scorer_kwargs)
         scorer_context.get_scorer_flags(&kwargs_context.kwargs, &scorer_flags)
+        c_kwargs = &kwargs_context.kwargs
+        if cache_entry is not None:
+            scorer_context = cache_entry.get_scorer(scorer_context, c_kwargs, &cached_kwargs)
+            c_kwargs = &cached_kwargs
+
+        if isinstance(choices, PreparedChoices):
+            prepared = <PreparedChoices>choices
+            return extractOne_list_preprocessed(query, prepared.proc_choices, prepared._choices, prepared._keys,
+                scorer_context, &scorer_flags, score_cutoff, score_hint, workers, c_kwargs,
+                &prepared.block_lengths)
+
+        # scoring the choices in parallel requires them to be preprocessed upfront
+        if workers != 1:
+            # handle generators, since preprocessing the choices requires their length
+            if not hasattr(choices, "__len__"):
+                choices = list(choices)
+
+            if hasattr(choices, "items"):
+                return extractOne_dict_preprocessed(query, preprocess_dict(choices, processor, workers), scorer_context,
+                    &scorer_flags, score_cutoff, score_hint, workers, c_kwargs)
+            else:
+                return extractOne_list_preprocessed(query, preprocess_list(choices, processor, workers), None, None,
+                    scorer_context, &scorer_flags, score_cutoff, score_hint, workers, c_kwargs, NULL)
 
         if hasattr(choices, "items"):
             return extractOne_dict(query, choices, scorer_context, &scorer_flags,
-                processor, score_cutoff, score_hint, &kwargs_context.kwargs)
+                processor, score_cutoff, score_hint, c_kwargs)
         else:
             return extractOne_list(query, choices, scorer_context, &scorer_flags,
-                processor, score_cutoff, score_hint, &kwargs_context.kwargs)
+                processor, score_cutoff, score_hint, c_kwargs)
 
 
     worst_score, optimal_score = get_scorer_flags_py(scorer, scorer_kwargs)
@@ -853,6 +1622,11 @@ def extractOne(query, choices, *, scorer=WRatio, processor=None, score_cutoff=No
 
     scorer_kwargs["score_cutoff"] = score_cutoff
 
+    if isinstance(choices, PreparedChoices):
+        prepared = <PreparedChoices>choices
+        result = py_extractOne_list(query, prepared.get_processed(), scorer, None, score_cutoff, worst_score, optimal_score, scorer_kwargs)
+        return None if result is None else prepared.convert_result(result)
+
     if hasattr(choices, "items"):
         return py_extractOne_dict(query, choices, scorer, processor, score_cutoff, worst_score, optimal_score, scorer_kwargs)
     else:
@@ -860,22 +1634,23 @@ def extractOne(query, choices, *, scorer=WRatio, processor=None, score_cutoff=No
 
 
 cdef inline extract_dict_f64(
-    query, choices,
+    query, const vector[DictStringElem]& proc_choices,
     RF_Scorer* scorer,
     const RF_ScorerFlags* scorer_flags,
-    processor,
     int64_t limit,
     score_cutoff,
     score_hint,
+    int c_workers,
     const RF_Kwargs* scorer_kwargs
 ):
     proc_query = move(RF_StringWrapper(conv_sequence(query)))
-    proc_choices = preprocess_dict(choices, processor)
 
     cdef vector[DictMatchElem[double]] results = extract_dict_impl[double](
         scorer_kwargs, scorer_flags, scorer, proc_query, proc_choices,
         get_score_cutoff_f64(score_cutoff, scorer_flags.worst_score.f64, scorer_flags.optimal_score.f64),
-        get_score_cutoff_f64(score_hint, scorer_flags.worst_score.f64, scorer_flags.optimal_score.f64)
+        get_score_cutoff_f64(score_hint, scorer_flags.worst_score.f64, scorer_flags.optimal_score.f64),
+        <size_t>limit,
+        c_workers
     )
 
     # due to score_cutoff not always completely filled
@@ -899,22 +1674,23 @@ cdef inline extract_dict_f64(
 
 
 cdef inline extract_dict_i64(
-    query, choices,
+    query, const vector[DictStringElem]& proc_choices,
     RF_Scorer* scorer,
     const RF_ScorerFlags* scorer_flags,
-    processor,
     int64_t limit,
     score_cutoff,
     score_hint,
+    int c_workers,
     const RF_Kwargs* scorer_kwargs
 ):
     proc_query = move(RF_StringWrapper(conv_sequence(query)))
-    proc_choices = preprocess_dict(choices, processor)
 
     cdef vector[DictMatchElem[int64_t]] results = extract_dict_impl[int64_t](
         scorer_kwargs, scorer_flags, scorer, proc_query, proc_choices,
         get_score_cutoff_i64(score_cutoff, scorer_flags.worst_score.i64, scorer_flags.optimal_score.i64),
-        get_score_cutoff_i64(score_hint, scorer_flags.worst_score.i64, scorer_flags.optimal_score.i64)
+        get_score_cutoff_i64(score_hint, scorer_flags.worst_score.i64, scorer_flags.optimal_score.i64),
+        <size_t>limit,
+        c_workers
     )
 
     # due to score_cutoff not always completely filled
@@ -938,22 +1714,23 @@ cdef inline extract_dict_i64(
 
 
 cdef inline extract_dict_size_t(
-    query, choices,
+    query, const vector[DictStringElem]& proc_choices,
     RF_Scorer* scorer,
     const RF_ScorerFlags* scorer_flags,
-    processor,
     int64_t limit,
     score_cutoff,
     score_hint,
+    int c_workers,
     const RF_Kwargs* scorer_kwargs
 ):
     proc_query = move(RF_StringWrapper(conv_sequence(query)))
-    proc_choices = preprocess_dict(choices, processor)
 
     cdef vector[DictMatchElem[size_t]] results = extract_dict_impl[size_t](
         scorer_kwargs, scorer_flags, scorer, proc_query, proc_choices,
         get_score_cutoff_size_t(score_cutoff, scorer_flags.worst_score.sizet, scorer_flags.optimal_score.sizet),
-        get_score_cutoff_size_t(score_hint, scorer_flags.worst_score.sizet, scorer_flags.optimal_score.sizet)
+        get_score_cutoff_size_t(score_hint, scorer_flags.worst_score.sizet, scorer_flags.optimal_score.sizet),
+        <size_t>limit,
+        c_workers
     )
 
     # due to score_cutoff not always completely filled
@@ -977,50 +1754,53 @@ cdef inline extract_dict_size_t(
 
 
 cdef inline extract_dict(
-    query, choices,
+    query, const vector[DictStringElem]& proc_choices,
     RF_Scorer* scorer,
     const RF_ScorerFlags* scorer_flags,
-    processor,
     int64_t limit,
     score_cutoff,
     score_hint,
+    int c_workers,
     const RF_Kwargs* scorer_kwargs
 ):
     flags = scorer_flags.flags
 
     if flags & RF_SCORER_FLAG_RESULT_F64:
         return extract_dict_f64(
-            query, choices, scorer, scorer_flags, processor, limit, score_cutoff, score_hint, scorer_kwargs
+            query, proc_choices, scorer, scorer_flags, limit, score_cutoff, score_hint, c_workers, scorer_kwargs
         )
     elif flags & RF_SCORER_FLAG_RESULT_SIZE_T:
         return extract_dict_size_t(
-            query, choices, scorer, scorer_flags, processor, limit, score_cutoff, score_hint, scorer_kwargs
+            query, proc_choices, scorer, scorer_flags, limit, score_cutoff, score_hint, c_workers, scorer_kwargs
         )
     elif flags & RF_SCORER_FLAG_RESULT_I64:
         return extract_dict_i64(
-            query, choices, scorer, scorer_flags, processor, limit, score_cutoff, score_hint, scorer_kwargs
+            query, proc_choices, scorer, scorer_flags, limit, score_cutoff, score_hint, c_workers, scorer_kwargs
         )
 
     raise ValueError("scorer does not properly use the C-API")
 
 
 cdef inline extract_list_f64(
-    query, choices,
+    query, const vector[ListStringElem]& proc_choices, choices, keys,
     RF_Scorer* scorer,
     const RF_ScorerFlags* scorer_flags,
-    processor,
     int64_t limit,
     score_cutoff,
     score_hint,
-    const RF_Kwargs* scorer_kwargs
+    int c_workers,
+    const RF_Kwargs* scorer_kwargs,
+    const vector[LengthRange]* block_lengths
 ):
     proc_query = move(RF_StringWrapper(conv_sequence(query)))
-    proc_choices = preprocess_list(choices, processor)
 
     cdef vector[ListMatchElem[double]] results = extract_list_impl[double](
         scorer_kwargs, scorer_flags, scorer, proc_query, proc_choices,
         get_score_cutoff_f64(score_cutoff, scorer_flags.worst_score.f64, scorer_flags.optimal_score.f64),
-        get_score_cutoff_f64(score_hint, scorer_flags.worst_score.f64, scorer_flags.optimal_score.f64)
+        get_score_cutoff_f64(score_hint, scorer_flags.worst_score.f64, scorer_flags.optimal_score.f64),
+        <size_t>limit,
+        c_workers,
+        block_lengths
     )
 
     # due to score_cutoff not always completely filled
@@ -1036,7 +1816,9 @@ cdef inline extract_list_f64(
     # copy elements into Python List
     result_list = PyList_New(<Py_ssize_t>limit)
     for i in range(limit):
-        result_item = (<object>results[i].choice.obj, results[i].score, results[i].index)
+        index = results[i].index
+        result_item = (<object>results[i].choice.obj if choices is None else choices[index], results[i].score,
+            index if keys is None else keys[index])
         Py_INCREF(result_item)
         PyList_SET_ITEM(result_list, <Py_ssize_t>i, result_item)
 
@@ -1044,22 +1826,25 @@ cdef inline extract_list_f64(
 
 
 cdef inline extract_list_i64(
-    query, choices,
+    query, const vector[ListStringElem]& proc_choices, choices, keys,
     RF_Scorer* scorer,
     const RF_ScorerFlags* scorer_flags,
-    processor,
     int64_t limit,
     score_cutoff,
     score_hint,
-    const RF_Kwargs* scorer_kwargs
+    int c_workers,
+    const RF_Kwargs* scorer_kwargs,
+    const vector[LengthRange]* block_lengths
 ):
     proc_query = move(RF_StringWrapper(conv_sequence(query)))
-    proc_choices = preprocess_list(choices, processor)
 
     cdef vector[ListMatchElem[int64_t]] results = extract_list_impl[int64_t](
         scorer_kwargs, scorer_flags, scorer, proc_query, proc_choices,
         get_score_cutoff_i64(score_cutoff, scorer_flags.worst_score.i64, scorer_flags.optimal_score.i64),
-        get_score_cutoff_i64(score_hint, scorer_flags.worst_score.i64, scorer_flags.optimal_score.i64)
+        get_score_cutoff_i64(score_hint, scorer_flags.worst_score.i64, scorer_flags.optimal_score.i64),
+        <size_t>limit,
+        c_workers,
+        block_lengths
     )
 
     # due to score_cutoff not always completely filled
@@ -1075,7 +1860,9 @@ cdef inline extract_list_i64(
     # copy elements into Python List
     result_list = PyList_New(<Py_ssize_t>limit)
     for i in range(limit):
-        result_item = (<object>results[i].choice.obj, results[i].score, results[i].index)
+        index = results[i].index
+        result_item = (<object>results[i].choice.obj if choices is None else choices[index], results[i].score,
+            index if keys is None else keys[index])
         Py_INCREF(result_item)
         PyList_SET_ITEM(result_list, <Py_ssize_t>i, result_item)
 
@@ -1083,22 +1870,25 @@ cdef inline extract_list_i64(
 
 
 cdef inline extract_list_size_t(
-    query, choices,
+    query, const vector[ListStringElem]& proc_choices, choices, keys,
     RF_Scorer* scorer,
     const RF_ScorerFlags* scorer_flags,
-    processor,
     int64_t limit,
     score_cutoff,
     score_hint,
-    const RF_Kwargs* scorer_kwargs
+    int c_workers,
+    const RF_Kwargs* scorer_kwargs,
+    const vector[LengthRange]* block_lengths
 ):
     proc_query = move(RF_StringWrapper(conv_sequence(query)))
-    proc_choices = preprocess_list(choices, processor)
 
     cdef vector[ListMatchElem[size_t]] results = extract_list_impl[size_t](
         scorer_kwargs, scorer_flags, scorer, proc_query, proc_choices,
         get_score_cutoff_size_t(score_cutoff, scorer_flags.worst_score.sizet, scorer_flags.optimal_score.sizet),
-        get_score_cutoff_size_t(score_hint, scorer_flags.worst_score.sizet, scorer_flags.optimal_score.sizet)
+        get_score_cutoff_size_t(score_hint, scorer_flags.worst_score.sizet, scorer_flags.optimal_score.sizet),
+        <size_t>limit,
+        c_workers,
+        block_lengths
     )
 
     # due to score_cutoff not always completely filled
@@ -1114,7 +1904,9 @@ cdef inline extract_list_size_t(
     # copy elements into Python List
     result_list = PyList_New(<Py_ssize_t>limit)
     for i in range(limit):
-        result_item = (<object>results[i].choice.obj, results[i].score, results[i].index)
+        index = results[i].index
+        result_item = (<object>results[i].choice.obj if choices is None else choices[index], results[i].score,
+            index if keys is None else keys[index])
         Py_INCREF(result_item)
         PyList_SET_ITEM(result_list, <Py_ssize_t>i, result_item)
 
@@ -1122,28 +1914,32 @@ cdef inline extract_list_size_t(
 
 
 cdef inline extract_list(
-    query, choices,
+    query, const vector[ListStringElem]& proc_choices, choices, keys,
     RF_Scorer* scorer,
     const RF_ScorerFlags* scorer_flags,
-    processor,
     int64_t limit,
     score_cutoff,
     score_hint,
-    const RF_Kwargs* scorer_kwargs
+    int c_workers,
+    const RF_Kwargs* scorer_kwargs,
+    const vector[LengthRange]* block_lengths
 ):
     flags = scorer_flags.flags
 
     if flags & RF_SCORER_FLAG_RESULT_F64:
         return extract_list_f64(
-            query, choices, scorer, scorer_flags, processor, limit, score_cutoff, score_hint, scorer_kwargs
+            query, proc_choices, choices, keys, scorer, scorer_flags, limit, score_cutoff, score_hint, c_workers, scorer_kwargs,
+            block_lengths
         )
     elif flags & RF_SCORER_FLAG_RESULT_SIZE_T:
         return extract_list_size_t(
-            query, choices, scorer, scorer_flags, processor, limit, score_cutoff, score_hint, scorer_kwargs
+            query, proc_choices, choices, keys, scorer, scorer_flags, limit, score_cutoff, score_hint, c_workers, scorer_kwargs,
+            block_lengths
         )
     elif flags & RF_SCORER_FLAG_RESULT_I64:
         return extract_list_i64(
-            query, choices, scorer, scorer_flags, processor, limit, score_cutoff, score_hint, scorer_kwargs
+            query, proc_choices, choices, keys, scorer, scorer_flags, limit, score_cutoff, score_hint, c_workers, scorer_kwargs,
+            block_lengths
         )
 
     raise ValueError("scorer does not properly use the C-API")
@@ -1204,14 +2000,28 @@ cdef inline py_extract_list(query, choices, scorer, processor, int64_t limit, do
         return heapq.nsmallest(limit, result_list, key=lambda i: i[1])
 
 
-def extract(query, choices, *, scorer=WRatio, processor=None, limit=5, score_cutoff=None, score_hint=None, scorer_kwargs=None):
+def extract(query, choices, *, scorer=WRatio, processor=None, limit=5, score_cutoff=None, score_hint=None, workers=1, scorer_kwargs=None, query_cache=None):
+    cdef PreparedChoices prepared
+    args = (query, choices, scorer, processor, limit, score_cutoff, score_hint, workers, scorer_kwargs, query_cache)
+    if isinstance(choices, PreparedChoices) and (<PreparedChoices>choices).result_cache is not None:
+        prepared = <PreparedChoices>choices
+        key = result_cache_key("extract", query, scorer, processor, score_cutoff, limit, scorer_kwargs or {})
+        return prepared.result_cache._call(prepared.version, key, _extract, *args)
+    return _extract(*args)
+
+
+def _extract(query, choices, scorer, processor, limit, score_cutoff, score_hint, workers, scorer_kwargs, query_cache):
     cdef RF_Scorer* scorer_context = NULL
     cdef RF_ScorerFlags scorer_flags
     cdef int64_t c_limit
     cdef int64_t choices_len
+    cdef _QueryCacheEntry cache_entry = None
+    cdef RF_Kwargs cached_kwargs
+    cdef const RF_Kwargs* c_kwargs = NULL
     scorer_kwargs = scorer_kwargs.copy() if scorer_kwargs else {}
 
     setupPandas()
+    choices = prepare_string_arrays(choices, processor)
 
     if is_none(query):
         return []
@@ -1229,21 +2039,18 @@ def extract(query, choices, *, scorer=WRatio, processor=None, limit=5, score_cut
         c_limit = min(c_limit, <int64_t>limit)
 
     if c_limit == 1:
-        res = extractOne(
-            query,
-            choices,
-            processor=processor,
-            scorer=scorer,
-            score_cutoff=score_cutoff,
-            score_hint=score_hint,
-            scorer_kwargs=scorer_kwargs,
-        )
+        res = _extractOne(query, choices, scorer, processor, score_cutoff, score_hint, workers, scorer_kwargs, query_cache)
         if res is None:
             return []
         return [res]
 
     # preprocess the query
-    if callable(processor):
+    if query_cache is not None:
+        cache_entry = (<QueryCache?>query_cache).lookup(query, processor, scorer, scorer_kwargs)
+
+    if cache_entry is not None:
+        query = cache_entry.proc_query
+    elif callable(processor):
         query = processor(query)
 
     scorer_capsule = getattr(scorer, '_RF_Scorer', scorer)
@@ -1254,13 +2061,22 @@ def extract(query, choices, *, scorer=WRatio, processor=None, limit=5, score_cut
         kwargs_context = RF_KwargsWrapper()
         scorer_context.kwargs_init(&kwargs_context.kwargs, scorer_kwargs)
         scorer_context.get_scorer_flags(&kwargs_context.kwargs, &scorer_flags)
+        c_kwargs = &kwargs_context.kwargs
+        if cache_entry is not None:
+            scorer_context = cache_entry.get_scorer(scorer_context, c_kwargs, &cached_kwargs)
+            c_kwargs = &cached_kwargs
+
+        if isinstance(choices, PreparedChoices):
+            prepared = <PreparedChoices>choices
+            return extract_list(query, prepared.proc_choices, prepared._choices, prepared._keys, scorer_context,
+                &scorer_flags, c_limit, score_cutoff, score_hint, workers, c_kwargs, &prepared.block_lengths)
 
         if hasattr(choices, "items"):
-            return extract_dict(query, choices, scorer_context, &scorer_flags,
-                processor, c_limit, score_cutoff, score_hint, &kwargs_context.kwargs)
+            return extract_dict(query, preprocess_dict(choices, processor, workers), scorer_context, &scorer_flags,
+                c_limit, score_cutoff, score_hint, workers, c_kwargs)
         else:
-            return extract_list(query, choices, scorer_context, &scorer_flags,
-                processor, c_limit, score_cutoff, score_hint, &kwargs_context.kwargs)
+            return extract_list(query, preprocess_list(choices, processor, workers), None, None, scorer_context,
+                &scorer_flags, c_limit, score_cutoff, score_hint, workers, c_kwargs, NULL)
 
 
     worst_score, optimal_score = get_scorer_flags_py(scorer, scorer_kwargs)
@@ -1270,17 +2086,25 @@ def extract(query, choices, *, scorer=WRatio, processor=None, limit=5, score_cut
 
     scorer_kwargs["score_cutoff"] = score_cutoff
 
+    if isinstance(choices, PreparedChoices):
+        prepared = <PreparedChoices>choices
+        results = py_extract_list(query, prepared.get_processed(), scorer, None, c_limit, score_cutoff, worst_score, optimal_score, scorer_kwargs)
+        return [prepared.convert_result(result) for result in results]
+
     if hasattr(choices, "items"):
         return py_extract_dict(query, choices, scorer, processor, c_limit, score_cutoff, worst_score, optimal_score, scorer_kwargs)
     else:
         return py_extract_list(query, choices, scorer, processor, c_limit, score_cutoff, worst_score, optimal_score, scorer_kwargs)
 
 
-def extract_iter(query, choices, *, scorer=WRatio, processor=None, score_cutoff=None, score_hint=None, scorer_kwargs=None):
+def extract_iter(query, choices, *, scorer=WRatio, processor=None, score_cutoff=None, score_hint=None, scorer_kwargs=None, query_cache=None):
     cdef RF_Scorer* scorer_context = NULL
     cdef RF_ScorerFlags scorer_flags
     cdef RF_Preprocessor* processor_context = NULL
     cdef RF_KwargsWrapper kwargs_context
+    cdef _QueryCacheEntry cache_entry = None
+    cdef RF_Kwargs cached_kwargs
+    cdef const RF_Kwargs* c_kwargs = NULL
 
     def extract_iter_dict_f64():
         """
@@ -1294,7 +2118,7 @@ def extract_iter(query, choices, *, scorer=WRatio, processor=None, score_cutoff=
 
         cdef RF_ScorerFunc scorer_func
         scorer_context.scorer_func_init(
-            &scorer_func, &kwargs_context.kwargs, 1, &query_proc.string
+            &scorer_func, c_kwargs, 1, &query_proc.string
         )
         cdef RF_ScorerWrapper ScorerFunc = RF_ScorerWrapper(scorer_func)
         cdef bool lowest_score_worst = is_lowest_score_worst[double](&scorer_flags)
@@ -1337,7 +2161,7 @@ def extract_iter(query, choices, *, scorer=WRatio, processor=None, score_cutoff=
 
         cdef RF_ScorerFunc scorer_func
         scorer_context.scorer_func_init(
-            &scorer_func, &kwargs_context.kwargs, 1, &query_proc.string
+            &scorer_func, c_kwargs, 1, &query_proc.string
         )
         cdef RF_ScorerWrapper ScorerFunc = RF_ScorerWrapper(scorer_func)
         cdef bool lowest_score_worst = is_lowest_score_worst[int64_t](&scorer_flags)
@@ -1380,7 +2204,7 @@ def extract_iter(query, choices, *, scorer=WRatio, processor=None, score_cutoff=
 
         cdef RF_ScorerFunc scorer_func
         scorer_context.scorer_func_init(
-            &scorer_func, &kwargs_context.kwargs, 1, &query_proc.string
+            &scorer_func, c_kwargs, 1, &query_proc.string
         )
         cdef RF_ScorerWrapper ScorerFunc = RF_ScorerWrapper(scorer_func)
         cdef bool lowest_score_worst = is_lowest_score_worst[size_t](&scorer_flags)
@@ -1423,7 +2247,7 @@ def extract_iter(query, choices, *, scorer=WRatio, processor=None, score_cutoff=
 
         cdef RF_ScorerFunc scorer_func
         scorer_context.scorer_func_init(
-            &scorer_func, &kwargs_context.kwargs, 1, &query_proc.string
+            &scorer_func, c_kwargs, 1, &query_proc.string
         )
         cdef RF_ScorerWrapper ScorerFunc = RF_ScorerWrapper(scorer_func)
         cdef bool lowest_score_worst = is_lowest_score_worst[double](&scorer_flags)
@@ -1466,7 +2290,7 @@ def extract_iter(query, choices, *, scorer=WRatio, processor=None, score_cutoff=
 
         cdef RF_ScorerFunc scorer_func
         scorer_context.scorer_func_init(
-            &scorer_func, &kwargs_context.kwargs, 1, &query_proc.string
+            &scorer_func, c_kwargs, 1, &query_proc.string
         )
         cdef RF_ScorerWrapper ScorerFunc = RF_ScorerWrapper(scorer_func)
         cdef bool lowest_score_worst = is_lowest_score_worst[int64_t](&scorer_flags)
@@ -1509,7 +2333,7 @@ def extract_iter(query, choices, *, scorer=WRatio, processor=None, score_cutoff=
 
         cdef RF_ScorerFunc scorer_func
         scorer_context.scorer_func_init(
-            &scorer_func, &kwargs_context.kwargs, 1, &query_proc.string
+            &scorer_func, c_kwargs, 1, &query_proc.string
         )
         cdef RF_ScorerWrapper ScorerFunc = RF_ScorerWrapper(scorer_func)
         cdef bool lowest_score_worst = is_lowest_score_worst[size_t](&scorer_flags)
@@ -1540,6 +2364,111 @@ def extract_iter(query, choices, *, scorer=WRatio, processor=None, score_cutoff=
                 if score <= c_score_cutoff:
                     yield (choice, score, i)
 
+    def extract_iter_prepared_f64():
+        """
+        implementation of extract_iter for PreparedChoices, scorer using RapidFuzz C-API with the result type
+        double
+        """
+        cdef PreparedChoices prepared = <PreparedChoices>choices
+        cdef double c_score_cutoff = get_score_cutoff_f64(score_cutoff, scorer_flags.worst_score.f64, scorer_flags.optimal_score.f64)
+        cdef double c_score_hint = get_score_cutoff_f64(score_hint, scorer_flags.worst_score.f64, scorer_flags.optimal_score.f64)
+        query_proc = RF_StringWrapper(conv_sequence(query))
+
+        cdef RF_ScorerFunc scorer_func
+        scorer_context.scorer_func_init(
+            &scorer_func, c_kwargs, 1, &query_proc.string
+        )
+        cdef RF_ScorerWrapper ScorerFunc = RF_ScorerWrapper(scorer_func)
+        cdef bool lowest_score_worst = is_lowest_score_worst[double](&scorer_flags)
+        cdef double score
+        cdef size_t i
+
+        for i in range(prepared.proc_choices.size()):
+            # removed choices of a MutablePreparedChoices
+            if prepared.proc_choices[i].proc_val.string.data == NULL:
+                continue
+
+            ScorerFunc.call(&prepared.proc_choices[i].proc_val.string, c_score_cutoff, c_score_hint, &score)
+            if lowest_score_worst:
+                if score < c_score_cutoff:
+                    continue
+            else:
+                if score > c_score_cutoff:
+                    continue
+
+            index = prepared.proc_choices[i].index
+            yield (prepared._choices[index], score, index if prepared._keys is None else prepared._keys[index])
+
+    def extract_iter_prepared_i64():
+        """
+        implementation of extract_iter for PreparedChoices, scorer using RapidFuzz C-API with the result type
+        int64_t
+        """
+        cdef PreparedChoices prepared = <PreparedChoices>choices
+        cdef int64_t c_score_cutoff = get_score_cutoff_i64(score_cutoff, scorer_flags.worst_score.i64, scorer_flags.optimal_score.i64)
+        cdef int64_t c_score_hint = get_score_cutoff_i64(score_hint, scorer_flags.worst_score.i64, scorer_flags.optimal_score.i64)
+        query_proc = RF_StringWrapper(conv_sequence(query))
+
+        cdef RF_ScorerFunc scorer_func
+        scorer_context.scorer_func_init(
+            &scorer_func, c_kwargs, 1, &query_proc.string
+        )
+        cdef RF_ScorerWrapper ScorerFunc = RF_ScorerWrapper(scorer_func)
+        cdef bool lowest_score_worst = is_lowest_score_worst[int64_t](&scorer_flags)
+        cdef int64_t score
+        cdef size_t i
+
+        for i in range(prepared.proc_choices.size()):
+            # removed choices of a MutablePreparedChoices
+            if prepared.proc_choices[i].proc_val.string.data == NULL:
+                continue
+
+            ScorerFunc.call(&prepared.proc_choices[i].proc_val.string, c_score_cutoff, c_score_hint, &score)
+            if lowest_score_worst:
+                if score < c_score_cutoff:
+                    continue
+            else:
+                if score > c_score_cutoff:
+                    continue
+
+            index = prepared.proc_choices[i].index
+            yield (prepared._choices[index], score, index if prepared._keys is None else prepared._keys[index])
+
+    def extract_iter_prepared_size_t():
+        """
+        implementation of extract_iter for PreparedChoices, scorer using RapidFuzz C-API with the result type
+        size_t
+        """
+        cdef PreparedChoices prepared = <PreparedChoices>choices
+        cdef size_t c_score_cutoff = get_score_cutoff_size_t(score_cutoff, scorer_flags.worst_score.sizet, scorer_flags.optimal_score.sizet)
+        cdef size_t c_score_hint = get_score_cutoff_size_t(score_hint, scorer_flags.worst_score.sizet, scorer_flags.optimal_score.sizet)
+        query_proc = RF_StringWrapper(conv_sequence(query))
+
+        cdef RF_ScorerFunc scorer_func
+        scorer_context.scorer_func_init(
+            &scorer_func, c_kwargs, 1, &query_proc.string
+        )
+        cdef RF_ScorerWrapper ScorerFunc = RF_ScorerWrapper(scorer_func)
+        cdef bool lowest_score_worst = is_lowest_score_worst[size_t](&scorer_flags)
+        cdef size_t score
+        cdef size_t i
+
+        for i in range(prepared.proc_choices.size()):
+            # removed choices of a MutablePreparedChoices
+            if prepared.proc_choices[i].proc_val.string.data == NULL:
+                continue
+
+            ScorerFunc.call(&prepared.proc_choices[i].proc_val.string, c_score_cutoff, c_score_hint, &score)
+            if lowest_score_worst:
+                if score < c_score_cutoff:
+                    continue
+            else:
+                if score > c_score_cutoff:
+                    continue
+
+            index = prepared.proc_choices[i].index
+            yield (prepared._choices[index], score, index if prepared._keys is None else prepared._keys[index])
+
     def py_extract_iter_dict(worst_score, optimal_score):
         """
         implementation of extract_iter for:
@@ -1589,16 +2518,45 @@ def extract_iter(query, choices, *, scorer=WRatio, processor=None, score_cutoff=
                 if score <= score_cutoff:
                     yield (choice, score, i)
 
+    def py_extract_iter_prepared(worst_score, optimal_score):
+        """
+        implementation of extract_iter for:
+          - type of choices = PreparedChoices
+          - scorer = python function
+        """
+        cdef PreparedChoices prepared = <PreparedChoices>choices
+        cdef bool lowest_score_worst = optimal_score > worst_score
+        cdef int64_t i
+
+        for i, proc_choice in enumerate(prepared.get_processed()):
+            if is_none(proc_choice):
+                continue
+
+            score = scorer(query, proc_choice, **scorer_kwargs)
+
+            if lowest_score_worst:
+                if score >= score_cutoff:
+                    yield prepared.convert_result((proc_choice, score, i))
+            else:
+                if score <= score_cutoff:
+                    yield prepared.convert_result((proc_choice, score, i))
+
     scorer_kwargs = scorer_kwargs.copy() if scorer_kwargs else {}
 
     setupPandas()
+    choices = prepare_string_arrays(choices, processor)
 
     if is_none(query):
         # finish generator
         return
 
     # preprocess the query
-    if callable(processor):
+    if query_cache is not None:
+        cache_entry = (<QueryCache?>query_cache).lookup(query, processor, scorer, scorer_kwargs)
+
+    if cache_entry is not None:
+        query = cache_entry.proc_query
+    elif callable(processor):
         query = processor(query)
 
     scorer_capsule = getattr(scorer, '_RF_Scorer', scorer)
@@ -1609,12 +2567,26 @@ def extract_iter(query, choices, *, scorer=WRatio, processor=None, score_cutoff=
         kwargs_context = RF_KwargsWrapper()
         scorer_context.kwargs_init(&kwargs_context.kwargs, scorer_kwargs)
         scorer_context.get_scorer_flags(&kwargs_context.kwargs, &scorer_flags)
+        c_kwargs = &kwargs_context.kwargs
+        if cache_entry is not None:
+            scorer_context = cache_entry.get_scorer(scorer_context, c_kwargs, &cached_kwargs)
+            c_kwargs = &cached_kwargs
 
         processor_capsule = getattr(processor, '_RF_Preprocess', processor)
         if PyCapsule_IsValid(processor_capsule, NULL):
             processor_context = <RF_Preprocessor*>PyCapsule_GetPointer(processor_capsule, NULL)
 
-        if hasattr(choices, "items"):
+        if isinstance(choices, PreparedChoices):
+            if scorer_flags.flags & RF_SCORER_FLAG_RESULT_F64:
+                yield from extract_iter_prepared_f64()
+                return
+            elif scorer_flags.flags & RF_SCORER_FLAG_RESULT_SIZE_T:
+                yield from extract_iter_prepared_size_t()
+                return
+            elif scorer_flags.flags & RF_SCORER_FLAG_RESULT_I64:
+                yield from extract_iter_prepared_i64()
+                return
+        elif hasattr(choices, "items"):
             if scorer_flags.flags & RF_SCORER_FLAG_RESULT_F64:
                 yield from extract_iter_dict_f64()
                 return
@@ -1644,7 +2616,9 @@ def extract_iter(query, choices, *, scorer=WRatio, processor=None, score_cutoff=
 
     scorer_kwargs["score_cutoff"] = score_cutoff
 
-    if hasattr(choices, "items"):
+    if isinstance(choices, PreparedChoices):
+        yield from py_extract_iter_prepared(worst_score, optimal_score)
+    elif hasattr(choices, "items"):
         yield from py_extract_iter_dict(worst_score, optimal_score)
     else:
         yield from py_extract_iter_list(worst_score, optimal_score)
@@ -1666,8 +2640,15 @@ cdef inline vector[PyObjectWrapper] preprocess_py(queries, processor) except *:
     cdef int64_t queries_len = <int64_t>len(queries)
     proc_queries.reserve(queries_len)
 
+    # already preprocessed
+    if isinstance(queries, PreparedChoices):
+        # every choice is a row / column of the result, so removed choices have to be dropped
+        if isinstance(queries, MutablePreparedChoices):
+            queries.compact()
+        for query in (<PreparedChoices>queries).get_processed():
+            proc_queries.emplace_back(<PyObject*>query)
     # processor None/False
-    if not processor:
+    elif not processor:
         for query in queries:
             proc_queries.emplace_back(<PyObject*>query)
     # processor has to be called through python
@@ -1678,12 +2659,18 @@ cdef inline vector[PyObjectWrapper] preprocess_py(queries, processor) except *:
 
     return move(proc_queries)
 
-cdef inline vector[RF_StringWrapper] preprocess(const RF_ScorerFlags* scorer_flags, queries, processor) except *:
+cdef inline vector[RF_StringWrapper] preprocess(const RF_ScorerFlags* scorer_flags, queries, processor, int workers=1) except *:
     cdef vector[RF_StringWrapper] proc_queries
     cdef int64_t queries_len = <int64_t>len(queries)
     cdef RF_String proc_str
     cdef RF_Preprocessor* processor_context = NULL
+    cdef bool parallel = False
     flags = scorer_flags.flags
+
+    # already preprocessed
+    if isinstance(queries, PreparedChoices):
+        return move((<PreparedChoices>queries).get_views(scorer_flags))
+
     proc_queries.reserve(queries_len)
 
     # No processor
@@ -1701,16 +2688,23 @@ cdef inline vector[RF_StringWrapper] preprocess(const RF_ScorerFlags* scorer_fla
         processor_capsule = getattr(processor, '_RF_Preprocess', processor)
         if PyCapsule_IsValid(processor_capsule, NULL):
             processor_context = <RF_Preprocessor*>PyCapsule_GetPointer(processor_capsule, NULL)
+        parallel = workers != 1 and hasattr(processor, '_RF_ProcessorSteps')
 
         # use RapidFuzz C-Api
         if processor_context != NULL and processor_context.version == PREPROCESSOR_STRUCT_VERSION:
             for query in queries:
                 if is_none(query) and flags & RF_SCORER_NONE_IS_WORST_SCORE:
                     proc_queries.emplace_back()
+                # strings are processed by the thread pool afterwards
+                elif parallel and type(query) is str:
+                    proc_queries.emplace_back(conv_sequence(query), <PyObject*>query)
                 else:
                     processor_context.preprocess(query, &proc_str)
                     proc_queries.emplace_back(proc_str, <PyObject*>query)
 
+            if parallel:
+                processor_strings(proc_queries, <uint32_t>processor._RF_ProcessorSteps, workers)
+
         # Call Processor through Python
         else:
             for query in queries:
@@ -1808,13 +2802,14 @@ cdef Matrix cpdist_cpp(
     int c_workers,
     const RF_Kwargs* scorer_kwargs
 ):
-    proc_queries = preprocess(scorer_flags, queries, processor)
-    proc_choices = preprocess(scorer_flags, choices, processor)
+    proc_queries = preprocess(scorer_flags, queries, processor, c_workers)
+    proc_choices = preprocess(scorer_flags, choices, processor, c_workers)
     flags = scorer_flags.flags
     cdef Matrix matrix = Matrix(vector_output=True)
 
     if flags & RF_SCORER_FLAG_RESULT_F64:
         matrix.matrix = cpdist_cpp_impl[double](
+            scorer_flags,
             scorer_kwargs, scorer, proc_queries, proc_choices,
             dtype_to_type_num_f64(dtype),
             c_workers,
@@ -1825,6 +2820,7 @@ cdef Matrix cpdist_cpp(
         )
     elif flags & RF_SCORER_FLAG_RESULT_SIZE_T:
         matrix.matrix = cpdist_cpp_impl[size_t](
+            scorer_flags,
             scorer_kwargs, scorer, proc_queries, proc_choices,
             dtype_to_type_num_size_t(dtype),
             c_workers,
@@ -1835,6 +2831,7 @@ cdef Matrix cpdist_cpp(
         )
     elif flags & RF_SCORER_FLAG_RESULT_I64:
         matrix.matrix = cpdist_cpp_impl[int64_t](
+            scorer_flags,
             scorer_kwargs, scorer, proc_queries, proc_choices,
             dtype_to_type_num_i64(dtype),
             c_workers,
@@ -1858,10 +2855,11 @@ cdef Matrix cdist_two_lists(
     score_multiplier,
     dtype,
     int c_workers,
-    const RF_Kwargs* scorer_kwargs
+    const RF_Kwargs* scorer_kwargs,
+    void* out
 ):
-    proc_queries = preprocess(scorer_flags, queries, processor)
-    proc_choices = preprocess(scorer_flags, choices, processor)
+    proc_queries = preprocess(scorer_flags, queries, processor, c_workers)
+    proc_choices = preprocess(scorer_flags, choices, processor, c_workers)
     flags = scorer_flags.flags
     cdef Matrix matrix = Matrix()
 
@@ -1875,6 +2873,7 @@ cdef Matrix cdist_two_lists(
             get_score_cutoff_f64(score_hint, scorer_flags.worst_score.f64, scorer_flags.optimal_score.f64),
             <double>score_multiplier,
             scorer_flags.worst_score.f64,
+            out
         )
     elif flags & RF_SCORER_FLAG_RESULT_SIZE_T:
         matrix.matrix = cdist_two_lists_impl[size_t](
@@ -1885,7 +2884,8 @@ cdef Matrix cdist_two_lists(
             get_score_cutoff_size_t(score_cutoff, scorer_flags.worst_score.sizet, scorer_flags.optimal_score.sizet),
             get_score_cutoff_size_t(score_hint, scorer_flags.worst_score.sizet, scorer_flags.optimal_score.sizet),
             <size_t>score_multiplier,
-            scorer_flags.worst_score.sizet
+            scorer_flags.worst_score.sizet,
+            out
         )
     elif flags & RF_SCORER_FLAG_RESULT_I64:
         matrix.matrix = cdist_two_lists_impl[int64_t](
@@ -1896,7 +2896,8 @@ cdef Matrix cdist_two_lists(
             get_score_cutoff_i64(score_cutoff, scorer_flags.worst_score.i64, scorer_flags.optimal_score.i64),
             get_score_cutoff_i64(score_hint, scorer_flags.worst_score.i64, scorer_flags.optimal_score.i64),
             <int64_t>score_multiplier,
-            scorer_flags.worst_score.i64
+            scorer_flags.worst_score.i64,
+            out
         )
     else:
         raise ValueError("scorer does not properly use the C-API")
@@ -1913,9 +2914,10 @@ cdef Matrix cdist_single_list(
     score_multiplier,
     dtype,
     int c_workers,
-    const RF_Kwargs* scorer_kwargs
+    const RF_Kwargs* scorer_kwargs,
+    void* out
 ):
-    proc_queries = preprocess(scorer_flags, queries, processor)
+    proc_queries = preprocess(scorer_flags, queries, processor, c_workers)
     flags = scorer_flags.flags
     cdef Matrix matrix = Matrix()
 
@@ -1928,7 +2930,8 @@ cdef Matrix cdist_single_list(
             get_score_cutoff_f64(score_cutoff, scorer_flags.worst_score.f64, scorer_flags.optimal_score.f64),
             get_score_cutoff_f64(score_hint, scorer_flags.worst_score.f64, scorer_flags.optimal_score.f64),
             <double>score_multiplier,
-            scorer_flags.worst_score.f64
+            scorer_flags.worst_score.f64,
+            out
         )
     elif flags & RF_SCORER_FLAG_RESULT_SIZE_T:
         matrix.matrix = cdist_single_list_impl[size_t](
@@ -1939,7 +2942,8 @@ cdef Matrix cdist_single_list(
             get_score_cutoff_size_t(score_cutoff, scorer_flags.worst_score.sizet, scorer_flags.optimal_score.sizet),
             get_score_cutoff_size_t(score_hint, scorer_flags.worst_score.sizet, scorer_flags.optimal_score.sizet),
             <size_t>score_multiplier,
-            scorer_flags.worst_score.sizet
+            scorer_flags.worst_score.sizet,
+            out
         )
     elif flags & RF_SCORER_FLAG_RESULT_I64:
         matrix.matrix = cdist_single_list_impl[int64_t](
@@ -1950,7 +2954,8 @@ cdef Matrix cdist_single_list(
             get_score_cutoff_i64(score_cutoff, scorer_flags.worst_score.i64, scorer_flags.optimal_score.i64),
             get_score_cutoff_i64(score_hint, scorer_flags.worst_score.i64, scorer_flags.optimal_score.i64),
             <int64_t>score_multiplier,
-            scorer_flags.worst_score.i64
+            scorer_flags.worst_score.i64,
+            out
         )
     else:
         raise ValueError("scorer does not properly use the C-API")
@@ -1958,9 +2963,210 @@ cdef Matrix cdist_single_list(
     return matrix
 
 
+cdef cdist_topk(
+    queries, choices,
+    RF_Scorer* scorer,
+    const RF_ScorerFlags* scorer_flags,
+    processor,
+    score_cutoff,
+    score_hint,
+    score_multiplier,
+    dtype,
+    int64_t limit,
+    int c_workers,
+    const RF_Kwargs* scorer_kwargs
+):
+    proc_queries = preprocess(scorer_flags, queries, processor, c_workers)
+    proc_choices = preprocess(scorer_flags, choices, processor, c_workers)
+    flags = scorer_flags.flags
+    cdef pair[RfMatrix, RfMatrix] result
+    cdef Matrix indices = Matrix()
+    cdef Matrix scores = Matrix()
+
+    if flags & RF_SCORER_FLAG_RESULT_F64:
+        result = cdist_topk_impl[double](
+            scorer_flags,
+            scorer_kwargs, scorer, proc_queries, proc_choices,
+            dtype_to_type_num_f64(dtype),
+            c_workers,
+            <size_t>limit,
+            get_score_cutoff_f64(score_cutoff, scorer_flags.worst_score.f64, scorer_flags.optimal_score.f64),
+            get_score_cutoff_f64(score_hint, scorer_flags.worst_score.f64, scorer_flags.optimal_score.f64),
+            <double>score_multiplier,
+            scorer_flags.worst_score.f64
+        )
+    elif flags & RF_SCORER_FLAG_RESULT_SIZE_T:
+        result = cdist_topk_impl[size_t](
+            scorer_flags,
+            scorer_kwargs, scorer, proc_queries, proc_choices,
+            dtype_to_type_num_size_t(dtype),
+            c_workers,
+            <size_t>limit,
+            get_score_cutoff_size_t(score_cutoff, scorer_flags.worst_score.sizet, scorer_flags.optimal_score.sizet),
+            get_score_cutoff_size_t(score_hint, scorer_flags.worst_score.sizet, scorer_flags.optimal_score.sizet),
+            <size_t>score_multiplier,
+            scorer_flags.worst_score.sizet
+        )
+    elif flags & RF_SCORER_FLAG_RESULT_I64:
+        result = cdist_topk_impl[int64_t](
+            scorer_flags,
+            scorer_kwargs, scorer, proc_queries, proc_choices,
+            dtype_to_type_num_i64(dtype),
+            c_workers,
+            <size_t>limit,
+            get_score_cutoff_i64(score_cutoff, scorer_flags.worst_score.i64, scorer_flags.optimal_score.i64),
+            get_score_cutoff_i64(score_hint, scorer_flags.worst_score.i64, scorer_flags.optimal_score.i64),
+            <int64_t>score_multiplier,
+            scorer_flags.worst_score.i64
+        )
+    else:
+        raise ValueError("scorer does not properly use the C-API")
+
+    indices.matrix = move(result.first)
+    scores.matrix = move(result.second)
+    return indices, scores
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+cdef cdist_py_topk(queries, choices, scorer, processor, score_cutoff, score_multiplier, dtype, int64_t limit, dict scorer_kwargs):
+    proc_queries = preprocess_py(queries, processor)
+    proc_choices = preprocess_py(choices, processor)
+    cdef size_t cols = proc_choices.size()
+    cdef size_t c_limit = min(<size_t>limit, cols)
+    cdef double score
+    cdef Matrix indices = Matrix()
+    cdef Matrix scores = Matrix()
+    c_dtype = dtype_to_type_num_py(dtype, scorer, scorer_kwargs)
+    indices.matrix = RfMatrix(MatrixType.INT64, proc_queries.size(), c_limit)
+    scores.matrix = RfMatrix(c_dtype, proc_queries.size(), c_limit)
+
+    worst_score, optimal_score = get_scorer_flags_py(scorer, scorer_kwargs)
+    scorer_kwargs["score_cutoff"] = score_cutoff
+
+    for i in range(proc_queries.size()):
+        row = [
+            scorer(<object>proc_queries[i].obj, <object>proc_choices[j].obj, **scorer_kwargs)
+            for j in range(cols)
+        ]
+        # on equal scores the choice with the lower index comes first
+        if optimal_score > worst_score:
+            best = heapq.nlargest(c_limit, range(cols), key=row.__getitem__)
+        else:
+            best = heapq.nsmallest(c_limit, range(cols), key=row.__getitem__)
+
+        for j, col in enumerate(best):
+            score = row[col]
+            indices.matrix.set(i, j, <int64_t>col)
+            scores.matrix.set(i, j, score * <double>score_multiplier)
+
+    return indices, scores
+
+
+cdef cdist_sparse(
+    queries, choices,
+    RF_Scorer* scorer,
+    const RF_ScorerFlags* scorer_flags,
+    processor,
+    score_cutoff,
+    score_hint,
+    score_multiplier,
+    dtype,
+    int c_workers,
+    const RF_Kwargs* scorer_kwargs
+):
+    proc_queries = preprocess(scorer_flags, queries, processor, c_workers)
+    proc_choices = preprocess(scorer_flags, choices, processor, c_workers)
+    flags = scorer_flags.flags
+    cdef SparseMatrix result
+    cdef Matrix rows = Matrix(vector_output=True)
+    cdef Matrix cols = Matrix(vector_output=True)
+    cdef Matrix scores = Matrix(vector_output=True)
+
+    if flags & RF_SCORER_FLAG_RESULT_F64:
+        result = cdist_sparse_impl[double](
+            scorer_flags,
+            scorer_kwargs, scorer, proc_queries, proc_choices,
+            dtype_to_type_num_f64(dtype),
+            c_workers,
+            get_score_cutoff_f64(score_cutoff, scorer_flags.worst_score.f64, scorer_flags.optimal_score.f64),
+            get_score_cutoff_f64(score_hint, scorer_flags.worst_score.f64, scorer_flags.optimal_score.f64),
+            <double>score_multiplier,
+            scorer_flags.worst_score.f64
+        )
+    elif flags & RF_SCORER_FLAG_RESULT_SIZE_T:
+        result = cdist_sparse_impl[size_t](
+            scorer_flags,
+            scorer_kwargs, scorer, proc_queries, proc_choices,
+            dtype_to_type_num_size_t(dtype),
+            c_workers,
+            get_score_cutoff_size_t(score_cutoff, scorer_flags.worst_score.sizet, scorer_flags.optimal_score.sizet),
+            get_score_cutoff_size_t(score_hint, scorer_flags.worst_score.sizet, scorer_flags.optimal_score.sizet),
+            <size_t>score_multiplier,
+            scorer_flags.worst_score.sizet
+        )
+    elif flags & RF_SCORER_FLAG_RESULT_I64:
+        result = cdist_sparse_impl[int64_t](
+            scorer_flags,
+            scorer_kwargs, scorer, proc_queries, proc_choices,
+            dtype_to_type_num_i64(dtype),
+            c_workers,
+            get_score_cutoff_i64(score_cutoff, scorer_flags.worst_score.i64, scorer_flags.optimal_score.i64),
+            get_score_cutoff_i64(score_hint, scorer_flags.worst_score.i64, scorer_flags.optimal_score.i64),
+            <int64_t>score_multiplier,
+            scorer_flags.worst_score.i64
+        )
+    else:
+        raise ValueError("scorer does not properly use the C-API")
+
+    rows.matrix = move(result.rows)
+    cols.matrix = move(result.cols)
+    scores.matrix = move(result.scores)
+    return rows, cols, scores
+
+
 @cython.boundscheck(False)
 @cython.wraparound(False)
-cdef cdist_py(queries, choices, scorer, processor, score_cutoff, score_multiplier, dtype, workers, dict scorer_kwargs):
+cdef cdist_py_sparse(queries, choices, scorer, processor, score_cutoff, score_multiplier, dtype, dict scorer_kwargs):
+    proc_queries = preprocess_py(queries, processor)
+    proc_choices = preprocess_py(choices, processor)
+    cdef double score
+    cdef size_t i
+    cdef Matrix rows = Matrix(vector_output=True)
+    cdef Matrix cols = Matrix(vector_output=True)
+    cdef Matrix scores = Matrix(vector_output=True)
+    c_dtype = dtype_to_type_num_py(dtype, scorer, scorer_kwargs)
+
+    worst_score, optimal_score = get_scorer_flags_py(scorer, scorer_kwargs)
+    lowest_score_worst = optimal_score > worst_score
+    scorer_kwargs["score_cutoff"] = score_cutoff
+
+    result = []
+    for row in range(proc_queries.size()):
+        for col in range(proc_choices.size()):
+            score = scorer(<object>proc_queries[row].obj, <object>proc_choices[col].obj, **scorer_kwargs)
+            if (
+                score_cutoff is None
+                or (lowest_score_worst and score >= score_cutoff)
+                or (not lowest_score_worst and score <= score_cutoff)
+            ):
+                result.append((row, col, score))
+
+    rows.matrix = RfMatrix(MatrixType.INT64, len(result), 1)
+    cols.matrix = RfMatrix(MatrixType.INT64, len(result), 1)
+    scores.matrix = RfMatrix(c_dtype, len(result), 1)
+    for i in range(len(result)):
+        row, col, score = result[i]
+        rows.matrix.set(i, 0, <int64_t>row)
+        cols.matrix.set(i, 0, <int64_t>col)
+        scores.matrix.set(i, 0, score * <double>score_multiplier)
+
+    return rows, cols, scores
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+cdef cdist_py(queries, choices, scorer, processor, score_cutoff, score_multiplier, dtype, workers, dict scorer_kwargs, void* out):
     # todo this should handle two similar sequences more efficiently
 
     proc_queries = preprocess_py(queries, processor)
@@ -1968,7 +3174,10 @@ cdef cdist_py(queries, choices, scorer, processor, score_cutoff, score_multiplie
     cdef double score
     cdef Matrix matrix = Matrix()
     c_dtype = dtype_to_type_num_py(dtype, scorer, scorer_kwargs)
-    matrix.matrix = RfMatrix(c_dtype, proc_queries.size(), proc_choices.size())
+    if out:
+        matrix.matrix = RfMatrix(c_dtype, proc_queries.size(), proc_choices.size(), out)
+    else:
+        matrix.matrix = RfMatrix(c_dtype, proc_queries.size(), proc_choices.size())
 
     scorer_kwargs["score_cutoff"] = score_cutoff
 
@@ -1979,39 +3188,83 @@ cdef cdist_py(queries, choices, scorer, processor, score_cutoff, score_multiplie
 
     return matrix
 
-def cdist(queries, choices, *, scorer=ratio, processor=None, score_cutoff=None, score_hint=None, score_multiplier=1, dtype=None, workers=1, scorer_kwargs=None):
+def cdist(queries, choices, *, scorer=ratio, processor=None, score_cutoff=None, score_hint=None, score_multiplier=1, dtype=None, workers=1, limit=None, output="dense", out=None, scorer_kwargs=None):
     cdef RF_Scorer* scorer_context = NULL
     cdef RF_ScorerFlags scorer_flags
     cdef bool is_orig_scorer
+    cdef Py_buffer out_view
+    cdef void* c_out = NULL
+
+    if output not in ("dense", "sparse"):
+        raise ValueError(f"output has to be 'dense' or 'sparse', not {output!r}")
+    if limit is not None and limit < 0:
+        raise ValueError("limit has to be a non-negative number or None")
+    if output == "sparse" and limit is not None:
+        raise ValueError("limit can not be combined with output='sparse'")
+
+    if out is not None:
+        if output != "dense" or limit is not None:
+            raise ValueError("out can only be used with output='dense' and without limit")
+
+        PyObject_GetBuffer(out, &out_view, PyBUF_WRITABLE | PyBUF_C_CONTIGUOUS)
+        if out_view.ndim != 2 or out_view.shape[0] != len(queries) or out_view.shape[1] != len(choices):
+            PyBuffer_Release(&out_view)
+            raise ValueError(f"out has to be a matrix of shape ({len(queries)}, {len(choices)})")
+        c_out = out_view.buf
 
-    setupPandas()
-
-    scorer_kwargs = scorer_kwargs.copy() if scorer_kwargs else {}
-
-    scorer_capsule = getattr(scorer, '_RF_Scorer', scorer)
-    if PyCapsule_IsValid(scorer_capsule, NULL):
-        scorer_context = <RF_Scorer*>PyCapsule_GetPointer(scorer_capsule, NULL)
-
-    is_orig_scorer = getattr(scorer, '_RF_OriginalScorer', None) is scorer
+    try:
+        setupPandas()
+        is_same_list = queries is choices
+        choices = prepare_string_arrays(choices, processor)
+        queries = choices if is_same_list else prepare_string_arrays(queries, processor)
+
+        scorer_kwargs = scorer_kwargs.copy() if scorer_kwargs else {}
+
+        scorer_capsule = getattr(scorer, '_RF_Scorer', scorer)
+        if PyCapsule_IsValid(scorer_capsule, NULL):
+            scorer_context = <RF_Scorer*>PyCapsule_GetPointer(scorer_capsule, NULL)
+
+        is_orig_scorer = getattr(scorer, '_RF_OriginalScorer', None) is scorer
+
+        if is_orig_scorer and scorer_context and scorer_context.version == SCORER_STRUCT_VERSION:
+            kwargs_context = RF_KwargsWrapper()
+            scorer_context.kwargs_init(&kwargs_context.kwargs, scorer_kwargs)
+            scorer_context.get_scorer_flags(&kwargs_context.kwargs, &scorer_flags)
+
+            if limit is not None:
+                return cdist_topk(
+                    queries, choices, scorer_context, &scorer_flags, processor,
+                    score_cutoff, score_hint, score_multiplier,
+                    dtype, limit, workers, &kwargs_context.kwargs)
+
+            if output == "sparse":
+                return cdist_sparse(
+                    queries, choices, scorer_context, &scorer_flags, processor,
+                    score_cutoff, score_hint, score_multiplier,
+                    dtype, workers, &kwargs_context.kwargs)
+
+            # scorer(queries[i], choices[j]) == scorer(queries[j], choices[i])
+            if scorer_flags.flags & RF_SCORER_FLAG_SYMMETRIC and queries is choices:
+                return cdist_single_list(
+                    queries, scorer_context, &scorer_flags, processor,
+                    score_cutoff, score_hint, score_multiplier,
+                    dtype, workers, &kwargs_context.kwargs, c_out)
+            else:
+                return cdist_two_lists(
+                    queries, choices, scorer_context, &scorer_flags, processor,
+                    score_cutoff, score_hint, score_multiplier,
+                    dtype, workers, &kwargs_context.kwargs, c_out)
 
-    if is_orig_scorer and scorer_context and scorer_context.version == SCORER_STRUCT_VERSION:
-        kwargs_context = RF_KwargsWrapper()
-        scorer_context.kwargs_init(&kwargs_context.kwargs, scorer_kwargs)
-        scorer_context.get_scorer_flags(&kwargs_context.kwargs, &scorer_flags)
+        if limit is not None:
+            return cdist_py_topk(queries, choices, scorer, processor, score_cutoff, score_multiplier, dtype, limit, scorer_kwargs)
 
-        # scorer(queries[i], choices[j]) == scorer(queries[j], choices[i])
-        if scorer_flags.flags & RF_SCORER_FLAG_SYMMETRIC and queries is choices:
-            return cdist_single_list(
-                queries, scorer_context, &scorer_flags, processor,
-                score_cutoff, score_hint, score_multiplier,
-                dtype, workers, &kwargs_context.kwargs)
-        else:
-            return cdist_two_lists(
-                queries, choices, scorer_context, &scorer_flags, processor,
-                score_cutoff, score_hint, score_multiplier,
-                dtype, workers, &kwargs_context.kwargs)
+        if output == "sparse":
+            return cdist_py_sparse(queries, choices, scorer, processor, score_cutoff, score_multiplier, dtype, scorer_kwargs)
 
-    return cdist_py(queries, choices, scorer, processor, score_cutoff, score_multiplier, dtype, workers, scorer_kwargs)
+        return cdist_py(queries, choices, scorer, processor, score_cutoff, score_multiplier, dtype, workers, scorer_kwargs, c_out)
+    finally:
+        if c_out != NULL:
+            PyBuffer_Release(&out_view)
 
 @cython.boundscheck(False)
 @cython.wraparound(False)
@@ -2043,6 +3296,7 @@ def cpdist(queries, choices, *, scorer=ratio, processor=None, score_cutoff=None,
     cdef bool is_orig_scorer
 
     setupPandas()
+    queries, choices = prepare_string_arrays(queries, processor), prepare_string_arrays(choices, processor)
 
     scorer_kwargs = scorer_kwargs.copy() if scorer_kwargs else {}
 
@@ -4,11 +4,447 @@ from __future__ import annotations
 
 import heapq
 import numbers
-
-from rapidfuzz._utils import ScorerFlag, is_none, setupPandas
+from collections import OrderedDict
+
+from rapidfuzz import _catalog
+from rapidfuzz._result_cache import ResultCache, result_cache_key
+from rapidfuzz._utils import (
+    ScorerFlag,
+    ThreadPoolContext,
+    as_arrow_strings,
+    as_output_buffer,
+    is_none,
+    iter_cdist_blocks,
+    setupPandas,
+    sparse_matrix_type,
+    to_sparse_matrix,
+)
 from rapidfuzz.fuzz import WRatio, ratio
 
-__all__ = ["extract", "extract_iter", "extractOne", "cdist"]
+__all__ = [
+    "MutablePreparedChoices",
+    "PreparedChoices",
+    "QueryCache",
+    "ResultCache",
+    "cdist",
+    "cdist_iter",
+    "extract",
+    "extractOne",
+    "extract_iter",
+    "set_thread_pool",
+]
+
+
+class PreparedChoices:
+    """
+    Collection of choices, which are converted and preprocessed once, so they can be reused
+    across multiple calls to the functions in this module without preprocessing them again.
+
+    Parameters
+    ----------
+    choices : Iterable[Sequence[Hashable]] | Mapping[Sequence[Hashable]]
+        list of all strings the queries should be compared with or dict with a mapping
+        {<result>: <string to compare>}
+    processor : Callable, optional
+        Optional callable that is used to preprocess the choices. Default is None,
+        which deactivates this behaviour.
+    result_cache : ResultCache, optional
+        Optional cache for the results of `extract` and `extractOne` on these choices.
+        It can be replaced using the ``result_cache`` attribute. Default is None,
+        which deactivates this behaviour.
+
+    Notes
+    -----
+    The processor passed to the functions of this module is only applied to the
+    query and not to the prepared choices. When the choices are a mapping, the values
+    of the mapping are used by `cdist` and `cpdist`.
+
+    NumPy arrays with the dtype ``U`` or ``S`` and pyarrow arrays of the type ``string`` or
+    ``large_string`` are read in place when processor is None or a `utils.Processor`, so no
+    Python object is created for their elements. Non ASCII strings of pyarrow arrays are
+    decoded from UTF-8 once. The functions of this module wrap these arrays in `PreparedChoices`
+    automatically.
+
+    Examples
+    --------
+
+    >>> from rapidfuzz.process import PreparedChoices, extractOne
+    >>> from rapidfuzz.utils import default_process
+    >>> choices = PreparedChoices(["abcD", "efgh"], processor=default_process)
+    >>> extractOne("ABCD", choices, processor=default_process)
+    ("abcD", 100.0, 0)
+    """
+
+    def __init__(self, choices, *, processor=None, result_cache=None):
+        setupPandas()
+
+        if hasattr(choices, "items"):
+            self._keys = list(choices.keys())
+            self._choices = list(choices.values())
+        else:
+            self._keys = None
+            arrow_strings = as_arrow_strings(choices)
+            self._choices = list(choices if arrow_strings is None else arrow_strings)
+
+        self.processor = processor
+        self.result_cache = result_cache
+        self._version = 0
+        if processor:
+            self._processed = [x if is_none(x) else processor(x) for x in self._choices]
+        else:
+            self._processed = self._choices
+
+    def __len__(self):
+        return len(self._choices)
+
+    @property
+    def version(self):
+        """counter, which is increased whenever the choices are modified"""
+        return self._version
+
+    def save(self, path):
+        """
+        Save the choices and the preprocessed choices to a file, so they can be loaded
+        again using `PreparedChoices.load` without preprocessing them.
+
+        Parameters
+        ----------
+        path : str | os.PathLike
+            path of the file
+
+        Raises
+        ------
+        TypeError
+            If a preprocessed choice is not of type str or bytes
+
+        Notes
+        -----
+        Choices and keys, which are not of type str or bytes, are pickled. These files
+        can only be loaded using ``allow_pickle=True``.
+        """
+        _catalog.save(path, self._choices, self._keys, self._processed)
+
+    @classmethod
+    def load(cls, path, *, allow_pickle=False):
+        """
+        Load choices saved with `PreparedChoices.save`. The file is memory mapped,
+        so processes loading the same file share its memory and the choices are only
+        decoded when they are part of a result. The file must not be modified while
+        it is loaded.
+
+        Parameters
+        ----------
+        path : str | os.PathLike
+            path of the file
+        allow_pickle : bool, optional
+            Allow loading choices and keys, which are not of type str or bytes and are
+            therefore pickled. Default is False.
+
+        Returns
+        -------
+        PreparedChoices
+            the prepared choices. The processor is not saved, so it is None.
+            No result_cache is attached to them.
+
+        Raises
+        ------
+        ValueError
+            If the file was not saved by `PreparedChoices.save`, is corrupted, uses an
+            unsupported version or contains pickled objects while allow_pickle is False
+
+        Notes
+        -----
+        Unpickling a file can execute arbitrary code. Only use ``allow_pickle=True``
+        for files from a trusted source.
+        """
+        self = cls.__new__(cls)
+        self._choices, self._keys, self._processed = _catalog.load(path, allow_pickle)
+        self.processor = None
+        self.result_cache = None
+        self._version = 0
+        return self
+
+
+# key of removed choices in a MutablePreparedChoices until it is compacted
+_REMOVED = object()
+
+
+class MutablePreparedChoices(PreparedChoices):
+    """
+    `PreparedChoices`, which can be modified after they are created. Choices can be added,
+    replaced and removed by their key without preprocessing the other choices again.
+    Results contain the key of a choice as the third element of the tuple just like for
+    dict choices.
+
+    Parameters
+    ----------
+    choices : Iterable[Sequence[Hashable]] | Mapping[Sequence[Hashable]], optional
+        mapping {<result>: <string to compare>} of the initial choices. When a list of strings
+        is passed, their index is used as key. Default is no choices.
+    processor : Callable, optional
+        Optional callable that is used to preprocess the choices. Default is None,
+        which deactivates this behaviour.
+    result_cache : ResultCache, optional
+        Optional cache for the results of `extract` and `extractOne` on these choices.
+        It is invalidated whenever the choices are modified. Default is None,
+        which deactivates this behaviour.
+
+    Notes
+    -----
+    Removed choices are only marked as removed and skipped while scoring. Once more than a
+    quarter of the choices is removed, they are dropped from the choices. This can be done
+    explicitly using `compact`. The results are the same as for a dict with the same
+    choices, including the order of choices with the same score. The choices must not be
+    modified while they are used by another thread.
+
+    Examples
+    --------
+
+    >>> from rapidfuzz.process import MutablePreparedChoices, extractOne
+    >>> choices = MutablePreparedChoices({"a": "abcd", "b": "efgh"})
+    >>> choices.add("c", "abce")
+    >>> choices.remove("a")
+    >>> extractOne("abcd", choices)
+    ("abce", 75.0, "c")
+    """
+
+    def __init__(self, choices=(), *, processor=None, result_cache=None):
+        if hasattr(choices, "items"):
+            super().__init__(choices, processor=processor, result_cache=result_cache)
+        else:
+            super().__init__(dict(enumerate(choices)), processor=processor, result_cache=result_cache)
+
+        self._slots = {key: i for i, key in enumerate(self._keys)}
+        self._removed_count = 0
+
+    def __len__(self):
+        return len(self._slots)
+
+    def __contains__(self, key):
+        return key in self._slots
+
+    def __getitem__(self, key):
+        return self._choices[self._slots[key]]
+
+    def add(self, key, choice):
+        """
+        Add a choice or replace the choice of an existing key. Replaced choices keep
+        their position in the choices.
+
+        Parameters
+        ----------
+        key : Hashable
+            key of the choice, which is returned as the third element of results
+        choice : Sequence[Hashable]
+            string to compare
+        """
+        proc_choice = choice if not self.processor or is_none(choice) else self.processor(choice)
+        self._version += 1
+        index = self._slots.get(key)
+        if index is None:
+            self._slots[key] = len(self._keys)
+            self._keys.append(key)
+            self._choices.append(choice)
+            if self._processed is not self._choices:
+                self._processed.append(proc_choice)
+        else:
+            self._choices[index] = choice
+            if self._processed is not self._choices:
+                self._processed[index] = proc_choice
+
+    def update(self, choices):
+        """
+        Add or replace multiple choices
+
+        Parameters
+        ----------
+        choices : Mapping[Sequence[Hashable]] | Iterable[tuple[Hashable, Sequence[Hashable]]]
+            mapping {<result>: <string to compare>} or iterable of key / choice pairs
+        """
+        items = choices.items() if hasattr(choices, "items") else choices
+        for key, choice in items:
+            self.add(key, choice)
+
+    def remove(self, key):
+        """
+        Remove the choice of a key
+
+        Parameters
+        ----------
+        key : Hashable
+            key of the choice
+
+        Raises
+        ------
+        KeyError
+            If no choice with this key exists
+        """
+        index = self._slots.pop(key)
+        self._version += 1
+        self._keys[index] = _REMOVED
+        self._choices[index] = None
+        if self._processed is not self._choices:
+            self._processed[index] = None
+
+        self._removed_count += 1
+        if self._removed_count * 4 > len(self._keys):
+            self.compact()
+
+    def compact(self):
+        """
+        Drop the removed choices and release their memory. This is done automatically
+        once more than a quarter of the choices is removed.
+        """
+        if not self._removed_count:
+            return
+
+        live = [i for i, key in enumerate(self._keys) if key is not _REMOVED]
+        shared = self._processed is self._choices
+        self._keys = [self._keys[i] for i in live]
+        self._choices = [self._choices[i] for i in live]
+        self._processed = self._choices if shared else [self._processed[i] for i in live]
+        self._slots = {key: i for i, key in enumerate(self._keys)}
+        self._removed_count = 0
+
+    def save(self, path):
+        self.compact()
+        super().save(path)
+
+    @classmethod
+    def load(cls, path, *, allow_pickle=False):  # noqa: ARG003
+        msg = "MutablePreparedChoices can not be loaded, load them using PreparedChoices.load instead"
+        raise TypeError(msg)
+
+
+class QueryCache:
+    """
+    Bounded least recently used cache for queries, which are passed to `extract`, `extractOne`
+    and `extract_iter` multiple times. It stores the preprocessed query and for scorers using the
+    RapidFuzz C-API the scorer initialized with the query, so they are only created once.
+
+    Parameters
+    ----------
+    maxsize : int, optional
+        maximum amount of queries kept in the cache. Default is 128.
+
+    Raises
+    ------
+    ValueError
+        If maxsize is smaller than 1
+
+    Notes
+    -----
+    Entries are looked up by the query, processor, scorer and scorer_kwargs. The cache is skipped
+    when one of them is not hashable. The processor and scorer are expected to be pure functions.
+    The cache must not be used by multiple threads at the same time.
+
+    Examples
+    --------
+
+    >>> from rapidfuzz.process import QueryCache, extractOne
+    >>> from rapidfuzz.utils import default_process
+    >>> cache = QueryCache(maxsize=16)
+    >>> extractOne("ABCD", ["abcd"], processor=default_process, query_cache=cache)
+    ('abcd', 100.0, 0)
+    >>> extractOne("ABCD", ["abce"], processor=default_process, query_cache=cache)
+    ('abce', 75.0, 0)
+    >>> (cache.hits, cache.misses)
+    (1, 1)
+    """
+
+    def __init__(self, maxsize=128):
+        if maxsize < 1:
+            msg = "maxsize has to be a positive number"
+            raise ValueError(msg)
+
+        self._maxsize = maxsize
+        self._entries = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+
+    @property
+    def maxsize(self):
+        """maximum amount of queries kept in the cache"""
+        return self._maxsize
+
+    @property
+    def hits(self):
+        """amount of lookups, which found the query in the cache"""
+        return self._hits
+
+    @property
+    def misses(self):
+        """amount of lookups, which added the query to the cache"""
+        return self._misses
+
+    def __len__(self):
+        return len(self._entries)
+
+    def clear(self):
+        """
+        Remove all queries from the cache and reset the hits and misses
+        """
+        self._entries.clear()
+        self._hits = 0
+        self._misses = 0
+
+    def _process(self, query, processor, scorer, scorer_kwargs):
+        """
+        preprocessed query, which is only calculated when it is not cached yet
+        """
+        key = (query, processor, scorer, tuple(sorted(scorer_kwargs.items())))
+        try:
+            cached = key in self._entries
+        except TypeError:
+            return query if processor is None else processor(query)
+
+        if cached:
+            self._hits += 1
+            self._entries.move_to_end(key)
+            return self._entries[key]
+
+        self._misses += 1
+        proc_query = query if processor is None else processor(query)
+        self._entries[key] = proc_query
+        if len(self._entries) > self._maxsize:
+            self._entries.popitem(last=False)
+        return proc_query
+
+
+def _iter_choices(choices, processor):
+    """
+    yields the key, choice and preprocessed choice for all choices, which are not None
+    """
+    if isinstance(choices, PreparedChoices):
+        keys = range(len(choices)) if choices._keys is None else choices._keys
+        for key, choice, proc_choice in zip(keys, choices._choices, choices._processed):
+            if not is_none(choice):
+                yield key, choice, proc_choice
+        return
+
+    arrow_strings = as_arrow_strings(choices)
+    if arrow_strings is not None:
+        choices = arrow_strings
+    choices_iter = choices.items() if hasattr(choices, "items") else enumerate(choices)
+    for key, choice in choices_iter:
+        if is_none(choice):
+            continue
+
+        yield key, choice, (choice if processor is None else processor(choice))
+
+
+def _preprocess(choices, processor):
+    if isinstance(choices, PreparedChoices):
+        # every choice is a column of the result, so removed choices have to be dropped
+        if isinstance(choices, MutablePreparedChoices):
+            choices.compact()
+        return choices._processed
+    arrow_strings = as_arrow_strings(choices)
+    if arrow_strings is not None:
+        choices = arrow_strings
+    if not processor:
+        return list(choices)
+    return [x if is_none(x) else processor(x) for x in choices]
 
 
 def _get_scorer_flags_py(scorer, scorer_kwargs):
@@ -28,6 +464,7 @@ def extract_iter(
     score_cutoff=None,
     score_hint=None,
     scorer_kwargs=None,
+    query_cache=None,
 ):
     """
     Find the best match in a list of choices
@@ -36,9 +473,9 @@ def extract_iter(
     ----------
     query : Sequence[Hashable]
         string we want to find
-    choices : Iterable[Sequence[Hashable]] | Mapping[Sequence[Hashable]]
+    choices : Iterable[Sequence[Hashable]] | Mapping[Sequence[Hashable]] | PreparedChoices
         list of all strings the query should be compared with or dict with a mapping
-        {<result>: <string to compare>}
+        {<result>: <string to compare>}. These can be preprocessed upfront using `PreparedChoices`
     scorer : Callable, optional
         Optional callable that is used to calculate the matching score between
         the query and each choice. This can be any of the scorers included in RapidFuzz
@@ -60,6 +497,10 @@ def extract_iter(
     scorer_kwargs : dict[str, Any], optional
         any other named parameters are passed to the scorer. This can be used to pass
         e.g. weights to `Levenshtein.distance`
+    query_cache : QueryCache, optional
+        Optional cache, which stores the preprocessed query and the scorer initialized with it,
+        so they are not created again when the same query is searched multiple times.
+        Default is None, which deactivates this behaviour.
 
     Yields
     -------
@@ -100,23 +541,13 @@ def extract_iter(
         score_cutoff = worst_score
 
     # preprocess the query
-    if processor is not None:
+    if query_cache is not None:
+        query = query_cache._process(query, processor, scorer, scorer_kwargs)
+    elif processor is not None:
         query = processor(query)
 
-    choices_iter = choices.items() if hasattr(choices, "items") else enumerate(choices)
-    for key, choice in choices_iter:
-        if is_none(choice):
-            continue
-
-        if processor is None:
-            score = scorer(query, choice, score_cutoff=score_cutoff, **scorer_kwargs)
-        else:
-            score = scorer(
-                query,
-                processor(choice),
-                score_cutoff=score_cutoff,
-                **scorer_kwargs,
-            )
+    for key, choice, proc_choice in _iter_choices(choices, processor):
+        score = scorer(query, proc_choice, score_cutoff=score_cutoff, **scorer_kwargs)
 
         if lowest_score_worst:
             if score >= score_cutoff:
@@ -134,7 +565,9 @@ def extractOne(
     processor=None,
     score_cutoff=None,
     score_hint=None,
+    workers=1,
     scorer_kwargs=None,
+    query_cache=None,
 ):
     """
     Find the best match in a list of choices. When multiple elements have the same similarity,
@@ -144,9 +577,9 @@ def extractOne(
     ----------
     query : Sequence[Hashable]
         string we want to find
-    choices : Iterable[Sequence[Hashable]] | Mapping[Sequence[Hashable]]
+    choices : Iterable[Sequence[Hashable]] | Mapping[Sequence[Hashable]] | PreparedChoices
         list of all strings the query should be compared with or dict with a mapping
-        {<result>: <string to compare>}
+        {<result>: <string to compare>}. These can be preprocessed upfront using `PreparedChoices`
     scorer : Callable, optional
         Optional callable that is used to calculate the matching score between
         the query and each choice. This can be any of the scorers included in RapidFuzz
@@ -165,9 +598,19 @@ def extractOne(
         Optional argument for an expected score to be passed to the scorer.
         This is used to select a faster implementation. Default is None,
         which deactivates this behaviour.
+    workers : int, optional
+        The choices are subdivided into blocks, which are evaluated in parallel using workers threads.
+        Supply -1 to use all available CPU cores. The result is the same as for a sequential search.
+        This argument is only available for scorers using the RapidFuzz C-API so far, since it
+        releases the Python GIL. When workers is not 1 all choices are preprocessed before the search
+        is started.
     scorer_kwargs : dict[str, Any], optional
         any other named parameters are passed to the scorer. This can be used to pass
         e.g. weights to `Levenshtein.distance`
+    query_cache : QueryCache, optional
+        Optional cache, which stores the preprocessed query and the scorer initialized with it,
+        so they are not created again when the same query is searched multiple times.
+        Default is None, which deactivates this behaviour.
 
     Returns
     -------
@@ -252,8 +695,16 @@ def extractOne(
     None
 
     """
-    _ = score_hint
+    _ = workers, score_hint
     scorer_kwargs = scorer_kwargs or {}
+    args = (query, choices, scorer, processor, score_cutoff, scorer_kwargs, query_cache)
+    if isinstance(choices, PreparedChoices) and choices.result_cache is not None:
+        key = result_cache_key("extractOne", query, scorer, processor, score_cutoff, None, scorer_kwargs)
+        return choices.result_cache._call(choices.version, key, _extractOne, *args)
+    return _extractOne(*args)
+
+
+def _extractOne(query, choices, scorer, processor, score_cutoff, scorer_kwargs, query_cache):
     worst_score, optimal_score = _get_scorer_flags_py(scorer, scorer_kwargs)
     lowest_score_worst = optimal_score > worst_score
 
@@ -266,25 +717,15 @@ def extractOne(
         score_cutoff = worst_score
 
     # preprocess the query
-    if processor is not None:
+    if query_cache is not None:
+        query = query_cache._process(query, processor, scorer, scorer_kwargs)
+    elif processor is not None:
         query = processor(query)
 
     result = None
 
-    choices_iter = choices.items() if hasattr(choices, "items") else enumerate(choices)
-    for key, choice in choices_iter:
-        if is_none(choice):
-            continue
-
-        if processor is None:
-            score = scorer(query, choice, score_cutoff=score_cutoff, **scorer_kwargs)
-        else:
-            score = scorer(
-                query,
-                processor(choice),
-                score_cutoff=score_cutoff,
-                **scorer_kwargs,
-            )
+    for key, choice, proc_choice in _iter_choices(choices, processor):
+        score = scorer(query, proc_choice, score_cutoff=score_cutoff, **scorer_kwargs)
 
         if lowest_score_worst:
             if score >= score_cutoff and (result is None or score > result[1]):
@@ -310,7 +751,9 @@ def extract(
     limit=5,
     score_cutoff=None,
     score_hint=None,
+    workers=1,
     scorer_kwargs=None,
+    query_cache=None,
 ):
     """
     Find the best matches in a list of choices. The list is sorted by the similarity.
@@ -320,9 +763,9 @@ def extract(
     ----------
     query : Sequence[Hashable]
         string we want to find
-    choices : Collection[Sequence[Hashable]] | Mapping[Sequence[Hashable]]
+    choices : Collection[Sequence[Hashable]] | Mapping[Sequence[Hashable]] | PreparedChoices
         list of all strings the query should be compared with or dict with a mapping
-        {<result>: <string to compare>}
+        {<result>: <string to compare>}. These can be preprocessed upfront using `PreparedChoices`
     scorer : Callable, optional
         Optional callable that is used to calculate the matching score between
         the query and each choice. This can be any of the scorers included in RapidFuzz
@@ -344,9 +787,18 @@ def extract(
         Optional argument for an expected score to be passed to the scorer.
         This is used to select a faster implementation. Default is None,
         which deactivates this behaviour.
+    workers : int, optional
+        The choices are subdivided into blocks, which are evaluated in parallel using workers threads.
+        Supply -1 to use all available CPU cores. The result is the same as for a sequential search.
+        This argument is only available for scorers using the RapidFuzz C-API so far, since it
+        releases the Python GIL.
     scorer_kwargs : dict[str, Any], optional
         any other named parameters are passed to the scorer. This can be used to pass
         e.g. weights to `Levenshtein.distance`
+    query_cache : QueryCache, optional
+        Optional cache, which stores the preprocessed query and the scorer initialized with it,
+        so they are not created again when the same query is searched multiple times.
+        Default is None, which deactivates this behaviour.
 
     Returns
     -------
@@ -376,20 +828,21 @@ def extract(
         has the `highest similarity`/`smallest distance`.
 
     """
+    _ = workers
     scorer_kwargs = scorer_kwargs or {}
+    args = (query, choices, scorer, processor, limit, score_cutoff, score_hint, scorer_kwargs, query_cache)
+    if isinstance(choices, PreparedChoices) and choices.result_cache is not None:
+        key = result_cache_key("extract", query, scorer, processor, score_cutoff, limit, scorer_kwargs)
+        return choices.result_cache._call(choices.version, key, _extract, *args)
+    return _extract(*args)
+
+
+def _extract(query, choices, scorer, processor, limit, score_cutoff, score_hint, scorer_kwargs, query_cache):
     worst_score, optimal_score = _get_scorer_flags_py(scorer, scorer_kwargs)
     lowest_score_worst = optimal_score > worst_score
 
     if limit == 1:
-        res = extractOne(
-            query,
-            choices,
-            processor=processor,
-            scorer=scorer,
-            score_cutoff=score_cutoff,
-            score_hint=score_hint,
-            scorer_kwargs=scorer_kwargs,
-        )
+        res = _extractOne(query, choices, scorer, processor, score_cutoff, scorer_kwargs, query_cache)
         if res is None:
             return []
         return [res]
@@ -402,6 +855,7 @@ def extract(
         score_cutoff=score_cutoff,
         score_hint=score_hint,
         scorer_kwargs=scorer_kwargs,
+        query_cache=query_cache,
     )
 
     if limit is None:
@@ -444,6 +898,64 @@ def _is_symmetric(scorer, scorer_kwargs):
     return False
 
 
+def _cdist_topk(proc_queries, proc_choices, scorer, score_cutoff, score_multiplier, dtype, limit, scorer_kwargs):
+    import numpy as np
+
+    worst_score, optimal_score = _get_scorer_flags_py(scorer, scorer_kwargs)
+    limit = min(limit, len(proc_choices))
+    indices = np.zeros((len(proc_queries), limit), dtype=np.int64)
+    results = np.zeros((len(proc_queries), limit), dtype=dtype)
+
+    for i, proc_query in enumerate(proc_queries):
+        row = [scorer(proc_query, choice, score_cutoff=score_cutoff, **scorer_kwargs) for choice in proc_choices]
+
+        # on equal scores the choice with the lower index comes first
+        if optimal_score > worst_score:
+            best = heapq.nlargest(limit, range(len(row)), key=row.__getitem__)
+        else:
+            best = heapq.nsmallest(limit, range(len(row)), key=row.__getitem__)
+
+        for j, col in enumerate(best):
+            score = row[col] * score_multiplier
+            if issubclass(dtype, numbers.Integral):
+                score = round(score)
+
+            indices[i, j] = col
+            results[i, j] = score
+
+    return indices, results
+
+
+def _cdist_sparse(proc_queries, proc_choices, scorer, score_cutoff, score_multiplier, dtype, scorer_kwargs):
+    import numpy as np
+
+    worst_score, optimal_score = _get_scorer_flags_py(scorer, scorer_kwargs)
+    lowest_score_worst = optimal_score > worst_score
+    rows = []
+    cols = []
+    results = []
+
+    for i, proc_query in enumerate(proc_queries):
+        for j, choice in enumerate(proc_choices):
+            score = scorer(proc_query, choice, score_cutoff=score_cutoff, **scorer_kwargs)
+            if score_cutoff is not None and (score < score_cutoff if lowest_score_worst else score > score_cutoff):
+                continue
+
+            score *= score_multiplier
+            if issubclass(dtype, numbers.Integral):
+                score = round(score)
+
+            rows.append(i)
+            cols.append(j)
+            results.append(score)
+
+    return (
+        np.array(rows, dtype=np.int64),
+        np.array(cols, dtype=np.int64),
+        np.array(results, dtype=dtype),
+    )
+
+
 def cdist(
     queries,
     choices,
@@ -455,6 +967,9 @@ def cdist(
     score_multiplier=1,
     dtype=None,
     workers=1,
+    limit=None,
+    output="dense",
+    out=None,
     scorer_kwargs=None,
 ):
     """
@@ -462,9 +977,9 @@ def cdist(
 
     Parameters
     ----------
-    queries : Collection[Sequence[Hashable]]
+    queries : Collection[Sequence[Hashable]] | PreparedChoices
         list of all strings the queries
-    choices : Collection[Sequence[Hashable]]
+    choices : Collection[Sequence[Hashable]] | PreparedChoices
         list of all strings the query should be compared
     scorer : Callable, optional
         Optional callable that is used to calculate the matching score between
@@ -503,6 +1018,20 @@ def cdist(
         Supply -1 to use all available CPU cores.
         This argument is only available for scorers using the RapidFuzz C-API so far, since it
         releases the Python GIL.
+    limit : int, optional
+        maximum amount of choices to keep for each query. When this is set only the best
+        `limit` choices of each query are kept instead of calculating the whole matrix.
+        It has to be a non-negative number. Default is None, which deactivates this behaviour.
+    output : {"dense", "sparse"}, optional
+        Format of the result. "dense" returns the full matrix. "sparse" only keeps
+        the scores passing `score_cutoff`, which requires a lot less memory when most
+        pairs are filtered out. It requires SciPy and can not be combined with `limit`.
+        Default is "dense".
+    out : ndarray, optional
+        Writable C-contiguous buffer of shape (len(queries) x len(choices)) the result is written to
+        instead of allocating a new matrix, e.g. a preallocated array, a slice of a larger array or a
+        `numpy.memmap`. When `dtype` is not given, the dtype of `out` is used. It can only be used
+        for the dense output without `limit`. Default is None, which deactivates this behaviour.
     scorer_kwargs : dict[str, Any], optional
         any other named parameters are passed to the scorer. This can be used to pass
         e.g. weights to `Levenshtein.distance`
@@ -511,21 +1040,64 @@ def cdist(
     -------
     ndarray
         Returns a matrix of dtype with the distance/similarity between each pair
-        of the two collections of inputs.
+        of the two collections of inputs. When `out` is passed it is returned.
+    scipy.sparse.csr_matrix
+        When `output` is "sparse" a csr_matrix of size (len(queries) x len(choices)) with the
+        scores passing `score_cutoff` is returned. Pairs, which are not stored, read as 0.
+        For distances this is the best possible score, so matches have to be found using the
+        stored entries (e.g. ``indices`` and ``indptr`` or ``tocoo()``) and not their values.
+        Perfect matches of distances are stored as explicit zeros, which are removed by
+        operations like ``eliminate_zeros``.
+    tuple[ndarray, ndarray]
+        When `limit` is set a tuple ``(indices, scores)`` is returned instead. Both are matrices
+        of size (len(queries) x min(limit, len(choices))). `indices` contains the indices of the best
+        choices of each query with the dtype np.int64 and `scores` the corresponding distance/similarity
+        with the dtype `dtype`. They are sorted from the best to the worst match. When multiple choices
+        have the same score, they are sorted by their index.
     """
     import numpy as np
 
     _ = workers, score_hint
+    if output not in {"dense", "sparse"}:
+        msg = f"output has to be 'dense' or 'sparse', not {output!r}"
+        raise ValueError(msg)
+    if limit is not None and limit < 0:
+        msg = "limit has to be a non-negative number or None"
+        raise ValueError(msg)
+    if output == "sparse" and limit is not None:
+        msg = "limit can not be combined with output='sparse'"
+        raise ValueError(msg)
+    if out is not None and (output != "dense" or limit is not None):
+        msg = "out can only be used with output='dense' and without limit"
+        raise ValueError(msg)
+    if output == "sparse":
+        sparse_matrix_type()
+
     scorer_kwargs = scorer_kwargs or {}
+    out_array = None
+    if out is not None:
+        out_array = as_output_buffer(out, dtype, (len(queries), len(choices)))
+        dtype = out_array.dtype.type
     dtype = _dtype_to_type_num(dtype, scorer, scorer_kwargs)
-    results = np.zeros((len(queries), len(choices)), dtype=dtype)
 
     setupPandas()
 
-    if processor is None:
-        proc_choices = list(choices)
-    else:
-        proc_choices = [x if is_none(x) else processor(x) for x in choices]
+    proc_choices = _preprocess(choices, processor)
+
+    if output == "sparse":
+        proc_queries = proc_choices if queries is choices else _preprocess(queries, processor)
+        rows, cols, results = _cdist_sparse(
+            proc_queries, proc_choices, scorer, score_cutoff, score_multiplier, dtype, scorer_kwargs
+        )
+        return to_sparse_matrix(rows, cols, results, shape=(len(queries), len(choices)))
+
+    if limit is not None:
+        proc_queries = proc_choices if queries is choices else _preprocess(queries, processor)
+        return _cdist_topk(
+            proc_queries, proc_choices, scorer, score_cutoff, score_multiplier, dtype, limit, scorer_kwargs
+        )
+
+    results = out_array if out_array is not None else np.zeros((len(queries), len(choices)), dtype=dtype)
 
     if queries is choices and _is_symmetric(scorer, scorer_kwargs):
         for i, proc_query in enumerate(proc_choices):
@@ -551,8 +1123,8 @@ def cdist(
 
                 results[i, j] = results[j, i] = score
     else:
-        for i, query in enumerate(queries):
-            proc_query = processor(query) if (processor and not is_none(query)) else query
+        proc_queries = proc_choices if queries is choices else _preprocess(queries, processor)
+        for i, proc_query in enumerate(proc_queries):
             for j, choice in enumerate(proc_choices):
                 score = (
                     scorer(
@@ -569,7 +1141,87 @@ def cdist(
 
                 results[i, j] = score
 
-    return results
+    return results if out is None else out
+
+
+def cdist_iter(
+    queries,
+    choices,
+    *,
+    scorer=ratio,
+    processor=None,
+    score_cutoff=None,
+    score_hint=None,
+    score_multiplier=1,
+    dtype=None,
+    workers=1,
+    chunk_size=1024,
+    scorer_kwargs=None,
+):
+    """
+    Compute distance/similarity between each pair of the two collections of inputs
+    in blocks of `chunk_size` queries. This calculates the same result as `cdist`,
+    but only keeps a few blocks in memory at the same time.
+
+    Parameters
+    ----------
+    queries : Collection[Sequence[Hashable]]
+        list of all strings the queries
+    choices : Collection[Sequence[Hashable]] | PreparedChoices
+        list of all strings the query should be compared. They are only preprocessed once.
+    scorer : Callable, optional
+        Optional callable that is used to calculate the matching score between
+        the query and each choice. fuzz.ratio is used by default.
+    processor : Callable, optional
+        Optional callable that is used to preprocess the strings before
+        comparing them. Default is None, which deactivates this behaviour.
+    score_cutoff : Any, optional
+        Optional argument for a score threshold to be passed to the scorer.
+        Default is None, which deactivates this behaviour.
+    score_hint : Any, optional
+        Optional argument for an expected score to be passed to the scorer.
+        This is used to select a faster implementation. Default is None,
+        which deactivates this behaviour.
+    score_multiplier: Any, optional
+        Optional argument to multiply the calculated score with. Default is 1,
+        which deactivates this behaviour.
+    dtype : data-type, optional
+        The desired data-type for the result blocks. See `cdist` for the supported dtypes.
+    workers : int, optional
+        The calculation of each block is subdivided into workers sections and evaluated in parallel.
+        Supply -1 to use all available CPU cores.
+    chunk_size : int, optional
+        Amount of queries in each block. Default is 1024.
+    scorer_kwargs : dict[str, Any], optional
+        any other named parameters are passed to the scorer. This can be used to pass
+        e.g. weights to `Levenshtein.distance`
+
+    Yields
+    ------
+    tuple[slice, ndarray]
+        Yields the rows of the block as slice of the queries and a matrix of size
+        (rows x len(choices)) with the distance/similarity between these queries
+        and all choices. While a block is consumed the next one is calculated in
+        a background thread.
+    """
+    if isinstance(queries, PreparedChoices):
+        msg = "queries can not be PreparedChoices, since they are split into blocks"
+        raise TypeError(msg)
+
+    if not isinstance(choices, PreparedChoices):
+        choices = PreparedChoices(choices, processor=processor)
+
+    kwargs = {
+        "scorer": scorer,
+        "processor": processor,
+        "score_cutoff": score_cutoff,
+        "score_hint": score_hint,
+        "score_multiplier": score_multiplier,
+        "dtype": dtype,
+        "workers": workers,
+        "scorer_kwargs": scorer_kwargs,
+    }
+    return iter_cdist_blocks(cdist, queries, choices, chunk_size, kwargs)
 
 
 def cpdist(
@@ -590,9 +1242,9 @@ def cpdist(
 
     Parameters
     ----------
-    queries : Collection[Sequence[Hashable]]
+    queries : Collection[Sequence[Hashable]] | PreparedChoices
         list of strings used to compute the distance/similarity.
-    choices : Collection[Sequence[Hashable]]
+    choices : Collection[Sequence[Hashable]] | PreparedChoices
         list of strings the queries should be compared with. Must be the same length as the queries.
     scorer : Callable, optional
         Optional callable that is used to calculate the matching score between
@@ -657,9 +1309,9 @@ def cpdist(
 
     setupPandas()
 
-    for i, (query, choice) in enumerate(zip(queries, choices)):
-        proc_query = processor(query) if (processor and not is_none(query)) else query
-        proc_choice = processor(choice) if (processor and not is_none(choice)) else choice
+    proc_queries = _preprocess(queries, processor)
+    proc_choices = _preprocess(choices, processor)
+    for i, (proc_query, proc_choice) in enumerate(zip(proc_queries, proc_choices)):
         score = scorer(
             proc_query,
             proc_choice,
@@ -678,3 +1330,42 @@ def cpdist(
         results[i] = score
 
     return results
+
+
+def set_thread_pool(workers=None):
+    """
+    Configure the thread pool shared by all functions in this module, which are called
+    with workers != 1. The pool is created lazily on first use and reused across calls,
+    so threads are not spawned and joined on every call.
+
+    Parameters
+    ----------
+    workers : int, optional
+        Amount of threads in the pool. Supply -1 to use all available CPU cores. Calls requesting
+        more workers are limited to this amount. Default is None, which shuts the pool down.
+        It is recreated on the next use with the size set in the environment variable
+        ``RAPIDFUZZ_NUM_THREADS`` or when it is not set with the largest amount of workers
+        requested (at least the amount of CPU cores).
+
+    Returns
+    -------
+    ThreadPoolContext
+        When used as context manager the previous configuration is restored on exit.
+
+    Notes
+    -----
+    The thread pool is not inherited by child processes created using fork. They create
+    a new pool on first use instead. The pure Python implementation does not use any threads,
+    so this has no effect on it.
+
+    Examples
+    --------
+    >>> from rapidfuzz.process import cdist, set_thread_pool
+    >>> with set_thread_pool(4):
+    ...     cdist(queries, choices, workers=-1)
+    """
+    if workers is not None and (workers == 0 or workers < -1):
+        msg = "workers has to be a positive number, -1 or None"
+        raise ValueError(msg)
+
+    return ThreadPoolContext(lambda: None)
@@ -183,6 +183,21 @@ typedef bool (*RF_ScorerFuncInit)(RF_ScorerFunc* self, const RF_Kwargs* kwargs,
 /* when none is passed this is the worst score */
 #define RF_SCORER_NONE_IS_WORST_SCORE ((uint32_t)1 << 13)
 
+/* the distance is at least the length difference of the strings: scorer(a, b) >= |len(a) - len(b)|
+ * This allows callers to skip strings, which can not reach score_cutoff, without calling the scorer
+ */
+#define RF_SCORER_FLAG_LENGTH_DIFF_BOUND ((uint32_t)1 << 14)
+
+/* the normalized similarity is at most the length ratio of the strings:
+ * (scorer(a, b) - worst_score) / (optimal_score - worst_score) <= min(len) / max(len)
+ */
+#define RF_SCORER_FLAG_LENGTH_RATIO_BOUND ((uint32_t)1 << 15)
+
+/* the normalized similarity is at most:
+ * (scorer(a, b) - worst_score) / (optimal_score - worst_score) <= 2 * min(len) / (len(a) + len(b))
+ */
+#define RF_SCORER_FLAG_LENGTH_SUM_RATIO_BOUND ((uint32_t)1 << 16)
+
 /**
  * @brief information associated with a scorer
  */
@@ -0,0 +1,1250 @@
+/* this file was generated by tools/generate_strip_accents.py using Unicode 14.0.0 */
+#pragma once
+#include <cstdint>
+
+#define STRIP_ACCENTS_MAX_LENGTH 18
+
+/* sorted code points, which are changed by strip_accents */
+static const uint32_t strip_accents_keys[] = {
+    160, 168, 170, 175, 178, 179, 180, 181, 184, 185, 186, 188, 189, 190, 192, 193, 194, 195, 196, 197, 199, 200, 201,
+    202, 203, 204, 205, 206, 207, 209, 210, 211, 212, 213, 214, 217, 218, 219, 220, 221, 224, 225, 226, 227, 228, 229,
+    231, 232, 233, 234, 235, 236, 237, 238, 239, 241, 242, 243, 244, 245, 246, 249, 250, 251, 252, 253, 255, 256, 257,
+    258, 259, 260, 261, 262, 263, 264, 265, 266, 267, 268, 269, 270, 271, 274, 275, 276, 277, 278, 279, 280, 281, 282,
+    283, 284, 285, 286, 287, 288, 289, 290, 291, 292, 293, 296, 297, 298, 299, 300, 301, 302, 303, 304, 306, 307, 308,
+    309, 310, 311, 313, 314, 315, 316, 317, 318, 319, 320, 323, 324, 325, 326, 327, 328, 329, 332, 333, 334, 335, 336,
+    337, 340, 341, 342, 343, 344, 345, 346, 347, 348, 349, 350, 351, 352, 353, 354, 355, 356, 357, 360, 361, 362, 363,
+    364, 365, 366, 367, 368, 369, 370, 371, 372, 373, 374, 375, 376, 377, 378, 379, 380, 381, 382, 383, 416, 417, 431,
+    432, 452, 453, 454, 455, 456, 457, 458, 459, 460, 461, 462, 463, 464, 465, 466, 467, 468, 469, 470, 471, 472, 473,
+    474, 475, 476, 478, 479, 480, 481, 482, 483, 486, 487, 488, 489, 490, 491, 492, 493, 494, 495, 496, 497, 498, 499,
+    500, 501, 504, 505, 506, 507, 508, 509, 510, 511, 512, 513, 514, 515, 516, 517, 518, 519, 520, 521, 522, 523, 524,
+    525, 526, 527, 528, 529, 530, 531, 532, 533, 534, 535, 536, 537, 538, 539, 542, 543, 550, 551, 552, 553, 554, 555,
+    556, 557, 558, 559, 560, 561, 562, 563, 688, 689, 690, 691, 692, 693, 694, 695, 696, 728, 729, 730, 731, 732, 733,
+    736, 737, 738, 739, 740, 768, 769, 770, 771, 772, 773, 774, 775, 776, 777, 778, 779, 780, 781, 782, 783, 784, 785,
+    786, 787, 788, 789, 790, 791, 792, 793, 794, 795, 796, 797, 798, 799, 800, 801, 802, 803, 804, 805, 806, 807, 808,
+    809, 810, 811, 812, 813, 814, 815, 816, 817, 818, 819, 820, 821, 822, 823, 824, 825, 826, 827, 828, 829, 830, 831,
+    832, 833, 834, 835, 836, 837, 838, 839, 840, 841, 842, 843, 844, 845, 846, 848, 849, 850, 851, 852, 853, 854, 855,
+    856, 857, 858, 859, 860, 861, 862, 863, 864, 865, 866, 867, 868, 869, 870, 871, 872, 873, 874, 875, 876, 877, 878,
+    879, 884, 890, 894, 900, 901, 902, 903, 904, 905, 906, 908, 910, 911, 912, 938, 939, 940, 941, 942, 943, 944, 970,
+    971, 972, 973, 974, 976, 977, 978, 979, 980, 981, 982, 1008, 1009, 1010, 1012, 1013, 1017, 1024, 1025, 1027, 1031,
+    1036, 1037, 1038, 1049, 1081, 1104, 1105, 1107, 1111, 1116, 1117, 1118, 1142, 1143, 1155, 1156, 1157, 1158, 1159,
+    1217, 1218, 1232, 1233, 1234, 1235, 1238, 1239, 1242, 1243, 1244, 1245, 1246, 1247, 1250, 1251, 1252, 1253, 1254,
+    1255, 1258, 1259, 1260, 1261, 1262, 1263, 1264, 1265, 1266, 1267, 1268, 1269, 1272, 1273, 1415, 1425, 1426, 1427,
+    1428, 1429, 1430, 1431, 1432, 1433, 1434, 1435, 1436, 1437, 1438, 1439, 1440, 1441, 1442, 1443, 1444, 1445, 1446,
+    1447, 1448, 1449, 1450, 1451, 1452, 1453, 1454, 1455, 1456, 1457, 1458, 1459, 1460, 1461, 1462, 1463, 1464, 1465,
+    1466, 1467, 1468, 1469, 1471, 1473, 1474, 1476, 1477, 1479, 1552, 1553, 1554, 1555, 1556, 1557, 1558, 1559, 1560,
+    1561, 1562, 1570, 1571, 1572, 1573, 1574, 1611, 1612, 1613, 1614, 1615, 1616, 1617, 1618, 1619, 1620, 1621, 1622,
+    1623, 1624, 1625, 1626, 1627, 1628, 1629, 1630, 1631, 1648, 1653, 1654, 1655, 1656, 1728, 1730, 1747, 1750, 1751,
+    1752, 1753, 1754, 1755, 1756, 1759, 1760, 1761, 1762, 1763, 1764, 1767, 1768, 1770, 1771, 1772, 1773, 1809, 1840,
+    1841, 1842, 1843, 1844, 1845, 1846, 1847, 1848, 1849, 1850, 1851, 1852, 1853, 1854, 1855, 1856, 1857, 1858, 1859,
+    1860, 1861, 1862, 1863, 1864, 1865, 1866, 2027, 2028, 2029, 2030, 2031, 2032, 2033, 2034, 2035, 2045, 2070, 2071,
+    2072, 2073, 2075, 2076, 2077, 2078, 2079, 2080, 2081, 2082, 2083, 2085, 2086, 2087, 2089, 2090, 2091, 2092, 2093,
+    2137, 2138, 2139, 2200, 2201, 2202, 2203, 2204, 2205, 2206, 2207, 2250, 2251, 2252, 2253, 2254, 2255, 2256, 2257,
+    2258, 2259, 2260, 2261, 2262, 2263, 2264, 2265, 2266, 2267, 2268, 2269, 2270, 2271, 2272, 2273, 2275, 2276, 2277,
+    2278, 2279, 2280, 2281, 2282, 2283, 2284, 2285, 2286, 2287, 2288, 2289, 2290, 2291, 2292, 2293, 2294, 2295, 2296,
+    2297, 2298, 2299, 2300, 2301, 2302, 2303, 2345, 2353, 2356, 2364, 2381, 2385, 2386, 2387, 2388, 2392, 2393, 2394,
+    2395, 2396, 2397, 2398, 2399, 2492, 2507, 2508, 2509, 2524, 2525, 2527, 2558, 2611, 2614, 2620, 2637, 2649, 2650,
+    2651, 2654, 2748, 2765, 2876, 2888, 2891, 2892, 2893, 2908, 2909, 2964, 3018, 3019, 3020, 3021, 3132, 3144, 3149,
+    3157, 3158, 3260, 3264, 3271, 3272, 3274, 3275, 3277, 3387, 3388, 3402, 3403, 3404, 3405, 3530, 3546, 3548, 3549,
+    3550, 3635, 3640, 3641, 3642, 3656, 3657, 3658, 3659, 3763, 3768, 3769, 3770, 3784, 3785, 3786, 3787, 3804, 3805,
+    3852, 3864, 3865, 3893, 3895, 3897, 3907, 3917, 3922, 3927, 3932, 3945, 3953, 3954, 3955, 3956, 3957, 3958, 3959,
+    3960, 3961, 3962, 3963, 3964, 3965, 3968, 3969, 3970, 3971, 3972, 3974, 3975, 3987, 3997, 4002, 4007, 4012, 4025,
+    4038, 4134, 4151, 4153, 4154, 4237, 4348, 4957, 4958, 4959, 5908, 5909, 5940, 6098, 6109, 6313, 6457, 6458, 6459,
+    6679, 6680, 6752, 6773, 6774, 6775, 6776, 6777, 6778, 6779, 6780, 6783, 6832, 6833, 6834, 6835, 6836, 6837, 6838,
+    6839, 6840, 6841, 6842, 6843, 6844, 6845, 6847, 6848, 6849, 6850, 6851, 6852, 6853, 6854, 6855, 6856, 6857, 6858,
+    6859, 6860, 6861, 6862, 6918, 6920, 6922, 6924, 6926, 6930, 6964, 6971, 6973, 6976, 6977, 6979, 6980, 7019, 7020,
+    7021, 7022, 7023, 7024, 7025, 7026, 7027, 7082, 7083, 7142, 7154, 7155, 7223, 7376, 7377, 7378, 7380, 7381, 7382,
+    7383, 7384, 7385, 7386, 7387, 7388, 7389, 7390, 7391, 7392, 7394, 7395, 7396, 7397, 7398, 7399, 7400, 7405, 7412,
+    7416, 7417, 7468, 7469, 7470, 7472, 7473, 7474, 7475, 7476, 7477, 7478, 7479, 7480, 7481, 7482, 7484, 7485, 7486,
+    7487, 7488, 7489, 7490, 7491, 7492, 7493, 7494, 7495, 7496, 7497, 7498, 7499, 7500, 7501, 7503, 7504, 7505, 7506,
+    7507, 7508, 7509, 7510, 7511, 7512, 7513, 7514, 7515, 7516, 7517, 7518, 7519, 7520, 7521, 7522, 7523, 7524, 7525,
+    7526, 7527, 7528, 7529, 7530, 7544, 7579, 7580, 7581, 7582, 7583, 7584, 7585, 7586, 7587, 7588, 7589, 7590, 7591,
+    7592, 7593, 7594, 7595, 7596, 7597, 7598, 7599, 7600, 7601, 7602, 7603, 7604, 7605, 7606, 7607, 7608, 7609, 7610,
+    7611, 7612, 7613, 7614, 7615, 7616, 7617, 7618, 7619, 7620, 7621, 7622, 7623, 7624, 7625, 7626, 7627, 7628, 7629,
+    7630, 7631, 7632, 7633, 7634, 7635, 7636, 7637, 7638, 7639, 7640, 7641, 7642, 7643, 7644, 7645, 7646, 7647, 7648,
+    7649, 7650, 7651, 7652, 7653, 7654, 7655, 7656, 7657, 7658, 7659, 7660, 7661, 7662, 7663, 7664, 7665, 7666, 7667,
+    7668, 7669, 7670, 7671, 7672, 7673, 7674, 7675, 7676, 7677, 7678, 7679, 7680, 7681, 7682, 7683, 7684, 7685, 7686,
+    7687, 7688, 7689, 7690, 7691, 7692, 7693, 7694, 7695, 7696, 7697, 7698, 7699, 7700, 7701, 7702, 7703, 7704, 7705,
+    7706, 7707, 7708, 7709, 7710, 7711, 7712, 7713, 7714, 7715, 7716, 7717, 7718, 7719, 7720, 7721, 7722, 7723, 7724,
+    7725, 7726, 7727, 7728, 7729, 7730, 7731, 7732, 7733, 7734, 7735, 7736, 7737, 7738, 7739, 7740, 7741, 7742, 7743,
+    7744, 7745, 7746, 7747, 7748, 7749, 7750, 7751, 7752, 7753, 7754, 7755, 7756, 7757, 7758, 7759, 7760, 7761, 7762,
+    7763, 7764, 7765, 7766, 7767, 7768, 7769, 7770, 7771, 7772, 7773, 7774, 7775, 7776, 7777, 7778, 7779, 7780, 7781,
+    7782, 7783, 7784, 7785, 7786, 7787, 7788, 7789, 7790, 7791, 7792, 7793, 7794, 7795, 7796, 7797, 7798, 7799, 7800,
+    7801, 7802, 7803, 7804, 7805, 7806, 7807, 7808, 7809, 7810, 7811, 7812, 7813, 7814, 7815, 7816, 7817, 7818, 7819,
+    7820, 7821, 7822, 7823, 7824, 7825, 7826, 7827, 7828, 7829, 7830, 7831, 7832, 7833, 7834, 7835, 7840, 7841, 7842,
+    7843, 7844, 7845, 7846, 7847, 7848, 7849, 7850, 7851, 7852, 7853, 7854, 7855, 7856, 7857, 7858, 7859, 7860, 7861,
+    7862, 7863, 7864, 7865, 7866, 7867, 7868, 7869, 7870, 7871, 7872, 7873, 7874, 7875, 7876, 7877, 7878, 7879, 7880,
+    7881, 7882, 7883, 7884, 7885, 7886, 7887, 7888, 7889, 7890, 7891, 7892, 7893, 7894, 7895, 7896, 7897, 7898, 7899,
+    7900, 7901, 7902, 7903, 7904, 7905, 7906, 7907, 7908, 7909, 7910, 7911, 7912, 7913, 7914, 7915, 7916, 7917, 7918,
+    7919, 7920, 7921, 7922, 7923, 7924, 7925, 7926, 7927, 7928, 7929, 7936, 7937, 7938, 7939, 7940, 7941, 7942, 7943,
+    7944, 7945, 7946, 7947, 7948, 7949, 7950, 7951, 7952, 7953, 7954, 7955, 7956, 7957, 7960, 7961, 7962, 7963, 7964,
+    7965, 7968, 7969, 7970, 7971, 7972, 7973, 7974, 7975, 7976, 7977, 7978, 7979, 7980, 7981, 7982, 7983, 7984, 7985,
+    7986, 7987, 7988, 7989, 7990, 7991, 7992, 7993, 7994, 7995, 7996, 7997, 7998, 7999, 8000, 8001, 8002, 8003, 8004,
+    8005, 8008, 8009, 8010, 8011, 8012, 8013, 8016, 8017, 8018, 8019, 8020, 8021, 8022, 8023, 8025, 8027, 8029, 8031,
+    8032, 8033, 8034, 8035, 8036, 8037, 8038, 8039, 8040, 8041, 8042, 8043, 8044, 8045, 8046, 8047, 8048, 8049, 8050,
+    8051, 8052, 8053, 8054, 8055, 8056, 8057, 8058, 8059, 8060, 8061, 8064, 8065, 8066, 8067, 8068, 8069, 8070, 8071,
+    8072, 8073, 8074, 8075, 8076, 8077, 8078, 8079, 8080, 8081, 8082, 8083, 8084, 8085, 8086, 8087, 8088, 8089, 8090,
+    8091, 8092, 8093, 8094, 8095, 8096, 8097, 8098, 8099, 8100, 8101, 8102, 8103, 8104, 8105, 8106, 8107, 8108, 8109,
+    8110, 8111, 8112, 8113, 8114, 8115, 8116, 8118, 8119, 8120, 8121, 8122, 8123, 8124, 8125, 8126, 8127, 8128, 8129,
+    8130, 8131, 8132, 8134, 8135, 8136, 8137, 8138, 8139, 8140, 8141, 8142, 8143, 8144, 8145, 8146, 8147, 8150, 8151,
+    8152, 8153, 8154, 8155, 8157, 8158, 8159, 8160, 8161, 8162, 8163, 8164, 8165, 8166, 8167, 8168, 8169, 8170, 8171,
+    8172, 8173, 8174, 8175, 8178, 8179, 8180, 8182, 8183, 8184, 8185, 8186, 8187, 8188, 8189, 8190, 8192, 8193, 8194,
+    8195, 8196, 8197, 8198, 8199, 8200, 8201, 8202, 8209, 8215, 8228, 8229, 8230, 8239, 8243, 8244, 8246, 8247, 8252,
+    8254, 8263, 8264, 8265, 8279, 8287, 8304, 8305, 8308, 8309, 8310, 8311, 8312, 8313, 8314, 8315, 8316, 8317, 8318,
+    8319, 8320, 8321, 8322, 8323, 8324, 8325, 8326, 8327, 8328, 8329, 8330, 8331, 8332, 8333, 8334, 8336, 8337, 8338,
+    8339, 8340, 8341, 8342, 8343, 8344, 8345, 8346, 8347, 8348, 8360, 8400, 8401, 8402, 8403, 8404, 8405, 8406, 8407,
+    8408, 8409, 8410, 8411, 8412, 8417, 8421, 8422, 8423, 8424, 8425, 8426, 8427, 8428, 8429, 8430, 8431, 8432, 8448,
+    8449, 8450, 8451, 8453, 8454, 8455, 8457, 8458, 8459, 8460, 8461, 8462, 8463, 8464, 8465, 8466, 8467, 8469, 8470,
+    8473, 8474, 8475, 8476, 8477, 8480, 8481, 8482, 8484, 8486, 8488, 8490, 8491, 8492, 8493, 8495, 8496, 8497, 8499,
+    8500, 8501, 8502, 8503, 8504, 8505, 8507, 8508, 8509, 8510, 8511, 8512, 8517, 8518, 8519, 8520, 8521, 8528, 8529,
+    8530, 8531, 8532, 8533, 8534, 8535, 8536, 8537, 8538, 8539, 8540, 8541, 8542, 8543, 8544, 8545, 8546, 8547, 8548,
+    8549, 8550, 8551, 8552, 8553, 8554, 8555, 8556, 8557, 8558, 8559, 8560, 8561, 8562, 8563, 8564, 8565, 8566, 8567,
+    8568, 8569, 8570, 8571, 8572, 8573, 8574, 8575, 8585, 8602, 8603, 8622, 8653, 8654, 8655, 8708, 8713, 8716, 8740,
+    8742, 8748, 8749, 8751, 8752, 8769, 8772, 8775, 8777, 8800, 8802, 8813, 8814, 8815, 8816, 8817, 8820, 8821, 8824,
+    8825, 8832, 8833, 8836, 8837, 8840, 8841, 8876, 8877, 8878, 8879, 8928, 8929, 8930, 8931, 8938, 8939, 8940, 8941,
+    9001, 9002, 9312, 9313, 9314, 9315, 9316, 9317, 9318, 9319, 9320, 9321, 9322, 9323, 9324, 9325, 9326, 9327, 9328,
+    9329, 9330, 9331, 9332, 9333, 9334, 9335, 9336, 9337, 9338, 9339, 9340, 9341, 9342, 9343, 9344, 9345, 9346, 9347,
+    9348, 9349, 9350, 9351, 9352, 9353, 9354, 9355, 9356, 9357, 9358, 9359, 9360, 9361, 9362, 9363, 9364, 9365, 9366,
+    9367, 9368, 9369, 9370, 9371, 9372, 9373, 9374, 9375, 9376, 9377, 9378, 9379, 9380, 9381, 9382, 9383, 9384, 9385,
+    9386, 9387, 9388, 9389, 9390, 9391, 9392, 9393, 9394, 9395, 9396, 9397, 9398, 9399, 9400, 9401, 9402, 9403, 9404,
+    9405, 9406, 9407, 9408, 9409, 9410, 9411, 9412, 9413, 9414, 9415, 9416, 9417, 9418, 9419, 9420, 9421, 9422, 9423,
+    9424, 9425, 9426, 9427, 9428, 9429, 9430, 9431, 9432, 9433, 9434, 9435, 9436, 9437, 9438, 9439, 9440, 9441, 9442,
+    9443, 9444, 9445, 9446, 9447, 9448, 9449, 9450, 10764, 10868, 10869, 10870, 10972, 11388, 11389, 11503, 11504,
+    11505, 11631, 11647, 11744, 11745, 11746, 11747, 11748, 11749, 11750, 11751, 11752, 11753, 11754, 11755, 11756,
+    11757, 11758, 11759, 11760, 11761, 11762, 11763, 11764, 11765, 11766, 11767, 11768, 11769, 11770, 11771, 11772,
+    11773, 11774, 11775, 11935, 12019, 12032, 12033, 12034, 12035, 12036, 12037, 12038, 12039, 12040, 12041, 12042,
+    12043, 12044, 12045, 12046, 12047, 12048, 12049, 12050, 12051, 12052, 12053, 12054, 12055, 12056, 12057, 12058,
+    12059, 12060, 12061, 12062, 12063, 12064, 12065, 12066, 12067, 12068, 12069, 12070, 12071, 12072, 12073, 12074,
+    12075, 12076, 12077, 12078, 12079, 12080, 12081, 12082, 12083, 12084, 12085, 12086, 12087, 12088, 12089, 12090,
+    12091, 12092, 12093, 12094, 12095, 12096, 12097, 12098, 12099, 12100, 12101, 12102, 12103, 12104, 12105, 12106,
+    12107, 12108, 12109, 12110, 12111, 12112, 12113, 12114, 12115, 12116, 12117, 12118, 12119, 12120, 12121, 12122,
+    12123, 12124, 12125, 12126, 12127, 12128, 12129, 12130, 12131, 12132, 12133, 12134, 12135, 12136, 12137, 12138,
+    12139, 12140, 12141, 12142, 12143, 12144, 12145, 12146, 12147, 12148, 12149, 12150, 12151, 12152, 12153, 12154,
+    12155, 12156, 12157, 12158, 12159, 12160, 12161, 12162, 12163, 12164, 12165, 12166, 12167, 12168, 12169, 12170,
+    12171, 12172, 12173, 12174, 12175, 12176, 12177, 12178, 12179, 12180, 12181, 12182, 12183, 12184, 12185, 12186,
+    12187, 12188, 12189, 12190, 12191, 12192, 12193, 12194, 12195, 12196, 12197, 12198, 12199, 12200, 12201, 12202,
+    12203, 12204, 12205, 12206, 12207, 12208, 12209, 12210, 12211, 12212, 12213, 12214, 12215, 12216, 12217, 12218,
+    12219, 12220, 12221, 12222, 12223, 12224, 12225, 12226, 12227, 12228, 12229, 12230, 12231, 12232, 12233, 12234,
+    12235, 12236, 12237, 12238, 12239, 12240, 12241, 12242, 12243, 12244, 12245, 12288, 12330, 12331, 12332, 12333,
+    12334, 12335, 12342, 12344, 12345, 12346, 12364, 12366, 12368, 12370, 12372, 12374, 12376, 12378, 12380, 12382,
+    12384, 12386, 12389, 12391, 12393, 12400, 12401, 12403, 12404, 12406, 12407, 12409, 12410, 12412, 12413, 12436,
+    12441, 12442, 12443, 12444, 12446, 12447, 12460, 12462, 12464, 12466, 12468, 12470, 12472, 12474, 12476, 12478,
+    12480, 12482, 12485, 12487, 12489, 12496, 12497, 12499, 12500, 12502, 12503, 12505, 12506, 12508, 12509, 12532,
+    12535, 12536, 12537, 12538, 12542, 12543, 12593, 12594, 12595, 12596, 12597, 12598, 12599, 12600, 12601, 12602,
+    12603, 12604, 12605, 12606, 12607, 12608, 12609, 12610, 12611, 12612, 12613, 12614, 12615, 12616, 12617, 12618,
+    12619, 12620, 12621, 12622, 12623, 12624, 12625, 12626, 12627, 12628, 12629, 12630, 12631, 12632, 12633, 12634,
+    12635, 12636, 12637, 12638, 12639, 12640, 12641, 12642, 12643, 12644, 12645, 12646, 12647, 12648, 12649, 12650,
+    12651, 12652, 12653, 12654, 12655, 12656, 12657, 12658, 12659, 12660, 12661, 12662, 12663, 12664, 12665, 12666,
+    12667, 12668, 12669, 12670, 12671, 12672, 12673, 12674, 12675, 12676, 12677, 12678, 12679, 12680, 12681, 12682,
+    12683, 12684, 12685, 12686, 12690, 12691, 12692, 12693, 12694, 12695, 12696, 12697, 12698, 12699, 12700, 12701,
+    12702, 12703, 12800, 12801, 12802, 12803, 12804, 12805, 12806, 12807, 12808, 12809, 12810, 12811, 12812, 12813,
+    12814, 12815, 12816, 12817, 12818, 12819, 12820, 12821, 12822, 12823, 12824, 12825, 12826, 12827, 12828, 12829,
+    12830, 12832, 12833, 12834, 12835, 12836, 12837, 12838, 12839, 12840, 12841, 12842, 12843, 12844, 12845, 12846,
+    12847, 12848, 12849, 12850, 12851, 12852, 12853, 12854, 12855, 12856, 12857, 12858, 12859, 12860, 12861, 12862,
+    12863, 12864, 12865, 12866, 12867, 12868, 12869, 12870, 12871, 12880, 12881, 12882, 12883, 12884, 12885, 12886,
+    12887, 12888, 12889, 12890, 12891, 12892, 12893, 12894, 12895, 12896, 12897, 12898, 12899, 12900, 12901, 12902,
+    12903, 12904, 12905, 12906, 12907, 12908, 12909, 12910, 12911, 12912, 12913, 12914, 12915, 12916, 12917, 12918,
+    12919, 12920, 12921, 12922, 12923, 12924, 12925, 12926, 12928, 12929, 12930, 12931, 12932, 12933, 12934, 12935,
+    12936, 12937, 12938, 12939, 12940, 12941, 12942, 12943, 12944, 12945, 12946, 12947, 12948, 12949, 12950, 12951,
+    12952, 12953, 12954, 12955, 12956, 12957, 12958, 12959, 12960, 12961, 12962, 12963, 12964, 12965, 12966, 12967,
+    12968, 12969, 12970, 12971, 12972, 12973, 12974, 12975, 12976, 12977, 12978, 12979, 12980, 12981, 12982, 12983,
+    12984, 12985, 12986, 12987, 12988, 12989, 12990, 12991, 12992, 12993, 12994, 12995, 12996, 12997, 12998, 12999,
+    13000, 13001, 13002, 13003, 13004, 13005, 13006, 13007, 13008, 13009, 13010, 13011, 13012, 13013, 13014, 13015,
+    13016, 13017, 13018, 13019, 13020, 13021, 13022, 13023, 13024, 13025, 13026, 13027, 13028, 13029, 13030, 13031,
+    13032, 13033, 13034, 13035, 13036, 13037, 13038, 13039, 13040, 13041, 13042, 13043, 13044, 13045, 13046, 13047,
+    13048, 13049, 13050, 13051, 13052, 13053, 13054, 13055, 13056, 13057, 13058, 13059, 13060, 13061, 13062, 13063,
+    13064, 13065, 13066, 13067, 13068, 13069, 13070, 13071, 13072, 13073, 13074, 13075, 13076, 13077, 13078, 13079,
+    13080, 13081, 13082, 13083, 13084, 13085, 13086, 13087, 13088, 13089, 13090, 13091, 13092, 13093, 13094, 13095,
+    13096, 13097, 13098, 13099, 13100, 13101, 13102, 13103, 13104, 13105, 13106, 13107, 13108, 13109, 13110, 13111,
+    13112, 13113, 13114, 13115, 13116, 13117, 13118, 13119, 13120, 13121, 13122, 13123, 13124, 13125, 13126, 13127,
+    13128, 13129, 13130, 13131, 13132, 13133, 13134, 13135, 13136, 13137, 13138, 13139, 13140, 13141, 13142, 13143,
+    13144, 13145, 13146, 13147, 13148, 13149, 13150, 13151, 13152, 13153, 13154, 13155, 13156, 13157, 13158, 13159,
+    13160, 13161, 13162, 13163, 13164, 13165, 13166, 13167, 13168, 13169, 13170, 13171, 13172, 13173, 13174, 13175,
+    13176, 13177, 13178, 13179, 13180, 13181, 13182, 13183, 13184, 13185, 13186, 13187, 13188, 13189, 13190, 13191,
+    13192, 13193, 13194, 13195, 13196, 13197, 13198, 13199, 13200, 13201, 13202, 13203, 13204, 13205, 13206, 13207,
+    13208, 13209, 13210, 13211, 13212, 13213, 13214, 13215, 13216, 13217, 13218, 13219, 13220, 13221, 13222, 13223,
+    13224, 13225, 13226, 13227, 13228, 13229, 13230, 13231, 13232, 13233, 13234, 13235, 13236, 13237, 13238, 13239,
+    13240, 13241, 13242, 13243, 13244, 13245, 13246, 13247, 13248, 13249, 13250, 13251, 13252, 13253, 13254, 13255,
+    13256, 13257, 13258, 13259, 13260, 13261, 13262, 13263, 13264, 13265, 13266, 13267, 13268, 13269, 13270, 13271,
+    13272, 13273, 13274, 13275, 13276, 13277, 13278, 13279, 13280, 13281, 13282, 13283, 13284, 13285, 13286, 13287,
+    13288, 13289, 13290, 13291, 13292, 13293, 13294, 13295, 13296, 13297, 13298, 13299, 13300, 13301, 13302, 13303,
+    13304, 13305, 13306, 13307, 13308, 13309, 13310, 13311, 42607, 42612, 42613, 42614, 42615, 42616, 42617, 42618,
+    42619, 42620, 42621, 42652, 42653, 42654, 42655, 42736, 42737, 42864, 42994, 42995, 42996, 43000, 43001, 43014,
+    43052, 43204, 43232, 43233, 43234, 43235, 43236, 43237, 43238, 43239, 43240, 43241, 43242, 43243, 43244, 43245,
+    43246, 43247, 43248, 43249, 43307, 43308, 43309, 43347, 43443, 43456, 43696, 43698, 43699, 43700, 43703, 43704,
+    43710, 43711, 43713, 43766, 43868, 43869, 43870, 43871, 43881, 44013, 63744, 63745, 63746, 63747, 63748, 63749,
+    63750, 63751, 63752, 63753, 63754, 63755, 63756, 63757, 63758, 63759, 63760, 63761, 63762, 63763, 63764, 63765,
+    63766, 63767, 63768, 63769, 63770, 63771, 63772, 63773, 63774, 63775, 63776, 63777, 63778, 63779, 63780, 63781,
+    63782, 63783, 63784, 63785, 63786, 63787, 63788, 63789, 63790, 63791, 63792, 63793, 63794, 63795, 63796, 63797,
+    63798, 63799, 63800, 63801, 63802, 63803, 63804, 63805, 63806, 63807, 63808, 63809, 63810, 63811, 63812, 63813,
+    63814, 63815, 63816, 63817, 63818, 63819, 63820, 63821, 63822, 63823, 63824, 63825, 63826, 63827, 63828, 63829,
+    63830, 63831, 63832, 63833, 63834, 63835, 63836, 63837, 63838, 63839, 63840, 63841, 63842, 63843, 63844, 63845,
+    63846, 63847, 63848, 63849, 63850, 63851, 63852, 63853, 63854, 63855, 63856, 63857, 63858, 63859, 63860, 63861,
+    63862, 63863, 63864, 63865, 63866, 63867, 63868, 63869, 63870, 63871, 63872, 63873, 63874, 63875, 63876, 63877,
+    63878, 63879, 63880, 63881, 63882, 63883, 63884, 63885, 63886, 63887, 63888, 63889, 63890, 63891, 63892, 63893,
+    63894, 63895, 63896, 63897, 63898, 63899, 63900, 63901, 63902, 63903, 63904, 63905, 63906, 63907, 63908, 63909,
+    63910, 63911, 63912, 63913, 63914, 63915, 63916, 63917, 63918, 63919, 63920, 63921, 63922, 63923, 63924, 63925,
+    63926, 63927, 63928, 63929, 63930, 63931, 63932, 63933, 63934, 63935, 63936, 63937, 63938, 63939, 63940, 63941,
+    63942, 63943, 63944, 63945, 63946, 63947, 63948, 63949, 63950, 63951, 63952, 63953, 63954, 63955, 63956, 63957,
+    63958, 63959, 63960, 63961, 63962, 63963, 63964, 63965, 63966, 63967, 63968, 63969, 63970, 63971, 63972, 63973,
+    63974, 63975, 63976, 63977, 63978, 63979, 63980, 63981, 63982, 63983, 63984, 63985, 63986, 63987, 63988, 63989,
+    63990, 63991, 63992, 63993, 63994, 63995, 63996, 63997, 63998, 63999, 64000, 64001, 64002, 64003, 64004, 64005,
+    64006, 64007, 64008, 64009, 64010, 64011, 64012, 64013, 64016, 64018, 64021, 64022, 64023, 64024, 64025, 64026,
+    64027, 64028, 64029, 64030, 64032, 64034, 64037, 64038, 64042, 64043, 64044, 64045, 64046, 64047, 64048, 64049,
+    64050, 64051, 64052, 64053, 64054, 64055, 64056, 64057, 64058, 64059, 64060, 64061, 64062, 64063, 64064, 64065,
+    64066, 64067, 64068, 64069, 64070, 64071, 64072, 64073, 64074, 64075, 64076, 64077, 64078, 64079, 64080, 64081,
+    64082, 64083, 64084, 64085, 64086, 64087, 64088, 64089, 64090, 64091, 64092, 64093, 64094, 64095, 64096, 64097,
+    64098, 64099, 64100, 64101, 64102, 64103, 64104, 64105, 64106, 64107, 64108, 64109, 64112, 64113, 64114, 64115,
+    64116, 64117, 64118, 64119, 64120, 64121, 64122, 64123, 64124, 64125, 64126, 64127, 64128, 64129, 64130, 64131,
+    64132, 64133, 64134, 64135, 64136, 64137, 64138, 64139, 64140, 64141, 64142, 64143, 64144, 64145, 64146, 64147,
+    64148, 64149, 64150, 64151, 64152, 64153, 64154, 64155, 64156, 64157, 64158, 64159, 64160, 64161, 64162, 64163,
+    64164, 64165, 64166, 64167, 64168, 64169, 64170, 64171, 64172, 64173, 64174, 64175, 64176, 64177, 64178, 64179,
+    64180, 64181, 64182, 64183, 64184, 64185, 64186, 64187, 64188, 64189, 64190, 64191, 64192, 64193, 64194, 64195,
+    64196, 64197, 64198, 64199, 64200, 64201, 64202, 64203, 64204, 64205, 64206, 64207, 64208, 64209, 64210, 64211,
+    64212, 64213, 64214, 64215, 64216, 64217, 64256, 64257, 64258, 64259, 64260, 64261, 64262, 64275, 64276, 64277,
+    64278, 64279, 64285, 64286, 64287, 64288, 64289, 64290, 64291, 64292, 64293, 64294, 64295, 64296, 64297, 64298,
+    64299, 64300, 64301, 64302, 64303, 64304, 64305, 64306, 64307, 64308, 64309, 64310, 64312, 64313, 64314, 64315,
+    64316, 64318, 64320, 64321, 64323, 64324, 64326, 64327, 64328, 64329, 64330, 64331, 64332, 64333, 64334, 64335,
+    64336, 64337, 64338, 64339, 64340, 64341, 64342, 64343, 64344, 64345, 64346, 64347, 64348, 64349, 64350, 64351,
+    64352, 64353, 64354, 64355, 64356, 64357, 64358, 64359, 64360, 64361, 64362, 64363, 64364, 64365, 64366, 64367,
+    64368, 64369, 64370, 64371, 64372, 64373, 64374, 64375, 64376, 64377, 64378, 64379, 64380, 64381, 64382, 64383,
+    64384, 64385, 64386, 64387, 64388, 64389, 64390, 64391, 64392, 64393, 64394, 64395, 64396, 64397, 64398, 64399,
+    64400, 64401, 64402, 64403, 64404, 64405, 64406, 64407, 64408, 64409, 64410, 64411, 64412, 64413, 64414, 64415,
+    64416, 64417, 64418, 64419, 64420, 64421, 64422, 64423, 64424, 64425, 64426, 64427, 64428, 64429, 64430, 64431,
+    64432, 64433, 64467, 64468, 64469, 64470, 64471, 64472, 64473, 64474, 64475, 64476, 64477, 64478, 64479, 64480,
+    64481, 64482, 64483, 64484, 64485, 64486, 64487, 64488, 64489, 64490, 64491, 64492, 64493, 64494, 64495, 64496,
+    64497, 64498, 64499, 64500, 64501, 64502, 64503, 64504, 64505, 64506, 64507, 64508, 64509, 64510, 64511, 64512,
+    64513, 64514, 64515, 64516, 64517, 64518, 64519, 64520, 64521, 64522, 64523, 64524, 64525, 64526, 64527, 64528,
+    64529, 64530, 64531, 64532, 64533, 64534, 64535, 64536, 64537, 64538, 64539, 64540, 64541, 64542, 64543, 64544,
+    64545, 64546, 64547, 64548, 64549, 64550, 64551, 64552, 64553, 64554, 64555, 64556, 64557, 64558, 64559, 64560,
+    64561, 64562, 64563, 64564, 64565, 64566, 64567, 64568, 64569, 64570, 64571, 64572, 64573, 64574, 64575, 64576,
+    64577, 64578, 64579, 64580, 64581, 64582, 64583, 64584, 64585, 64586, 64587, 64588, 64589, 64590, 64591, 64592,
+    64593, 64594, 64595, 64596, 64597, 64598, 64599, 64600, 64601, 64602, 64603, 64604, 64605, 64606, 64607, 64608,
+    64609, 64610, 64611, 64612, 64613, 64614, 64615, 64616, 64617, 64618, 64619, 64620, 64621, 64622, 64623, 64624,
+    64625, 64626, 64627, 64628, 64629, 64630, 64631, 64632, 64633, 64634, 64635, 64636, 64637, 64638, 64639, 64640,
+    64641, 64642, 64643, 64644, 64645, 64646, 64647, 64648, 64649, 64650, 64651, 64652, 64653, 64654, 64655, 64656,
+    64657, 64658, 64659, 64660, 64661, 64662, 64663, 64664, 64665, 64666, 64667, 64668, 64669, 64670, 64671, 64672,
+    64673, 64674, 64675, 64676, 64677, 64678, 64679, 64680, 64681, 64682, 64683, 64684, 64685, 64686, 64687, 64688,
+    64689, 64690, 64691, 64692, 64693, 64694, 64695, 64696, 64697, 64698, 64699, 64700, 64701, 64702, 64703, 64704,
+    64705, 64706, 64707, 64708, 64709, 64710, 64711, 64712, 64713, 64714, 64715, 64716, 64717, 64718, 64719, 64720,
+    64721, 64722, 64723, 64724, 64725, 64726, 64727, 64728, 64729, 64730, 64731, 64732, 64733, 64734, 64735, 64736,
+    64737, 64738, 64739, 64740, 64741, 64742, 64743, 64744, 64745, 64746, 64747, 64748, 64749, 64750, 64751, 64752,
+    64753, 64754, 64755, 64756, 64757, 64758, 64759, 64760, 64761, 64762, 64763, 64764, 64765, 64766, 64767, 64768,
+    64769, 64770, 64771, 64772, 64773, 64774, 64775, 64776, 64777, 64778, 64779, 64780, 64781, 64782, 64783, 64784,
+    64785, 64786, 64787, 64788, 64789, 64790, 64791, 64792, 64793, 64794, 64795, 64796, 64797, 64798, 64799, 64800,
+    64801, 64802, 64803, 64804, 64805, 64806, 64807, 64808, 64809, 64810, 64811, 64812, 64813, 64814, 64815, 64816,
+    64817, 64818, 64819, 64820, 64821, 64822, 64823, 64824, 64825, 64826, 64827, 64828, 64829, 64848, 64849, 64850,
+    64851, 64852, 64853, 64854, 64855, 64856, 64857, 64858, 64859, 64860, 64861, 64862, 64863, 64864, 64865, 64866,
+    64867, 64868, 64869, 64870, 64871, 64872, 64873, 64874, 64875, 64876, 64877, 64878, 64879, 64880, 64881, 64882,
+    64883, 64884, 64885, 64886, 64887, 64888, 64889, 64890, 64891, 64892, 64893, 64894, 64895, 64896, 64897, 64898,
+    64899, 64900, 64901, 64902, 64903, 64904, 64905, 64906, 64907, 64908, 64909, 64910, 64911, 64914, 64915, 64916,
+    64917, 64918, 64919, 64920, 64921, 64922, 64923, 64924, 64925, 64926, 64927, 64928, 64929, 64930, 64931, 64932,
+    64933, 64934, 64935, 64936, 64937, 64938, 64939, 64940, 64941, 64942, 64943, 64944, 64945, 64946, 64947, 64948,
+    64949, 64950, 64951, 64952, 64953, 64954, 64955, 64956, 64957, 64958, 64959, 64960, 64961, 64962, 64963, 64964,
+    64965, 64966, 64967, 65008, 65009, 65010, 65011, 65012, 65013, 65014, 65015, 65016, 65017, 65018, 65019, 65020,
+    65040, 65041, 65042, 65043, 65044, 65045, 65046, 65047, 65048, 65049, 65056, 65057, 65058, 65059, 65060, 65061,
+    65062, 65063, 65064, 65065, 65066, 65067, 65068, 65069, 65070, 65071, 65072, 65073, 65074, 65075, 65076, 65077,
+    65078, 65079, 65080, 65081, 65082, 65083, 65084, 65085, 65086, 65087, 65088, 65089, 65090, 65091, 65092, 65095,
+    65096, 65097, 65098, 65099, 65100, 65101, 65102, 65103, 65104, 65105, 65106, 65108, 65109, 65110, 65111, 65112,
+    65113, 65114, 65115, 65116, 65117, 65118, 65119, 65120, 65121, 65122, 65123, 65124, 65125, 65126, 65128, 65129,
+    65130, 65131, 65136, 65137, 65138, 65140, 65142, 65143, 65144, 65145, 65146, 65147, 65148, 65149, 65150, 65151,
+    65152, 65153, 65154, 65155, 65156, 65157, 65158, 65159, 65160, 65161, 65162, 65163, 65164, 65165, 65166, 65167,
+    65168, 65169, 65170, 65171, 65172, 65173, 65174, 65175, 65176, 65177, 65178, 65179, 65180, 65181, 65182, 65183,
+    65184, 65185, 65186, 65187, 65188, 65189, 65190, 65191, 65192, 65193, 65194, 65195, 65196, 65197, 65198, 65199,
+    65200, 65201, 65202, 65203, 65204, 65205, 65206, 65207, 65208, 65209, 65210, 65211, 65212, 65213, 65214, 65215,
+    65216, 65217, 65218, 65219, 65220, 65221, 65222, 65223, 65224, 65225, 65226, 65227, 65228, 65229, 65230, 65231,
+    65232, 65233, 65234, 65235, 65236, 65237, 65238, 65239, 65240, 65241, 65242, 65243, 65244, 65245, 65246, 65247,
+    65248, 65249, 65250, 65251, 65252, 65253, 65254, 65255, 65256, 65257, 65258, 65259, 65260, 65261, 65262, 65263,
+    65264, 65265, 65266, 65267, 65268, 65269, 65270, 65271, 65272, 65273, 65274, 65275, 65276, 65281, 65282, 65283,
+    65284, 65285, 65286, 65287, 65288, 65289, 65290, 65291, 65292, 65293, 65294, 65295, 65296, 65297, 65298, 65299,
+    65300, 65301, 65302, 65303, 65304, 65305, 65306, 65307, 65308, 65309, 65310, 65311, 65312, 65313, 65314, 65315,
+    65316, 65317, 65318, 65319, 65320, 65321, 65322, 65323, 65324, 65325, 65326, 65327, 65328, 65329, 65330, 65331,
+    65332, 65333, 65334, 65335, 65336, 65337, 65338, 65339, 65340, 65341, 65342, 65343, 65344, 65345, 65346, 65347,
+    65348, 65349, 65350, 65351, 65352, 65353, 65354, 65355, 65356, 65357, 65358, 65359, 65360, 65361, 65362, 65363,
+    65364, 65365, 65366, 65367, 65368, 65369, 65370, 65371, 65372, 65373, 65374, 65375, 65376, 65377, 65378, 65379,
+    65380, 65381, 65382, 65383, 65384, 65385, 65386, 65387, 65388, 65389, 65390, 65391, 65392, 65393, 65394, 65395,
+    65396, 65397, 65398, 65399, 65400, 65401, 65402, 65403, 65404, 65405, 65406, 65407, 65408, 65409, 65410, 65411,
+    65412, 65413, 65414, 65415, 65416, 65417, 65418, 65419, 65420, 65421, 65422, 65423, 65424, 65425, 65426, 65427,
+    65428, 65429, 65430, 65431, 65432, 65433, 65434, 65435, 65436, 65437, 65438, 65439, 65440, 65441, 65442, 65443,
+    65444, 65445, 65446, 65447, 65448, 65449, 65450, 65451, 65452, 65453, 65454, 65455, 65456, 65457, 65458, 65459,
+    65460, 65461, 65462, 65463, 65464, 65465, 65466, 65467, 65468, 65469, 65470, 65474, 65475, 65476, 65477, 65478,
+    65479, 65482, 65483, 65484, 65485, 65486, 65487, 65490, 65491, 65492, 65493, 65494, 65495, 65498, 65499, 65500,
+    65504, 65505, 65506, 65507, 65508, 65509, 65510, 65512, 65513, 65514, 65515, 65516, 65517, 65518, 66045, 66272,
+    66422, 66423, 66424, 66425, 66426, 67457, 67458, 67459, 67460, 67461, 67463, 67464, 67465, 67466, 67467, 67468,
+    67469, 67470, 67471, 67472, 67473, 67474, 67475, 67476, 67477, 67478, 67479, 67480, 67481, 67482, 67483, 67484,
+    67485, 67486, 67487, 67488, 67489, 67490, 67491, 67492, 67493, 67494, 67495, 67496, 67497, 67498, 67499, 67500,
+    67501, 67502, 67503, 67504, 67506, 67507, 67508, 67509, 67510, 67511, 67512, 67513, 67514, 68109, 68111, 68152,
+    68153, 68154, 68159, 68325, 68326, 68900, 68901, 68902, 68903, 69291, 69292, 69446, 69447, 69448, 69449, 69450,
+    69451, 69452, 69453, 69454, 69455, 69456, 69506, 69507, 69508, 69509, 69702, 69744, 69759, 69786, 69788, 69803,
+    69817, 69818, 69888, 69889, 69890, 69934, 69935, 69939, 69940, 70003, 70080, 70090, 70197, 70198, 70377, 70378,
+    70459, 70460, 70475, 70476, 70477, 70502, 70503, 70504, 70505, 70506, 70507, 70508, 70512, 70513, 70514, 70515,
+    70516, 70722, 70726, 70750, 70843, 70844, 70846, 70850, 70851, 71098, 71099, 71103, 71104, 71231, 71350, 71351,
+    71467, 71737, 71738, 71992, 71997, 71998, 72003, 72160, 72244, 72263, 72345, 72767, 73026, 73028, 73029, 73111,
+    92912, 92913, 92914, 92915, 92916, 92976, 92977, 92978, 92979, 92980, 92981, 92982, 94192, 94193, 113822, 119134,
+    119135, 119136, 119137, 119138, 119139, 119140, 119141, 119142, 119143, 119144, 119145, 119149, 119150, 119151,
+    119152, 119153, 119154, 119163, 119164, 119165, 119166, 119167, 119168, 119169, 119170, 119173, 119174, 119175,
+    119176, 119177, 119178, 119179, 119210, 119211, 119212, 119213, 119227, 119228, 119229, 119230, 119231, 119232,
+    119362, 119363, 119364, 119808, 119809, 119810, 119811, 119812, 119813, 119814, 119815, 119816, 119817, 119818,
+    119819, 119820, 119821, 119822, 119823, 119824, 119825, 119826, 119827, 119828, 119829, 119830, 119831, 119832,
+    119833, 119834, 119835, 119836, 119837, 119838, 119839, 119840, 119841, 119842, 119843, 119844, 119845, 119846,
+    119847, 119848, 119849, 119850, 119851, 119852, 119853, 119854, 119855, 119856, 119857, 119858, 119859, 119860,
+    119861, 119862, 119863, 119864, 119865, 119866, 119867, 119868, 119869, 119870, 119871, 119872, 119873, 119874,
+    119875, 119876, 119877, 119878, 119879, 119880, 119881, 119882, 119883, 119884, 119885, 119886, 119887, 119888,
+    119889, 119890, 119891, 119892, 119894, 119895, 119896, 119897, 119898, 119899, 119900, 119901, 119902, 119903,
+    119904, 119905, 119906, 119907, 119908, 119909, 119910, 119911, 119912, 119913, 119914, 119915, 119916, 119917,
+    119918, 119919, 119920, 119921, 119922, 119923, 119924, 119925, 119926, 119927, 119928, 119929, 119930, 119931,
+    119932, 119933, 119934, 119935, 119936, 119937, 119938, 119939, 119940, 119941, 119942, 119943, 119944, 119945,
+    119946, 119947, 119948, 119949, 119950, 119951, 119952, 119953, 119954, 119955, 119956, 119957, 119958, 119959,
+    119960, 119961, 119962, 119963, 119964, 119966, 119967, 119970, 119973, 119974, 119977, 119978, 119979, 119980,
+    119982, 119983, 119984, 119985, 119986, 119987, 119988, 119989, 119990, 119991, 119992, 119993, 119995, 119997,
+    119998, 119999, 120000, 120001, 120002, 120003, 120005, 120006, 120007, 120008, 120009, 120010, 120011, 120012,
+    120013, 120014, 120015, 120016, 120017, 120018, 120019, 120020, 120021, 120022, 120023, 120024, 120025, 120026,
+    120027, 120028, 120029, 120030, 120031, 120032, 120033, 120034, 120035, 120036, 120037, 120038, 120039, 120040,
+    120041, 120042, 120043, 120044, 120045, 120046, 120047, 120048, 120049, 120050, 120051, 120052, 120053, 120054,
+    120055, 120056, 120057, 120058, 120059, 120060, 120061, 120062, 120063, 120064, 120065, 120066, 120067, 120068,
+    120069, 120071, 120072, 120073, 120074, 120077, 120078, 120079, 120080, 120081, 120082, 120083, 120084, 120086,
+    120087, 120088, 120089, 120090, 120091, 120092, 120094, 120095, 120096, 120097, 120098, 120099, 120100, 120101,
+    120102, 120103, 120104, 120105, 120106, 120107, 120108, 120109, 120110, 120111, 120112, 120113, 120114, 120115,
+    120116, 120117, 120118, 120119, 120120, 120121, 120123, 120124, 120125, 120126, 120128, 120129, 120130, 120131,
+    120132, 120134, 120138, 120139, 120140, 120141, 120142, 120143, 120144, 120146, 120147, 120148, 120149, 120150,
+    120151, 120152, 120153, 120154, 120155, 120156, 120157, 120158, 120159, 120160, 120161, 120162, 120163, 120164,
+    120165, 120166, 120167, 120168, 120169, 120170, 120171, 120172, 120173, 120174, 120175, 120176, 120177, 120178,
+    120179, 120180, 120181, 120182, 120183, 120184, 120185, 120186, 120187, 120188, 120189, 120190, 120191, 120192,
+    120193, 120194, 120195, 120196, 120197, 120198, 120199, 120200, 120201, 120202, 120203, 120204, 120205, 120206,
+    120207, 120208, 120209, 120210, 120211, 120212, 120213, 120214, 120215, 120216, 120217, 120218, 120219, 120220,
+    120221, 120222, 120223, 120224, 120225, 120226, 120227, 120228, 120229, 120230, 120231, 120232, 120233, 120234,
+    120235, 120236, 120237, 120238, 120239, 120240, 120241, 120242, 120243, 120244, 120245, 120246, 120247, 120248,
+    120249, 120250, 120251, 120252, 120253, 120254, 120255, 120256, 120257, 120258, 120259, 120260, 120261, 120262,
+    120263, 120264, 120265, 120266, 120267, 120268, 120269, 120270, 120271, 120272, 120273, 120274, 120275, 120276,
+    120277, 120278, 120279, 120280, 120281, 120282, 120283, 120284, 120285, 120286, 120287, 120288, 120289, 120290,
+    120291, 120292, 120293, 120294, 120295, 120296, 120297, 120298, 120299, 120300, 120301, 120302, 120303, 120304,
+    120305, 120306, 120307, 120308, 120309, 120310, 120311, 120312, 120313, 120314, 120315, 120316, 120317, 120318,
+    120319, 120320, 120321, 120322, 120323, 120324, 120325, 120326, 120327, 120328, 120329, 120330, 120331, 120332,
+    120333, 120334, 120335, 120336, 120337, 120338, 120339, 120340, 120341, 120342, 120343, 120344, 120345, 120346,
+    120347, 120348, 120349, 120350, 120351, 120352, 120353, 120354, 120355, 120356, 120357, 120358, 120359, 120360,
+    120361, 120362, 120363, 120364, 120365, 120366, 120367, 120368, 120369, 120370, 120371, 120372, 120373, 120374,
+    120375, 120376, 120377, 120378, 120379, 120380, 120381, 120382, 120383, 120384, 120385, 120386, 120387, 120388,
+    120389, 120390, 120391, 120392, 120393, 120394, 120395, 120396, 120397, 120398, 120399, 120400, 120401, 120402,
+    120403, 120404, 120405, 120406, 120407, 120408, 120409, 120410, 120411, 120412, 120413, 120414, 120415, 120416,
+    120417, 120418, 120419, 120420, 120421, 120422, 120423, 120424, 120425, 120426, 120427, 120428, 120429, 120430,
+    120431, 120432, 120433, 120434, 120435, 120436, 120437, 120438, 120439, 120440, 120441, 120442, 120443, 120444,
+    120445, 120446, 120447, 120448, 120449, 120450, 120451, 120452, 120453, 120454, 120455, 120456, 120457, 120458,
+    120459, 120460, 120461, 120462, 120463, 120464, 120465, 120466, 120467, 120468, 120469, 120470, 120471, 120472,
+    120473, 120474, 120475, 120476, 120477, 120478, 120479, 120480, 120481, 120482, 120483, 120484, 120485, 120488,
+    120489, 120490, 120491, 120492, 120493, 120494, 120495, 120496, 120497, 120498, 120499, 120500, 120501, 120502,
+    120503, 120504, 120505, 120506, 120507, 120508, 120509, 120510, 120511, 120512, 120513, 120514, 120515, 120516,
+    120517, 120518, 120519, 120520, 120521, 120522, 120523, 120524, 120525, 120526, 120527, 120528, 120529, 120530,
+    120531, 120532, 120533, 120534, 120535, 120536, 120537, 120538, 120539, 120540, 120541, 120542, 120543, 120544,
+    120545, 120546, 120547, 120548, 120549, 120550, 120551, 120552, 120553, 120554, 120555, 120556, 120557, 120558,
+    120559, 120560, 120561, 120562, 120563, 120564, 120565, 120566, 120567, 120568, 120569, 120570, 120571, 120572,
+    120573, 120574, 120575, 120576, 120577, 120578, 120579, 120580, 120581, 120582, 120583, 120584, 120585, 120586,
+    120587, 120588, 120589, 120590, 120591, 120592, 120593, 120594, 120595, 120596, 120597, 120598, 120599, 120600,
+    120601, 120602, 120603, 120604, 120605, 120606, 120607, 120608, 120609, 120610, 120611, 120612, 120613, 120614,
+    120615, 120616, 120617, 120618, 120619, 120620, 120621, 120622, 120623, 120624, 120625, 120626, 120627, 120628,
+    120629, 120630, 120631, 120632, 120633, 120634, 120635, 120636, 120637, 120638, 120639, 120640, 120641, 120642,
+    120643, 120644, 120645, 120646, 120647, 120648, 120649, 120650, 120651, 120652, 120653, 120654, 120655, 120656,
+    120657, 120658, 120659, 120660, 120661, 120662, 120663, 120664, 120665, 120666, 120667, 120668, 120669, 120670,
+    120671, 120672, 120673, 120674, 120675, 120676, 120677, 120678, 120679, 120680, 120681, 120682, 120683, 120684,
+    120685, 120686, 120687, 120688, 120689, 120690, 120691, 120692, 120693, 120694, 120695, 120696, 120697, 120698,
+    120699, 120700, 120701, 120702, 120703, 120704, 120705, 120706, 120707, 120708, 120709, 120710, 120711, 120712,
+    120713, 120714, 120715, 120716, 120717, 120718, 120719, 120720, 120721, 120722, 120723, 120724, 120725, 120726,
+    120727, 120728, 120729, 120730, 120731, 120732, 120733, 120734, 120735, 120736, 120737, 120738, 120739, 120740,
+    120741, 120742, 120743, 120744, 120745, 120746, 120747, 120748, 120749, 120750, 120751, 120752, 120753, 120754,
+    120755, 120756, 120757, 120758, 120759, 120760, 120761, 120762, 120763, 120764, 120765, 120766, 120767, 120768,
+    120769, 120770, 120771, 120772, 120773, 120774, 120775, 120776, 120777, 120778, 120779, 120782, 120783, 120784,
+    120785, 120786, 120787, 120788, 120789, 120790, 120791, 120792, 120793, 120794, 120795, 120796, 120797, 120798,
+    120799, 120800, 120801, 120802, 120803, 120804, 120805, 120806, 120807, 120808, 120809, 120810, 120811, 120812,
+    120813, 120814, 120815, 120816, 120817, 120818, 120819, 120820, 120821, 120822, 120823, 120824, 120825, 120826,
+    120827, 120828, 120829, 120830, 120831, 122880, 122881, 122882, 122883, 122884, 122885, 122886, 122888, 122889,
+    122890, 122891, 122892, 122893, 122894, 122895, 122896, 122897, 122898, 122899, 122900, 122901, 122902, 122903,
+    122904, 122907, 122908, 122909, 122910, 122911, 122912, 122913, 122915, 122916, 122918, 122919, 122920, 122921,
+    122922, 123184, 123185, 123186, 123187, 123188, 123189, 123190, 123566, 123628, 123629, 123630, 123631, 125136,
+    125137, 125138, 125139, 125140, 125141, 125142, 125252, 125253, 125254, 125255, 125256, 125257, 125258, 126464,
+    126465, 126466, 126467, 126469, 126470, 126471, 126472, 126473, 126474, 126475, 126476, 126477, 126478, 126479,
+    126480, 126481, 126482, 126483, 126484, 126485, 126486, 126487, 126488, 126489, 126490, 126491, 126492, 126493,
+    126494, 126495, 126497, 126498, 126500, 126503, 126505, 126506, 126507, 126508, 126509, 126510, 126511, 126512,
+    126513, 126514, 126516, 126517, 126518, 126519, 126521, 126523, 126530, 126535, 126537, 126539, 126541, 126542,
+    126543, 126545, 126546, 126548, 126551, 126553, 126555, 126557, 126559, 126561, 126562, 126564, 126567, 126568,
+    126569, 126570, 126572, 126573, 126574, 126575, 126576, 126577, 126578, 126580, 126581, 126582, 126583, 126585,
+    126586, 126587, 126588, 126590, 126592, 126593, 126594, 126595, 126596, 126597, 126598, 126599, 126600, 126601,
+    126603, 126604, 126605, 126606, 126607, 126608, 126609, 126610, 126611, 126612, 126613, 126614, 126615, 126616,
+    126617, 126618, 126619, 126625, 126626, 126627, 126629, 126630, 126631, 126632, 126633, 126635, 126636, 126637,
+    126638, 126639, 126640, 126641, 126642, 126643, 126644, 126645, 126646, 126647, 126648, 126649, 126650, 126651,
+    127232, 127233, 127234, 127235, 127236, 127237, 127238, 127239, 127240, 127241, 127242, 127248, 127249, 127250,
+    127251, 127252, 127253, 127254, 127255, 127256, 127257, 127258, 127259, 127260, 127261, 127262, 127263, 127264,
+    127265, 127266, 127267, 127268, 127269, 127270, 127271, 127272, 127273, 127274, 127275, 127276, 127277, 127278,
+    127280, 127281, 127282, 127283, 127284, 127285, 127286, 127287, 127288, 127289, 127290, 127291, 127292, 127293,
+    127294, 127295, 127296, 127297, 127298, 127299, 127300, 127301, 127302, 127303, 127304, 127305, 127306, 127307,
+    127308, 127309, 127310, 127311, 127338, 127339, 127340, 127376, 127488, 127489, 127490, 127504, 127505, 127506,
+    127507, 127508, 127509, 127510, 127511, 127512, 127513, 127514, 127515, 127516, 127517, 127518, 127519, 127520,
+    127521, 127522, 127523, 127524, 127525, 127526, 127527, 127528, 127529, 127530, 127531, 127532, 127533, 127534,
+    127535, 127536, 127537, 127538, 127539, 127540, 127541, 127542, 127543, 127544, 127545, 127546, 127547, 127552,
+    127553, 127554, 127555, 127556, 127557, 127558, 127559, 127560, 127568, 127569, 130032, 130033, 130034, 130035,
+    130036, 130037, 130038, 130039, 130040, 130041, 194560, 194561, 194562, 194563, 194564, 194565, 194566, 194567,
+    194568, 194569, 194570, 194571, 194572, 194573, 194574, 194575, 194576, 194577, 194578, 194579, 194580, 194581,
+    194582, 194583, 194584, 194585, 194586, 194587, 194588, 194589, 194590, 194591, 194592, 194593, 194594, 194595,
+    194596, 194597, 194598, 194599, 194600, 194601, 194602, 194603, 194604, 194605, 194606, 194607, 194608, 194609,
+    194610, 194611, 194612, 194613, 194614, 194615, 194616, 194617, 194618, 194619, 194620, 194621, 194622, 194623,
+    194624, 194625, 194626, 194627, 194628, 194629, 194630, 194631, 194632, 194633, 194634, 194635, 194636, 194637,
+    194638, 194639, 194640, 194641, 194642, 194643, 194644, 194645, 194646, 194647, 194648, 194649, 194650, 194651,
+    194652, 194653, 194654, 194655, 194656, 194657, 194658, 194659, 194660, 194661, 194662, 194663, 194664, 194665,
+    194666, 194667, 194668, 194669, 194670, 194671, 194672, 194673, 194674, 194675, 194676, 194677, 194678, 194679,
+    194680, 194681, 194682, 194683, 194684, 194685, 194686, 194687, 194688, 194689, 194690, 194691, 194692, 194693,
+    194694, 194695, 194696, 194697, 194698, 194699, 194700, 194701, 194702, 194703, 194704, 194705, 194706, 194707,
+    194708, 194709, 194710, 194711, 194712, 194713, 194714, 194715, 194716, 194717, 194718, 194719, 194720, 194721,
+    194722, 194723, 194724, 194725, 194726, 194727, 194728, 194729, 194730, 194731, 194732, 194733, 194734, 194735,
+    194736, 194737, 194738, 194739, 194740, 194741, 194742, 194743, 194744, 194745, 194746, 194747, 194748, 194749,
+    194750, 194751, 194752, 194753, 194754, 194755, 194756, 194757, 194758, 194759, 194760, 194761, 194762, 194763,
+    194764, 194765, 194766, 194767, 194768, 194769, 194770, 194771, 194772, 194773, 194774, 194775, 194776, 194777,
+    194778, 194779, 194780, 194781, 194782, 194783, 194784, 194785, 194786, 194787, 194788, 194789, 194790, 194791,
+    194792, 194793, 194794, 194795, 194796, 194797, 194798, 194799, 194800, 194801, 194802, 194803, 194804, 194805,
+    194806, 194807, 194808, 194809, 194810, 194811, 194812, 194813, 194814, 194815, 194816, 194817, 194818, 194819,
+    194820, 194821, 194822, 194823, 194824, 194825, 194826, 194827, 194828, 194829, 194830, 194831, 194832, 194833,
+    194834, 194835, 194836, 194837, 194838, 194839, 194840, 194841, 194842, 194843, 194844, 194845, 194846, 194847,
+    194848, 194849, 194850, 194851, 194852, 194853, 194854, 194855, 194856, 194857, 194858, 194859, 194860, 194861,
+    194862, 194863, 194864, 194865, 194866, 194867, 194868, 194869, 194870, 194871, 194872, 194873, 194874, 194875,
+    194876, 194877, 194878, 194879, 194880, 194881, 194882, 194883, 194884, 194885, 194886, 194887, 194888, 194889,
+    194890, 194891, 194892, 194893, 194894, 194895, 194896, 194897, 194898, 194899, 194900, 194901, 194902, 194903,
+    194904, 194905, 194906, 194907, 194908, 194909, 194910, 194911, 194912, 194913, 194914, 194915, 194916, 194917,
+    194918, 194919, 194920, 194921, 194922, 194923, 194924, 194925, 194926, 194927, 194928, 194929, 194930, 194931,
+    194932, 194933, 194934, 194935, 194936, 194937, 194938, 194939, 194940, 194941, 194942, 194943, 194944, 194945,
+    194946, 194947, 194948, 194949, 194950, 194951, 194952, 194953, 194954, 194955, 194956, 194957, 194958, 194959,
+    194960, 194961, 194962, 194963, 194964, 194965, 194966, 194967, 194968, 194969, 194970, 194971, 194972, 194973,
+    194974, 194975, 194976, 194977, 194978, 194979, 194980, 194981, 194982, 194983, 194984, 194985, 194986, 194987,
+    194988, 194989, 194990, 194991, 194992, 194993, 194994, 194995, 194996, 194997, 194998, 194999, 195000, 195001,
+    195002, 195003, 195004, 195005, 195006, 195007, 195008, 195009, 195010, 195011, 195012, 195013, 195014, 195015,
+    195016, 195017, 195018, 195019, 195020, 195021, 195022, 195023, 195024, 195025, 195026, 195027, 195028, 195029,
+    195030, 195031, 195032, 195033, 195034, 195035, 195036, 195037, 195038, 195039, 195040, 195041, 195042, 195043,
+    195044, 195045, 195046, 195047, 195048, 195049, 195050, 195051, 195052, 195053, 195054, 195055, 195056, 195057,
+    195058, 195059, 195060, 195061, 195062, 195063, 195064, 195065, 195066, 195067, 195068, 195069, 195070, 195071,
+    195072, 195073, 195074, 195075, 195076, 195077, 195078, 195079, 195080, 195081, 195082, 195083, 195084, 195085,
+    195086, 195087, 195088, 195089, 195090, 195091, 195092, 195093, 195094, 195095, 195096, 195097, 195098, 195099,
+    195100, 195101,
+};
+
+/* position of the replacement in strip_accents_data << 5 | length of the replacement */
+static const uint32_t strip_accents_index[] = {
+    1, 33, 65, 97, 129, 161, 193, 225, 257, 289, 321, 355, 451, 547, 641, 673, 705, 737, 769, 801, 833, 865, 897, 929,
+    961, 993, 1025, 1057, 1089, 1121, 1153, 1185, 1217, 1249, 1281, 1313, 1345, 1377, 1409, 1441, 1473, 1505, 1537,
+    1569, 1601, 1633, 1665, 1697, 1729, 1761, 1793, 1825, 1857, 1889, 1921, 1953, 1985, 2017, 2049, 2081, 2113, 2145,
+    2177, 2209, 2241, 2273, 2305, 2337, 2369, 2401, 2433, 2465, 2497, 2529, 2561, 2593, 2625, 2657, 2689, 2721, 2753,
+    2785, 2817, 2849, 2881, 2913, 2945, 2977, 3009, 3041, 3073, 3105, 3137, 3169, 3201, 3233, 3265, 3297, 3329, 3361,
+    3393, 3425, 3457, 3489, 3521, 3553, 3585, 3617, 3649, 3681, 3713, 3745, 3778, 3842, 3905, 3937, 3969, 4001, 4033,
+    4065, 4097, 4129, 4161, 4193, 4226, 4290, 4353, 4385, 4417, 4449, 4481, 4513, 4546, 4609, 4641, 4673, 4705, 4737,
+    4769, 4801, 4833, 4865, 4897, 4929, 4961, 4993, 5025, 5057, 5089, 5121, 5153, 5185, 5217, 5249, 5281, 5313, 5345,
+    5377, 5409, 5441, 5473, 5505, 5537, 5569, 5601, 5633, 5665, 5697, 5729, 5761, 5793, 5825, 5857, 5889, 5921, 5953,
+    5985, 6017, 6049, 6081, 6113, 6145, 6177, 6209, 6241, 6274, 6338, 6402, 6466, 6530, 6594, 6658, 6722, 6786, 6849,
+    6881, 6913, 6945, 6977, 7009, 7041, 7073, 7105, 7137, 7169, 7201, 7233, 7265, 7297, 7329, 7361, 7393, 7425, 7457,
+    7489, 7521, 7553, 7585, 7617, 7649, 7681, 7713, 7745, 7777, 7809, 7841, 7873, 7906, 7970, 8034, 8097, 8129, 8161,
+    8193, 8225, 8257, 8289, 8321, 8353, 8385, 8417, 8449, 8481, 8513, 8545, 8577, 8609, 8641, 8673, 8705, 8737, 8769,
+    8801, 8833, 8865, 8897, 8929, 8961, 8993, 9025, 9057, 9089, 9121, 9153, 9185, 9217, 9249, 9281, 9313, 9345, 9377,
+    9409, 9441, 9473, 9505, 9537, 9569, 9601, 9633, 9665, 9697, 9729, 9761, 9793, 9825, 9857, 9889, 9921, 9953, 9985,
+    10017, 10049, 10081, 10113, 10145, 10177, 10209, 10241, 10273, 10305, 10337, 10369, 10401, 10433, 10464, 10464,
+    10464, 10464, 10464, 10464, 10464, 10464, 10464, 10464, 10464, 10464, 10464, 10464, 10464, 10464, 10464, 10464,
+    10464, 10464, 10464, 10464, 10464, 10464, 10464, 10464, 10464, 10464, 10464, 10464, 10464, 10464, 10464, 10464,
+    10464, 10464, 10464, 10464, 10464, 10464, 10464, 10464, 10464, 10464, 10464, 10464, 10464, 10464, 10464, 10464,
+    10464, 10464, 10464, 10464, 10464, 10464, 10464, 10464, 10464, 10464, 10464, 10464, 10464, 10464, 10464, 10464,
+    10464, 10464, 10464, 10464, 10464, 10464, 10464, 10464, 10464, 10464, 10464, 10464, 10464, 10464, 10464, 10464,
+    10464, 10464, 10464, 10464, 10464, 10464, 10464, 10464, 10464, 10464, 10464, 10464, 10464, 10464, 10464, 10464,
+    10464, 10464, 10464, 10464, 10464, 10464, 10464, 10464, 10464, 10464, 10464, 10464, 10464, 10465, 10497, 10529,
+    10561, 10593, 10625, 10657, 10689, 10721, 10753, 10785, 10817, 10849, 10881, 10913, 10945, 10977, 11009, 11041,
+    11073, 11105, 11137, 11169, 11201, 11233, 11265, 11297, 11329, 11361, 11393, 11425, 11457, 11489, 11521, 11553,
+    11585, 11617, 11649, 11681, 11713, 11745, 11777, 11809, 11841, 11873, 11905, 11937, 11969, 12001, 12033, 12065,
+    12097, 12129, 12161, 12193, 12225, 12257, 12288, 12288, 12288, 12288, 12288, 12289, 12321, 12353, 12385, 12417,
+    12449, 12481, 12513, 12545, 12577, 12609, 12641, 12673, 12705, 12737, 12769, 12801, 12833, 12865, 12897, 12929,
+    12961, 12993, 13025, 13057, 13089, 13121, 13153, 13185, 13217, 13249, 13281, 13313, 13345, 13378, 13440, 13440,
+    13440, 13440, 13440, 13440, 13440, 13440, 13440, 13440, 13440, 13440, 13440, 13440, 13440, 13440, 13440, 13440,
+    13440, 13440, 13440, 13440, 13440, 13440, 13440, 13440, 13440, 13440, 13440, 13440, 13440, 13440, 13440, 13440,
+    13440, 13440, 13440, 13440, 13440, 13440, 13440, 13440, 13440, 13440, 13440, 13440, 13440, 13440, 13440, 13440,
+    13440, 13440, 13440, 13440, 13440, 13440, 13440, 13440, 13440, 13440, 13440, 13440, 13441, 13473, 13505, 13537,
+    13569, 13600, 13600, 13600, 13600, 13600, 13600, 13600, 13600, 13600, 13600, 13600, 13600, 13600, 13600, 13600,
+    13600, 13600, 13600, 13600, 13600, 13600, 13600, 13602, 13666, 13730, 13794, 13857, 13889, 13921, 13952, 13952,
+    13952, 13952, 13952, 13952, 13952, 13952, 13952, 13952, 13952, 13952, 13952, 13952, 13952, 13952, 13952, 13952,
+    13952, 13952, 13952, 13952, 13952, 13952, 13952, 13952, 13952, 13952, 13952, 13952, 13952, 13952, 13952, 13952,
+    13952, 13952, 13952, 13952, 13952, 13952, 13952, 13952, 13952, 13952, 13952, 13952, 13952, 13952, 13952, 13952,
+    13952, 13952, 13952, 13952, 13952, 13952, 13952, 13952, 13952, 13952, 13952, 13952, 13952, 13952, 13952, 13952,
+    13952, 13952, 13952, 13952, 13952, 13952, 13952, 13952, 13952, 13952, 13952, 13952, 13952, 13952, 13952, 13952,
+    13952, 13952, 13952, 13952, 13952, 13952, 13952, 13952, 13952, 13952, 13952, 13952, 13952, 13952, 13952, 13952,
+    13952, 13952, 13952, 13952, 13952, 13952, 13952, 13952, 13952, 13952, 13952, 13952, 13952, 13952, 13952, 13952,
+    13952, 13952, 13952, 13952, 13952, 13952, 13952, 13952, 13952, 13952, 13952, 13952, 13952, 13952, 13952, 13952,
+    13952, 13952, 13952, 13952, 13952, 13952, 13952, 13952, 13952, 13952, 13952, 13952, 13953, 13985, 14017, 14048,
+    14048, 14048, 14048, 14048, 14048, 14049, 14081, 14113, 14145, 14177, 14209, 14241, 14273, 14304, 14306, 14370,
+    14432, 14433, 14465, 14497, 14528, 14529, 14561, 14592, 14592, 14593, 14625, 14657, 14689, 14720, 14720, 14720,
+    14722, 14786, 14850, 14912, 14913, 14945, 14978, 15042, 15106, 15170, 15232, 15232, 15233, 15264, 15264, 15264,
+    15264, 15266, 15330, 15394, 15458, 15523, 15616, 15616, 15616, 15618, 15682, 15746, 15808, 15808, 15809, 15842,
+    15906, 15970, 16034, 16096, 16096, 16096, 16096, 16096, 16096, 16096, 16098, 16160, 16160, 16160, 16160, 16160,
+    16160, 16160, 16162, 16226, 16289, 16320, 16320, 16320, 16320, 16320, 16322, 16386, 16450, 16514, 16578, 16642,
+    16704, 16704, 16704, 16704, 16704, 16705, 16737, 16769, 16801, 16832, 16832, 16832, 16832, 16832, 16832, 16832,
+    16832, 16832, 16832, 16832, 16834, 16898, 16962, 17026, 17090, 17154, 17216, 17218, 17280, 17280, 17280, 17280,
+    17281, 17312, 17312, 17312, 17312, 17312, 17312, 17312, 17312, 17312, 17312, 17312, 17312, 17312, 17312, 17312,
+    17312, 17312, 17312, 17312, 17312, 17312, 17312, 17312, 17312, 17312, 17312, 17312, 17312, 17312, 17312, 17312,
+    17312, 17312, 17312, 17312, 17312, 17312, 17312, 17312, 17312, 17312, 17312, 17312, 17312, 17312, 17312, 17312,
+    17312, 17312, 17312, 17312, 17312, 17312, 17312, 17314, 17378, 17442, 17506, 17570, 17634, 17696, 17698, 17762,
+    17826, 17890, 17954, 18016, 18016, 18016, 18016, 18016, 18016, 18016, 18016, 18016, 18016, 18016, 18016, 18016,
+    18016, 18016, 18016, 18016, 18016, 18016, 18016, 18016, 18016, 18016, 18016, 18016, 18016, 18016, 18016, 18016,
+    18016, 18016, 18016, 18016, 18016, 18016, 18016, 18016, 18016, 18016, 18016, 18016, 18016, 18016, 18017, 18049,
+    18081, 18113, 18145, 18177, 18209, 18241, 18273, 18305, 18337, 18369, 18401, 18433, 18465, 18497, 18529, 18561,
+    18593, 18625, 18657, 18689, 18721, 18753, 18785, 18817, 18849, 18881, 18913, 18945, 18977, 19009, 19041, 19073,
+    19105, 19137, 19169, 19201, 19233, 19265, 19297, 19329, 19361, 19393, 19425, 19457, 19489, 19521, 19553, 19585,
+    19617, 19649, 19681, 19713, 19745, 19777, 19809, 19841, 19873, 19905, 19937, 19969, 20001, 20033, 20065, 20097,
+    20129, 20161, 20193, 20225, 20257, 20289, 20321, 20353, 20385, 20417, 20449, 20481, 20513, 20545, 20577, 20609,
+    20641, 20673, 20705, 20737, 20769, 20801, 20833, 20865, 20897, 20929, 20961, 20993, 21025, 21057, 21089, 21121,
+    21152, 21152, 21152, 21152, 21152, 21152, 21152, 21152, 21152, 21152, 21152, 21152, 21152, 21152, 21152, 21152,
+    21152, 21152, 21152, 21152, 21152, 21152, 21152, 21152, 21152, 21152, 21152, 21152, 21152, 21152, 21152, 21152,
+    21152, 21152, 21152, 21152, 21152, 21152, 21152, 21152, 21152, 21152, 21152, 21152, 21152, 21152, 21152, 21152,
+    21152, 21152, 21152, 21152, 21152, 21152, 21152, 21152, 21152, 21152, 21152, 21152, 21152, 21152, 21152, 21152,
+    21153, 21185, 21217, 21249, 21281, 21313, 21345, 21377, 21409, 21441, 21473, 21505, 21537, 21569, 21601, 21633,
+    21665, 21697, 21729, 21761, 21793, 21825, 21857, 21889, 21921, 21953, 21985, 22017, 22049, 22081, 22113, 22145,
+    22177, 22209, 22241, 22273, 22305, 22337, 22369, 22401, 22433, 22465, 22497, 22529, 22561, 22593, 22625, 22657,
+    22689, 22721, 22753, 22785, 22817, 22849, 22881, 22913, 22945, 22977, 23009, 23041, 23073, 23105, 23137, 23169,
+    23201, 23233, 23265, 23297, 23329, 23361, 23393, 23425, 23457, 23489, 23521, 23553, 23585, 23617, 23649, 23681,
+    23713, 23745, 23777, 23809, 23841, 23873, 23905, 23937, 23969, 24001, 24033, 24065, 24097, 24129, 24161, 24193,
+    24225, 24257, 24289, 24321, 24353, 24385, 24417, 24449, 24481, 24513, 24545, 24577, 24609, 24641, 24673, 24705,
+    24737, 24769, 24801, 24833, 24865, 24897, 24929, 24961, 24993, 25025, 25057, 25089, 25121, 25153, 25185, 25217,
+    25249, 25281, 25313, 25345, 25377, 25409, 25441, 25473, 25505, 25537, 25569, 25601, 25633, 25665, 25697, 25729,
+    25761, 25793, 25825, 25857, 25889, 25921, 25953, 25985, 26017, 26049, 26082, 26145, 26177, 26209, 26241, 26273,
+    26305, 26337, 26369, 26401, 26433, 26465, 26497, 26529, 26561, 26593, 26625, 26657, 26689, 26721, 26753, 26785,
+    26817, 26849, 26881, 26913, 26945, 26977, 27009, 27041, 27073, 27105, 27137, 27169, 27201, 27233, 27265, 27297,
+    27329, 27361, 27393, 27425, 27457, 27489, 27521, 27553, 27585, 27617, 27649, 27681, 27713, 27745, 27777, 27809,
+    27841, 27873, 27905, 27937, 27969, 28001, 28033, 28065, 28097, 28129, 28161, 28193, 28225, 28257, 28289, 28321,
+    28353, 28385, 28417, 28449, 28481, 28513, 28545, 28577, 28609, 28641, 28673, 28705, 28737, 28769, 28801, 28833,
+    28865, 28897, 28929, 28961, 28993, 29025, 29057, 29089, 29121, 29153, 29185, 29217, 29249, 29281, 29313, 29345,
+    29377, 29409, 29441, 29473, 29505, 29537, 29569, 29601, 29633, 29665, 29697, 29729, 29761, 29793, 29825, 29857,
+    29889, 29921, 29953, 29985, 30017, 30049, 30081, 30113, 30145, 30177, 30209, 30241, 30273, 30305, 30337, 30369,
+    30401, 30433, 30465, 30497, 30529, 30561, 30593, 30625, 30657, 30689, 30721, 30753, 30785, 30817, 30849, 30881,
+    30913, 30945, 30977, 31009, 31041, 31073, 31105, 31137, 31169, 31201, 31233, 31265, 31297, 31329, 31361, 31393,
+    31425, 31457, 31489, 31521, 31553, 31585, 31617, 31649, 31681, 31713, 31745, 31777, 31809, 31841, 31873, 31905,
+    31937, 31969, 32001, 32033, 32065, 32097, 32129, 32161, 32193, 32225, 32257, 32289, 32321, 32353, 32385, 32417,
+    32449, 32481, 32513, 32545, 32577, 32609, 32641, 32673, 32705, 32737, 32769, 32801, 32833, 32865, 32897, 32929,
+    32961, 32993, 33025, 33057, 33089, 33121, 33153, 33185, 33217, 33249, 33281, 33313, 33345, 33377, 33409, 33441,
+    33473, 33505, 33537, 33569, 33601, 33633, 33665, 33697, 33729, 33761, 33793, 33825, 33857, 33889, 33921, 33953,
+    33985, 34017, 34049, 34081, 34113, 34145, 34177, 34209, 34241, 34273, 34305, 34337, 34369, 34401, 34433, 34465,
+    34497, 34529, 34561, 34593, 34625, 34657, 34689, 34721, 34753, 34785, 34817, 34849, 34881, 34913, 34945, 34977,
+    35009, 35041, 35073, 35105, 35137, 35169, 35201, 35233, 35265, 35297, 35329, 35361, 35393, 35425, 35457, 35489,
+    35521, 35553, 35585, 35617, 35649, 35681, 35713, 35745, 35777, 35809, 35841, 35873, 35905, 35937, 35969, 36001,
+    36033, 36065, 36097, 36129, 36161, 36193, 36225, 36257, 36289, 36321, 36353, 36385, 36417, 36449, 36481, 36513,
+    36545, 36577, 36609, 36641, 36673, 36705, 36737, 36769, 36801, 36833, 36865, 36897, 36929, 36962, 37027, 37121,
+    37154, 37219, 37314, 37379, 37474, 37537, 37570, 37634, 37698, 37764, 37889, 37921, 37953, 37985, 38017, 38049,
+    38081, 38113, 38145, 38177, 38209, 38241, 38273, 38305, 38337, 38369, 38401, 38433, 38465, 38497, 38529, 38561,
+    38593, 38625, 38657, 38689, 38721, 38753, 38785, 38817, 38849, 38881, 38913, 38945, 38977, 39009, 39041, 39073,
+    39105, 39137, 39169, 39201, 39233, 39266, 39328, 39328, 39328, 39328, 39328, 39328, 39328, 39328, 39328, 39328,
+    39328, 39328, 39328, 39328, 39328, 39328, 39328, 39328, 39328, 39328, 39328, 39328, 39328, 39328, 39328, 39328,
+    39331, 39427, 39521, 39554, 39619, 39715, 39809, 39842, 39905, 39937, 39969, 40001, 40033, 40065, 40097, 40129,
+    40161, 40193, 40225, 40258, 40321, 40353, 40385, 40417, 40449, 40482, 40547, 40642, 40705, 40737, 40769, 40801,
+    40833, 40865, 40897, 40929, 40961, 40993, 41025, 41057, 41089, 41121, 41153, 41185, 41217, 41251, 41345, 41377,
+    41409, 41441, 41473, 41505, 41537, 41569, 41601, 41633, 41667, 41763, 41860, 41987, 42083, 42179, 42275, 42371,
+    42467, 42563, 42659, 42755, 42851, 42947, 43043, 43138, 43201, 43234, 43299, 43394, 43457, 43490, 43555, 43652,
+    43778, 43841, 43874, 43939, 44033, 44065, 44097, 44129, 44161, 44194, 44259, 44354, 44417, 44450, 44515, 44612,
+    44738, 44801, 44834, 44899, 44993, 45025, 45057, 45089, 45123, 45217, 45249, 45281, 45313, 45345, 45377, 45409,
+    45441, 45473, 45505, 45537, 45570, 45635, 45730, 45795, 45889, 45921, 45953, 45985, 46017, 46049, 46081, 46113,
+    46145, 46177, 46209, 46241, 46273, 46305, 46337, 46369, 46401, 46433, 46465, 46497, 46529, 46561, 46593, 46625,
+    46657, 46689, 46721, 46753, 46785, 46817, 46849, 46881, 46913, 46945, 46977, 47009, 47041, 47073, 47105, 47137,
+    47169, 47201, 47233, 47265, 47298, 47362, 47426, 47490, 47554, 47618, 47682, 47746, 47810, 47874, 47938, 48003,
+    48099, 48195, 48291, 48387, 48483, 48579, 48675, 48771, 48868, 48996, 49124, 49252, 49380, 49508, 49636, 49764,
+    49892, 50020, 50148, 50274, 50338, 50402, 50466, 50530, 50594, 50658, 50722, 50786, 50851, 50947, 51043, 51139,
+    51235, 51331, 51427, 51523, 51619, 51715, 51811, 51907, 52003, 52099, 52195, 52291, 52387, 52483, 52579, 52675,
+    52771, 52867, 52963, 53059, 53155, 53251, 53347, 53443, 53539, 53635, 53731, 53827, 53923, 54019, 54115, 54211,
+    54307, 54401, 54433, 54465, 54497, 54529, 54561, 54593, 54625, 54657, 54689, 54721, 54753, 54785, 54817, 54849,
+    54881, 54913, 54945, 54977, 55009, 55041, 55073, 55105, 55137, 55169, 55201, 55233, 55265, 55297, 55329, 55361,
+    55393, 55425, 55457, 55489, 55521, 55553, 55585, 55617, 55649, 55681, 55713, 55745, 55777, 55809, 55841, 55873,
+    55905, 55937, 55969, 56001, 56033, 56065, 56100, 56227, 56322, 56387, 56481, 56513, 56545, 56576, 56576, 56576,
+    56577, 56608, 56608, 56608, 56608, 56608, 56608, 56608, 56608, 56608, 56608, 56608, 56608, 56608, 56608, 56608,
+    56608, 56608, 56608, 56608, 56608, 56608, 56608, 56608, 56608, 56608, 56608, 56608, 56608, 56608, 56608, 56608,
+    56608, 56608, 56609, 56641, 56673, 56705, 56737, 56769, 56801, 56833, 56865, 56897, 56929, 56961, 56993, 57025,
+    57057, 57089, 57121, 57153, 57185, 57217, 57249, 57281, 57313, 57345, 57377, 57409, 57441, 57473, 57505, 57537,
+    57569, 57601, 57633, 57665, 57697, 57729, 57761, 57793, 57825, 57857, 57889, 57921, 57953, 57985, 58017, 58049,
+    58081, 58113, 58145, 58177, 58209, 58241, 58273, 58305, 58337, 58369, 58401, 58433, 58465, 58497, 58529, 58561,
+    58593, 58625, 58657, 58689, 58721, 58753, 58785, 58817, 58849, 58881, 58913, 58945, 58977, 59009, 59041, 59073,
+    59105, 59137, 59169, 59201, 59233, 59265, 59297, 59329, 59361, 59393, 59425, 59457, 59489, 59521, 59553, 59585,
+    59617, 59649, 59681, 59713, 59745, 59777, 59809, 59841, 59873, 59905, 59937, 59969, 60001, 60033, 60065, 60097,
+    60129, 60161, 60193, 60225, 60257, 60289, 60321, 60353, 60385, 60417, 60449, 60481, 60513, 60545, 60577, 60609,
+    60641, 60673, 60705, 60737, 60769, 60801, 60833, 60865, 60897, 60929, 60961, 60993, 61025, 61057, 61089, 61121,
+    61153, 61185, 61217, 61249, 61281, 61313, 61345, 61377, 61409, 61441, 61473, 61505, 61537, 61569, 61601, 61633,
+    61665, 61697, 61729, 61761, 61793, 61825, 61857, 61889, 61921, 61953, 61985, 62017, 62049, 62081, 62113, 62145,
+    62177, 62209, 62241, 62273, 62305, 62337, 62369, 62401, 62433, 62465, 62497, 62529, 62561, 62593, 62625, 62657,
+    62689, 62721, 62753, 62785, 62817, 62849, 62881, 62913, 62945, 62977, 63009, 63041, 63073, 63105, 63137, 63169,
+    63201, 63233, 63265, 63297, 63329, 63361, 63393, 63425, 63457, 63489, 63521, 63552, 63552, 63552, 63552, 63552,
+    63552, 63553, 63585, 63617, 63649, 63681, 63713, 63745, 63777, 63809, 63841, 63873, 63905, 63937, 63969, 64001,
+    64033, 64065, 64097, 64129, 64161, 64193, 64225, 64257, 64289, 64321, 64353, 64385, 64417, 64449, 64481, 64512,
+    64512, 64513, 64545, 64577, 64610, 64673, 64705, 64737, 64769, 64801, 64833, 64865, 64897, 64929, 64961, 64993,
+    65025, 65057, 65089, 65121, 65153, 65185, 65217, 65249, 65281, 65313, 65345, 65377, 65409, 65441, 65473, 65505,
+    65537, 65569, 65601, 65633, 65666, 65729, 65761, 65793, 65825, 65857, 65889, 65921, 65953, 65985, 66017, 66049,
+    66081, 66113, 66145, 66177, 66209, 66241, 66273, 66305, 66337, 66369, 66401, 66433, 66465, 66497, 66529, 66561,
+    66593, 66625, 66657, 66689, 66721, 66753, 66785, 66817, 66849, 66881, 66913, 66945, 66977, 67009, 67041, 67073,
+    67105, 67137, 67169, 67201, 67233, 67265, 67297, 67329, 67361, 67393, 67425, 67457, 67489, 67521, 67553, 67585,
+    67617, 67649, 67681, 67713, 67745, 67777, 67809, 67841, 67873, 67905, 67937, 67969, 68001, 68033, 68065, 68097,
+    68129, 68161, 68193, 68225, 68257, 68289, 68321, 68353, 68385, 68417, 68449, 68481, 68513, 68545, 68577, 68609,
+    68641, 68673, 68705, 68737, 68769, 68801, 68833, 68865, 68897, 68929, 68961, 68993, 69025, 69057, 69089, 69121,
+    69153, 69187, 69283, 69379, 69475, 69571, 69667, 69763, 69859, 69955, 70051, 70147, 70243, 70339, 70435, 70532,
+    70660, 70788, 70916, 71044, 71172, 71300, 71428, 71556, 71684, 71812, 71940, 72068, 72196, 72324, 72455, 72678,
+    72867, 72963, 73059, 73155, 73251, 73347, 73443, 73539, 73635, 73731, 73827, 73923, 74019, 74115, 74211, 74307,
+    74403, 74499, 74595, 74691, 74787, 74883, 74979, 75075, 75171, 75267, 75363, 75459, 75555, 75651, 75747, 75843,
+    75939, 76035, 76131, 76227, 76321, 76353, 76385, 76417, 76451, 76546, 76610, 76674, 76738, 76802, 76866, 76930,
+    76994, 77058, 77122, 77186, 77250, 77314, 77378, 77442, 77505, 77537, 77569, 77601, 77633, 77665, 77697, 77729,
+    77761, 77793, 77825, 77857, 77889, 77921, 77954, 78018, 78082, 78146, 78210, 78274, 78338, 78402, 78466, 78530,
+    78594, 78658, 78722, 78786, 78853, 79012, 79138, 79201, 79233, 79265, 79297, 79329, 79361, 79393, 79425, 79457,
+    79489, 79521, 79553, 79585, 79617, 79649, 79681, 79713, 79745, 79777, 79809, 79841, 79873, 79905, 79937, 79969,
+    80001, 80033, 80065, 80097, 80129, 80161, 80193, 80225, 80257, 80289, 80321, 80353, 80385, 80417, 80449, 80481,
+    80513, 80545, 80577, 80609, 80641, 80673, 80705, 80737, 80770, 80834, 80898, 80962, 81026, 81090, 81154, 81218,
+    81282, 81346, 81410, 81474, 81538, 81602, 81666, 81730, 81794, 81858, 81922, 81986, 82050, 82114, 82178, 82242,
+    82307, 82403, 82499, 82594, 82659, 82754, 82819, 82913, 82945, 82977, 83009, 83041, 83073, 83105, 83137, 83169,
+    83201, 83233, 83265, 83297, 83329, 83361, 83393, 83425, 83457, 83489, 83521, 83553, 83585, 83617, 83649, 83681,
+    83713, 83745, 83777, 83809, 83841, 83873, 83905, 83937, 83969, 84001, 84033, 84065, 84097, 84129, 84161, 84193,
+    84225, 84257, 84289, 84321, 84353, 84385, 84418, 84484, 84612, 84740, 84867, 84964, 85091, 85187, 85285, 85444,
+    85571, 85667, 85763, 85860, 85988, 86115, 86211, 86306, 86371, 86468, 86596, 86722, 86789, 86950, 87141, 87299,
+    87397, 87557, 87716, 87843, 87939, 88035, 88132, 88261, 88420, 88547, 88643, 88739, 88834, 88898, 88962, 89026,
+    89091, 89187, 89285, 89443, 89540, 89669, 89827, 89922, 89986, 90053, 90212, 90341, 90499, 90597, 90754, 90819,
+    90915, 91011, 91107, 91203, 91300, 91427, 91522, 91587, 91683, 91779, 91876, 92003, 92099, 92195, 92293, 92452,
+    92578, 92645, 92802, 92868, 92996, 93123, 93219, 93315, 93412, 93538, 93603, 93700, 93826, 93893, 94051, 94146,
+    94210, 94274, 94338, 94402, 94466, 94530, 94594, 94658, 94722, 94787, 94883, 94979, 95075, 95171, 95267, 95363,
+    95459, 95555, 95651, 95747, 95843, 95939, 96035, 96131, 96227, 96322, 96386, 96451, 96546, 96610, 96674, 96739,
+    96835, 96930, 96994, 97058, 97122, 97186, 97252, 97378, 97442, 97506, 97570, 97634, 97698, 97762, 97826, 97891,
+    97988, 98114, 98178, 98242, 98306, 98370, 98434, 98498, 98563, 98659, 98755, 98851, 98946, 99010, 99074, 99138,
+    99202, 99266, 99330, 99394, 99458, 99522, 99587, 99683, 99778, 99843, 99939, 100035, 100130, 100195, 100291, 100388,
+    100514, 100579, 100675, 100771, 100867, 100965, 101126, 101314, 101378, 101442, 101506, 101570, 101634, 101698,
+    101762, 101826, 101890, 101954, 102018, 102082, 102146, 102210, 102274, 102338, 102402, 102468, 102594, 102658,
+    102722, 102788, 102915, 103010, 103074, 103138, 103202, 103266, 103330, 103394, 103458, 103522, 103586, 103651,
+    103746, 103810, 103875, 103971, 104066, 104132, 104259, 104354, 104418, 104482, 104546, 104611, 104707, 104802,
+    104866, 104930, 104994, 105058, 105122, 105186, 105250, 105314, 105379, 105475, 105571, 105667, 105763, 105859,
+    105955, 106051, 106147, 106243, 106339, 106435, 106531, 106627, 106723, 106819, 106915, 107011, 107107, 107203,
+    107299, 107395, 107491, 107584, 107584, 107584, 107584, 107584, 107584, 107584, 107584, 107584, 107584, 107584,
+    107585, 107617, 107648, 107648, 107648, 107648, 107649, 107681, 107713, 107745, 107777, 107809, 107840, 107840,
+    107840, 107840, 107840, 107840, 107840, 107840, 107840, 107840, 107840, 107840, 107840, 107840, 107840, 107840,
+    107840, 107840, 107840, 107840, 107840, 107840, 107840, 107840, 107840, 107840, 107840, 107840, 107840, 107840,
+    107840, 107840, 107840, 107840, 107840, 107840, 107840, 107841, 107873, 107905, 107937, 107969, 108000, 108001,
+    108033, 108065, 108097, 108129, 108161, 108193, 108225, 108257, 108289, 108321, 108353, 108385, 108417, 108449,
+    108481, 108513, 108545, 108577, 108609, 108641, 108673, 108705, 108737, 108769, 108801, 108833, 108865, 108897,
+    108929, 108961, 108993, 109025, 109057, 109089, 109121, 109153, 109185, 109217, 109249, 109281, 109313, 109345,
+    109377, 109409, 109441, 109473, 109505, 109537, 109569, 109601, 109633, 109665, 109697, 109729, 109761, 109793,
+    109825, 109857, 109889, 109921, 109953, 109985, 110017, 110049, 110081, 110113, 110145, 110177, 110209, 110241,
+    110273, 110305, 110337, 110369, 110401, 110433, 110465, 110497, 110529, 110561, 110593, 110625, 110657, 110689,
+    110721, 110753, 110785, 110817, 110849, 110881, 110913, 110945, 110977, 111009, 111041, 111073, 111105, 111137,
+    111169, 111201, 111233, 111265, 111297, 111329, 111361, 111393, 111425, 111457, 111489, 111521, 111553, 111585,
+    111617, 111649, 111681, 111713, 111745, 111777, 111809, 111841, 111873, 111905, 111937, 111969, 112001, 112033,
+    112065, 112097, 112129, 112161, 112193, 112225, 112257, 112289, 112321, 112353, 112385, 112417, 112449, 112481,
+    112513, 112545, 112577, 112609, 112641, 112673, 112705, 112737, 112769, 112801, 112833, 112865, 112897, 112929,
+    112961, 112993, 113025, 113057, 113089, 113121, 113153, 113185, 113217, 113249, 113281, 113313, 113345, 113377,
+    113409, 113441, 113473, 113505, 113537, 113569, 113601, 113633, 113665, 113697, 113729, 113761, 113793, 113825,
+    113857, 113889, 113921, 113953, 113985, 114017, 114049, 114081, 114113, 114145, 114177, 114209, 114241, 114273,
+    114305, 114337, 114369, 114401, 114433, 114465, 114497, 114529, 114561, 114593, 114625, 114657, 114689, 114721,
+    114753, 114785, 114817, 114849, 114881, 114913, 114945, 114977, 115009, 115041, 115073, 115105, 115137, 115169,
+    115201, 115233, 115265, 115297, 115329, 115361, 115393, 115425, 115457, 115489, 115521, 115553, 115585, 115617,
+    115649, 115681, 115713, 115745, 115777, 115809, 115841, 115873, 115905, 115937, 115969, 116001, 116033, 116065,
+    116097, 116129, 116161, 116193, 116225, 116257, 116289, 116321, 116353, 116385, 116417, 116449, 116481, 116513,
+    116545, 116577, 116609, 116641, 116673, 116705, 116737, 116769, 116801, 116833, 116865, 116897, 116929, 116961,
+    116993, 117025, 117057, 117089, 117121, 117153, 117185, 117217, 117249, 117281, 117313, 117345, 117377, 117409,
+    117441, 117473, 117505, 117537, 117569, 117601, 117633, 117665, 117697, 117729, 117761, 117793, 117825, 117857,
+    117889, 117921, 117953, 117985, 118017, 118049, 118081, 118113, 118145, 118177, 118209, 118241, 118273, 118305,
+    118337, 118369, 118401, 118433, 118465, 118497, 118529, 118561, 118593, 118625, 118657, 118689, 118721, 118753,
+    118785, 118817, 118849, 118881, 118913, 118945, 118977, 119009, 119041, 119073, 119105, 119137, 119169, 119201,
+    119233, 119265, 119297, 119329, 119361, 119393, 119425, 119457, 119489, 119521, 119553, 119585, 119617, 119649,
+    119681, 119713, 119745, 119777, 119809, 119841, 119873, 119905, 119937, 119969, 120001, 120033, 120065, 120097,
+    120129, 120161, 120193, 120225, 120257, 120289, 120321, 120353, 120385, 120417, 120449, 120481, 120513, 120545,
+    120577, 120609, 120641, 120673, 120705, 120737, 120769, 120801, 120833, 120865, 120897, 120929, 120961, 120993,
+    121025, 121057, 121089, 121121, 121153, 121185, 121217, 121249, 121281, 121313, 121345, 121377, 121409, 121441,
+    121473, 121505, 121537, 121569, 121601, 121633, 121665, 121697, 121729, 121761, 121793, 121825, 121857, 121889,
+    121921, 121953, 121985, 122017, 122049, 122081, 122113, 122145, 122177, 122209, 122241, 122273, 122305, 122337,
+    122369, 122401, 122433, 122465, 122497, 122529, 122561, 122593, 122625, 122657, 122689, 122722, 122786, 122850,
+    122915, 123011, 123106, 123170, 123234, 123298, 123362, 123426, 123490, 123553, 123584, 123585, 123617, 123649,
+    123681, 123713, 123745, 123777, 123809, 123841, 123873, 123905, 123937, 123969, 124001, 124033, 124065, 124097,
+    124129, 124161, 124193, 124225, 124257, 124289, 124321, 124353, 124385, 124417, 124449, 124481, 124513, 124545,
+    124577, 124609, 124641, 124673, 124705, 124737, 124769, 124801, 124833, 124865, 124897, 124929, 124962, 125025,
+    125057, 125089, 125121, 125153, 125185, 125217, 125249, 125281, 125313, 125345, 125377, 125409, 125441, 125473,
+    125505, 125537, 125569, 125601, 125633, 125665, 125697, 125729, 125761, 125793, 125825, 125857, 125889, 125921,
+    125953, 125985, 126017, 126049, 126081, 126113, 126145, 126177, 126209, 126241, 126273, 126305, 126337, 126369,
+    126401, 126433, 126465, 126497, 126529, 126561, 126593, 126625, 126657, 126689, 126721, 126753, 126785, 126817,
+    126849, 126881, 126913, 126945, 126977, 127009, 127041, 127073, 127105, 127137, 127169, 127201, 127233, 127265,
+    127297, 127329, 127361, 127393, 127425, 127457, 127489, 127521, 127553, 127585, 127617, 127649, 127681, 127713,
+    127745, 127777, 127809, 127841, 127873, 127905, 127937, 127969, 128001, 128033, 128065, 128097, 128129, 128161,
+    128193, 128225, 128257, 128289, 128321, 128353, 128385, 128417, 128449, 128482, 128545, 128577, 128609, 128641,
+    128673, 128705, 128737, 128769, 128801, 128833, 128865, 128897, 128930, 128994, 129058, 129122, 129186, 129250,
+    129314, 129378, 129442, 129506, 129570, 129634, 129698, 129762, 129826, 129890, 129954, 130018, 130081, 130113,
+    130145, 130177, 130210, 130274, 130338, 130402, 130466, 130530, 130594, 130658, 130722, 130786, 130850, 130914,
+    130978, 131042, 131106, 131170, 131234, 131298, 131362, 131426, 131490, 131554, 131618, 131682, 131746, 131810,
+    131874, 131938, 132002, 132066, 132130, 132194, 132258, 132322, 132386, 132450, 132514, 132578, 132642, 132706,
+    132770, 132834, 132898, 132962, 133026, 133090, 133154, 133218, 133282, 133346, 133410, 133474, 133538, 133602,
+    133666, 133730, 133794, 133858, 133922, 133986, 134050, 134114, 134178, 134242, 134306, 134370, 134434, 134498,
+    134562, 134626, 134690, 134754, 134818, 134882, 134946, 135010, 135074, 135138, 135202, 135266, 135330, 135394,
+    135458, 135522, 135586, 135650, 135714, 135778, 135842, 135906, 135970, 136033, 136065, 136097, 136129, 136161,
+    136193, 136225, 136257, 136289, 136322, 136386, 136450, 136514, 136578, 136642, 136706, 136770, 136834, 136898,
+    136962, 137026, 137090, 137154, 137218, 137282, 137346, 137410, 137474, 137538, 137602, 137666, 137730, 137794,
+    137858, 137922, 137986, 138050, 138114, 138178, 138242, 138306, 138370, 138434, 138498, 138562, 138626, 138690,
+    138754, 138818, 138882, 138946, 139010, 139074, 139137, 139170, 139234, 139298, 139362, 139426, 139490, 139554,
+    139618, 139682, 139746, 139810, 139874, 139938, 140002, 140066, 140130, 140194, 140258, 140322, 140386, 140450,
+    140514, 140578, 140642, 140706, 140770, 140834, 140898, 140962, 141026, 141090, 141154, 141218, 141282, 141346,
+    141410, 141474, 141538, 141602, 141666, 141730, 141794, 141858, 141922, 141986, 142050, 142114, 142178, 142242,
+    142306, 142370, 142434, 142498, 142562, 142626, 142690, 142754, 142818, 142882, 142946, 143010, 143074, 143138,
+    143202, 143266, 143330, 143394, 143458, 143522, 143586, 143650, 143714, 143777, 143810, 143874, 143938, 144002,
+    144066, 144130, 144194, 144258, 144322, 144386, 144450, 144514, 144578, 144642, 144706, 144770, 144834, 144898,
+    144962, 145026, 145090, 145154, 145218, 145282, 145345, 145377, 145409, 145442, 145506, 145570, 145634, 145698,
+    145762, 145826, 145890, 145954, 146018, 146082, 146146, 146210, 146274, 146338, 146402, 146466, 146530, 146594,
+    146658, 146722, 146786, 146850, 146914, 146978, 147042, 147106, 147170, 147234, 147298, 147362, 147426, 147490,
+    147554, 147618, 147682, 147746, 147810, 147874, 147938, 148002, 148066, 148130, 148194, 148258, 148322, 148386,
+    148450, 148514, 148578, 148642, 148706, 148770, 148834, 148898, 148962, 149026, 149090, 149154, 149218, 149282,
+    149346, 149410, 149474, 149538, 149602, 149666, 149730, 149794, 149858, 149922, 149985, 150017, 150051, 150147,
+    150243, 150339, 150435, 150531, 150627, 150723, 150819, 150915, 151011, 151107, 151203, 151299, 151395, 151491,
+    151587, 151683, 151779, 151875, 151971, 152067, 152163, 152259, 152355, 152451, 152547, 152643, 152739, 152835,
+    152931, 153027, 153123, 153219, 153315, 153411, 153507, 153603, 153699, 153795, 153891, 153987, 154083, 154179,
+    154275, 154371, 154467, 154563, 154659, 154755, 154851, 154947, 155043, 155139, 155235, 155331, 155427, 155523,
+    155619, 155715, 155811, 155907, 156003, 156099, 156195, 156291, 156387, 156483, 156579, 156675, 156771, 156867,
+    156963, 157059, 157155, 157251, 157347, 157443, 157539, 157635, 157731, 157827, 157923, 158019, 158115, 158211,
+    158307, 158403, 158499, 158595, 158691, 158787, 158883, 158979, 159075, 159171, 159267, 159363, 159459, 159555,
+    159651, 159747, 159843, 159939, 160035, 160131, 160227, 160323, 160419, 160515, 160611, 160707, 160803, 160899,
+    160995, 161091, 161187, 161283, 161379, 161475, 161572, 161700, 161828, 161956, 162084, 162212, 162340, 162467,
+    162578, 163144, 163396, 163521, 163553, 163585, 163617, 163649, 163681, 163713, 163745, 163777, 163811, 163904,
+    163904, 163904, 163904, 163904, 163904, 163904, 163904, 163904, 163904, 163904, 163904, 163904, 163904, 163904,
+    163904, 163906, 163969, 164001, 164033, 164065, 164097, 164129, 164161, 164193, 164225, 164257, 164289, 164321,
+    164353, 164385, 164417, 164449, 164481, 164513, 164545, 164577, 164609, 164641, 164673, 164705, 164737, 164769,
+    164801, 164833, 164865, 164897, 164929, 164961, 164993, 165025, 165057, 165089, 165121, 165153, 165185, 165217,
+    165249, 165281, 165313, 165345, 165377, 165409, 165441, 165473, 165505, 165537, 165569, 165601, 165633, 165665,
+    165697, 165729, 165761, 165793, 165825, 165857, 165889, 165921, 165953, 165985, 166017, 166049, 166081, 166113,
+    166145, 166177, 166209, 166241, 166273, 166305, 166337, 166369, 166401, 166433, 166465, 166497, 166529, 166561,
+    166593, 166625, 166657, 166689, 166721, 166753, 166785, 166817, 166849, 166881, 166913, 166945, 166977, 167009,
+    167041, 167073, 167105, 167137, 167169, 167201, 167233, 167265, 167297, 167329, 167361, 167393, 167425, 167457,
+    167489, 167521, 167553, 167585, 167617, 167649, 167681, 167713, 167745, 167777, 167809, 167841, 167873, 167905,
+    167937, 167969, 168001, 168033, 168065, 168097, 168129, 168161, 168193, 168225, 168257, 168289, 168321, 168353,
+    168385, 168417, 168449, 168481, 168513, 168545, 168577, 168609, 168641, 168673, 168705, 168737, 168769, 168801,
+    168833, 168865, 168897, 168929, 168961, 168993, 169025, 169057, 169089, 169121, 169153, 169185, 169217, 169249,
+    169281, 169313, 169345, 169377, 169409, 169441, 169473, 169505, 169537, 169569, 169601, 169633, 169665, 169697,
+    169729, 169761, 169793, 169825, 169857, 169889, 169922, 169986, 170050, 170114, 170178, 170242, 170306, 170370,
+    170433, 170465, 170497, 170529, 170561, 170593, 170625, 170657, 170689, 170721, 170753, 170785, 170817, 170849,
+    170881, 170913, 170945, 170977, 171009, 171041, 171073, 171105, 171137, 171169, 171201, 171233, 171265, 171297,
+    171329, 171361, 171393, 171425, 171457, 171489, 171521, 171553, 171585, 171617, 171649, 171681, 171713, 171745,
+    171777, 171809, 171841, 171873, 171905, 171937, 171969, 172001, 172033, 172065, 172097, 172129, 172161, 172193,
+    172225, 172257, 172289, 172321, 172353, 172385, 172417, 172449, 172481, 172513, 172545, 172577, 172609, 172641,
+    172673, 172705, 172737, 172769, 172801, 172833, 172865, 172897, 172929, 172961, 172993, 173025, 173057, 173089,
+    173121, 173153, 173185, 173217, 173249, 173281, 173313, 173345, 173377, 173409, 173441, 173473, 173505, 173537,
+    173569, 173601, 173633, 173665, 173697, 173729, 173761, 173793, 173825, 173857, 173889, 173921, 173953, 173985,
+    174017, 174049, 174081, 174113, 174145, 174177, 174209, 174241, 174273, 174305, 174337, 174369, 174401, 174433,
+    174465, 174497, 174529, 174561, 174593, 174625, 174657, 174689, 174721, 174753, 174785, 174817, 174849, 174881,
+    174913, 174945, 174977, 175009, 175041, 175073, 175105, 175137, 175169, 175201, 175233, 175265, 175297, 175329,
+    175361, 175393, 175425, 175456, 175456, 175457, 175489, 175521, 175553, 175585, 175617, 175649, 175681, 175713,
+    175745, 175777, 175809, 175841, 175873, 175905, 175937, 175969, 176001, 176033, 176065, 176097, 176129, 176161,
+    176193, 176225, 176257, 176289, 176321, 176353, 176385, 176417, 176449, 176481, 176513, 176545, 176577, 176609,
+    176641, 176673, 176705, 176737, 176769, 176801, 176833, 176865, 176897, 176929, 176961, 176993, 177025, 177057,
+    177089, 177121, 177153, 177185, 177217, 177249, 177281, 177313, 177345, 177377, 177409, 177441, 177473, 177505,
+    177537, 177568, 177568, 177568, 177568, 177568, 177568, 177568, 177569, 177601, 177633, 177665, 177697, 177729,
+    177761, 177793, 177825, 177857, 177889, 177921, 177953, 177985, 178017, 178049, 178081, 178113, 178145, 178177,
+    178209, 178241, 178273, 178305, 178337, 178369, 178401, 178433, 178465, 178497, 178529, 178561, 178593, 178625,
+    178657, 178689, 178721, 178753, 178785, 178817, 178849, 178881, 178913, 178945, 178977, 179009, 179041, 179073,
+    179105, 179137, 179169, 179201, 179233, 179265, 179297, 179329, 179360, 179360, 179360, 179360, 179360, 179360,
+    179360, 179360, 179360, 179360, 179360, 179360, 179360, 179360, 179360, 179360, 179360, 179360, 179360, 179360,
+    179360, 179360, 179360, 179360, 179360, 179360, 179360, 179360, 179360, 179360, 179360, 179360, 179361, 179393,
+    179425, 179456, 179456, 179456, 179456, 179456, 179458, 179522, 179584, 179584, 179584, 179584, 179584, 179584,
+    179584, 179584, 179584, 179584, 179584, 179586, 179650, 179712, 179712, 179712, 179712, 179712, 179712, 179712,
+    179712, 179712, 179712, 179712, 179712, 179712, 179712, 179712, 179712, 179714, 179778, 179842, 179904, 179904,
+    179906, 179970, 180032, 180032, 180032, 180032, 180032, 180032, 180032, 180032, 180034, 180096, 180096, 180096,
+    180096, 180096, 180096, 180096, 180096, 180096, 180096, 180096, 180096, 180096, 180096, 180096, 180096, 180096,
+    180096, 180096, 180096, 180096, 180096, 180096, 180096, 180096, 180096, 180096, 180097, 180129, 180161, 180193,
+    180225, 180257, 180289, 180320, 180320, 180320, 180320, 180320, 180320, 180320, 180320, 180320, 180320, 180320,
+    180320, 180320, 180320, 180320, 180320, 180320, 180320, 180320, 180320, 180320, 180320, 180320, 180320, 180320,
+    180320, 180320, 180320, 180320, 180320, 180321, 180353, 180385, 180417, 180449, 180481, 180512, 180512, 180512,
+    180513, 180545, 180577, 180609, 180641, 180673, 180705, 180737, 180769, 180801, 180833, 180865, 180897, 180929,
+    180961, 180993, 181025, 181057, 181089, 181121, 181153, 181185, 181217, 181249, 181281, 181313, 181345, 181377,
+    181409, 181441, 181473, 181505, 181537, 181569, 181601, 181633, 181665, 181697, 181729, 181761, 181793, 181825,
+    181857, 181889, 181921, 181953, 181985, 182017, 182049, 182081, 182113, 182145, 182177, 182209, 182241, 182273,
+    182305, 182337, 182369, 182401, 182433, 182465, 182497, 182529, 182561, 182593, 182625, 182657, 182689, 182721,
+    182753, 182785, 182817, 182849, 182881, 182913, 182945, 182977, 183009, 183041, 183073, 183105, 183137, 183169,
+    183201, 183233, 183265, 183297, 183329, 183361, 183393, 183425, 183457, 183489, 183521, 183553, 183585, 183617,
+    183649, 183681, 183713, 183745, 183777, 183809, 183841, 183873, 183905, 183937, 183969, 184001, 184033, 184065,
+    184097, 184129, 184161, 184193, 184225, 184257, 184289, 184321, 184353, 184385, 184417, 184449, 184481, 184513,
+    184545, 184577, 184609, 184641, 184673, 184705, 184737, 184769, 184801, 184833, 184865, 184897, 184929, 184961,
+    184993, 185025, 185057, 185089, 185121, 185153, 185185, 185217, 185249, 185281, 185313, 185345, 185377, 185409,
+    185441, 185473, 185505, 185537, 185569, 185601, 185633, 185665, 185697, 185729, 185761, 185793, 185825, 185857,
+    185889, 185921, 185953, 185985, 186017, 186049, 186081, 186113, 186145, 186177, 186209, 186241, 186273, 186305,
+    186337, 186369, 186401, 186433, 186465, 186497, 186529, 186561, 186593, 186625, 186657, 186689, 186721, 186753,
+    186785, 186817, 186849, 186881, 186913, 186945, 186977, 187009, 187041, 187073, 187105, 187137, 187169, 187201,
+    187233, 187265, 187297, 187329, 187361, 187393, 187425, 187457, 187489, 187521, 187553, 187585, 187617, 187649,
+    187681, 187713, 187745, 187777, 187809, 187841, 187873, 187905, 187937, 187969, 188001, 188033, 188065, 188097,
+    188129, 188161, 188193, 188225, 188257, 188289, 188321, 188353, 188385, 188417, 188449, 188481, 188513, 188545,
+    188577, 188609, 188641, 188673, 188705, 188737, 188769, 188801, 188833, 188865, 188897, 188929, 188961, 188993,
+    189025, 189057, 189089, 189121, 189153, 189185, 189217, 189249, 189281, 189313, 189345, 189377, 189409, 189441,
+    189473, 189505, 189537, 189569, 189601, 189633, 189665, 189697, 189729, 189761, 189793, 189825, 189857, 189889,
+    189921, 189953, 189985, 190017, 190049, 190081, 190113, 190145, 190177, 190209, 190241, 190273, 190305, 190337,
+    190369, 190401, 190433, 190465, 190497, 190529, 190561, 190593, 190625, 190657, 190689, 190721, 190753, 190785,
+    190817, 190849, 190881, 190913, 190945, 190977, 191009, 191041, 191073, 191105, 191137, 191169, 191201, 191233,
+    191265, 191297, 191329, 191361, 191393, 191425, 191457, 191489, 191521, 191553, 191585, 191617, 191649, 191681,
+    191713, 191745, 191777, 191809, 191841, 191873, 191905, 191937, 191969, 192001, 192033, 192065, 192097, 192129,
+    192161, 192193, 192225, 192257, 192289, 192321, 192353, 192385, 192417, 192449, 192481, 192513, 192545, 192577,
+    192609, 192641, 192673, 192705, 192737, 192769, 192801, 192833, 192865, 192897, 192929, 192961, 192993, 193025,
+    193057, 193089, 193121, 193153, 193185, 193217, 193249, 193281, 193313, 193345, 193377, 193409, 193441, 193473,
+    193505, 193537, 193569, 193601, 193633, 193665, 193697, 193729, 193761, 193793, 193825, 193857, 193889, 193921,
+    193953, 193985, 194017, 194049, 194081, 194113, 194145, 194177, 194209, 194241, 194273, 194305, 194337, 194369,
+    194401, 194433, 194465, 194497, 194529, 194561, 194593, 194625, 194657, 194689, 194721, 194753, 194785, 194817,
+    194849, 194881, 194913, 194945, 194977, 195009, 195041, 195073, 195105, 195137, 195169, 195201, 195233, 195265,
+    195297, 195329, 195361, 195393, 195425, 195457, 195489, 195521, 195553, 195585, 195617, 195649, 195681, 195713,
+    195745, 195777, 195809, 195841, 195873, 195905, 195937, 195969, 196001, 196033, 196065, 196097, 196129, 196161,
+    196193, 196225, 196257, 196289, 196321, 196353, 196385, 196417, 196449, 196481, 196513, 196545, 196577, 196609,
+    196641, 196673, 196705, 196737, 196769, 196801, 196833, 196865, 196897, 196929, 196961, 196993, 197025, 197057,
+    197089, 197121, 197153, 197185, 197217, 197249, 197281, 197313, 197345, 197377, 197409, 197441, 197473, 197505,
+    197537, 197569, 197601, 197633, 197665, 197697, 197729, 197761, 197793, 197825, 197857, 197889, 197921, 197953,
+    197985, 198017, 198049, 198081, 198113, 198145, 198177, 198209, 198241, 198273, 198305, 198337, 198369, 198401,
+    198433, 198465, 198497, 198529, 198561, 198593, 198625, 198657, 198689, 198721, 198753, 198785, 198817, 198849,
+    198881, 198913, 198945, 198977, 199009, 199041, 199073, 199105, 199137, 199169, 199201, 199233, 199265, 199297,
+    199329, 199361, 199393, 199425, 199457, 199489, 199521, 199553, 199585, 199617, 199649, 199681, 199713, 199745,
+    199777, 199809, 199841, 199873, 199905, 199937, 199969, 200001, 200033, 200065, 200097, 200129, 200161, 200193,
+    200225, 200257, 200289, 200321, 200353, 200385, 200417, 200449, 200481, 200513, 200545, 200577, 200609, 200641,
+    200673, 200705, 200737, 200769, 200801, 200833, 200865, 200897, 200929, 200961, 200993, 201025, 201057, 201089,
+    201121, 201153, 201185, 201217, 201249, 201281, 201313, 201345, 201377, 201409, 201441, 201473, 201505, 201537,
+    201569, 201601, 201633, 201665, 201697, 201729, 201761, 201793, 201825, 201857, 201889, 201921, 201953, 201985,
+    202017, 202049, 202081, 202113, 202145, 202177, 202209, 202241, 202273, 202305, 202337, 202369, 202401, 202433,
+    202465, 202497, 202529, 202561, 202593, 202625, 202657, 202689, 202721, 202753, 202785, 202817, 202849, 202881,
+    202913, 202945, 202977, 203009, 203041, 203073, 203105, 203137, 203169, 203201, 203233, 203265, 203297, 203329,
+    203361, 203393, 203425, 203457, 203489, 203521, 203553, 203585, 203617, 203649, 203681, 203713, 203745, 203777,
+    203809, 203841, 203873, 203905, 203937, 203969, 204001, 204033, 204065, 204097, 204129, 204161, 204193, 204225,
+    204257, 204289, 204321, 204353, 204385, 204417, 204449, 204481, 204513, 204545, 204577, 204609, 204641, 204673,
+    204705, 204737, 204769, 204801, 204833, 204865, 204897, 204929, 204961, 204993, 205025, 205057, 205089, 205121,
+    205153, 205185, 205217, 205249, 205281, 205313, 205345, 205377, 205409, 205441, 205473, 205505, 205537, 205569,
+    205601, 205633, 205665, 205697, 205729, 205761, 205793, 205825, 205857, 205889, 205921, 205953, 205985, 206017,
+    206049, 206081, 206113, 206145, 206177, 206209, 206241, 206273, 206305, 206337, 206369, 206401, 206433, 206465,
+    206497, 206529, 206561, 206593, 206625, 206657, 206689, 206721, 206753, 206785, 206817, 206849, 206881, 206913,
+    206945, 206977, 207009, 207041, 207073, 207105, 207137, 207169, 207201, 207233, 207265, 207297, 207329, 207361,
+    207393, 207425, 207457, 207489, 207521, 207553, 207585, 207617, 207649, 207681, 207713, 207745, 207777, 207809,
+    207841, 207873, 207905, 207937, 207969, 208001, 208033, 208065, 208097, 208129, 208161, 208193, 208225, 208257,
+    208289, 208321, 208353, 208385, 208417, 208449, 208481, 208513, 208545, 208577, 208609, 208641, 208673, 208705,
+    208737, 208769, 208801, 208833, 208865, 208897, 208929, 208961, 208993, 209025, 209057, 209089, 209121, 209153,
+    209185, 209217, 209249, 209281, 209313, 209345, 209377, 209409, 209441, 209473, 209505, 209537, 209569, 209601,
+    209633, 209665, 209697, 209729, 209761, 209793, 209825, 209857, 209889, 209921, 209953, 209985, 210017, 210049,
+    210081, 210113, 210145, 210177, 210209, 210241, 210273, 210305, 210337, 210369, 210401, 210433, 210465, 210497,
+    210529, 210561, 210593, 210625, 210657, 210689, 210721, 210753, 210785, 210817, 210849, 210881, 210913, 210945,
+    210977, 211009, 211041, 211073, 211105, 211137, 211169, 211201, 211233, 211265, 211297, 211329, 211361, 211393,
+    211425, 211457, 211489, 211521, 211553, 211585, 211617, 211649, 211681, 211713, 211745, 211777, 211809, 211841,
+    211873, 211905, 211937, 211969, 212001, 212033, 212065, 212097, 212129, 212161, 212193, 212225, 212257, 212289,
+    212321, 212353, 212384, 212384, 212384, 212384, 212384, 212384, 212384, 212384, 212384, 212384, 212384, 212384,
+    212384, 212384, 212384, 212384, 212384, 212384, 212384, 212384, 212384, 212384, 212384, 212384, 212384, 212384,
+    212384, 212384, 212384, 212384, 212384, 212384, 212384, 212384, 212384, 212384, 212384, 212384, 212384, 212384,
+    212384, 212384, 212384, 212384, 212384, 212384, 212384, 212384, 212384, 212384, 212384, 212384, 212384, 212384,
+    212384, 212384, 212384, 212384, 212384, 212384, 212384, 212384, 212384, 212384, 212385, 212417, 212449, 212481,
+    212513, 212545, 212577, 212609, 212641, 212673, 212705, 212737, 212769, 212801, 212833, 212865, 212897, 212929,
+    212961, 212993, 213025, 213057, 213089, 213121, 213153, 213185, 213217, 213249, 213281, 213313, 213345, 213377,
+    213409, 213441, 213473, 213505, 213537, 213569, 213601, 213633, 213665, 213697, 213729, 213761, 213793, 213825,
+    213857, 213889, 213921, 213953, 213985, 214017, 214049, 214081, 214113, 214145, 214177, 214209, 214241, 214273,
+    214305, 214337, 214369, 214401, 214433, 214465, 214497, 214529, 214561, 214593, 214625, 214657, 214689, 214721,
+    214753, 214785, 214817, 214849, 214881, 214913, 214945, 214977, 215009, 215041, 215073, 215105, 215137, 215169,
+    215201, 215233, 215265, 215297, 215329, 215361, 215393, 215425, 215457, 215489, 215521, 215553, 215585, 215617,
+    215649, 215681, 215713, 215745, 215777, 215809, 215841, 215873, 215905, 215937, 215969, 216001, 216033, 216065,
+    216097, 216129, 216161, 216193, 216225, 216257, 216289, 216321, 216353, 216385, 216417, 216449, 216481, 216513,
+    216545, 216577, 216609, 216641, 216673, 216705, 216737, 216769, 216801, 216833, 216865, 216898, 216962, 217026,
+    217090, 217154, 217218, 217282, 217346, 217410, 217474, 217538, 217603, 217699, 217795, 217891, 217987, 218083,
+    218179, 218275, 218371, 218467, 218563, 218659, 218755, 218851, 218947, 219043, 219139, 219235, 219331, 219427,
+    219523, 219619, 219715, 219811, 219907, 220003, 220099, 220193, 220225, 220258, 220322, 220385, 220417, 220449,
+    220481, 220513, 220545, 220577, 220609, 220641, 220673, 220705, 220737, 220769, 220801, 220833, 220865, 220897,
+    220929, 220961, 220993, 221025, 221057, 221089, 221121, 221153, 221185, 221218, 221282, 221346, 221410, 221475,
+    221570, 221634, 221698, 221762, 221826, 221890, 221954, 222017, 222049, 222081, 222113, 222145, 222177, 222209,
+    222241, 222273, 222305, 222337, 222369, 222401, 222433, 222465, 222497, 222529, 222561, 222593, 222625, 222657,
+    222689, 222721, 222753, 222785, 222817, 222849, 222881, 222913, 222945, 222977, 223009, 223041, 223073, 223105,
+    223137, 223169, 223201, 223233, 223265, 223297, 223329, 223361, 223393, 223425, 223459, 223555, 223651, 223747,
+    223843, 223939, 224035, 224131, 224227, 224321, 224353, 224385, 224417, 224449, 224481, 224513, 224545, 224577,
+    224609, 224641, 224673, 224705, 224737, 224769, 224801, 224833, 224865, 224897, 224929, 224961, 224993, 225025,
+    225057, 225089, 225121, 225153, 225185, 225217, 225249, 225281, 225313, 225345, 225377, 225409, 225441, 225473,
+    225505, 225537, 225569, 225601, 225633, 225665, 225697, 225729, 225761, 225793, 225825, 225857, 225889, 225921,
+    225953, 225985, 226017, 226049, 226081, 226113, 226145, 226177, 226209, 226241, 226273, 226305, 226337, 226369,
+    226401, 226433, 226465, 226497, 226529, 226561, 226593, 226625, 226657, 226689, 226721, 226753, 226785, 226817,
+    226849, 226881, 226913, 226945, 226977, 227009, 227041, 227073, 227105, 227137, 227169, 227201, 227233, 227265,
+    227297, 227329, 227361, 227393, 227425, 227457, 227489, 227521, 227553, 227585, 227617, 227649, 227681, 227713,
+    227745, 227777, 227809, 227841, 227873, 227905, 227937, 227969, 228001, 228033, 228065, 228097, 228129, 228161,
+    228193, 228225, 228257, 228289, 228321, 228353, 228385, 228417, 228449, 228481, 228513, 228545, 228577, 228609,
+    228641, 228673, 228705, 228737, 228769, 228801, 228833, 228865, 228897, 228929, 228961, 228993, 229025, 229057,
+    229089, 229121, 229153, 229185, 229217, 229249, 229281, 229313, 229345, 229377, 229409, 229441, 229473, 229505,
+    229537, 229569, 229601, 229633, 229665, 229697, 229729, 229761, 229793, 229825, 229857, 229889, 229921, 229953,
+    229985, 230017, 230049, 230081, 230113, 230145, 230177, 230209, 230241, 230273, 230305, 230337, 230369, 230401,
+    230433, 230465, 230497, 230529, 230561, 230593, 230625, 230657, 230689, 230721, 230753, 230785, 230817, 230849,
+    230881, 230913, 230945, 230977, 231009, 231041, 231073, 231105, 231137, 231169, 231201, 231233, 231265, 231297,
+    231329, 231361, 231393, 231425, 231457, 231489, 231521, 231553, 231585, 231617, 231649, 231681, 231713, 231745,
+    231777, 231809, 231841, 231873, 231905, 231937, 231969, 232001, 232033, 232065, 232097, 232129, 232161, 232193,
+    232225, 232257, 232289, 232321, 232353, 232385, 232417, 232449, 232481, 232513, 232545, 232577, 232609, 232641,
+    232673, 232705, 232737, 232769, 232801, 232833, 232865, 232897, 232929, 232961, 232993, 233025, 233057, 233089,
+    233121, 233153, 233185, 233217, 233249, 233281, 233313, 233345, 233377, 233409, 233441, 233473, 233505, 233537,
+    233569, 233601, 233633, 233665, 233697, 233729, 233761, 233793, 233825, 233857, 233889, 233921, 233953, 233985,
+    234017, 234049, 234081, 234113, 234145, 234177, 234209, 234241, 234273, 234305, 234337, 234369, 234401, 234433,
+    234465, 234497, 234529, 234561, 234593, 234625, 234657, 234689, 234721, 234753, 234785, 234817, 234849, 234881,
+    234913, 234945, 234977, 235009, 235041, 235073, 235105, 235137, 235169, 235201, 235233, 235265, 235297, 235329,
+    235361, 235393, 235425, 235457, 235489, 235521, 235553, 235585, 235617, 235649, 235681, 235713, 235745, 235777,
+    235809, 235841, 235873, 235905, 235937, 235969, 236001, 236033, 236065, 236097, 236129, 236161, 236193, 236225,
+    236257, 236289, 236321, 236353, 236385, 236417, 236449, 236481, 236513, 236545, 236577, 236609, 236641, 236673,
+    236705, 236737, 236769, 236801, 236833, 236865, 236897, 236929, 236961, 236993, 237025, 237057, 237089, 237121,
+    237153, 237185, 237217, 237249, 237281, 237313, 237345, 237377, 237409, 237441, 237473, 237505, 237537, 237569,
+    237601, 237633, 237665, 237697, 237729, 237761, 237793, 237825, 237857, 237889, 237921, 237953, 237985, 238017,
+    238049, 238081, 238113, 238145, 238177, 238209, 238241, 238273, 238305, 238337, 238369, 238401, 238433, 238465,
+    238497, 238529, 238561, 238593, 238625, 238657, 238689, 238721, 238753, 238785, 238817, 238849, 238881, 238913,
+    238945, 238977, 239009, 239041, 239073, 239105, 239137, 239169, 239201, 239233, 239265, 239297, 239329, 239361,
+    239393, 239425, 239457, 239489, 239521, 239553, 239585, 239617, 239649, 239681, 239713, 239745, 239777, 239809,
+    239841, 239873, 239905, 239937, 239969, 240001, 240033, 240065, 240097, 240129, 240161, 240193, 240225, 240257,
+    240289, 240321, 240353, 240385, 240417, 240449, 240481, 240513, 240545, 240577, 240609, 240641, 240673, 240705,
+    240737, 240769, 240801, 240833, 240865, 240897, 240929, 240961, 240993, 241025, 241057, 241089, 241121, 241153,
+    241185, 241217, 241249, 241281, 241313, 241345, 241377, 241409, 241441, 241473, 241505, 241537, 241569, 241601,
+    241633, 241665, 241697, 241729, 241761, 241793, 241825, 241857, 241889, 241921, 241953, 241985, 242017,
+};
+
+/* replacements of the code points */
+static const uint32_t strip_accents_data[] = {
+    32, 32, 97, 32, 50, 51, 32, 956, 32, 49, 111, 49, 8260, 52, 49, 8260, 50, 51, 8260, 52, 65, 65, 65, 65, 65, 65, 67,
+    69, 69, 69, 69, 73, 73, 73, 73, 78, 79, 79, 79, 79, 79, 85, 85, 85, 85, 89, 97, 97, 97, 97, 97, 97, 99, 101, 101,
+    101, 101, 105, 105, 105, 105, 110, 111, 111, 111, 111, 111, 117, 117, 117, 117, 121, 121, 65, 97, 65, 97, 65, 97,
+    67, 99, 67, 99, 67, 99, 67, 99, 68, 100, 69, 101, 69, 101, 69, 101, 69, 101, 69, 101, 71, 103, 71, 103, 71, 103, 71,
+    103, 72, 104, 73, 105, 73, 105, 73, 105, 73, 105, 73, 73, 74, 105, 106, 74, 106, 75, 107, 76, 108, 76, 108, 76, 108,
+    76, 183, 108, 183, 78, 110, 78, 110, 78, 110, 700, 110, 79, 111, 79, 111, 79, 111, 82, 114, 82, 114, 82, 114, 83,
+    115, 83, 115, 83, 115, 83, 115, 84, 116, 84, 116, 85, 117, 85, 117, 85, 117, 85, 117, 85, 117, 85, 117, 87, 119, 89,
+    121, 89, 90, 122, 90, 122, 90, 122, 115, 79, 111, 85, 117, 68, 90, 68, 122, 100, 122, 76, 74, 76, 106, 108, 106, 78,
+    74, 78, 106, 110, 106, 65, 97, 73, 105, 79, 111, 85, 117, 85, 117, 85, 117, 85, 117, 85, 117, 65, 97, 65, 97, 198,
+    230, 71, 103, 75, 107, 79, 111, 79, 111, 439, 658, 106, 68, 90, 68, 122, 100, 122, 71, 103, 78, 110, 65, 97, 198,
+    230, 216, 248, 65, 97, 65, 97, 69, 101, 69, 101, 73, 105, 73, 105, 79, 111, 79, 111, 82, 114, 82, 114, 85, 117, 85,
+    117, 83, 115, 84, 116, 72, 104, 65, 97, 69, 101, 79, 111, 79, 111, 79, 111, 79, 111, 89, 121, 104, 614, 106, 114,
+    633, 635, 641, 119, 121, 32, 32, 32, 32, 32, 32, 611, 108, 115, 120, 661, 697, 32, 59, 32, 32, 913, 183, 917, 919,
+    921, 927, 933, 937, 953, 921, 933, 945, 949, 951, 953, 965, 953, 965, 959, 965, 969, 946, 952, 933, 933, 933, 966,
+    960, 954, 961, 962, 920, 949, 931, 1045, 1045, 1043, 1030, 1050, 1048, 1059, 1048, 1080, 1077, 1077, 1075, 1110,
+    1082, 1080, 1091, 1140, 1141, 1046, 1078, 1040, 1072, 1040, 1072, 1045, 1077, 1240, 1241, 1046, 1078, 1047, 1079,
+    1048, 1080, 1048, 1080, 1054, 1086, 1256, 1257, 1069, 1101, 1059, 1091, 1059, 1091, 1059, 1091, 1063, 1095, 1067,
+    1099, 1381, 1410, 1575, 1575, 1608, 1575, 1610, 1575, 1652, 1608, 1652, 1735, 1652, 1610, 1652, 1749, 1729, 1746,
+    2344, 2352, 2355, 2325, 2326, 2327, 2332, 2337, 2338, 2347, 2351, 2503, 2494, 2503, 2519, 2465, 2466, 2479, 2610,
+    2616, 2582, 2583, 2588, 2603, 2887, 2902, 2887, 2878, 2887, 2903, 2849, 2850, 2962, 3031, 3014, 3006, 3015, 3006,
+    3014, 3031, 3142, 3263, 3285, 3270, 3285, 3270, 3286, 3270, 3266, 3270, 3266, 3285, 3398, 3390, 3399, 3390, 3398,
+    3415, 3545, 3545, 3535, 3545, 3535, 3545, 3551, 3661, 3634, 3789, 3762, 3755, 3737, 3755, 3745, 3851, 3906, 4023,
+    3916, 4023, 3921, 4023, 3926, 4023, 3931, 4023, 3904, 4021, 4018, 4018, 4019, 4019, 3986, 4023, 3996, 4023, 4001,
+    4023, 4006, 4023, 4011, 4023, 3984, 4021, 4133, 4142, 4316, 6917, 6965, 6919, 6965, 6921, 6965, 6923, 6965, 6925,
+    6965, 6929, 6965, 6970, 6965, 6972, 6965, 6974, 6965, 6975, 6965, 6978, 6965, 65, 198, 66, 68, 69, 398, 71, 72, 73,
+    74, 75, 76, 77, 78, 79, 546, 80, 82, 84, 85, 87, 97, 592, 593, 7426, 98, 100, 101, 601, 603, 604, 103, 107, 109,
+    331, 111, 596, 7446, 7447, 112, 116, 117, 7453, 623, 118, 7461, 946, 947, 948, 966, 967, 105, 114, 117, 118, 946,
+    947, 961, 966, 967, 1085, 594, 99, 597, 240, 604, 102, 607, 609, 613, 616, 617, 618, 7547, 669, 621, 7557, 671, 625,
+    624, 626, 627, 628, 629, 632, 642, 643, 427, 649, 650, 7452, 651, 652, 122, 656, 657, 658, 952, 65, 97, 66, 98, 66,
+    98, 66, 98, 67, 99, 68, 100, 68, 100, 68, 100, 68, 100, 68, 100, 69, 101, 69, 101, 69, 101, 69, 101, 69, 101, 70,
+    102, 71, 103, 72, 104, 72, 104, 72, 104, 72, 104, 72, 104, 73, 105, 73, 105, 75, 107, 75, 107, 75, 107, 76, 108, 76,
+    108, 76, 108, 76, 108, 77, 109, 77, 109, 77, 109, 78, 110, 78, 110, 78, 110, 78, 110, 79, 111, 79, 111, 79, 111, 79,
+    111, 80, 112, 80, 112, 82, 114, 82, 114, 82, 114, 82, 114, 83, 115, 83, 115, 83, 115, 83, 115, 83, 115, 84, 116, 84,
+    116, 84, 116, 84, 116, 85, 117, 85, 117, 85, 117, 85, 117, 85, 117, 86, 118, 86, 118, 87, 119, 87, 119, 87, 119, 87,
+    119, 87, 119, 88, 120, 88, 120, 89, 121, 90, 122, 90, 122, 90, 122, 104, 116, 119, 121, 97, 702, 115, 65, 97, 65,
+    97, 65, 97, 65, 97, 65, 97, 65, 97, 65, 97, 65, 97, 65, 97, 65, 97, 65, 97, 65, 97, 69, 101, 69, 101, 69, 101, 69,
+    101, 69, 101, 69, 101, 69, 101, 69, 101, 73, 105, 73, 105, 79, 111, 79, 111, 79, 111, 79, 111, 79, 111, 79, 111, 79,
+    111, 79, 111, 79, 111, 79, 111, 79, 111, 79, 111, 85, 117, 85, 117, 85, 117, 85, 117, 85, 117, 85, 117, 85, 117, 89,
+    121, 89, 121, 89, 121, 89, 121, 945, 945, 945, 945, 945, 945, 945, 945, 913, 913, 913, 913, 913, 913, 913, 913, 949,
+    949, 949, 949, 949, 949, 917, 917, 917, 917, 917, 917, 951, 951, 951, 951, 951, 951, 951, 951, 919, 919, 919, 919,
+    919, 919, 919, 919, 953, 953, 953, 953, 953, 953, 953, 953, 921, 921, 921, 921, 921, 921, 921, 921, 959, 959, 959,
+    959, 959, 959, 927, 927, 927, 927, 927, 927, 965, 965, 965, 965, 965, 965, 965, 965, 933, 933, 933, 933, 969, 969,
+    969, 969, 969, 969, 969, 969, 937, 937, 937, 937, 937, 937, 937, 937, 945, 945, 949, 949, 951, 951, 953, 953, 959,
+    959, 965, 965, 969, 969, 945, 945, 945, 945, 945, 945, 945, 945, 913, 913, 913, 913, 913, 913, 913, 913, 951, 951,
+    951, 951, 951, 951, 951, 951, 919, 919, 919, 919, 919, 919, 919, 919, 969, 969, 969, 969, 969, 969, 969, 969, 937,
+    937, 937, 937, 937, 937, 937, 937, 945, 945, 945, 945, 945, 945, 945, 913, 913, 913, 913, 913, 32, 953, 32, 32, 32,
+    951, 951, 951, 951, 951, 917, 917, 919, 919, 919, 32, 32, 32, 953, 953, 953, 953, 953, 953, 921, 921, 921, 921, 32,
+    32, 32, 965, 965, 965, 965, 961, 961, 965, 965, 933, 933, 933, 933, 929, 32, 32, 96, 969, 969, 969, 969, 969, 927,
+    927, 937, 937, 937, 32, 32, 32, 32, 32, 32, 32, 32, 32, 32, 32, 32, 32, 8208, 32, 46, 46, 46, 46, 46, 46, 32, 8242,
+    8242, 8242, 8242, 8242, 8245, 8245, 8245, 8245, 8245, 33, 33, 32, 63, 63, 63, 33, 33, 63, 8242, 8242, 8242, 8242,
+    32, 48, 105, 52, 53, 54, 55, 56, 57, 43, 8722, 61, 40, 41, 110, 48, 49, 50, 51, 52, 53, 54, 55, 56, 57, 43, 8722,
+    61, 40, 41, 97, 101, 111, 120, 601, 104, 107, 108, 109, 110, 112, 115, 116, 82, 115, 97, 47, 99, 97, 47, 115, 67,
+    176, 67, 99, 47, 111, 99, 47, 117, 400, 176, 70, 103, 72, 72, 72, 104, 295, 73, 73, 76, 108, 78, 78, 111, 80, 81,
+    82, 82, 82, 83, 77, 84, 69, 76, 84, 77, 90, 937, 90, 75, 65, 66, 67, 101, 69, 70, 77, 111, 1488, 1489, 1490, 1491,
+    105, 70, 65, 88, 960, 947, 915, 928, 8721, 68, 100, 101, 105, 106, 49, 8260, 55, 49, 8260, 57, 49, 8260, 49, 48, 49,
+    8260, 51, 50, 8260, 51, 49, 8260, 53, 50, 8260, 53, 51, 8260, 53, 52, 8260, 53, 49, 8260, 54, 53, 8260, 54, 49,
+    8260, 56, 51, 8260, 56, 53, 8260, 56, 55, 8260, 56, 49, 8260, 73, 73, 73, 73, 73, 73, 73, 86, 86, 86, 73, 86, 73,
+    73, 86, 73, 73, 73, 73, 88, 88, 88, 73, 88, 73, 73, 76, 67, 68, 77, 105, 105, 105, 105, 105, 105, 105, 118, 118,
+    118, 105, 118, 105, 105, 118, 105, 105, 105, 105, 120, 120, 120, 105, 120, 105, 105, 108, 99, 100, 109, 48, 8260,
+    51, 8592, 8594, 8596, 8656, 8660, 8658, 8707, 8712, 8715, 8739, 8741, 8747, 8747, 8747, 8747, 8747, 8750, 8750,
+    8750, 8750, 8750, 8764, 8771, 8773, 8776, 61, 8801, 8781, 60, 62, 8804, 8805, 8818, 8819, 8822, 8823, 8826, 8827,
+    8834, 8835, 8838, 8839, 8866, 8872, 8873, 8875, 8828, 8829, 8849, 8850, 8882, 8883, 8884, 8885, 12296, 12297, 49,
+    50, 51, 52, 53, 54, 55, 56, 57, 49, 48, 49, 49, 49, 50, 49, 51, 49, 52, 49, 53, 49, 54, 49, 55, 49, 56, 49, 57, 50,
+    48, 40, 49, 41, 40, 50, 41, 40, 51, 41, 40, 52, 41, 40, 53, 41, 40, 54, 41, 40, 55, 41, 40, 56, 41, 40, 57, 41, 40,
+    49, 48, 41, 40, 49, 49, 41, 40, 49, 50, 41, 40, 49, 51, 41, 40, 49, 52, 41, 40, 49, 53, 41, 40, 49, 54, 41, 40, 49,
+    55, 41, 40, 49, 56, 41, 40, 49, 57, 41, 40, 50, 48, 41, 49, 46, 50, 46, 51, 46, 52, 46, 53, 46, 54, 46, 55, 46, 56,
+    46, 57, 46, 49, 48, 46, 49, 49, 46, 49, 50, 46, 49, 51, 46, 49, 52, 46, 49, 53, 46, 49, 54, 46, 49, 55, 46, 49, 56,
+    46, 49, 57, 46, 50, 48, 46, 40, 97, 41, 40, 98, 41, 40, 99, 41, 40, 100, 41, 40, 101, 41, 40, 102, 41, 40, 103, 41,
+    40, 104, 41, 40, 105, 41, 40, 106, 41, 40, 107, 41, 40, 108, 41, 40, 109, 41, 40, 110, 41, 40, 111, 41, 40, 112, 41,
+    40, 113, 41, 40, 114, 41, 40, 115, 41, 40, 116, 41, 40, 117, 41, 40, 118, 41, 40, 119, 41, 40, 120, 41, 40, 121, 41,
+    40, 122, 41, 65, 66, 67, 68, 69, 70, 71, 72, 73, 74, 75, 76, 77, 78, 79, 80, 81, 82, 83, 84, 85, 86, 87, 88, 89, 90,
+    97, 98, 99, 100, 101, 102, 103, 104, 105, 106, 107, 108, 109, 110, 111, 112, 113, 114, 115, 116, 117, 118, 119, 120,
+    121, 122, 48, 8747, 8747, 8747, 8747, 58, 58, 61, 61, 61, 61, 61, 61, 10973, 106, 86, 11617, 27597, 40863, 19968,
+    20008, 20022, 20031, 20057, 20101, 20108, 20128, 20154, 20799, 20837, 20843, 20866, 20886, 20907, 20960, 20981,
+    20992, 21147, 21241, 21269, 21274, 21304, 21313, 21340, 21353, 21378, 21430, 21448, 21475, 22231, 22303, 22763,
+    22786, 22794, 22805, 22823, 22899, 23376, 23424, 23544, 23567, 23586, 23608, 23662, 23665, 24027, 24037, 24049,
+    24062, 24178, 24186, 24191, 24308, 24318, 24331, 24339, 24400, 24417, 24435, 24515, 25096, 25142, 25163, 25903,
+    25908, 25991, 26007, 26020, 26041, 26080, 26085, 26352, 26376, 26408, 27424, 27490, 27513, 27571, 27595, 27604,
+    27611, 27663, 27668, 27700, 28779, 29226, 29238, 29243, 29247, 29255, 29273, 29275, 29356, 29572, 29577, 29916,
+    29926, 29976, 29983, 29992, 30000, 30091, 30098, 30326, 30333, 30382, 30399, 30446, 30683, 30690, 30707, 31034,
+    31160, 31166, 31348, 31435, 31481, 31859, 31992, 32566, 32593, 32650, 32701, 32769, 32780, 32786, 32819, 32895,
+    32905, 33251, 33258, 33267, 33276, 33292, 33307, 33311, 33390, 33394, 33400, 34381, 34411, 34880, 34892, 34915,
+    35198, 35211, 35282, 35328, 35895, 35910, 35925, 35960, 35997, 36196, 36208, 36275, 36523, 36554, 36763, 36784,
+    36789, 37009, 37193, 37318, 37324, 37329, 38263, 38272, 38428, 38582, 38585, 38632, 38737, 38750, 38754, 38761,
+    38859, 38893, 38899, 38913, 39080, 39131, 39135, 39318, 39321, 39340, 39592, 39640, 39647, 39717, 39727, 39730,
+    39740, 39770, 40165, 40565, 40575, 40613, 40635, 40643, 40653, 40657, 40697, 40701, 40718, 40723, 40736, 40763,
+    40778, 40786, 40845, 40860, 40864, 32, 12306, 21313, 21316, 21317, 12363, 12365, 12367, 12369, 12371, 12373, 12375,
+    12377, 12379, 12381, 12383, 12385, 12388, 12390, 12392, 12399, 12399, 12402, 12402, 12405, 12405, 12408, 12408,
+    12411, 12411, 12358, 32, 32, 12445, 12424, 12426, 12459, 12461, 12463, 12465, 12467, 12469, 12471, 12473, 12475,
+    12477, 12479, 12481, 12484, 12486, 12488, 12495, 12495, 12498, 12498, 12501, 12501, 12504, 12504, 12507, 12507,
+    12454, 12527, 12528, 12529, 12530, 12541, 12467, 12488, 4352, 4353, 4522, 4354, 4524, 4525, 4355, 4356, 4357, 4528,
+    4529, 4530, 4531, 4532, 4533, 4378, 4358, 4359, 4360, 4385, 4361, 4362, 4363, 4364, 4365, 4366, 4367, 4368, 4369,
+    4370, 4449, 4450, 4451, 4452, 4453, 4454, 4455, 4456, 4457, 4458, 4459, 4460, 4461, 4462, 4463, 4464, 4465, 4466,
+    4467, 4468, 4469, 4448, 4372, 4373, 4551, 4552, 4556, 4558, 4563, 4567, 4569, 4380, 4573, 4575, 4381, 4382, 4384,
+    4386, 4387, 4391, 4393, 4395, 4396, 4397, 4398, 4399, 4402, 4406, 4416, 4423, 4428, 4593, 4594, 4439, 4440, 4441,
+    4484, 4485, 4488, 4497, 4498, 4500, 4510, 4513, 19968, 20108, 19977, 22235, 19978, 20013, 19979, 30002, 20057,
+    19993, 19969, 22825, 22320, 20154, 40, 4352, 41, 40, 4354, 41, 40, 4355, 41, 40, 4357, 41, 40, 4358, 41, 40, 4359,
+    41, 40, 4361, 41, 40, 4363, 41, 40, 4364, 41, 40, 4366, 41, 40, 4367, 41, 40, 4368, 41, 40, 4369, 41, 40, 4370, 41,
+    40, 4352, 4449, 41, 40, 4354, 4449, 41, 40, 4355, 4449, 41, 40, 4357, 4449, 41, 40, 4358, 4449, 41, 40, 4359, 4449,
+    41, 40, 4361, 4449, 41, 40, 4363, 4449, 41, 40, 4364, 4449, 41, 40, 4366, 4449, 41, 40, 4367, 4449, 41, 40, 4368,
+    4449, 41, 40, 4369, 4449, 41, 40, 4370, 4449, 41, 40, 4364, 4462, 41, 40, 4363, 4457, 4364, 4453, 4523, 41, 40,
+    4363, 4457, 4370, 4462, 41, 40, 19968, 41, 40, 20108, 41, 40, 19977, 41, 40, 22235, 41, 40, 20116, 41, 40, 20845,
+    41, 40, 19971, 41, 40, 20843, 41, 40, 20061, 41, 40, 21313, 41, 40, 26376, 41, 40, 28779, 41, 40, 27700, 41, 40,
+    26408, 41, 40, 37329, 41, 40, 22303, 41, 40, 26085, 41, 40, 26666, 41, 40, 26377, 41, 40, 31038, 41, 40, 21517, 41,
+    40, 29305, 41, 40, 36001, 41, 40, 31069, 41, 40, 21172, 41, 40, 20195, 41, 40, 21628, 41, 40, 23398, 41, 40, 30435,
+    41, 40, 20225, 41, 40, 36039, 41, 40, 21332, 41, 40, 31085, 41, 40, 20241, 41, 40, 33258, 41, 40, 33267, 41, 21839,
+    24188, 25991, 31631, 80, 84, 69, 50, 49, 50, 50, 50, 51, 50, 52, 50, 53, 50, 54, 50, 55, 50, 56, 50, 57, 51, 48, 51,
+    49, 51, 50, 51, 51, 51, 52, 51, 53, 4352, 4354, 4355, 4357, 4358, 4359, 4361, 4363, 4364, 4366, 4367, 4368, 4369,
+    4370, 4352, 4449, 4354, 4449, 4355, 4449, 4357, 4449, 4358, 4449, 4359, 4449, 4361, 4449, 4363, 4449, 4364, 4449,
+    4366, 4449, 4367, 4449, 4368, 4449, 4369, 4449, 4370, 4449, 4366, 4449, 4535, 4352, 4457, 4364, 4462, 4363, 4468,
+    4363, 4462, 19968, 20108, 19977, 22235, 20116, 20845, 19971, 20843, 20061, 21313, 26376, 28779, 27700, 26408, 37329,
+    22303, 26085, 26666, 26377, 31038, 21517, 29305, 36001, 31069, 21172, 31192, 30007, 22899, 36969, 20778, 21360,
+    27880, 38917, 20241, 20889, 27491, 19978, 20013, 19979, 24038, 21491, 21307, 23447, 23398, 30435, 20225, 36039,
+    21332, 22812, 51, 54, 51, 55, 51, 56, 51, 57, 52, 48, 52, 49, 52, 50, 52, 51, 52, 52, 52, 53, 52, 54, 52, 55, 52,
+    56, 52, 57, 53, 48, 49, 26376, 50, 26376, 51, 26376, 52, 26376, 53, 26376, 54, 26376, 55, 26376, 56, 26376, 57,
+    26376, 49, 48, 26376, 49, 49, 26376, 49, 50, 26376, 72, 103, 101, 114, 103, 101, 86, 76, 84, 68, 12450, 12452,
+    12454, 12456, 12458, 12459, 12461, 12463, 12465, 12467, 12469, 12471, 12473, 12475, 12477, 12479, 12481, 12484,
+    12486, 12488, 12490, 12491, 12492, 12493, 12494, 12495, 12498, 12501, 12504, 12507, 12510, 12511, 12512, 12513,
+    12514, 12516, 12518, 12520, 12521, 12522, 12523, 12524, 12525, 12527, 12528, 12529, 12530, 20196, 21644, 12450,
+    12495, 12540, 12488, 12450, 12523, 12501, 12449, 12450, 12531, 12504, 12450, 12450, 12540, 12523, 12452, 12491,
+    12531, 12463, 12452, 12531, 12481, 12454, 12457, 12531, 12456, 12473, 12463, 12540, 12488, 12456, 12540, 12459,
+    12540, 12458, 12531, 12473, 12458, 12540, 12512, 12459, 12452, 12522, 12459, 12521, 12483, 12488, 12459, 12525,
+    12522, 12540, 12459, 12525, 12531, 12459, 12531, 12510, 12461, 12459, 12461, 12491, 12540, 12461, 12517, 12522,
+    12540, 12461, 12523, 12479, 12540, 12461, 12525, 12461, 12525, 12463, 12521, 12512, 12461, 12525, 12513, 12540,
+    12488, 12523, 12461, 12525, 12527, 12483, 12488, 12463, 12521, 12512, 12463, 12521, 12512, 12488, 12531, 12463,
+    12523, 12475, 12452, 12525, 12463, 12525, 12540, 12493, 12465, 12540, 12473, 12467, 12523, 12490, 12467, 12540,
+    12507, 12469, 12452, 12463, 12523, 12469, 12531, 12481, 12540, 12512, 12471, 12522, 12531, 12463, 12475, 12531,
+    12481, 12475, 12531, 12488, 12479, 12540, 12473, 12486, 12471, 12488, 12523, 12488, 12531, 12490, 12494, 12494,
+    12483, 12488, 12495, 12452, 12484, 12495, 12540, 12475, 12531, 12488, 12495, 12540, 12484, 12495, 12540, 12524,
+    12523, 12498, 12450, 12473, 12488, 12523, 12498, 12463, 12523, 12498, 12467, 12498, 12523, 12501, 12449, 12521,
+    12483, 12488, 12501, 12451, 12540, 12488, 12501, 12483, 12471, 12455, 12523, 12501, 12521, 12531, 12504, 12463,
+    12479, 12540, 12523, 12504, 12477, 12504, 12491, 12498, 12504, 12523, 12484, 12504, 12531, 12473, 12504, 12540,
+    12471, 12504, 12540, 12479, 12507, 12452, 12531, 12488, 12507, 12523, 12488, 12507, 12531, 12507, 12531, 12488,
+    12507, 12540, 12523, 12507, 12540, 12531, 12510, 12452, 12463, 12525, 12510, 12452, 12523, 12510, 12483, 12495,
+    12510, 12523, 12463, 12510, 12531, 12471, 12519, 12531, 12511, 12463, 12525, 12531, 12511, 12522, 12511, 12522,
+    12495, 12540, 12523, 12513, 12459, 12513, 12459, 12488, 12531, 12513, 12540, 12488, 12523, 12516, 12540, 12488,
+    12516, 12540, 12523, 12518, 12450, 12531, 12522, 12483, 12488, 12523, 12522, 12521, 12523, 12498, 12540, 12523,
+    12540, 12501, 12523, 12524, 12512, 12524, 12531, 12488, 12465, 12531, 12527, 12483, 12488, 48, 28857, 49, 28857, 50,
+    28857, 51, 28857, 52, 28857, 53, 28857, 54, 28857, 55, 28857, 56, 28857, 57, 28857, 49, 48, 28857, 49, 49, 28857,
+    49, 50, 28857, 49, 51, 28857, 49, 52, 28857, 49, 53, 28857, 49, 54, 28857, 49, 55, 28857, 49, 56, 28857, 49, 57,
+    28857, 50, 48, 28857, 50, 49, 28857, 50, 50, 28857, 50, 51, 28857, 50, 52, 28857, 104, 80, 97, 100, 97, 65, 85, 98,
+    97, 114, 111, 86, 112, 99, 100, 109, 100, 109, 50, 100, 109, 51, 73, 85, 24179, 25104, 26157, 21644, 22823, 27491,
+    26126, 27835, 26666, 24335, 20250, 31038, 112, 65, 110, 65, 956, 65, 109, 65, 107, 65, 75, 66, 77, 66, 71, 66, 99,
+    97, 108, 107, 99, 97, 108, 112, 70, 110, 70, 956, 70, 956, 103, 109, 103, 107, 103, 72, 122, 107, 72, 122, 77, 72,
+    122, 71, 72, 122, 84, 72, 122, 956, 108, 109, 108, 100, 108, 107, 108, 102, 109, 110, 109, 956, 109, 109, 109, 99,
+    109, 107, 109, 109, 109, 50, 99, 109, 50, 109, 50, 107, 109, 50, 109, 109, 51, 99, 109, 51, 109, 51, 107, 109, 51,
+    109, 8725, 115, 109, 8725, 115, 50, 80, 97, 107, 80, 97, 77, 80, 97, 71, 80, 97, 114, 97, 100, 114, 97, 100, 8725,
+    115, 114, 97, 100, 8725, 115, 50, 112, 115, 110, 115, 956, 115, 109, 115, 112, 86, 110, 86, 956, 86, 109, 86, 107,
+    86, 77, 86, 112, 87, 110, 87, 956, 87, 109, 87, 107, 87, 77, 87, 107, 937, 77, 937, 97, 46, 109, 46, 66, 113, 99,
+    99, 99, 100, 67, 8725, 107, 103, 67, 111, 46, 100, 66, 71, 121, 104, 97, 72, 80, 105, 110, 75, 75, 75, 77, 107, 116,
+    108, 109, 108, 110, 108, 111, 103, 108, 120, 109, 98, 109, 105, 108, 109, 111, 108, 80, 72, 112, 46, 109, 46, 80,
+    80, 77, 80, 82, 115, 114, 83, 118, 87, 98, 86, 8725, 109, 65, 8725, 109, 49, 26085, 50, 26085, 51, 26085, 52, 26085,
+    53, 26085, 54, 26085, 55, 26085, 56, 26085, 57, 26085, 49, 48, 26085, 49, 49, 26085, 49, 50, 26085, 49, 51, 26085,
+    49, 52, 26085, 49, 53, 26085, 49, 54, 26085, 49, 55, 26085, 49, 56, 26085, 49, 57, 26085, 50, 48, 26085, 50, 49,
+    26085, 50, 50, 26085, 50, 51, 26085, 50, 52, 26085, 50, 53, 26085, 50, 54, 26085, 50, 55, 26085, 50, 56, 26085, 50,
+    57, 26085, 51, 48, 26085, 51, 49, 26085, 103, 97, 108, 1098, 1100, 42863, 67, 70, 81, 294, 339, 42791, 43831, 619,
+    43858, 653, 35912, 26356, 36554, 36040, 28369, 20018, 21477, 40860, 40860, 22865, 37329, 21895, 22856, 25078, 30313,
+    32645, 34367, 34746, 35064, 37007, 27138, 27931, 28889, 29662, 33853, 37226, 39409, 20098, 21365, 27396, 29211,
+    34349, 40478, 23888, 28651, 34253, 35172, 25289, 33240, 34847, 24266, 26391, 28010, 29436, 37070, 20358, 20919,
+    21214, 25796, 27347, 29200, 30439, 32769, 34310, 34396, 36335, 38706, 39791, 40442, 30860, 31103, 32160, 33737,
+    37636, 40575, 35542, 22751, 24324, 31840, 32894, 29282, 30922, 36034, 38647, 22744, 23650, 27155, 28122, 28431,
+    32047, 32311, 38475, 21202, 32907, 20956, 20940, 31260, 32190, 33777, 38517, 35712, 25295, 27138, 35582, 20025,
+    23527, 24594, 29575, 30064, 21271, 30971, 20415, 24489, 19981, 27852, 25976, 32034, 21443, 22622, 30465, 33865,
+    35498, 27578, 36784, 27784, 25342, 33509, 25504, 30053, 20142, 20841, 20937, 26753, 31975, 33391, 35538, 37327,
+    21237, 21570, 22899, 24300, 26053, 28670, 31018, 38317, 39530, 40599, 40654, 21147, 26310, 27511, 36706, 24180,
+    24976, 25088, 25754, 28451, 29001, 29833, 31178, 32244, 32879, 36646, 34030, 36899, 37706, 21015, 21155, 21693,
+    28872, 35010, 35498, 24265, 24565, 25467, 27566, 31806, 29557, 20196, 22265, 23527, 23994, 24604, 29618, 29801,
+    32666, 32838, 37428, 38646, 38728, 38936, 20363, 31150, 37300, 38584, 24801, 20102, 20698, 23534, 23615, 26009,
+    27138, 29134, 30274, 34044, 36988, 40845, 26248, 38446, 21129, 26491, 26611, 27969, 28316, 29705, 30041, 30827,
+    32016, 39006, 20845, 25134, 38520, 20523, 23833, 28138, 36650, 24459, 24900, 26647, 29575, 38534, 21033, 21519,
+    23653, 26131, 26446, 26792, 27877, 29702, 30178, 32633, 35023, 35041, 37324, 38626, 21311, 28346, 21533, 29136,
+    29848, 34298, 38563, 40023, 40607, 26519, 28107, 33256, 31435, 31520, 31890, 29376, 28825, 35672, 20160, 33590,
+    21050, 20999, 24230, 25299, 31958, 23429, 27934, 26292, 36667, 34892, 38477, 35211, 24275, 20800, 21952, 22618,
+    26228, 20958, 29482, 30410, 31036, 31070, 31077, 31119, 38742, 31934, 32701, 34322, 35576, 36920, 37117, 39151,
+    39164, 39208, 40372, 37086, 38583, 20398, 20711, 20813, 21193, 21220, 21329, 21917, 22022, 22120, 22592, 22696,
+    23652, 23662, 24724, 24936, 24974, 25074, 25935, 26082, 26257, 26757, 28023, 28186, 28450, 29038, 29227, 29730,
+    30865, 31038, 31049, 31048, 31056, 31062, 31069, 31117, 31118, 31296, 31361, 31680, 32244, 32265, 32321, 32626,
+    32773, 33261, 33401, 33401, 33879, 35088, 35222, 35585, 35641, 36051, 36104, 36790, 36920, 38627, 38911, 38971,
+    24693, 148206, 33304, 20006, 20917, 20840, 20352, 20805, 20864, 21191, 21242, 21917, 21845, 21913, 21986, 22618,
+    22707, 22852, 22868, 23138, 23336, 24274, 24281, 24425, 24493, 24792, 24910, 24840, 24974, 24928, 25074, 25140,
+    25540, 25628, 25682, 25942, 26228, 26391, 26395, 26454, 27513, 27578, 27969, 28379, 28363, 28450, 28702, 29038,
+    30631, 29237, 29359, 29482, 29809, 29958, 30011, 30237, 30239, 30410, 30427, 30452, 30538, 30528, 30924, 31409,
+    31680, 31867, 32091, 32244, 32574, 32773, 33618, 33775, 34681, 35137, 35206, 35222, 35519, 35576, 35531, 35585,
+    35582, 35565, 35641, 35722, 36104, 36664, 36978, 37273, 37494, 38524, 38627, 38742, 38875, 38911, 38923, 38971,
+    39698, 40860, 141386, 141380, 144341, 15261, 16408, 16441, 152137, 154832, 163539, 40771, 40846, 102, 102, 102, 105,
+    102, 108, 102, 102, 105, 102, 102, 108, 115, 116, 115, 116, 1396, 1398, 1396, 1381, 1396, 1387, 1406, 1398, 1396,
+    1389, 1497, 1522, 1506, 1488, 1491, 1492, 1499, 1500, 1501, 1512, 1514, 43, 1513, 1513, 1513, 1513, 1488, 1488,
+    1488, 1489, 1490, 1491, 1492, 1493, 1494, 1496, 1497, 1498, 1499, 1500, 1502, 1504, 1505, 1507, 1508, 1510, 1511,
+    1512, 1513, 1514, 1493, 1489, 1499, 1508, 1488, 1500, 1649, 1649, 1659, 1659, 1659, 1659, 1662, 1662, 1662, 1662,
+    1664, 1664, 1664, 1664, 1658, 1658, 1658, 1658, 1663, 1663, 1663, 1663, 1657, 1657, 1657, 1657, 1700, 1700, 1700,
+    1700, 1702, 1702, 1702, 1702, 1668, 1668, 1668, 1668, 1667, 1667, 1667, 1667, 1670, 1670, 1670, 1670, 1671, 1671,
+    1671, 1671, 1677, 1677, 1676, 1676, 1678, 1678, 1672, 1672, 1688, 1688, 1681, 1681, 1705, 1705, 1705, 1705, 1711,
+    1711, 1711, 1711, 1715, 1715, 1715, 1715, 1713, 1713, 1713, 1713, 1722, 1722, 1723, 1723, 1723, 1723, 1749, 1749,
+    1729, 1729, 1729, 1729, 1726, 1726, 1726, 1726, 1746, 1746, 1746, 1746, 1709, 1709, 1709, 1709, 1735, 1735, 1734,
+    1734, 1736, 1736, 1735, 1652, 1739, 1739, 1733, 1733, 1737, 1737, 1744, 1744, 1744, 1744, 1609, 1609, 1610, 1575,
+    1610, 1575, 1610, 1749, 1610, 1749, 1610, 1608, 1610, 1608, 1610, 1735, 1610, 1735, 1610, 1734, 1610, 1734, 1610,
+    1736, 1610, 1736, 1610, 1744, 1610, 1744, 1610, 1744, 1610, 1609, 1610, 1609, 1610, 1609, 1740, 1740, 1740, 1740,
+    1610, 1580, 1610, 1581, 1610, 1605, 1610, 1609, 1610, 1610, 1576, 1580, 1576, 1581, 1576, 1582, 1576, 1605, 1576,
+    1609, 1576, 1610, 1578, 1580, 1578, 1581, 1578, 1582, 1578, 1605, 1578, 1609, 1578, 1610, 1579, 1580, 1579, 1605,
+    1579, 1609, 1579, 1610, 1580, 1581, 1580, 1605, 1581, 1580, 1581, 1605, 1582, 1580, 1582, 1581, 1582, 1605, 1587,
+    1580, 1587, 1581, 1587, 1582, 1587, 1605, 1589, 1581, 1589, 1605, 1590, 1580, 1590, 1581, 1590, 1582, 1590, 1605,
+    1591, 1581, 1591, 1605, 1592, 1605, 1593, 1580, 1593, 1605, 1594, 1580, 1594, 1605, 1601, 1580, 1601, 1581, 1601,
+    1582, 1601, 1605, 1601, 1609, 1601, 1610, 1602, 1581, 1602, 1605, 1602, 1609, 1602, 1610, 1603, 1575, 1603, 1580,
+    1603, 1581, 1603, 1582, 1603, 1604, 1603, 1605, 1603, 1609, 1603, 1610, 1604, 1580, 1604, 1581, 1604, 1582, 1604,
+    1605, 1604, 1609, 1604, 1610, 1605, 1580, 1605, 1581, 1605, 1582, 1605, 1605, 1605, 1609, 1605, 1610, 1606, 1580,
+    1606, 1581, 1606, 1582, 1606, 1605, 1606, 1609, 1606, 1610, 1607, 1580, 1607, 1605, 1607, 1609, 1607, 1610, 1610,
+    1580, 1610, 1581, 1610, 1582, 1610, 1605, 1610, 1609, 1610, 1610, 1584, 1585, 1609, 32, 32, 32, 32, 32, 32, 1610,
+    1585, 1610, 1586, 1610, 1605, 1610, 1606, 1610, 1609, 1610, 1610, 1576, 1585, 1576, 1586, 1576, 1605, 1576, 1606,
+    1576, 1609, 1576, 1610, 1578, 1585, 1578, 1586, 1578, 1605, 1578, 1606, 1578, 1609, 1578, 1610, 1579, 1585, 1579,
+    1586, 1579, 1605, 1579, 1606, 1579, 1609, 1579, 1610, 1601, 1609, 1601, 1610, 1602, 1609, 1602, 1610, 1603, 1575,
+    1603, 1604, 1603, 1605, 1603, 1609, 1603, 1610, 1604, 1605, 1604, 1609, 1604, 1610, 1605, 1575, 1605, 1605, 1606,
+    1585, 1606, 1586, 1606, 1605, 1606, 1606, 1606, 1609, 1606, 1610, 1609, 1610, 1585, 1610, 1586, 1610, 1605, 1610,
+    1606, 1610, 1609, 1610, 1610, 1610, 1580, 1610, 1581, 1610, 1582, 1610, 1605, 1610, 1607, 1576, 1580, 1576, 1581,
+    1576, 1582, 1576, 1605, 1576, 1607, 1578, 1580, 1578, 1581, 1578, 1582, 1578, 1605, 1578, 1607, 1579, 1605, 1580,
+    1581, 1580, 1605, 1581, 1580, 1581, 1605, 1582, 1580, 1582, 1605, 1587, 1580, 1587, 1581, 1587, 1582, 1587, 1605,
+    1589, 1581, 1589, 1582, 1589, 1605, 1590, 1580, 1590, 1581, 1590, 1582, 1590, 1605, 1591, 1581, 1592, 1605, 1593,
+    1580, 1593, 1605, 1594, 1580, 1594, 1605, 1601, 1580, 1601, 1581, 1601, 1582, 1601, 1605, 1602, 1581, 1602, 1605,
+    1603, 1580, 1603, 1581, 1603, 1582, 1603, 1604, 1603, 1605, 1604, 1580, 1604, 1581, 1604, 1582, 1604, 1605, 1604,
+    1607, 1605, 1580, 1605, 1581, 1605, 1582, 1605, 1605, 1606, 1580, 1606, 1581, 1606, 1582, 1606, 1605, 1606, 1607,
+    1607, 1580, 1607, 1605, 1607, 1610, 1580, 1610, 1581, 1610, 1582, 1610, 1605, 1610, 1607, 1610, 1605, 1610, 1607,
+    1576, 1605, 1576, 1607, 1578, 1605, 1578, 1607, 1579, 1605, 1579, 1607, 1587, 1605, 1587, 1607, 1588, 1605, 1588,
+    1607, 1603, 1604, 1603, 1605, 1604, 1605, 1606, 1605, 1606, 1607, 1610, 1605, 1610, 1607, 1600, 1600, 1600, 1591,
+    1609, 1591, 1610, 1593, 1609, 1593, 1610, 1594, 1609, 1594, 1610, 1587, 1609, 1587, 1610, 1588, 1609, 1588, 1610,
+    1581, 1609, 1581, 1610, 1580, 1609, 1580, 1610, 1582, 1609, 1582, 1610, 1589, 1609, 1589, 1610, 1590, 1609, 1590,
+    1610, 1588, 1580, 1588, 1581, 1588, 1582, 1588, 1605, 1588, 1585, 1587, 1585, 1589, 1585, 1590, 1585, 1591, 1609,
+    1591, 1610, 1593, 1609, 1593, 1610, 1594, 1609, 1594, 1610, 1587, 1609, 1587, 1610, 1588, 1609, 1588, 1610, 1581,
+    1609, 1581, 1610, 1580, 1609, 1580, 1610, 1582, 1609, 1582, 1610, 1589, 1609, 1589, 1610, 1590, 1609, 1590, 1610,
+    1588, 1580, 1588, 1581, 1588, 1582, 1588, 1605, 1588, 1585, 1587, 1585, 1589, 1585, 1590, 1585, 1588, 1580, 1588,
+    1581, 1588, 1582, 1588, 1605, 1587, 1607, 1588, 1607, 1591, 1605, 1587, 1580, 1587, 1581, 1587, 1582, 1588, 1580,
+    1588, 1581, 1588, 1582, 1591, 1605, 1592, 1605, 1575, 1575, 1578, 1580, 1605, 1578, 1581, 1580, 1578, 1581, 1580,
+    1578, 1581, 1605, 1578, 1582, 1605, 1578, 1605, 1580, 1578, 1605, 1581, 1578, 1605, 1582, 1580, 1605, 1581, 1580,
+    1605, 1581, 1581, 1605, 1610, 1581, 1605, 1609, 1587, 1581, 1580, 1587, 1580, 1581, 1587, 1580, 1609, 1587, 1605,
+    1581, 1587, 1605, 1581, 1587, 1605, 1580, 1587, 1605, 1605, 1587, 1605, 1605, 1589, 1581, 1581, 1589, 1581, 1581,
+    1589, 1605, 1605, 1588, 1581, 1605, 1588, 1581, 1605, 1588, 1580, 1610, 1588, 1605, 1582, 1588, 1605, 1582, 1588,
+    1605, 1605, 1588, 1605, 1605, 1590, 1581, 1609, 1590, 1582, 1605, 1590, 1582, 1605, 1591, 1605, 1581, 1591, 1605,
+    1581, 1591, 1605, 1605, 1591, 1605, 1610, 1593, 1580, 1605, 1593, 1605, 1605, 1593, 1605, 1605, 1593, 1605, 1609,
+    1594, 1605, 1605, 1594, 1605, 1610, 1594, 1605, 1609, 1601, 1582, 1605, 1601, 1582, 1605, 1602, 1605, 1581, 1602,
+    1605, 1605, 1604, 1581, 1605, 1604, 1581, 1610, 1604, 1581, 1609, 1604, 1580, 1580, 1604, 1580, 1580, 1604, 1582,
+    1605, 1604, 1582, 1605, 1604, 1605, 1581, 1604, 1605, 1581, 1605, 1581, 1580, 1605, 1581, 1605, 1605, 1581, 1610,
+    1605, 1580, 1581, 1605, 1580, 1605, 1605, 1582, 1580, 1605, 1582, 1605, 1605, 1580, 1582, 1607, 1605, 1580, 1607,
+    1605, 1605, 1606, 1581, 1605, 1606, 1581, 1609, 1606, 1580, 1605, 1606, 1580, 1605, 1606, 1580, 1609, 1606, 1605,
+    1610, 1606, 1605, 1609, 1610, 1605, 1605, 1610, 1605, 1605, 1576, 1582, 1610, 1578, 1580, 1610, 1578, 1580, 1609,
+    1578, 1582, 1610, 1578, 1582, 1609, 1578, 1605, 1610, 1578, 1605, 1609, 1580, 1605, 1610, 1580, 1581, 1609, 1580,
+    1605, 1609, 1587, 1582, 1609, 1589, 1581, 1610, 1588, 1581, 1610, 1590, 1581, 1610, 1604, 1580, 1610, 1604, 1605,
+    1610, 1610, 1581, 1610, 1610, 1580, 1610, 1610, 1605, 1610, 1605, 1605, 1610, 1602, 1605, 1610, 1606, 1581, 1610,
+    1602, 1605, 1581, 1604, 1581, 1605, 1593, 1605, 1610, 1603, 1605, 1610, 1606, 1580, 1581, 1605, 1582, 1610, 1604,
+    1580, 1605, 1603, 1605, 1605, 1604, 1580, 1605, 1606, 1580, 1581, 1580, 1581, 1610, 1581, 1580, 1610, 1605, 1580,
+    1610, 1601, 1605, 1610, 1576, 1581, 1610, 1603, 1605, 1605, 1593, 1580, 1605, 1589, 1605, 1605, 1587, 1582, 1610,
+    1606, 1580, 1610, 1589, 1604, 1746, 1602, 1604, 1746, 1575, 1604, 1604, 1607, 1575, 1603, 1576, 1585, 1605, 1581,
+    1605, 1583, 1589, 1604, 1593, 1605, 1585, 1587, 1608, 1604, 1593, 1604, 1610, 1607, 1608, 1587, 1604, 1605, 1589,
+    1604, 1609, 1589, 1604, 1609, 32, 1575, 1604, 1604, 1607, 32, 1593, 1604, 1610, 1607, 32, 1608, 1587, 1604, 1605,
+    1580, 1604, 32, 1580, 1604, 1575, 1604, 1607, 1585, 1740, 1575, 1604, 44, 12289, 12290, 58, 59, 33, 63, 12310,
+    12311, 46, 46, 46, 46, 46, 8212, 8211, 95, 95, 40, 41, 123, 125, 12308, 12309, 12304, 12305, 12298, 12299, 12296,
+    12297, 12300, 12301, 12302, 12303, 91, 93, 32, 32, 32, 32, 95, 95, 95, 44, 12289, 46, 59, 58, 63, 33, 8212, 40, 41,
+    123, 125, 12308, 12309, 35, 38, 42, 43, 45, 60, 62, 61, 92, 36, 37, 64, 32, 1600, 32, 32, 32, 1600, 32, 1600, 32,
+    1600, 32, 1600, 32, 1600, 1569, 1575, 1575, 1575, 1575, 1608, 1608, 1575, 1575, 1610, 1610, 1610, 1610, 1575, 1575,
+    1576, 1576, 1576, 1576, 1577, 1577, 1578, 1578, 1578, 1578, 1579, 1579, 1579, 1579, 1580, 1580, 1580, 1580, 1581,
+    1581, 1581, 1581, 1582, 1582, 1582, 1582, 1583, 1583, 1584, 1584, 1585, 1585, 1586, 1586, 1587, 1587, 1587, 1587,
+    1588, 1588, 1588, 1588, 1589, 1589, 1589, 1589, 1590, 1590, 1590, 1590, 1591, 1591, 1591, 1591, 1592, 1592, 1592,
+    1592, 1593, 1593, 1593, 1593, 1594, 1594, 1594, 1594, 1601, 1601, 1601, 1601, 1602, 1602, 1602, 1602, 1603, 1603,
+    1603, 1603, 1604, 1604, 1604, 1604, 1605, 1605, 1605, 1605, 1606, 1606, 1606, 1606, 1607, 1607, 1607, 1607, 1608,
+    1608, 1609, 1609, 1610, 1610, 1610, 1610, 1604, 1575, 1604, 1575, 1604, 1575, 1604, 1575, 1604, 1575, 1604, 1575,
+    1604, 1575, 1604, 1575, 33, 34, 35, 36, 37, 38, 39, 40, 41, 42, 43, 44, 45, 46, 47, 48, 49, 50, 51, 52, 53, 54, 55,
+    56, 57, 58, 59, 60, 61, 62, 63, 64, 65, 66, 67, 68, 69, 70, 71, 72, 73, 74, 75, 76, 77, 78, 79, 80, 81, 82, 83, 84,
+    85, 86, 87, 88, 89, 90, 91, 92, 93, 94, 95, 96, 97, 98, 99, 100, 101, 102, 103, 104, 105, 106, 107, 108, 109, 110,
+    111, 112, 113, 114, 115, 116, 117, 118, 119, 120, 121, 122, 123, 124, 125, 126, 10629, 10630, 12290, 12300, 12301,
+    12289, 12539, 12530, 12449, 12451, 12453, 12455, 12457, 12515, 12517, 12519, 12483, 12540, 12450, 12452, 12454,
+    12456, 12458, 12459, 12461, 12463, 12465, 12467, 12469, 12471, 12473, 12475, 12477, 12479, 12481, 12484, 12486,
+    12488, 12490, 12491, 12492, 12493, 12494, 12495, 12498, 12501, 12504, 12507, 12510, 12511, 12512, 12513, 12514,
+    12516, 12518, 12520, 12521, 12522, 12523, 12524, 12525, 12527, 12531, 4448, 4352, 4353, 4522, 4354, 4524, 4525,
+    4355, 4356, 4357, 4528, 4529, 4530, 4531, 4532, 4533, 4378, 4358, 4359, 4360, 4385, 4361, 4362, 4363, 4364, 4365,
+    4366, 4367, 4368, 4369, 4370, 4449, 4450, 4451, 4452, 4453, 4454, 4455, 4456, 4457, 4458, 4459, 4460, 4461, 4462,
+    4463, 4464, 4465, 4466, 4467, 4468, 4469, 162, 163, 172, 32, 166, 165, 8361, 9474, 8592, 8593, 8594, 8595, 9632,
+    9675, 720, 721, 230, 665, 595, 675, 43878, 677, 676, 598, 599, 7569, 600, 606, 681, 612, 610, 608, 667, 295, 668,
+    615, 644, 682, 683, 620, 122628, 42894, 622, 122629, 654, 122630, 248, 630, 631, 113, 634, 122632, 637, 638, 640,
+    680, 678, 43879, 679, 648, 11377, 655, 673, 674, 664, 448, 449, 450, 122634, 122654, 69785, 69787, 69797, 69937,
+    69927, 69938, 69927, 70471, 70462, 70471, 70487, 70841, 70842, 70841, 70832, 70841, 70845, 71096, 71087, 71097,
+    71087, 71989, 71984, 119127, 119128, 119128, 119128, 119128, 119128, 119128, 119225, 119226, 119225, 119226, 119225,
+    119226, 65, 66, 67, 68, 69, 70, 71, 72, 73, 74, 75, 76, 77, 78, 79, 80, 81, 82, 83, 84, 85, 86, 87, 88, 89, 90, 97,
+    98, 99, 100, 101, 102, 103, 104, 105, 106, 107, 108, 109, 110, 111, 112, 113, 114, 115, 116, 117, 118, 119, 120,
+    121, 122, 65, 66, 67, 68, 69, 70, 71, 72, 73, 74, 75, 76, 77, 78, 79, 80, 81, 82, 83, 84, 85, 86, 87, 88, 89, 90,
+    97, 98, 99, 100, 101, 102, 103, 105, 106, 107, 108, 109, 110, 111, 112, 113, 114, 115, 116, 117, 118, 119, 120, 121,
+    122, 65, 66, 67, 68, 69, 70, 71, 72, 73, 74, 75, 76, 77, 78, 79, 80, 81, 82, 83, 84, 85, 86, 87, 88, 89, 90, 97, 98,
+    99, 100, 101, 102, 103, 104, 105, 106, 107, 108, 109, 110, 111, 112, 113, 114, 115, 116, 117, 118, 119, 120, 121,
+    122, 65, 67, 68, 71, 74, 75, 78, 79, 80, 81, 83, 84, 85, 86, 87, 88, 89, 90, 97, 98, 99, 100, 102, 104, 105, 106,
+    107, 108, 109, 110, 112, 113, 114, 115, 116, 117, 118, 119, 120, 121, 122, 65, 66, 67, 68, 69, 70, 71, 72, 73, 74,
+    75, 76, 77, 78, 79, 80, 81, 82, 83, 84, 85, 86, 87, 88, 89, 90, 97, 98, 99, 100, 101, 102, 103, 104, 105, 106, 107,
+    108, 109, 110, 111, 112, 113, 114, 115, 116, 117, 118, 119, 120, 121, 122, 65, 66, 68, 69, 70, 71, 74, 75, 76, 77,
+    78, 79, 80, 81, 83, 84, 85, 86, 87, 88, 89, 97, 98, 99, 100, 101, 102, 103, 104, 105, 106, 107, 108, 109, 110, 111,
+    112, 113, 114, 115, 116, 117, 118, 119, 120, 121, 122, 65, 66, 68, 69, 70, 71, 73, 74, 75, 76, 77, 79, 83, 84, 85,
+    86, 87, 88, 89, 97, 98, 99, 100, 101, 102, 103, 104, 105, 106, 107, 108, 109, 110, 111, 112, 113, 114, 115, 116,
+    117, 118, 119, 120, 121, 122, 65, 66, 67, 68, 69, 70, 71, 72, 73, 74, 75, 76, 77, 78, 79, 80, 81, 82, 83, 84, 85,
+    86, 87, 88, 89, 90, 97, 98, 99, 100, 101, 102, 103, 104, 105, 106, 107, 108, 109, 110, 111, 112, 113, 114, 115, 116,
+    117, 118, 119, 120, 121, 122, 65, 66, 67, 68, 69, 70, 71, 72, 73, 74, 75, 76, 77, 78, 79, 80, 81, 82, 83, 84, 85,
+    86, 87, 88, 89, 90, 97, 98, 99, 100, 101, 102, 103, 104, 105, 106, 107, 108, 109, 110, 111, 112, 113, 114, 115, 116,
+    117, 118, 119, 120, 121, 122, 65, 66, 67, 68, 69, 70, 71, 72, 73, 74, 75, 76, 77, 78, 79, 80, 81, 82, 83, 84, 85,
+    86, 87, 88, 89, 90, 97, 98, 99, 100, 101, 102, 103, 104, 105, 106, 107, 108, 109, 110, 111, 112, 113, 114, 115, 116,
+    117, 118, 119, 120, 121, 122, 65, 66, 67, 68, 69, 70, 71, 72, 73, 74, 75, 76, 77, 78, 79, 80, 81, 82, 83, 84, 85,
+    86, 87, 88, 89, 90, 97, 98, 99, 100, 101, 102, 103, 104, 105, 106, 107, 108, 109, 110, 111, 112, 113, 114, 115, 116,
+    117, 118, 119, 120, 121, 122, 65, 66, 67, 68, 69, 70, 71, 72, 73, 74, 75, 76, 77, 78, 79, 80, 81, 82, 83, 84, 85,
+    86, 87, 88, 89, 90, 97, 98, 99, 100, 101, 102, 103, 104, 105, 106, 107, 108, 109, 110, 111, 112, 113, 114, 115, 116,
+    117, 118, 119, 120, 121, 122, 65, 66, 67, 68, 69, 70, 71, 72, 73, 74, 75, 76, 77, 78, 79, 80, 81, 82, 83, 84, 85,
+    86, 87, 88, 89, 90, 97, 98, 99, 100, 101, 102, 103, 104, 105, 106, 107, 108, 109, 110, 111, 112, 113, 114, 115, 116,
+    117, 118, 119, 120, 121, 122, 305, 567, 913, 914, 915, 916, 917, 918, 919, 920, 921, 922, 923, 924, 925, 926, 927,
+    928, 929, 920, 931, 932, 933, 934, 935, 936, 937, 8711, 945, 946, 947, 948, 949, 950, 951, 952, 953, 954, 955, 956,
+    957, 958, 959, 960, 961, 962, 963, 964, 965, 966, 967, 968, 969, 8706, 949, 952, 954, 966, 961, 960, 913, 914, 915,
+    916, 917, 918, 919, 920, 921, 922, 923, 924, 925, 926, 927, 928, 929, 920, 931, 932, 933, 934, 935, 936, 937, 8711,
+    945, 946, 947, 948, 949, 950, 951, 952, 953, 954, 955, 956, 957, 958, 959, 960, 961, 962, 963, 964, 965, 966, 967,
+    968, 969, 8706, 949, 952, 954, 966, 961, 960, 913, 914, 915, 916, 917, 918, 919, 920, 921, 922, 923, 924, 925, 926,
+    927, 928, 929, 920, 931, 932, 933, 934, 935, 936, 937, 8711, 945, 946, 947, 948, 949, 950, 951, 952, 953, 954, 955,
+    956, 957, 958, 959, 960, 961, 962, 963, 964, 965, 966, 967, 968, 969, 8706, 949, 952, 954, 966, 961, 960, 913, 914,
+    915, 916, 917, 918, 919, 920, 921, 922, 923, 924, 925, 926, 927, 928, 929, 920, 931, 932, 933, 934, 935, 936, 937,
+    8711, 945, 946, 947, 948, 949, 950, 951, 952, 953, 954, 955, 956, 957, 958, 959, 960, 961, 962, 963, 964, 965, 966,
+    967, 968, 969, 8706, 949, 952, 954, 966, 961, 960, 913, 914, 915, 916, 917, 918, 919, 920, 921, 922, 923, 924, 925,
+    926, 927, 928, 929, 920, 931, 932, 933, 934, 935, 936, 937, 8711, 945, 946, 947, 948, 949, 950, 951, 952, 953, 954,
+    955, 956, 957, 958, 959, 960, 961, 962, 963, 964, 965, 966, 967, 968, 969, 8706, 949, 952, 954, 966, 961, 960, 988,
+    989, 48, 49, 50, 51, 52, 53, 54, 55, 56, 57, 48, 49, 50, 51, 52, 53, 54, 55, 56, 57, 48, 49, 50, 51, 52, 53, 54, 55,
+    56, 57, 48, 49, 50, 51, 52, 53, 54, 55, 56, 57, 48, 49, 50, 51, 52, 53, 54, 55, 56, 57, 1575, 1576, 1580, 1583,
+    1608, 1586, 1581, 1591, 1610, 1603, 1604, 1605, 1606, 1587, 1593, 1601, 1589, 1602, 1585, 1588, 1578, 1579, 1582,
+    1584, 1590, 1592, 1594, 1646, 1722, 1697, 1647, 1576, 1580, 1607, 1581, 1610, 1603, 1604, 1605, 1606, 1587, 1593,
+    1601, 1589, 1602, 1588, 1578, 1579, 1582, 1590, 1594, 1580, 1581, 1610, 1604, 1606, 1587, 1593, 1589, 1602, 1588,
+    1582, 1590, 1594, 1722, 1647, 1576, 1580, 1607, 1581, 1591, 1610, 1603, 1605, 1606, 1587, 1593, 1601, 1589, 1602,
+    1588, 1578, 1579, 1582, 1590, 1592, 1594, 1646, 1697, 1575, 1576, 1580, 1583, 1607, 1608, 1586, 1581, 1591, 1610,
+    1604, 1605, 1606, 1587, 1593, 1601, 1589, 1602, 1585, 1588, 1578, 1579, 1582, 1584, 1590, 1592, 1594, 1576, 1580,
+    1583, 1608, 1586, 1581, 1591, 1610, 1604, 1605, 1606, 1587, 1593, 1601, 1589, 1602, 1585, 1588, 1578, 1579, 1582,
+    1584, 1590, 1592, 1594, 48, 46, 48, 44, 49, 44, 50, 44, 51, 44, 52, 44, 53, 44, 54, 44, 55, 44, 56, 44, 57, 44, 40,
+    65, 41, 40, 66, 41, 40, 67, 41, 40, 68, 41, 40, 69, 41, 40, 70, 41, 40, 71, 41, 40, 72, 41, 40, 73, 41, 40, 74, 41,
+    40, 75, 41, 40, 76, 41, 40, 77, 41, 40, 78, 41, 40, 79, 41, 40, 80, 41, 40, 81, 41, 40, 82, 41, 40, 83, 41, 40, 84,
+    41, 40, 85, 41, 40, 86, 41, 40, 87, 41, 40, 88, 41, 40, 89, 41, 40, 90, 41, 12308, 83, 12309, 67, 82, 67, 68, 87,
+    90, 65, 66, 67, 68, 69, 70, 71, 72, 73, 74, 75, 76, 77, 78, 79, 80, 81, 82, 83, 84, 85, 86, 87, 88, 89, 90, 72, 86,
+    77, 86, 83, 68, 83, 83, 80, 80, 86, 87, 67, 77, 67, 77, 68, 77, 82, 68, 74, 12411, 12363, 12467, 12467, 12469,
+    25163, 23383, 21452, 12486, 20108, 22810, 35299, 22825, 20132, 26144, 28961, 26009, 21069, 24460, 20877, 26032,
+    21021, 32066, 29983, 36009, 22768, 21561, 28436, 25237, 25429, 19968, 19977, 36938, 24038, 20013, 21491, 25351,
+    36208, 25171, 31105, 31354, 21512, 28288, 26377, 26376, 30003, 21106, 21942, 37197, 12308, 26412, 12309, 12308,
+    19977, 12309, 12308, 20108, 12309, 12308, 23433, 12309, 12308, 28857, 12309, 12308, 25171, 12309, 12308, 30423,
+    12309, 12308, 21213, 12309, 12308, 25943, 12309, 24471, 21487, 48, 49, 50, 51, 52, 53, 54, 55, 56, 57, 20029, 20024,
+    20033, 131362, 20320, 20398, 20411, 20482, 20602, 20633, 20711, 20687, 13470, 132666, 20813, 20820, 20836, 20855,
+    132380, 13497, 20839, 20877, 132427, 20887, 20900, 20172, 20908, 20917, 168415, 20981, 20995, 13535, 21051, 21062,
+    21106, 21111, 13589, 21191, 21193, 21220, 21242, 21253, 21254, 21271, 21321, 21329, 21338, 21363, 21373, 21375,
+    21375, 21375, 133676, 28784, 21450, 21471, 133987, 21483, 21489, 21510, 21662, 21560, 21576, 21608, 21666, 21750,
+    21776, 21843, 21859, 21892, 21892, 21913, 21931, 21939, 21954, 22294, 22022, 22295, 22097, 22132, 20999, 22766,
+    22478, 22516, 22541, 22411, 22578, 22577, 22700, 136420, 22770, 22775, 22790, 22810, 22818, 22882, 136872, 136938,
+    23020, 23067, 23079, 23000, 23142, 14062, 14076, 23304, 23358, 23358, 137672, 23491, 23512, 23527, 23539, 138008,
+    23551, 23558, 24403, 23586, 14209, 23648, 23662, 23744, 23693, 138724, 23875, 138726, 23918, 23915, 23932, 24033,
+    24034, 14383, 24061, 24104, 24125, 24169, 14434, 139651, 14460, 24240, 24243, 24246, 24266, 172946, 24318, 140081,
+    140081, 33281, 24354, 24354, 14535, 144056, 156122, 24418, 24427, 14563, 24474, 24525, 24535, 24569, 24705, 14650,
+    14620, 24724, 141012, 24775, 24904, 24908, 24910, 24908, 24954, 24974, 25010, 24996, 25007, 25054, 25074, 25078,
+    25104, 25115, 25181, 25265, 25300, 25424, 142092, 25405, 25340, 25448, 25475, 25572, 142321, 25634, 25541, 25513,
+    14894, 25705, 25726, 25757, 25719, 14956, 25935, 25964, 143370, 26083, 26360, 26185, 15129, 26257, 15112, 15076,
+    20882, 20885, 26368, 26268, 32941, 17369, 26391, 26395, 26401, 26462, 26451, 144323, 15177, 26618, 26501, 26706,
+    26757, 144493, 26766, 26655, 26900, 15261, 26946, 27043, 27114, 27304, 145059, 27355, 15384, 27425, 145575, 27476,
+    15438, 27506, 27551, 27578, 27579, 146061, 138507, 146170, 27726, 146620, 27839, 27853, 27751, 27926, 27966, 28023,
+    27969, 28009, 28024, 28037, 146718, 27956, 28207, 28270, 15667, 28363, 28359, 147153, 28153, 28526, 147294, 147342,
+    28614, 28729, 28702, 28699, 15766, 28746, 28797, 28791, 28845, 132389, 28997, 148067, 29084, 148395, 29224, 29237,
+    29264, 149000, 29312, 29333, 149301, 149524, 29562, 29579, 16044, 29605, 16056, 16056, 29767, 29788, 29809, 29829,
+    29898, 16155, 29988, 150582, 30014, 150674, 30064, 139679, 30224, 151457, 151480, 151620, 16380, 16392, 30452,
+    151795, 151794, 151833, 151859, 30494, 30495, 30495, 30538, 16441, 30603, 16454, 16534, 152605, 30798, 30860, 30924,
+    16611, 153126, 31062, 153242, 153285, 31119, 31211, 16687, 31296, 31306, 31311, 153980, 154279, 154279, 31470,
+    16898, 154539, 31686, 31689, 16935, 154752, 31954, 17056, 31976, 31971, 32000, 155526, 32099, 17153, 32199, 32258,
+    32325, 17204, 156200, 156231, 17241, 156377, 32634, 156478, 32661, 32762, 32773, 156890, 156963, 32864, 157096,
+    32880, 144223, 17365, 32946, 33027, 17419, 33086, 23221, 157607, 157621, 144275, 144284, 33281, 33284, 36766, 17515,
+    33425, 33419, 33437, 21171, 33457, 33459, 33469, 33510, 158524, 33509, 33565, 33635, 33709, 33571, 33725, 33767,
+    33879, 33619, 33738, 33740, 33756, 158774, 159083, 158933, 17707, 34033, 34035, 34070, 160714, 34148, 159532, 17757,
+    17761, 159665, 159954, 17771, 34384, 34396, 34407, 34409, 34473, 34440, 34574, 34530, 34681, 34600, 34667, 34694,
+    17879, 34785, 34817, 17913, 34912, 34915, 161383, 35031, 35038, 17973, 35066, 13499, 161966, 162150, 18110, 18119,
+    35488, 35565, 35722, 35925, 162984, 36011, 36033, 36123, 36215, 163631, 133124, 36299, 36284, 36336, 133342, 36564,
+    36664, 165330, 165357, 37012, 37105, 37137, 165678, 37147, 37432, 37591, 37592, 37500, 37881, 37909, 166906, 38283,
+    18837, 38327, 167287, 18918, 38595, 23986, 38691, 168261, 168474, 19054, 19062, 38880, 168970, 19122, 169110, 38923,
+    38923, 38953, 169398, 39138, 19251, 39209, 39335, 39362, 39422, 19406, 170800, 39698, 40000, 40189, 19662, 19693,
+    40295, 172238, 19704, 172293, 172558, 172689, 40635, 19798, 40697, 40702, 40709, 40719, 40726, 40763, 173568,
+};
@@ -35,8 +35,11 @@ typedef struct {
     const unsigned short flags;
 } _PyUnicode_TypeRecord;
 
+#include "strip_accents_db.h"
 #include "unicodetype_db.h"
 
+static_assert(STRIP_ACCENTS_MAX_LENGTH <= UNICODE_MAX_STRIP_ACCENTS, "strip_accents_db.h is outdated");
+
 static inline const _PyUnicode_TypeRecord* gettyperecord(uint32_t code)
 {
     unsigned int index;
@@ -72,3 +75,68 @@ uint32_t UnicodeDefaultProcess(uint32_t ch)
     }
     return ch + static_cast<uint32_t>(ctype->lower);
 }
+
+/* Hangul syllables are decomposed algorithmically, see Unicode 3.12 Conjoining Jamo Behavior */
+#define HANGUL_S_BASE 0xAC00
+#define HANGUL_L_BASE 0x1100
+#define HANGUL_V_BASE 0x1161
+#define HANGUL_T_BASE 0x11A7
+#define HANGUL_V_COUNT 21
+#define HANGUL_T_COUNT 28
+#define HANGUL_S_COUNT 11172
+
+int UnicodeStripAccents(uint32_t ch, uint32_t* res)
+{
+    if (ch - HANGUL_S_BASE < HANGUL_S_COUNT) {
+        uint32_t index = ch - HANGUL_S_BASE;
+        res[0] = HANGUL_L_BASE + index / (HANGUL_V_COUNT * HANGUL_T_COUNT);
+        res[1] = HANGUL_V_BASE + (index % (HANGUL_V_COUNT * HANGUL_T_COUNT)) / HANGUL_T_COUNT;
+        if (index % HANGUL_T_COUNT == 0) return 2;
+
+        res[2] = HANGUL_T_BASE + index % HANGUL_T_COUNT;
+        return 3;
+    }
+
+    const uint32_t* keys_end = std::end(strip_accents_keys);
+    const uint32_t* key = std::lower_bound(std::begin(strip_accents_keys), keys_end, ch);
+    if (key == keys_end || *key != ch) {
+        res[0] = ch;
+        return 1;
+    }
+
+    uint32_t index = strip_accents_index[key - std::begin(strip_accents_keys)];
+    int len = static_cast<int>(index & 0x1F);
+    std::copy(strip_accents_data + (index >> 5), strip_accents_data + (index >> 5) + len, res);
+    return len;
+}
+
+int UnicodeCaseFold(uint32_t ch, uint32_t* res)
+{
+    /* same as _PyUnicode_ToFoldedFull */
+    const _PyUnicode_TypeRecord* ctype = gettyperecord(ch);
+
+    if (ctype->flags & EXTENDED_CASE_MASK) {
+        int index = ctype->lower & 0xFFFF;
+        int len = ctype->lower >> 24;
+        if ((ctype->lower >> 20) & 7) {
+            index += len;
+            len = (ctype->lower >> 20) & 7;
+        }
+
+        std::copy(_PyUnicode_ExtendedCase + index, _PyUnicode_ExtendedCase + index + len, res);
+        return len;
+    }
+
+    res[0] = ch + static_cast<uint32_t>(ctype->lower);
+    return 1;
+}
+
+bool UnicodeIsAlnum(uint32_t ch)
+{
+    return is_alnum(gettyperecord(ch)->flags);
+}
+
+bool UnicodeIsSpace(uint32_t ch)
+{
+    return gettyperecord(ch)->flags & SPACE_MASK;
+}
@@ -8,12 +8,24 @@
 #include <cmath>
 #include <cstddef>
 #include <cwctype>
+#include <iterator>
 #include <limits>
 #include <stdint.h>
+#include <utility>
 #include <vector>
 
 uint32_t UnicodeDefaultProcess(uint32_t ch);
 
+/* maximum amount of characters a single character is replaced with by UnicodeStripAccents */
+#define UNICODE_MAX_STRIP_ACCENTS 18
+/* maximum amount of characters a single character is replaced with by UnicodeCaseFold */
+#define UNICODE_MAX_CASE_FOLD 3
+
+int UnicodeStripAccents(uint32_t ch, uint32_t* res);
+int UnicodeCaseFold(uint32_t ch, uint32_t* res);
+bool UnicodeIsAlnum(uint32_t ch);
+bool UnicodeIsSpace(uint32_t ch);
+
 /**
  * @brief removes any non alphanumeric characters, trim whitespaces from
  * beginning/end and lowercase the string. Currently this only supports
@@ -87,3 +99,104 @@ std::vector<CharT> default_process_copy(CharT* str_, int64_t len_)
     str.resize(len);
     return str;
 }
+
+/**
+ * @brief steps of a utils.Processor. Independent of the order they are passed in,
+ * the steps are always applied in the order they are listed here
+ */
+enum ProcessorStep : uint32_t {
+    PROCESSOR_STRIP_ACCENTS = 1 << 0,
+    PROCESSOR_CASEFOLD = 1 << 1,
+    PROCESSOR_LOWERCASE_ASCII = 1 << 2,
+    PROCESSOR_REMOVE_PUNCTUATION = 1 << 3,
+    PROCESSOR_COLLAPSE_WHITESPACE = 1 << 4,
+    PROCESSOR_SORT_TOKENS = 1 << 5
+};
+
+/* amount of different combinations of processor steps */
+#define PROCESSOR_STEP_COMBINATIONS 64
+
+/* split the string on whitespaces and join the tokens with a single space */
+static inline void processor_join_tokens(std::vector<uint32_t>& str, bool sort)
+{
+    std::vector<std::pair<size_t, size_t>> tokens;
+    size_t start = 0;
+    for (size_t i = 0; i <= str.size(); ++i) {
+        if (i != str.size() && !UnicodeIsSpace(str[i])) continue;
+
+        if (i != start) tokens.emplace_back(start, i);
+        start = i + 1;
+    }
+
+    if (sort)
+        std::sort(tokens.begin(), tokens.end(), [&](const auto& a, const auto& b) {
+            return std::lexicographical_compare(str.begin() + static_cast<ptrdiff_t>(a.first),
+                                                str.begin() + static_cast<ptrdiff_t>(a.second),
+                                                str.begin() + static_cast<ptrdiff_t>(b.first),
+                                                str.begin() + static_cast<ptrdiff_t>(b.second));
+        });
+
+    std::vector<uint32_t> joined;
+    joined.reserve(str.size());
+    for (const auto& token : tokens) {
+        if (!joined.empty()) joined.push_back(' ');
+        joined.insert(joined.end(), str.begin() + static_cast<ptrdiff_t>(token.first),
+                      str.begin() + static_cast<ptrdiff_t>(token.second));
+    }
+    str.swap(joined);
+}
+
+/**
+ * @brief apply the steps of a utils.Processor to a string. The characters of the
+ * string are transformed one at a time, while the tokens are joined afterwards
+ *
+ * @tparam CharT char type of the string
+ *
+ * @param steps combination of ProcessorStep
+ * @param str string to process
+ * @param len length of the string
+ * @param out processed string
+ */
+template <typename CharT>
+void processor_apply(uint32_t steps, const CharT* str, int64_t len, std::vector<uint32_t>& out)
+{
+    out.clear();
+    out.reserve(static_cast<size_t>(len));
+
+    uint32_t stripped[UNICODE_MAX_STRIP_ACCENTS];
+    uint32_t folded[UNICODE_MAX_CASE_FOLD];
+    for (int64_t i = 0; i < len; ++i) {
+        uint32_t ch = static_cast<uint32_t>(str[i]);
+
+        /* ascii characters are never changed by strip accents and case folding only lowercases them */
+        if (ch < 128) {
+            if ((steps & (PROCESSOR_CASEFOLD | PROCESSOR_LOWERCASE_ASCII)) && ch >= 'A' && ch <= 'Z') ch += 32;
+            if ((steps & PROCESSOR_REMOVE_PUNCTUATION) && !UnicodeIsAlnum(ch) && !UnicodeIsSpace(ch)) ch = ' ';
+            out.push_back(ch);
+            continue;
+        }
+
+        int stripped_len = 1;
+        stripped[0] = ch;
+        if (steps & PROCESSOR_STRIP_ACCENTS) stripped_len = UnicodeStripAccents(ch, stripped);
+
+        for (int j = 0; j < stripped_len; ++j) {
+            int folded_len = 1;
+            folded[0] = stripped[j];
+            if (steps & PROCESSOR_CASEFOLD)
+                folded_len = UnicodeCaseFold(stripped[j], folded);
+            else if ((steps & PROCESSOR_LOWERCASE_ASCII) && stripped[j] >= 'A' && stripped[j] <= 'Z')
+                folded[0] += 32;
+
+            for (int k = 0; k < folded_len; ++k) {
+                if ((steps & PROCESSOR_REMOVE_PUNCTUATION) && !UnicodeIsAlnum(folded[k]) &&
+                    !UnicodeIsSpace(folded[k]))
+                    folded[k] = ' ';
+                out.push_back(folded[k]);
+            }
+        }
+    }
+
+    if (steps & (PROCESSOR_COLLAPSE_WHITESPACE | PROCESSOR_SORT_TOKENS))
+        processor_join_tokens(out, steps & PROCESSOR_SORT_TOKENS);
+}
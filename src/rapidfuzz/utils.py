@@ -8,58 +8,70 @@ import os
 
 from rapidfuzz._feature_detector import AVX2, SSE2, supports
 
-__all__ = ["default_process"]
+__all__ = ["Processor", "default_process", "default_process_batch"]
 
 _impl = os.environ.get("RAPIDFUZZ_IMPLEMENTATION")
 if _impl == "cpp":
     imported = False
     if supports(AVX2):
         with contextlib.suppress(ImportError):
-            from rapidfuzz.utils_cpp_avx2 import (
-                default_process,  # pyright: ignore[reportMissingImports]
+            from rapidfuzz.utils_cpp_avx2 import (  # pyright: ignore[reportMissingImports]
+                Processor,
+                default_process,
+                default_process_batch,
             )
 
             imported = True
 
     if not imported and supports(SSE2):
         with contextlib.suppress(ImportError):
-            from rapidfuzz.utils_cpp_sse2 import (
-                default_process,  # pyright: ignore[reportMissingImports]
+            from rapidfuzz.utils_cpp_sse2 import (  # pyright: ignore[reportMissingImports]
+                Processor,
+                default_process,
+                default_process_batch,
             )
 
             imported = True
 
     if not imported:
-        from rapidfuzz.utils_cpp import (
-            default_process,  # pyright: ignore[reportMissingImports]
+        from rapidfuzz.utils_cpp import (  # pyright: ignore[reportMissingImports]
+            Processor,
+            default_process,
+            default_process_batch,
         )
 elif _impl == "python":
-    from rapidfuzz.utils_py import default_process
+    from rapidfuzz.utils_py import Processor, default_process, default_process_batch
 else:
     imported = False
     if supports(AVX2):
         with contextlib.suppress(ImportError):
-            from rapidfuzz.utils_cpp_avx2 import (
-                default_process,  # pyright: ignore[reportMissingImports]
+            from rapidfuzz.utils_cpp_avx2 import (  # pyright: ignore[reportMissingImports]
+                Processor,
+                default_process,
+                default_process_batch,
             )
 
             imported = True
 
     if not imported and supports(SSE2):
         with contextlib.suppress(ImportError):
-            from rapidfuzz.utils_cpp_sse2 import (
-                default_process,  # pyright: ignore[reportMissingImports]
+            from rapidfuzz.utils_cpp_sse2 import (  # pyright: ignore[reportMissingImports]
+                Processor,
+                default_process,
+                default_process_batch,
             )
 
             imported = True
 
     if not imported:
         with contextlib.suppress(ImportError):
-            from rapidfuzz.utils_cpp import (
-                default_process,  # pyright: ignore[reportMissingImports]
+            from rapidfuzz.utils_cpp import (  # pyright: ignore[reportMissingImports]
+                Processor,
+                default_process,
+                default_process_batch,
             )
 
             imported = True
 
     if not imported:
-        from rapidfuzz.utils_py import default_process
+        from rapidfuzz.utils_py import Processor, default_process, default_process_batch
@@ -3,9 +3,53 @@
 
 from __future__ import annotations
 
-from collections.abc import Hashable, Sequence
-from typing import TypeVar
+from collections.abc import Hashable, Iterable, Sequence
+from typing import TypeVar, overload
 
 _StringType = TypeVar("_StringType", bound=Sequence[Hashable])
 
 def default_process(sentence: _StringType) -> _StringType: ...
+
+try:
+    import numpy as np
+
+    @overload
+    def default_process_batch(sentences: np.ndarray, *, workers: int = 1) -> np.ndarray: ...
+    @overload
+    def default_process_batch(
+        sentences: Iterable[_StringType | None], *, workers: int = 1
+    ) -> list[_StringType | None]: ...
+
+except ImportError:
+    def default_process_batch(
+        sentences: Iterable[_StringType | None], *, workers: int = 1
+    ) -> list[_StringType | None]: ...
+
+class Processor:
+    @property
+    def strip_accents(self) -> bool: ...
+    @property
+    def casefold(self) -> bool: ...
+    @property
+    def lowercase_ascii(self) -> bool: ...
+    @property
+    def remove_punctuation(self) -> bool: ...
+    @property
+    def collapse_whitespace(self) -> bool: ...
+    @property
+    def sort_tokens(self) -> bool: ...
+    def __init__(
+        self,
+        *,
+        strip_accents: bool = False,
+        casefold: bool = False,
+        lowercase_ascii: bool = False,
+        remove_punctuation: bool = False,
+        collapse_whitespace: bool = False,
+        sort_tokens: bool = False,
+    ) -> None: ...
+    def __call__(self, sentence: str) -> str: ...
+    @overload
+    def batch(self, sentences: np.ndarray, *, workers: int = 1) -> np.ndarray: ...
+    @overload
+    def batch(self, sentences: Iterable[str | None], *, workers: int = 1) -> list[str | None]: ...
@@ -59,3 +59,78 @@ RF_String default_process_func(RF_String sentence)
 #undef X_ENUM
     }
 }
+
+template <typename CharT>
+static inline RF_String processor_copy(const std::vector<uint32_t>& str, RF_StringType kind)
+{
+    /* at least one character is allocated, so empty strings are not mistaken for None */
+    CharT* data = static_cast<CharT*>(malloc(std::max<size_t>(str.size(), 1) * sizeof(CharT)));
+    if (data == NULL) throw std::bad_alloc();
+
+    std::transform(str.begin(), str.end(), data, [](uint32_t ch) { return static_cast<CharT>(ch); });
+
+    RF_String result;
+    result.dtor = default_string_deinit;
+    result.kind = kind;
+    result.data = data;
+    result.length = static_cast<int64_t>(str.size());
+    result.context = nullptr;
+    return result;
+}
+
+static inline void processor_apply(uint32_t steps, const RF_String& sentence, std::vector<uint32_t>& out)
+{
+    switch (sentence.kind) {
+#define X_ENUM(KIND, TYPE)                                                                                   \
+    case KIND: return processor_apply(steps, static_cast<const TYPE*>(sentence.data), sentence.length, out);
+        LIST_OF_CASES()
+    default: throw std::logic_error("Reached end of control flow in processor_apply");
+#undef X_ENUM
+    }
+}
+
+/* apply the steps of a utils.Processor to a string. The result owns its buffer */
+static inline RF_String processor_func(uint32_t steps, const RF_String& sentence)
+{
+    std::vector<uint32_t> proc_str;
+    processor_apply(steps, sentence, proc_str);
+
+    /* use the smallest char type like Python does */
+    uint32_t max_char = proc_str.empty() ? 0 : *std::max_element(proc_str.begin(), proc_str.end());
+    if (max_char < 0x100) return processor_copy<uint8_t>(proc_str, RF_UINT8);
+    if (max_char < 0x10000) return processor_copy<uint16_t>(proc_str, RF_UINT16);
+    return processor_copy<uint32_t>(proc_str, RF_UINT32);
+}
+
+static inline PyObject* processor_impl(uint32_t steps, PyObject* sentence)
+{
+    if (!PyUnicode_Check(sentence)) throw PythonTypeError("sentence must be a str");
+
+    std::vector<uint32_t> proc_str;
+    processor_apply(steps, convert_string(sentence), proc_str);
+    return PyUnicode_FromKindAndData(PyUnicode_4BYTE_KIND, proc_str.data(), (Py_ssize_t)proc_str.size());
+}
+
+template <size_t Steps>
+static bool processor_preprocess(PyObject* sentence, RF_String* str)
+{
+    return PyExceptionHandler([&] {
+        if (!PyUnicode_Check(sentence)) throw PythonTypeError("sentence must be a str");
+
+        *str = processor_func(Steps, convert_string(sentence));
+    });
+}
+
+template <size_t... Steps>
+static inline std::array<RF_Preprocessor, sizeof...(Steps)> processor_contexts(std::index_sequence<Steps...>)
+{
+    return {{RF_Preprocessor{PREPROCESSOR_STRUCT_VERSION, processor_preprocess<Steps>}...}};
+}
+
+/* the RF_Preprocess callback receives no context, so every combination of steps has its own callback */
+static inline RF_Preprocessor* get_processor_context(uint32_t steps)
+{
+    static std::array<RF_Preprocessor, PROCESSOR_STEP_COMBINATIONS> contexts =
+        processor_contexts(std::make_index_sequence<PROCESSOR_STEP_COMBINATIONS>{});
+    return &contexts[steps];
+}
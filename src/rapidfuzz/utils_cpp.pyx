@@ -3,9 +3,12 @@
 
 from cpp_common cimport (
     CreateProcessorContext,
+    SetFuncAttrs,
     SetProcessorAttrs,
     conv_sequence,
 )
+from cpython.pycapsule cimport PyCapsule_New
+from libc.stdint cimport uint32_t
 from libcpp cimport bool
 
 from rapidfuzz cimport RF_Preprocessor, RF_String
@@ -19,12 +22,29 @@ cdef extern from "utils_cpp.hpp":
     object default_process_impl(object) except + nogil
     void validate_string(object py_str, const char* err) except +
     RF_String default_process_func(RF_String sentence) except +
+    object processor_impl(uint32_t steps, object sentence) except +
+    RF_Preprocessor* get_processor_context(uint32_t steps)
+
+    uint32_t PROCESSOR_STRIP_ACCENTS
+    uint32_t PROCESSOR_CASEFOLD
+    uint32_t PROCESSOR_LOWERCASE_ASCII
+    uint32_t PROCESSOR_REMOVE_PUNCTUATION
+    uint32_t PROCESSOR_COLLAPSE_WHITESPACE
+    uint32_t PROCESSOR_SORT_TOKENS
 
 def default_process(sentence):
     validate_string(sentence, "sentence must be a String")
     return default_process_impl(sentence)
 
 
+def default_process_batch(sentences, *, workers=1):
+    # the strings are processed by the thread pool of rapidfuzz.process
+    from rapidfuzz.process_cpp_impl import _default_process_batch
+
+    results = _default_process_batch(utils_py._batch_items(sentences), workers, default_process)
+    return utils_py._batch_result(sentences, results)
+
+
 cdef bool default_process_capi(sentence, RF_String* str_) except False:
     validate_string(sentence, "sentence must be a String")
     proc_str = conv_sequence(sentence)
@@ -38,5 +58,58 @@ cdef bool default_process_capi(sentence, RF_String* str_) except False:
     str_[0] = proc_str
     return True
 
+cdef class Processor:
+    cdef readonly bint strip_accents
+    cdef readonly bint casefold
+    cdef readonly bint lowercase_ascii
+    cdef readonly bint remove_punctuation
+    cdef readonly bint collapse_whitespace
+    cdef readonly bint sort_tokens
+    # combination of the steps used by rapidfuzz.process to preprocess choices in parallel
+    cdef readonly uint32_t _RF_ProcessorSteps
+    cdef readonly object _RF_Preprocess
+
+    def __init__(self, *, strip_accents=False, casefold=False, lowercase_ascii=False, remove_punctuation=False,
+                 collapse_whitespace=False, sort_tokens=False):
+        self.strip_accents = strip_accents
+        self.casefold = casefold
+        self.lowercase_ascii = lowercase_ascii
+        self.remove_punctuation = remove_punctuation
+        self.collapse_whitespace = collapse_whitespace
+        self.sort_tokens = sort_tokens
+
+        cdef uint32_t steps = 0
+        if strip_accents:
+            steps |= PROCESSOR_STRIP_ACCENTS
+        if casefold:
+            steps |= PROCESSOR_CASEFOLD
+        if lowercase_ascii:
+            steps |= PROCESSOR_LOWERCASE_ASCII
+        if remove_punctuation:
+            steps |= PROCESSOR_REMOVE_PUNCTUATION
+        if collapse_whitespace:
+            steps |= PROCESSOR_COLLAPSE_WHITESPACE
+        if sort_tokens:
+            steps |= PROCESSOR_SORT_TOKENS
+
+        self._RF_ProcessorSteps = steps
+        self._RF_Preprocess = PyCapsule_New(get_processor_context(steps), NULL, NULL)
+
+    def __call__(self, sentence):
+        return processor_impl(self._RF_ProcessorSteps, sentence)
+
+    def batch(self, sentences, *, workers=1):
+        # the strings are processed by the thread pool of rapidfuzz.process
+        from rapidfuzz.process_cpp_impl import _processor_batch
+
+        results = _processor_batch(utils_py._batch_items(sentences), workers, self)
+        return utils_py._batch_result(sentences, results)
+
+    def __repr__(self):
+        steps = ", ".join(f"{step}=True" for step in utils_py._PROCESSOR_STEPS if getattr(self, step))
+        return f"Processor({steps})"
+
+
 cdef RF_Preprocessor DefaultProcessContext = CreateProcessorContext(default_process_capi)
 SetProcessorAttrs(default_process, utils_py.default_process, &DefaultProcessContext)
+SetFuncAttrs(default_process_batch, utils_py.default_process_batch)
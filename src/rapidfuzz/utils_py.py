@@ -4,8 +4,25 @@
 from __future__ import annotations
 
 import re
+import sys
+import unicodedata
+
+from rapidfuzz._utils import is_none
 
 _alnum_regex = re.compile(r"(?ui)\W")
+# characters, which are neither alphanumeric nor whitespace
+_punctuation_regex = re.compile(r"[^\w\s]|_")
+_ascii_lowercase = str.maketrans("ABCDEFGHIJKLMNOPQRSTUVWXYZ", "abcdefghijklmnopqrstuvwxyz")
+
+# steps of a Processor in the order they are applied
+_PROCESSOR_STEPS = (
+    "strip_accents",
+    "casefold",
+    "lowercase_ascii",
+    "remove_punctuation",
+    "collapse_whitespace",
+    "sort_tokens",
+)
 
 
 def default_process(sentence: str) -> str:
@@ -30,3 +47,183 @@ def default_process(sentence: str) -> str:
     """
     string_out = _alnum_regex.sub(" ", sentence)
     return string_out.strip().lower()
+
+
+def _is_ndarray(sentences):
+    np = sys.modules.get("numpy")
+    return np is not None and isinstance(sentences, np.ndarray)
+
+
+def _batch_items(sentences):
+    """
+    list of the sentences passed to default_process_batch. Arrays are flattened.
+    """
+    if _is_ndarray(sentences):
+        return sentences.ravel().tolist()
+    return list(sentences)
+
+
+def _batch_result(sentences, results):
+    """
+    convert the processed sentences into the container type returned by default_process_batch
+    """
+    if _is_ndarray(sentences):
+        import numpy as np
+
+        result = np.empty(len(results), dtype=sentences.dtype)
+        result[:] = results
+        return result.reshape(sentences.shape)
+    return results
+
+
+def default_process_batch(sentences, *, workers=1):
+    """
+    Preprocess many strings with `default_process` in a single call. The strings
+    are processed without calling into Python for every string and without holding
+    the GIL, so they can be processed in parallel.
+
+    Parameters
+    ----------
+    sentences : Iterable[str] | numpy.ndarray
+        strings to preprocess. Elements, which are None, are kept.
+    workers : int, optional
+        The strings are subdivided into blocks, which are processed in parallel using
+        workers threads. Passing -1 uses all available CPU cores. Default is 1.
+
+    Returns
+    -------
+    list[str] | numpy.ndarray
+        processed strings. When sentences is a numpy array, an array of the same shape
+        and dtype is returned. This supports object arrays, fixed width unicode arrays and
+        ``StringDType`` arrays. Otherwise a list is returned.
+
+    Examples
+    --------
+
+    >>> from rapidfuzz.utils import default_process_batch
+    >>> default_process_batch(["New York Mets!", None, " ATLANTA braves "])
+    ['new york mets', None, 'atlanta braves']
+    """
+    _ = workers
+    results = [x if is_none(x) else default_process(x) for x in _batch_items(sentences)]
+    return _batch_result(sentences, results)
+
+
+class Processor:
+    """
+    Processor composed of native preprocessing steps. Unlike a processor implemented
+    in Python, it is applied by RapidFuzz without calling into Python. When used with
+    a `workers` argument in `process.extract`, `process.extractOne`, `process.cdist` and
+    `process.cpdist`, the choices are preprocessed in parallel without holding the GIL.
+
+    Independent of the order of the arguments, the enabled steps are always applied
+    in the following order:
+
+    1. strip_accents
+    2. casefold / lowercase_ascii
+    3. remove_punctuation
+    4. collapse_whitespace / sort_tokens
+
+    Parameters
+    ----------
+    strip_accents : bool, optional
+        decompose the characters using the NFKD normalization and remove all
+        combining characters like accents. Default is False.
+    casefold : bool, optional
+        convert the string to its casefolded form like `str.casefold`. Default is False.
+    lowercase_ascii : bool, optional
+        convert only the ASCII letters to lower case. Default is False.
+    remove_punctuation : bool, optional
+        replace all characters, which are neither alphanumeric nor whitespace, with
+        a whitespace. Default is False.
+    collapse_whitespace : bool, optional
+        split the string on whitespaces and join the words with a single space. This
+        removes leading and trailing whitespaces. Default is False.
+    sort_tokens : bool, optional
+        split the string on whitespaces and join the sorted words with a single
+        space. Default is False.
+
+    Examples
+    --------
+
+    >>> from rapidfuzz.utils import Processor
+    >>> processor = Processor(strip_accents=True, casefold=True, remove_punctuation=True, sort_tokens=True)
+    >>> processor("Straße  de Málaga!")
+    'de malaga strasse'
+    """
+
+    def __init__(
+        self,
+        *,
+        strip_accents=False,
+        casefold=False,
+        lowercase_ascii=False,
+        remove_punctuation=False,
+        collapse_whitespace=False,
+        sort_tokens=False,
+    ):
+        self.strip_accents = bool(strip_accents)
+        self.casefold = bool(casefold)
+        self.lowercase_ascii = bool(lowercase_ascii)
+        self.remove_punctuation = bool(remove_punctuation)
+        self.collapse_whitespace = bool(collapse_whitespace)
+        self.sort_tokens = bool(sort_tokens)
+
+    def __call__(self, sentence):
+        """
+        Preprocess a string
+
+        Parameters
+        ----------
+        sentence : str
+            String to preprocess
+
+        Returns
+        -------
+        processed_string : str
+            processed string
+        """
+        if not isinstance(sentence, str):
+            msg = "sentence must be a str"
+            raise TypeError(msg)
+
+        if self.strip_accents:
+            sentence = "".join(ch for ch in unicodedata.normalize("NFKD", sentence) if not unicodedata.combining(ch))
+        if self.casefold:
+            sentence = sentence.casefold()
+        elif self.lowercase_ascii:
+            sentence = sentence.translate(_ascii_lowercase)
+        if self.remove_punctuation:
+            sentence = _punctuation_regex.sub(" ", sentence)
+        if self.sort_tokens:
+            sentence = " ".join(sorted(sentence.split()))
+        elif self.collapse_whitespace:
+            sentence = " ".join(sentence.split())
+        return sentence
+
+    def batch(self, sentences, *, workers=1):
+        """
+        Preprocess many strings in a single call. The strings are processed without
+        holding the GIL, so they can be processed in parallel.
+
+        Parameters
+        ----------
+        sentences : Iterable[str] | numpy.ndarray
+            strings to preprocess. Elements, which are None, are kept.
+        workers : int, optional
+            The strings are subdivided into blocks, which are processed in parallel using
+            workers threads. Passing -1 uses all available CPU cores. Default is 1.
+
+        Returns
+        -------
+        list[str] | numpy.ndarray
+            processed strings. When sentences is a numpy array, an array of the same shape
+            and dtype is returned. Otherwise a list is returned.
+        """
+        _ = workers
+        results = [x if is_none(x) else self(x) for x in _batch_items(sentences)]
+        return _batch_result(sentences, results)
+
+    def __repr__(self):
+        steps = ", ".join(f"{step}=True" for step in _PROCESSOR_STEPS if getattr(self, step))
+        return f"Processor({steps})"
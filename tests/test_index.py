@@ -0,0 +1,421 @@
+from __future__ import annotations
+
+import math
+import random
+from collections import Counter
+
+import pytest
+
+from rapidfuzz import fuzz, process
+from rapidfuzz.distance import (
+    OSA,
+    DamerauLevenshtein,
+    Indel,
+    Levenshtein,
+    Postfix,
+    Prefix,
+)
+from rapidfuzz.utils import default_process
+
+pytest.importorskip("numpy")
+
+from rapidfuzz.index import (
+    BKTree,
+    DeletionIndex,
+    MinHashIndex,
+    PrefixIndex,
+    QGramIndex,
+    TfidfIndex,
+    TokenIndex,
+)
+
+
+def random_strings(count, seed=0):
+    rng = random.Random(seed)
+    return ["".join(rng.choice("abcdef") for _ in range(rng.randint(0, 12))) for _ in range(count)]
+
+
+@pytest.mark.parametrize("q", [1, 2, 3])
+@pytest.mark.parametrize(
+    ("scorer", "score_cutoffs", "scorer_kwargs"),
+    [
+        (Levenshtein.distance, [0, 1, 3], None),
+        (Levenshtein.distance, [2, 4], {"weights": (1, 2, 3)}),
+        (Levenshtein.similarity, [4, 8], None),
+        (Levenshtein.normalized_distance, [0.1, 0.3], None),
+        (Levenshtein.normalized_similarity, [0.7, 0.9], None),
+        (Indel.distance, [0, 2, 4], None),
+        (Indel.similarity, [8, 16], None),
+        (Indel.normalized_distance, [0.2], None),
+        (Indel.normalized_similarity, [0.8], None),
+        (fuzz.ratio, [60, 80, 95], None),
+    ],
+)
+def test_qgram_index(q, scorer, score_cutoffs, scorer_kwargs):
+    """
+    the index should find the same matches as process.extract
+    """
+    choices = [*random_strings(500), None]
+    index = QGramIndex(choices, q=q)
+    assert len(index) == 500
+
+    for query in random_strings(20, seed=1) + choices[:20]:
+        for score_cutoff in score_cutoffs:
+            expected = process.extract(
+                query, choices, scorer=scorer, limit=None, score_cutoff=score_cutoff, scorer_kwargs=scorer_kwargs
+            )
+            result = index.extract(
+                query, scorer=scorer, limit=None, score_cutoff=score_cutoff, scorer_kwargs=scorer_kwargs
+            )
+            assert result == expected
+
+
+def test_qgram_index_api():
+    choices = {"a": "Apple", "b": "apply", "c": None, "d": "Banana"}
+    index = QGramIndex(choices, processor=default_process)
+
+    assert index.extractOne("APPLE", processor=default_process, score_cutoff=90) == ("Apple", 100.0, "a")
+    assert index.extractOne("cherry", score_cutoff=90) is None
+    assert index.extract("apple", scorer=Levenshtein.distance, score_cutoff=1, limit=1) == [("Apple", 0, "a")]
+    prepared = process.PreparedChoices(choices, processor=default_process)
+    assert index.extract("banana") == process.extract("banana", prepared)
+    assert index.extract(None) == []
+
+    with pytest.raises(ValueError, match="only supports"):
+        index.extract("apple", scorer=fuzz.WRatio, score_cutoff=90)
+    with pytest.raises(ValueError, match="weights"):
+        index.extract(
+            "apple", scorer=Levenshtein.normalized_similarity, score_cutoff=0.9, scorer_kwargs={"weights": (1, 1, 2)}
+        )
+    with pytest.raises(ValueError, match="q"):
+        QGramIndex(choices, q=0)
+
+
+@pytest.mark.parametrize(
+    ("scorer", "scorer_kwargs"),
+    [
+        (Levenshtein.distance, None),
+        (Levenshtein.distance, {"weights": (2, 2, 3)}),
+        (OSA.distance, None),
+        (DamerauLevenshtein.distance, None),
+        (Indel.distance, None),
+    ],
+)
+def test_bktree(scorer, scorer_kwargs):
+    """
+    the tree should find the same matches as process.extract
+    """
+    choices = [*random_strings(500), None]
+    tree = BKTree(choices, scorer=scorer, scorer_kwargs=scorer_kwargs)
+    assert len(tree) == 500
+
+    for query in random_strings(20, seed=1) + choices[:10]:
+        for limit, score_cutoff in [(None, 0), (None, 2), (3, 1), (1, None), (5, None)]:
+            expected = process.extract(
+                query, choices, scorer=scorer, limit=limit, score_cutoff=score_cutoff, scorer_kwargs=scorer_kwargs
+            )
+            assert tree.extract(query, limit=limit, score_cutoff=score_cutoff) == expected
+
+
+def test_bktree_api():
+    tree = BKTree({"a": "Apple", "b": "apply", "c": None}, processor=default_process)
+
+    assert tree.extractOne("APPLE", processor=default_process) == ("Apple", 0, "a")
+    assert tree.extractOne("banana", score_cutoff=2) is None
+    assert tree.extract("appl", limit=None) == [("Apple", 1, "a"), ("apply", 1, "b")]
+    assert tree.extract(None) == []
+    assert BKTree([]).extract("apple") == []
+
+    with pytest.raises(ValueError, match="only supports"):
+        BKTree(["apple"], scorer=fuzz.ratio)
+    with pytest.raises(ValueError, match="insertions and deletions"):
+        BKTree(["apple"], scorer_kwargs={"weights": (1, 2, 1)})
+
+
+def random_names(count, seed=0):
+    # frequent tokens like "inc" are shared by many names
+    rng = random.Random(seed)
+    words = ["inc", "ltd", "group", "acme", "globex", "initech", "umbrella", "hooli", "stark", "wayne", "tyrell"]
+    return [" ".join(rng.choices(words, weights=range(len(words), 0, -1), k=rng.randint(0, 4))) for _ in range(count)]
+
+
+@pytest.mark.parametrize("min_overlap", [0, 0.3, 0.6, 1])
+@pytest.mark.parametrize("scorer", [fuzz.token_set_ratio, fuzz.token_sort_ratio, fuzz.WRatio])
+def test_token_index(scorer, min_overlap):
+    """
+    the index should find the same matches as process.extract on the choices sharing
+    enough tokens with the query
+    """
+    choices = [*random_names(500), None]
+    index = TokenIndex(choices)
+    assert len(index) == 500
+
+    document_frequency = Counter(token for choice in choices[:-1] for token in set(choice.split()))
+
+    def idf(token):
+        return math.log(501 / (1 + document_frequency[token])) + 1
+
+    for query in random_names(20, seed=1):
+        tokens = set(query.split())
+        total = sum(idf(token) for token in tokens)
+        candidates = {
+            i: choice
+            for i, choice in enumerate(choices[:-1])
+            if tokens & set(choice.split())
+            and sum(idf(token) for token in tokens & set(choice.split())) >= min_overlap * total - 1e-9
+        }
+        for limit, score_cutoff in [(None, None), (3, None), (None, 80)]:
+            expected = process.extract(query, candidates, scorer=scorer, limit=limit, score_cutoff=score_cutoff)
+            result = index.extract(
+                query, scorer=scorer, limit=limit, score_cutoff=score_cutoff, min_overlap=min_overlap
+            )
+            assert result == expected
+
+
+def test_token_index_api():
+    choices = {"a": "Acme Inc", "b": "Globex Inc", "c": None, "d": "acme"}
+    index = TokenIndex(choices, processor=default_process)
+
+    assert index.extractOne("ACME", processor=default_process) == ("Acme Inc", 100.0, "a")
+    prepared = process.PreparedChoices({"a": "Acme Inc", "b": "Globex Inc"}, processor=default_process)
+    assert index.extract("inc", scorer=fuzz.ratio, score_cutoff=40) == process.extract(
+        "inc", prepared, scorer=fuzz.ratio, score_cutoff=40
+    )
+    assert index.extract("initech") == []
+    assert index.extract(None) == []
+    assert index.extractOne("globex", min_overlap=1) == ("Globex Inc", 100.0, "b")
+    assert TokenIndex([]).extract("acme") == []
+
+    with pytest.raises(ValueError, match="min_overlap"):
+        index.extract("acme", min_overlap=2)
+
+
+@pytest.mark.parametrize("prefix_length", [None, 3, 6])
+@pytest.mark.parametrize(
+    ("scorer", "scorer_kwargs"),
+    [
+        (Levenshtein.distance, None),
+        (Levenshtein.distance, {"weights": (1, 1, 2)}),
+        (OSA.distance, None),
+        (DamerauLevenshtein.distance, None),
+        (Indel.distance, None),
+    ],
+)
+def test_deletion_index(scorer, scorer_kwargs, prefix_length):
+    """
+    the index should find the same matches as process.extract
+    """
+    choices = [*random_strings(500), None]
+    index = DeletionIndex(choices, max_distance=2, prefix_length=prefix_length)
+    assert len(index) == 500
+
+    for query in random_strings(20, seed=1) + choices[:10]:
+        for limit, score_cutoff in [(None, 0), (None, 1), (3, 2), (1, None)]:
+            expected = process.extract(
+                query,
+                choices,
+                scorer=scorer,
+                limit=limit,
+                score_cutoff=2 if score_cutoff is None else score_cutoff,
+                scorer_kwargs=scorer_kwargs,
+            )
+            result = index.extract(
+                query, scorer=scorer, limit=limit, score_cutoff=score_cutoff, scorer_kwargs=scorer_kwargs
+            )
+            assert result == expected
+
+
+def test_deletion_index_api():
+    index = DeletionIndex({"a": "SKU-1", "b": "sku-2", "c": None}, max_distance=1, processor=str.lower)
+
+    assert index.extractOne("SKU-1", processor=str.lower) == ("SKU-1", 0, "a")
+    assert index.extract("sku-3") == [("SKU-1", 1, "a"), ("sku-2", 1, "b")]
+    assert index.extractOne("sku-33") is None
+    assert index.extract(None) == []
+    assert DeletionIndex([]).extract("sku") == []
+
+    with pytest.raises(ValueError, match="only supports"):
+        index.extract("sku", scorer=fuzz.ratio)
+    with pytest.raises(ValueError, match="max_distance"):
+        index.extract("sku", score_cutoff=2)
+    with pytest.raises(ValueError, match="weights"):
+        index.extract("sku", scorer_kwargs={"weights": (0, 1, 1)})
+    with pytest.raises(ValueError, match="prefix_length"):
+        DeletionIndex(["sku"], prefix_length=0)
+
+
+@pytest.mark.parametrize(
+    ("scorer", "score_cutoffs"),
+    [
+        (Prefix.similarity, [0, 2, 5]),
+        (Prefix.distance, [0, 3, 8]),
+        (Prefix.normalized_similarity, [0.3, 0.8]),
+        (Prefix.normalized_distance, [0.2, 0.6]),
+        (Postfix.similarity, [1, 3]),
+        (Postfix.distance, [2, 6]),
+        (Postfix.normalized_similarity, [0.5]),
+        (Postfix.normalized_distance, [0.5]),
+    ],
+)
+def test_prefix_index(scorer, score_cutoffs):
+    """
+    the index should find the same matches as process.extract
+    """
+    choices = [*random_strings(500), None]
+    index = PrefixIndex(choices)
+    assert len(index) == 500
+
+    for query in random_strings(20, seed=1) + choices[:10]:
+        for limit, score_cutoff in [(None, None), (1, None), (5, None), (50, None)] + [
+            (limit, score_cutoff) for limit in (None, 3) for score_cutoff in score_cutoffs
+        ]:
+            expected = process.extract(query, choices, scorer=scorer, limit=limit, score_cutoff=score_cutoff)
+            assert index.extract(query, scorer=scorer, limit=limit, score_cutoff=score_cutoff) == expected
+
+
+def test_prefix_index_api():
+    index = PrefixIndex({"a": "New York", "b": "new jersey", "c": None, "d": "Newark"}, processor=default_process)
+
+    assert index.extractOne("NEW YORK CITY", processor=default_process) == ("New York", 8, "a")
+    assert index.extract("new", limit=None) == [("New York", 3, "a"), ("new jersey", 3, "b"), ("Newark", 3, "d")]
+    assert PrefixIndex([["n", "e", "w"], ["n", "o"]]).extract(["n", "e"], limit=1) == [(["n", "e", "w"], 2, 0)]
+    assert index.extractOne("york", scorer=Postfix.distance, score_cutoff=2) is None
+    assert index.extract(None) == []
+    assert PrefixIndex([]).extract("new") == []
+
+    with pytest.raises(ValueError, match="only supports"):
+        index.extract("new", scorer=fuzz.ratio)
+
+
+@pytest.mark.parametrize("q", [1, 3])
+def test_minhash_index(q):
+    """
+    the index should find the same matches as process.extract on the choices sharing a band
+    with the query and find almost all of the similar choices
+    """
+    choices = [*random_strings(500), None]
+    index = MinHashIndex(choices, q=q, bands=20, rows=2)
+    assert len(index) == 500
+
+    for query in random_strings(20, seed=1) + choices[:10]:
+        candidates = {i: choices[i] for i in index._candidates(query).tolist()}
+        for limit, score_cutoff in [(None, None), (3, None), (None, 80)]:
+            expected = process.extract(query, candidates, scorer=fuzz.ratio, limit=limit, score_cutoff=score_cutoff)
+            assert index.extract(query, limit=limit, score_cutoff=score_cutoff) == expected
+
+    # identical strings always share all bands
+    for i, choice in enumerate(choices[:50]):
+        assert (choice, 100.0, i) in index.extract(choice, limit=None, score_cutoff=100)
+
+    stats = index.evaluate(random_strings(50, seed=2), score_cutoff=90)
+    assert stats["queries"] == 50
+    assert stats["recall"] >= 0.9
+    assert stats["candidates"] == stats["candidate_ratio"] * 500
+
+
+def test_minhash_index_pairs():
+    choices = [*random_strings(300), None]
+    index = MinHashIndex(choices, bands=20, rows=2)
+    first, second = index._candidate_pairs()
+
+    for scorer, score_cutoff in [(fuzz.ratio, 80), (Indel.normalized_similarity, 0.8), (Indel.distance, 2)]:
+        scores = [
+            (i, j, scorer(choices[i], choices[j], score_cutoff=score_cutoff))
+            for i, j in zip(first.tolist(), second.tolist())
+        ]
+        if scorer is Indel.distance:
+            expected = [(i, j, score) for i, j, score in scores if score <= score_cutoff]
+        else:
+            expected = [(i, j, score) for i, j, score in scores if score >= score_cutoff]
+        assert index.pairs(scorer=scorer, score_cutoff=score_cutoff) == expected
+
+    duplicates = [(i, j) for i in range(300) for j in range(i + 1, 300) if choices[i] == choices[j]]
+    assert set(duplicates) <= {(i, j) for i, j, _ in index.pairs(score_cutoff=100)}
+    assert len(index.pairs()) == len(first)
+
+
+def test_minhash_index_api():
+    choices = {"a": "John Smith", "b": "jon smith", "c": None, "d": "Jane Doe"}
+    index = MinHashIndex(choices, processor=default_process)
+
+    assert index.extractOne("JOHN SMITH", processor=default_process) == ("John Smith", 100.0, "a")
+    assert index.extractOne("x") is None
+    assert index.extract(None) == []
+    assert index.pairs(score_cutoff=90) == [("a", "b", 94.73684210526316)]
+    assert MinHashIndex([["j", "o", "n"], b"jon"]).extract("jon") == [(["j", "o", "n"], 100.0, 0), (b"jon", 100.0, 1)]
+    assert MinHashIndex([]).extract("john") == []
+    assert MinHashIndex([]).pairs() == []
+
+    assert index.candidate_probability(0) == 0
+    assert index.candidate_probability(1) == 1
+    assert index.candidate_probability(0.5) == pytest.approx(1 - (1 - 0.5**3) ** 32)
+
+    with pytest.raises(ValueError, match="q"):
+        MinHashIndex(choices, q=0)
+    with pytest.raises(ValueError, match="bands"):
+        MinHashIndex(choices, rows=0)
+
+
+@pytest.mark.parametrize("q", [2, 3])
+def test_tfidf_index(q):
+    """
+    the index should find the same matches as process.extract on its candidates and
+    the candidates should be the choices with the highest cosine similarity
+    """
+    import numpy as np
+
+    choices = [*random_strings(500), None]
+    index = TfidfIndex(choices, q=q)
+    assert len(index) == 500
+
+    def grams(s):
+        # strings shorter than q are a single q-gram
+        return [s[i : i + q] for i in range(len(s) - q + 1)] if len(s) >= q else [(s,)]
+
+    df = Counter(gram for choice in choices[:500] for gram in set(grams(choice)))
+
+    def vector(s):
+        weights = {gram: count * (math.log(501 / (1 + df[gram])) + 1) for gram, count in Counter(grams(s)).items()}
+        norm = math.sqrt(sum(w * w for w in weights.values()))
+        return {gram: w / norm for gram, w in weights.items()}
+
+    vectors = [vector(choice) for choice in choices[:500]]
+    for query in random_strings(10, seed=1) + choices[:5]:
+        candidates = index._candidates(query, 20)
+        query_vector = vector(query)
+        similarity = np.array(
+            [sum(w * query_vector.get(gram, 0) for gram, w in choice_vector.items()) for choice_vector in vectors]
+        )
+        assert len(candidates) == min(20, np.count_nonzero(similarity > 1e-6))
+        assert similarity[candidates].min() >= np.sort(similarity)[-len(candidates)] - 1e-6
+
+        expected = process.extract(query, {i: choices[i] for i in candidates.tolist()}, limit=5)
+        assert index.extract(query, candidates=20) == expected
+
+    # identical strings are the best candidate
+    for i, choice in enumerate(choices[:50]):
+        assert index.extractOne(choice, candidates=1, scorer=fuzz.ratio) == (choice, 100.0, i)
+
+    assert index.extract(choices[0], candidates=None, limit=None) == process.extract(
+        choices[0], {i: choices[i] for i in index._candidates(choices[0], None).tolist()}, limit=None
+    )
+
+
+def test_tfidf_index_api():
+    choices = {"a": "New York Mets", "b": "new york yankees", "c": None, "d": "Atlanta Braves"}
+    index = TfidfIndex(choices, processor=default_process)
+
+    assert index.extractOne("NEW YORK METS", processor=default_process) == ("New York Mets", 100.0, "a")
+    assert index.extract("mets york new", processor=default_process, limit=1) == [("New York Mets", 95.0, "a")]
+    assert index.extractOne("xxx") is None
+    assert index.extract(None) == []
+    assert TfidfIndex([["n", "y", "m"], b"nym"]).extract("nym", scorer=fuzz.ratio) == [
+        (["n", "y", "m"], 100.0, 0),
+        (b"nym", 100.0, 1),
+    ]
+    assert TfidfIndex([]).extract("new york") == []
+
+    with pytest.raises(ValueError, match="q"):
+        TfidfIndex(choices, q=0)
+    with pytest.raises(ValueError, match="candidates"):
+        index.extract("new york", candidates=0)
@@ -1,10 +1,21 @@
 from __future__ import annotations
 
+import os
+import sys
+
 import pytest
 
-from rapidfuzz import fuzz, process_cpp, process_py
-from rapidfuzz.distance import DamerauLevenshtein, Levenshtein, Levenshtein_py
-from rapidfuzz.utils import default_process
+from rapidfuzz import _catalog, fuzz, process_cpp, process_py
+from rapidfuzz.distance import (
+    OSA,
+    DamerauLevenshtein,
+    Hamming,
+    Indel,
+    Levenshtein,
+    Levenshtein_py,
+    Prefix,
+)
+from rapidfuzz.utils import Processor, default_process
 
 
 def wrapped(func):
@@ -739,6 +750,14 @@ def test_generators():
     assert res1 == res2
     assert len(res1) > 0
 
+    for workers in (1, 2):
+        res1 = process_cpp.extractOne(search, generate_choices(), workers=workers)
+        res2 = process_py.extractOne(search, generate_choices(), workers=workers)
+        assert res1 == res2 == ("a", 90.0, 0)
+        assert process_cpp.extract(search, generate_choices(), workers=workers) == process_py.extract(
+            search, generate_choices()
+        )
+
 
 def test_cdist_pure_python_dtype():
     np = pytest.importorskip("numpy")
@@ -766,3 +785,904 @@ def test_cpdist_integral_dtype_rounding():
     assert float_result % 1 >= 0.5
     # Check if the rounded float result is equal to the integer result
     assert round(float_result) == int_result
+
+
+@pytest.mark.parametrize("workers", [1, 2, -1])
+@pytest.mark.parametrize("scorer", [fuzz.ratio, Levenshtein.distance, custom_scorer])
+def test_extract_workers(workers, scorer):
+    """
+    the result of extract/extractOne should not depend on the amount of workers
+    """
+    choices = [f"{i % 97}-{i % 13}-test" for i in range(5000)]
+    choices[3000] = "42-3-tests"
+    choices[4500] = None
+    query = "42-3-test"
+
+    assert process.extractOne(query, choices, scorer=scorer, workers=workers) == process.extractOne(
+        query, choices, scorer=scorer
+    )
+    assert process.extract(query, choices, scorer=scorer, limit=20, workers=workers) == process.extract(
+        query, choices, scorer=scorer, limit=20
+    )
+
+    dict_choices = {f"key{i}": choice for i, choice in enumerate(choices)}
+    assert process.extractOne(query, dict_choices, scorer=scorer, workers=workers) == process.extractOne(
+        query, dict_choices, scorer=scorer
+    )
+    assert process.extract(query, dict_choices, scorer=scorer, limit=20, workers=workers) == process.extract(
+        query, dict_choices, scorer=scorer, limit=20
+    )
+
+
+@pytest.mark.parametrize("workers", [1, 2, -1])
+def test_processor_workers(workers):
+    """
+    choices preprocessed by utils.Processor in parallel should give the same result as a Python processor
+    """
+    processor = Processor(strip_accents=True, casefold=True, remove_punctuation=True, sort_tokens=True)
+    choices = [f"Málaga {i % 97}-{i % 13} TEST" for i in range(5000)]
+    choices[3000] = "42-3 Málaga tests"
+    choices[4500] = None
+    query = "malaga 42 3 test"
+
+    def py_processor(x):
+        return processor(x)
+
+    assert process.extract(query, choices, processor=processor, limit=20, workers=workers) == process.extract(
+        query, choices, processor=py_processor, limit=20
+    )
+    dict_choices = {f"key{i}": choice for i, choice in enumerate(choices)}
+    assert process.extractOne(query, dict_choices, processor=processor, workers=workers) == process.extractOne(
+        query, dict_choices, processor=py_processor
+    )
+
+    queries = choices[:100]
+    choices = choices[:4500]
+    assert (
+        process.cdist(queries, choices, processor=processor, workers=workers)
+        == process.cdist(queries, choices, processor=py_processor)
+    ).all()
+    assert (
+        process.cpdist(choices, choices[::-1], processor=processor, workers=workers)
+        == process.cpdist(choices, choices[::-1], processor=py_processor)
+    ).all()
+
+
+def test_extractOne_workers_first_match():
+    """
+    when multiple elements have the same score, the first one should be returned for any amount of workers
+    """
+    choices = ["abc"] * 3000 + ["test"] * 3000
+    assert process.extractOne("test", choices, workers=-1) == ("test", 100.0, 3000)
+    assert process.extractOne("tes", choices, workers=2, scorer=Levenshtein.distance) == ("test", 1, 3000)
+
+
+@pytest.mark.parametrize("module", [process_cpp, process_py])
+@pytest.mark.parametrize("scorer", [fuzz.WRatio, Levenshtein.distance, custom_scorer])
+def test_prepared_choices(module, scorer):
+    """
+    PreparedChoices should provide the same results as passing the choices directly
+    """
+    strings = ["new york mets", None, "NEW YORK YANKEES", "", "atlanta braves", "New York Mets"]
+    query = "new york mets"
+
+    for choices in (strings, {f"key{i}": choice for i, choice in enumerate(strings)}):
+        prepared = module.PreparedChoices(choices, processor=default_process)
+        assert len(prepared) == len(choices)
+        kwargs = {"scorer": scorer, "processor": default_process}
+
+        assert module.extractOne(query, prepared, **kwargs) == module.extractOne(query, choices, **kwargs)
+        assert module.extractOne(query, prepared, workers=2, **kwargs) == module.extractOne(query, choices, **kwargs)
+        assert module.extract(query, prepared, limit=None, **kwargs) == module.extract(
+            query, choices, limit=None, **kwargs
+        )
+        assert module.extract(query, prepared, limit=2, **kwargs) == module.extract(query, choices, limit=2, **kwargs)
+        assert list(module.extract_iter(query, prepared, **kwargs)) == list(
+            module.extract_iter(query, choices, **kwargs)
+        )
+
+
+@pytest.mark.parametrize("module", [process_cpp, process_py])
+@pytest.mark.parametrize("scorer", [fuzz.ratio, Levenshtein.distance, custom_scorer])
+def test_prepared_choices_cdist(module, scorer):
+    import numpy as np
+
+    queries = ["new york mets", "NEW YORK YANKEES", "", "atlanta braves"]
+    choices = ["new york mets", "", "new YORK yankees", "braves"]
+    prepared_queries = module.PreparedChoices(queries, processor=default_process)
+    prepared_choices = module.PreparedChoices(choices, processor=default_process)
+
+    expected = module.cdist(queries, choices, scorer=scorer, processor=default_process)
+    assert np.array_equal(module.cdist(prepared_queries, prepared_choices, scorer=scorer), expected)
+    assert np.array_equal(
+        module.cdist(queries, prepared_choices, scorer=scorer, processor=default_process),
+        expected,
+    )
+    assert np.array_equal(
+        module.cdist(prepared_queries, prepared_queries, scorer=scorer),
+        module.cdist(queries, queries, scorer=scorer, processor=default_process),
+    )
+
+    assert np.array_equal(
+        module.cpdist(prepared_queries, prepared_choices, scorer=scorer),
+        module.cpdist(queries, choices, scorer=scorer, processor=default_process),
+    )
+
+
+def test_prepared_choices_none():
+    """
+    None is only supported for scorers, which treat it as the worst score
+    """
+    prepared = process_cpp.PreparedChoices(["test", None])
+    assert process_cpp.cdist(["test"], prepared, scorer=fuzz.ratio).tolist() == [[100.0, 0.0]]
+    with pytest.raises(ValueError, match="passed unsupported element None"):
+        process_cpp.cdist(["test"], prepared, scorer=Levenshtein.distance)
+
+
+@pytest.mark.parametrize("saved_module", [process_cpp, process_py])
+@pytest.mark.parametrize("module", [process_cpp, process_py])
+@pytest.mark.parametrize("scorer", [fuzz.WRatio, Levenshtein.distance, custom_scorer])
+def test_prepared_choices_save(module, saved_module, scorer, tmp_path):
+    """
+    loaded PreparedChoices should provide the same results as the saved ones. The file format
+    is shared by both implementations
+    """
+    query = "new york mets"
+    for choices, processor in [
+        (["new york mets", None, "NEW YORK YANKEES", "", "atlanta bräves", "New York Mets \U0001f600", b"mets"], None),
+        ({f"key{i}": choice for i, choice in enumerate(["New York Mets", None, "Nëw York", ""])}, default_process),
+        ({(1, 2): "new york", 3: "mets"}, None),
+        ([1, 2.5, "new york mets"], str),
+    ]:
+        prepared = saved_module.PreparedChoices(choices, processor=processor)
+        prepared.save(tmp_path / "choices.bin")
+        loaded = module.PreparedChoices.load(tmp_path / "choices.bin", allow_pickle=True)
+        assert len(loaded) == len(choices)
+        assert loaded.processor is None
+
+        # the query is not changed by the processors
+        kwargs = {"scorer": scorer, "processor": processor}
+        for limit, workers in [(None, 1), (2, 2)]:
+            assert module.extract(query, loaded, scorer=scorer, limit=limit, workers=workers) == module.extract(
+                query, choices, limit=limit, **kwargs
+            )
+        assert module.extractOne(query, loaded, scorer=scorer) == module.extractOne(query, choices, **kwargs)
+        assert list(module.extract_iter(query, loaded, scorer=scorer)) == list(
+            module.extract_iter(query, choices, **kwargs)
+        )
+
+
+def test_prepared_choices_save_errors(tmp_path):
+    with pytest.raises(TypeError, match="str or bytes"):
+        process_cpp.PreparedChoices([["new", "york"]]).save(tmp_path / "choices.bin")
+
+    (tmp_path / "invalid.bin").write_bytes(b"RFCHOICE" + bytes(100))
+    with pytest.raises(ValueError, match="version"):
+        process_cpp.PreparedChoices.load(tmp_path / "invalid.bin")
+
+    (tmp_path / "invalid.bin").write_bytes(b"no choices" * 10)
+    with pytest.raises(ValueError, match="not a file saved by"):
+        process_py.PreparedChoices.load(tmp_path / "invalid.bin")
+
+    process_py.PreparedChoices(["new york"] * 100).save(tmp_path / "choices.bin")
+    (tmp_path / "invalid.bin").write_bytes((tmp_path / "choices.bin").read_bytes()[:500])
+    with pytest.raises(ValueError, match="truncated"):
+        process_cpp.PreparedChoices.load(tmp_path / "invalid.bin")
+
+    process_py.PreparedChoices({1: "new york"}).save(tmp_path / "choices.bin")
+    for module in (process_cpp, process_py):
+        with pytest.raises(ValueError, match="allow_pickle"):
+            module.PreparedChoices.load(tmp_path / "choices.bin")
+        assert len(module.PreparedChoices.load(tmp_path / "choices.bin", allow_pickle=True)) == 1
+
+    # tables with a different amount of elements than the choices
+    choices = ["New York", "Mets", None]
+    for keys, processed in [
+        (["a", "b"], ["new york", "mets", None]),
+        (["a", "b", "c", "d"], ["new york", "mets", None]),
+        (["a", "b", "c"], ["new york", "mets"]),
+        (["a", "b", "c"], ["new york", "mets", None, "braves"]),
+        ([1, 2], ["new york", "mets", None]),
+    ]:
+        _catalog.save(tmp_path / "invalid.bin", choices, keys, processed)
+        for module in (process_cpp, process_py):
+            with pytest.raises(ValueError, match="not a file saved by"):
+                module.PreparedChoices.load(tmp_path / "invalid.bin", allow_pickle=True)
+
+    # the amount of choices stored in the header differs from the choices table
+    _catalog.save(tmp_path / "choices.bin", choices, ["a", "b", "c"], ["new york", "mets", None])
+    data = bytearray((tmp_path / "choices.bin").read_bytes())
+    data[16:24] = (2).to_bytes(8, "little")
+    (tmp_path / "invalid.bin").write_bytes(bytes(data))
+    for module in (process_cpp, process_py):
+        with pytest.raises(ValueError, match="not a file saved by"):
+            module.PreparedChoices.load(tmp_path / "invalid.bin")
+
+    # offsets and sizes of the strings outside of the data section or not aligned to the characters
+    process_py.PreparedChoices(["new york", "mets", "\u0100abc"]).save(tmp_path / "choices.bin")
+    data = (tmp_path / "choices.bin").read_bytes()
+    # header, table header and the padded types, followed by the offsets and sizes
+    pos = 24 + 24 + 8
+    for index, value in [(4, 1 << 40), (4, 1 << 63), (3, 1 << 40), (2, 1), (5, 3)]:
+        corrupted = bytearray(data)
+        corrupted[pos + 8 * index : pos + 8 * index + 8] = value.to_bytes(8, sys.byteorder)
+        (tmp_path / "invalid.bin").write_bytes(bytes(corrupted))
+        # the C++ implementation checks them while loading, while they are checked on access otherwise
+        for module in (process_cpp, process_py):
+            with pytest.raises(ValueError, match="corrupted"):
+                module.extract("new york", module.PreparedChoices.load(tmp_path / "invalid.bin"), limit=None)
+
+
+@pytest.mark.parametrize("module", [process_cpp, process_py])
+@pytest.mark.parametrize("scorer", [fuzz.WRatio, Levenshtein.distance, custom_scorer])
+def test_mutable_prepared_choices(module, scorer):
+    """
+    MutablePreparedChoices should provide the same results as a dict with the same choices
+    """
+    import random
+
+    rng = random.Random(42)
+    words = ["new york", "mets", "yankees", "atlanta", "braves", "", None, "NEW YORK METS"]
+
+    def random_choice():
+        return " ".join(rng.choice(words) or "" for _ in range(rng.randint(1, 3))) if rng.random() < 0.95 else None
+
+    choices = {i: random_choice() for i in range(1500)}
+    prepared = module.MutablePreparedChoices(choices, processor=default_process)
+    query = "new york mets"
+    kwargs = {"scorer": scorer, "processor": default_process}
+
+    for _ in range(4):
+        for _ in range(300):
+            action = rng.random()
+            key = rng.randrange(2500)
+            if action < 0.4 and key in choices:
+                del choices[key]
+                prepared.remove(key)
+            elif action < 0.7:
+                choices[key] = random_choice()
+                prepared.add(key, choices[key])
+            else:
+                update = {rng.randrange(2500): random_choice() for _ in range(3)}
+                choices.update(update)
+                prepared.update(update)
+
+        assert len(prepared) == len(choices)
+        assert all(key in prepared and prepared[key] == choice for key, choice in choices.items())
+        assert module.extractOne(query, prepared, **kwargs) == module.extractOne(query, choices, **kwargs)
+        assert module.extractOne(query, prepared, workers=2, **kwargs) == module.extractOne(query, choices, **kwargs)
+        for limit in (None, 5):
+            assert module.extract(query, prepared, limit=limit, **kwargs) == module.extract(
+                query, choices, limit=limit, **kwargs
+            )
+        assert list(module.extract_iter(query, prepared, **kwargs)) == list(
+            module.extract_iter(query, choices, **kwargs)
+        )
+
+    prepared.compact()
+    assert module.extract(query, prepared, limit=None, **kwargs) == module.extract(query, choices, limit=None, **kwargs)
+
+
+@pytest.mark.parametrize("module", [process_cpp, process_py])
+def test_mutable_prepared_choices_cdist(module, tmp_path):
+    import numpy as np
+
+    prepared = module.MutablePreparedChoices(["new york mets", "yankees", "braves"])
+    prepared.add(3, "atlanta braves")
+    prepared.remove(1)
+    assert np.array_equal(
+        module.cdist(["new york", "braves"], prepared, scorer=fuzz.ratio),
+        module.cdist(["new york", "braves"], ["new york mets", "braves", "atlanta braves"], scorer=fuzz.ratio),
+    )
+    assert module.extractOne("braves", prepared, scorer=fuzz.ratio) == ("braves", 100.0, 2)
+
+    with pytest.raises(KeyError):
+        prepared.remove(1)
+
+    prepared.remove(0)
+    prepared.save(tmp_path / "choices.bin")
+    loaded = module.PreparedChoices.load(tmp_path / "choices.bin", allow_pickle=True)
+    assert module.extract("braves", loaded, scorer=fuzz.ratio) == module.extract(
+        "braves", {2: "braves", 3: "atlanta braves"}, scorer=fuzz.ratio
+    )
+    with pytest.raises(TypeError):
+        module.MutablePreparedChoices.load(tmp_path / "choices.bin")
+
+
+@pytest.mark.parametrize("module", [process_cpp, process_py])
+def test_mutable_prepared_choices_processor_calls(module, tmp_path):
+    """
+    added choices are only processed once, even when the processed choices are stored separately
+    """
+    calls = []
+
+    def processor(choice):
+        calls.append(choice)
+        return choice.lower()
+
+    prepared = module.MutablePreparedChoices({"a": "New York"}, processor=processor)
+    # saving creates the list of processed choices
+    prepared.save(tmp_path / "choices.bin")
+    calls.clear()
+
+    prepared.add("b", "ATLANTA Braves")
+    prepared.add("a", "New York Mets")
+    prepared.add("c", None)
+    assert calls == ["ATLANTA Braves", "New York Mets"]
+    expected = {"a": "new york mets", "b": "atlanta braves", "c": None}
+    assert [(key, score) for _, score, key in module.extract("atlanta braves", prepared, scorer=fuzz.ratio)] == [
+        (key, score) for _, score, key in module.extract("atlanta braves", expected, scorer=fuzz.ratio)
+    ]
+
+
+@pytest.mark.parametrize("workers", [1, -1])
+@pytest.mark.parametrize("scorer", [fuzz.ratio, Levenshtein.distance])
+def test_extract_limit_ties(workers, scorer):
+    """
+    extract only keeps the best limit matches while searching. This has to return the
+    same matches as sorting all results, even when they have the same score
+    """
+    choices = [f"{i % 7}-test" for i in range(5000)]
+    query = "3-test"
+
+    expected = process.extract(query, choices, scorer=scorer, limit=None)
+    for limit in (2, 5, 100, 2000):
+        assert process.extract(query, choices, scorer=scorer, limit=limit, workers=workers) == expected[:limit]
+
+
+@pytest.mark.parametrize("workers", [1, -1])
+@pytest.mark.parametrize("score_cutoff", [None, 50])
+@pytest.mark.parametrize("scorer", [fuzz.ratio, Levenshtein.distance, Levenshtein.normalized_distance, custom_scorer])
+def test_cdist_limit(workers, score_cutoff, scorer):
+    """
+    cdist with limit should return the best choices of each row in the dense matrix
+    """
+    import numpy as np
+
+    if score_cutoff is not None and scorer in {Levenshtein.distance, Levenshtein.normalized_distance}:
+        score_cutoff = 5 if scorer is Levenshtein.distance else 0.5
+
+    queries = [f"{i % 13}-{i % 7}-query" for i in range(60)] + ["a" * 70, ""]
+    choices = [f"{i % 11}-{i % 5}-query" for i in range(300)]
+    dense = process.cdist(queries, choices, scorer=scorer, score_cutoff=score_cutoff)
+    lowest_score_worst = scorer in {fuzz.ratio, custom_scorer}
+    order = np.argsort(-dense if lowest_score_worst else dense, axis=1, kind="stable")
+
+    for limit in (1, 5, 400):
+        for module in (process_cpp, process_py):
+            indices, scores = module.cdist(
+                queries, choices, scorer=scorer, score_cutoff=score_cutoff, limit=limit, workers=workers
+            )
+            assert indices.dtype == np.int64
+            assert scores.dtype == dense.dtype
+            assert np.array_equal(indices, order[:, :limit])
+            assert np.array_equal(scores, np.take_along_axis(dense, indices, axis=1))
+
+    for module in (process_cpp, process_py):
+        with pytest.raises(ValueError, match="non-negative"):
+            module.cdist(queries, choices, scorer=scorer, limit=-1, workers=workers)
+
+
+@pytest.mark.parametrize("workers", [1, -1])
+@pytest.mark.parametrize("score_cutoff", [None, 50])
+@pytest.mark.parametrize("scorer", [fuzz.ratio, Levenshtein.distance, Levenshtein.normalized_distance, custom_scorer])
+def test_cdist_sparse(workers, score_cutoff, scorer):
+    """
+    cdist with sparse output should only keep the scores passing score_cutoff
+    """
+    import numpy as np
+
+    pytest.importorskip("scipy")
+
+    if score_cutoff is not None and scorer in {Levenshtein.distance, Levenshtein.normalized_distance}:
+        score_cutoff = 5 if scorer is Levenshtein.distance else 0.5
+
+    queries = [f"{i % 13}-{i % 7}-query" for i in range(60)] + ["a" * 70, ""]
+    choices = [f"{i % 11}-{i % 5}-query" for i in range(300)]
+    dense = process.cdist(queries, choices, scorer=scorer, score_cutoff=score_cutoff)
+    if score_cutoff is None:
+        mask = np.ones(dense.shape, dtype=bool)
+    elif scorer in {fuzz.ratio, custom_scorer}:
+        mask = dense >= score_cutoff
+    else:
+        mask = dense <= score_cutoff
+
+    for module in (process_cpp, process_py):
+        sparse = module.cdist(
+            queries, choices, scorer=scorer, score_cutoff=score_cutoff, output="sparse", workers=workers
+        )
+        assert sparse.shape == dense.shape
+        assert sparse.dtype == dense.dtype
+        assert sparse.nnz == np.count_nonzero(mask)
+        rows, cols = np.nonzero(mask)
+        assert np.array_equal(np.asarray(sparse[rows, cols]).ravel(), dense[rows, cols])
+
+        with pytest.raises(ValueError, match="output"):
+            module.cdist(queries, choices, scorer=scorer, output="coo")
+        with pytest.raises(ValueError, match="limit"):
+            module.cdist(queries, choices, scorer=scorer, output="sparse", limit=5)
+
+
+@pytest.mark.parametrize("module", [process_cpp, process_py])
+def test_cdist_sparse_without_scipy(module, monkeypatch):
+    """
+    the sparse output is always a csr_matrix, so it can not be used without SciPy
+    """
+    pytest.importorskip("numpy")
+    monkeypatch.setitem(sys.modules, "scipy.sparse", None)
+    with pytest.raises(ImportError, match="SciPy"):
+        module.cdist(["new york"], ["new york mets"], output="sparse")
+
+
+def test_set_thread_pool():
+    """
+    results should not depend on the size of the shared thread pool
+    """
+    queries = [f"{i % 13}-{i % 7}-query" for i in range(60)]
+    choices = [f"{i % 11}-{i % 5}-query" for i in range(3000)]
+
+    for module in (process_cpp, process_py):
+        expected = module.cdist(queries, choices)
+        for workers in (1, 3, -1):
+            with module.set_thread_pool(workers):
+                assert (module.cdist(queries, choices, workers=-1) == expected).all()
+                assert (module.cdist(queries, choices, workers=8) == expected).all()
+                assert module.extract("1-1-query", choices, workers=2, limit=None) == module.extract(
+                    "1-1-query", choices, limit=None
+                )
+
+        assert (module.cdist(queries, choices, workers=2) == expected).all()
+        module.set_thread_pool(None)
+
+        with pytest.raises(ValueError, match="workers"):
+            module.set_thread_pool(0)
+
+
+@pytest.mark.skipif(not hasattr(os, "fork"), reason="requires os.fork")
+def test_thread_pool_fork():
+    """
+    a forked child process should not reuse the threads of the parent
+    """
+    queries = [f"{i % 13}-{i % 7}-query" for i in range(60)]
+    choices = [f"{i % 11}-{i % 5}-query" for i in range(3000)]
+    expected = process_cpp.cdist(queries, choices, workers=2)
+
+    pid = os.fork()
+    if pid == 0:
+        try:
+            result = process_cpp.cdist(queries, choices, workers=2)
+            os._exit(0 if (result == expected).all() else 1)
+        except BaseException:
+            os._exit(1)
+
+    _, status = os.waitpid(pid, 0)
+    assert os.WIFEXITED(status)
+    assert os.WEXITSTATUS(status) == 0
+
+
+@pytest.mark.parametrize("scorer", [fuzz.ratio, Levenshtein.distance, custom_scorer])
+def test_cdist_out(scorer, tmp_path):
+    """
+    cdist should write the result into the passed buffer
+    """
+    import numpy as np
+
+    queries = [f"{i % 13}-{i % 7}-query" for i in range(20)] + [None]
+    choices = [f"{i % 11}-{i % 5}-query" for i in range(30)] + [None]
+    if scorer is not fuzz.ratio:
+        queries, choices = queries[:-1], choices[:-1]
+
+    expected = process.cdist(queries, choices, scorer=scorer)
+    for module in (process_cpp, process_py):
+        out = np.full(expected.shape, 7, dtype=expected.dtype)
+        assert module.cdist(queries, choices, scorer=scorer, out=out) is out
+        assert np.array_equal(out, expected)
+
+        # slice of a larger array
+        larger = np.zeros((len(queries) * 2, len(choices)), dtype=np.float64)
+        module.cdist(queries, choices, scorer=scorer, out=larger[len(queries) :])
+        assert np.array_equal(larger[len(queries) :], module.cdist(queries, choices, scorer=scorer, dtype=np.float64))
+        assert not larger[: len(queries)].any()
+
+        # symmetric scorers with queries is choices
+        out = np.empty((len(queries), len(queries)), dtype=np.float64)
+        module.cdist(queries, queries, scorer=scorer, out=out)
+        assert np.array_equal(out, module.cdist(queries, queries, scorer=scorer, dtype=np.float64))
+
+        mmap = np.memmap(tmp_path / f"{module.__name__}.dat", dtype=np.int32, mode="w+", shape=expected.shape)
+        assert module.cdist(queries, choices, scorer=scorer, out=mmap) is mmap
+        assert np.array_equal(mmap, module.cdist(queries, choices, scorer=scorer, dtype=np.int32))
+
+        with pytest.raises(TypeError):
+            module.cdist(queries, choices, scorer=scorer, dtype=np.int64, out=np.empty(expected.shape, np.int32))
+        with pytest.raises(ValueError, match="shape"):
+            module.cdist(queries, choices, scorer=scorer, out=np.empty((1, 1), dtype=expected.dtype))
+        with pytest.raises(ValueError, match="C-contiguous"):
+            module.cdist(queries, choices, scorer=scorer, out=np.empty(expected.shape[::-1], expected.dtype).T)
+        with pytest.raises(ValueError, match="out"):
+            module.cdist(queries, choices, scorer=scorer, limit=1, out=np.empty(expected.shape, expected.dtype))
+
+
+@pytest.mark.parametrize("scorer", [fuzz.ratio, Levenshtein.distance, custom_scorer])
+def test_cdist_iter(scorer):
+    """
+    the blocks of cdist_iter should match the result of cdist
+    """
+    import numpy as np
+
+    queries = [f"{i % 13}-{i % 7}-query" for i in range(50)]
+    choices = [f"{i % 11}-{i % 5}-query" for i in range(30)]
+
+    for module in (process_cpp, process_py):
+        expected = module.cdist(queries, choices, scorer=scorer, processor=default_process)
+        for chunk_size in (1, 7, 50, 100):
+            blocks = list(
+                module.cdist_iter(queries, choices, scorer=scorer, processor=default_process, chunk_size=chunk_size)
+            )
+            assert len(blocks) == -(-len(queries) // chunk_size)
+            assert [rows.start for rows, _ in blocks] == list(range(0, len(queries), chunk_size))
+            assert np.array_equal(np.concatenate([block for _, block in blocks]), expected)
+            for rows, block in blocks:
+                assert np.array_equal(block, expected[rows])
+
+        # generators are accepted as queries and the iteration can be stopped early
+        gen = module.cdist_iter((q for q in queries), choices, scorer=scorer, chunk_size=10, workers=2)
+        rows, block = next(gen)
+        assert rows == slice(0, 10)
+        assert np.array_equal(block, module.cdist(queries[:10], choices, scorer=scorer))
+        gen.close()
+
+        assert list(module.cdist_iter([], choices, scorer=scorer)) == []
+        with pytest.raises(ValueError, match="chunk_size"):
+            module.cdist_iter(queries, choices, chunk_size=0)
+        with pytest.raises(TypeError):
+            module.cdist_iter(module.PreparedChoices(queries), choices)
+
+
+@pytest.mark.parametrize("workers", [1, -1])
+@pytest.mark.parametrize("scorer", [fuzz.ratio, Levenshtein.distance, Levenshtein.normalized_similarity])
+def test_cdist_length_buckets(workers, scorer):
+    """
+    queries of all lengths are grouped into simd blocks, which should not affect the result
+    """
+    import numpy as np
+
+    lengths = [0, 1, 7, 8, 9, 16, 17, 31, 32, 33, 63, 64, 65, 100, 129, 300]
+    queries = [("abcdefghij" * 30)[i % 5 : i % 5 + length] for i, length in enumerate(lengths * 4)]
+    choices = [("jihgfedcba" * 30)[:length] for length in lengths] + ["abcdefghij" * 8]
+
+    expected = np.array([[scorer(query, choice) for choice in choices] for query in queries])
+    result = process_cpp.cdist(queries, choices, scorer=scorer, workers=workers, dtype=np.float64)
+    assert np.array_equal(result, expected)
+
+
+@pytest.mark.parametrize("workers", [1, -1])
+@pytest.mark.parametrize("scorer", [fuzz.ratio, fuzz.WRatio, Levenshtein.distance, Levenshtein.normalized_similarity])
+def test_cpdist_repeated_strings(workers, scorer):
+    """
+    consecutive rows sharing the query or the choice are scored together, which should not affect the result
+    """
+    import numpy as np
+
+    lengths = [0, 1, 7, 8, 9, 16, 17, 31, 32, 33, 63, 64, 65, 100, 129]
+    strings = [("abcdefghij" * 13)[i % 5 : i % 5 + length] for i, length in enumerate(lengths)]
+    queries = [query for query in strings for _ in range(40)] + strings * 40
+    choices = strings * 40 + [choice for choice in strings for _ in range(40)]
+    if scorer is not Levenshtein.distance:
+        queries[50] = None
+        choices[900] = None
+
+    expected = np.array(
+        [0 if None in (query, choice) else scorer(query, choice) for query, choice in zip(queries, choices)]
+    )
+    result = process_cpp.cpdist(queries, choices, scorer=scorer, workers=workers, dtype=np.float64)
+    assert np.array_equal(result, expected)
+
+    if scorer is not Levenshtein.distance:
+        # None in the first row of a run of equal strings
+        for none_queries, none_choices in (
+            (["", ""], [None, ""]),
+            ([None, ""], ["", ""]),
+            (["abc", "abc", "abc"], [None, "abc", "abc"]),
+            ([None, "abc", "abc"], ["abc", "abc", "abc"]),
+        ):
+            expected = process_py.cpdist(none_queries, none_choices, scorer=scorer, dtype=np.float64)
+            result = process_cpp.cpdist(none_queries, none_choices, scorer=scorer, workers=workers, dtype=np.float64)
+            assert np.array_equal(result, expected)
+
+
+@pytest.mark.parametrize("workers", [1, -1])
+@pytest.mark.parametrize(
+    ("scorer", "score_cutoff", "scorer_kwargs"),
+    [
+        (fuzz.ratio, 85, None),
+        (fuzz.QRatio, 70, None),
+        (Levenshtein.distance, 2, None),
+        (Levenshtein.distance, 3, {"weights": (1, 2, 1)}),
+        (Levenshtein.normalized_similarity, 0.8, None),
+        (Levenshtein.normalized_distance, 0.3, {"weights": (1, 1, 2)}),
+        (Indel.normalized_similarity, 0.9, None),
+        (Hamming.normalized_distance, 0.2, None),
+        (OSA.distance, 1, None),
+        (Prefix.normalized_similarity, 0.75, None),
+    ],
+)
+def test_extract_length_bound(workers, scorer, score_cutoff, scorer_kwargs):
+    """
+    choices, which can not reach score_cutoff due to their length, are skipped without scoring them.
+    This should not affect the result
+    """
+    choices = [("abcdefghij" * 4)[i % 7 : i % 7 + i % 31] for i in range(3000)]
+    sorted_choices = sorted(choices, key=len)
+    kwargs = {"scorer": scorer, "score_cutoff": score_cutoff, "scorer_kwargs": scorer_kwargs}
+
+    for query in ["", "abcde", "bcdefghijab", "abcdefghijabcdefghij"]:
+        for choice_list in (choices, sorted_choices):
+            prepared = process_cpp.PreparedChoices(choice_list)
+            expected = process.extract(query, choice_list, limit=None, **kwargs)
+            assert process_cpp.extract(query, prepared, limit=None, workers=workers, **kwargs) == expected
+            assert process_cpp.extract(query, prepared, limit=10, workers=workers, **kwargs) == expected[:10]
+
+            expected_one = process.extractOne(query, choice_list, **kwargs)
+            assert process_cpp.extractOne(query, choice_list, workers=workers, **kwargs) == expected_one
+            assert process_cpp.extractOne(query, prepared, workers=workers, **kwargs) == expected_one
+
+
+@pytest.mark.parametrize("module", [process_cpp, process_py])
+@pytest.mark.parametrize(
+    ("scorer", "scorer_kwargs"),
+    [
+        (fuzz.WRatio, None),
+        (Levenshtein.distance, {"weights": (1, 2, 1)}),
+        (custom_scorer, None),
+    ],
+)
+def test_query_cache(module, scorer, scorer_kwargs):
+    """
+    queries found in the QueryCache should give the same results as uncached queries
+    """
+    choices = ["new york mets", "NEW YORK YANKEES", "atlanta braves", None, "new york"] * 300
+    prepared = module.PreparedChoices(choices, processor=default_process)
+    queries = ["New York", "ATLANTA", "", "New York", "ATLANTA", "new york mets"]
+    kwargs = {"scorer": scorer, "processor": default_process, "scorer_kwargs": scorer_kwargs}
+    cache = module.QueryCache(maxsize=4)
+
+    for query in queries:
+        for choice_list in (choices, prepared):
+            expected = module.extractOne(query, choice_list, **kwargs)
+            assert module.extractOne(query, choice_list, query_cache=cache, **kwargs) == expected
+            assert module.extractOne(query, choice_list, workers=2, query_cache=cache, **kwargs) == expected
+
+            for limit in (1, 5):
+                expected = module.extract(query, choice_list, limit=limit, **kwargs)
+                assert module.extract(query, choice_list, limit=limit, query_cache=cache, **kwargs) == expected
+
+            expected = list(module.extract_iter(query, choice_list, **kwargs))
+            assert list(module.extract_iter(query, choice_list, query_cache=cache, **kwargs)) == expected
+
+    # each query is processed once and looked up in all later calls
+    assert cache.misses == 4
+    assert cache.hits == len(queries) * 10 - 4
+    assert len(cache) == 4
+    assert cache.maxsize == 4
+
+    # the least recently used query "" is evicted
+    hits = cache.hits
+    module.extractOne("atlanta braves", choices, query_cache=cache, **kwargs)
+    module.extractOne("New York", choices, query_cache=cache, **kwargs)
+    assert (cache.hits, cache.misses) == (hits + 1, 5)
+    module.extractOne("", choices, query_cache=cache, **kwargs)
+    assert (cache.hits, cache.misses) == (hits + 1, 6)
+    assert len(cache) == 4
+
+    # queries processed with another scorer are not shared
+    module.extractOne("", choices, scorer=fuzz.ratio, processor=default_process, query_cache=cache)
+    assert cache.misses == 7
+
+    cache.clear()
+    assert (len(cache), cache.hits, cache.misses) == (0, 0, 0)
+
+
+@pytest.mark.parametrize("module", [process_cpp, process_py])
+def test_query_cache_unhashable(module):
+    """
+    unhashable queries and scorer_kwargs skip the QueryCache
+    """
+    cache = module.QueryCache()
+    choices = [["a", "b"], ["a", "c"]]
+    assert module.extractOne(["a", "b"], choices, query_cache=cache) == (["a", "b"], 100.0, 0)
+    assert module.extract(["a", "c"], choices, limit=None, query_cache=cache) == [
+        (["a", "c"], 100.0, 1),
+        (["a", "b"], 50.0, 0),
+    ]
+    assert module.extractOne(
+        "abcd", ["abce"], scorer=Levenshtein.distance, scorer_kwargs={"weights": [1, 1, 2]}, query_cache=cache
+    ) == ("abce", 2, 0)
+    assert (len(cache), cache.hits, cache.misses) == (0, 0, 0)
+
+    assert module.extractOne(None, choices, query_cache=cache) is None
+    assert len(cache) == 0
+
+    with pytest.raises(ValueError, match="maxsize"):
+        module.QueryCache(maxsize=0)
+
+
+@pytest.mark.parametrize("module", [process_cpp, process_py])
+@pytest.mark.parametrize("scorer", [fuzz.WRatio, Levenshtein.distance, custom_scorer])
+def test_result_cache(module, scorer):
+    """
+    results found in the ResultCache should be the same as uncached results and
+    the cache should be invalidated when the choices are modified
+    """
+    choices = dict(enumerate(["new york mets", "NEW YORK YANKEES", "atlanta braves", None] * 50))
+    cache = module.ResultCache(maxsize=64)
+    prepared = module.MutablePreparedChoices(choices, processor=default_process, result_cache=cache)
+    uncached = module.MutablePreparedChoices(choices, processor=default_process)
+    kwargs = {"scorer": scorer, "processor": default_process}
+
+    for _ in range(2):
+        for query in ["new york", "ATLANTA", ""]:
+            assert module.extractOne(query, prepared, **kwargs) == module.extractOne(query, uncached, **kwargs)
+            for limit in (None, 1, 5):
+                assert module.extract(query, prepared, limit=limit, **kwargs) == module.extract(
+                    query, uncached, limit=limit, **kwargs
+                )
+
+    assert (cache.hits, cache.misses, len(cache)) == (12, 12, 12)
+    assert cache.memory > 0
+
+    # returned lists are copies of the cached result
+    module.extract("new york", prepared, limit=5, **kwargs).clear()
+    assert module.extract("new york", prepared, limit=5, **kwargs) == module.extract(
+        "new york", uncached, limit=5, **kwargs
+    )
+
+    version = prepared.version
+    for choice_list in (prepared, uncached):
+        choice_list.add(1000, "new york")
+        choice_list.remove(0)
+    assert prepared.version == version + 2
+    assert module.extractOne("new york", prepared, **kwargs) == module.extractOne("new york", uncached, **kwargs)
+    assert module.extract("new york", prepared, **kwargs) == module.extract("new york", uncached, **kwargs)
+    assert len(cache) == 2
+
+    prepared.result_cache = None
+    assert module.extractOne("new york", prepared, **kwargs) == module.extractOne("new york", uncached, **kwargs)
+    assert len(cache) == 2
+
+    cache.clear()
+    assert (len(cache), cache.hits, cache.misses, cache.memory) == (0, 0, 0, 0)
+
+
+@pytest.mark.parametrize("module", [process_cpp, process_py])
+def test_result_cache_eviction(module):
+    """
+    results are evicted after ttl and when maxsize or max_memory are reached
+    """
+    now = [0.0]
+    cache = module.ResultCache(maxsize=2, ttl=10, timer=lambda: now[0])
+    prepared = module.PreparedChoices(["new york", "atlanta"], result_cache=cache)
+    assert prepared.version == 0
+
+    module.extractOne("a", prepared)
+    module.extractOne("b", prepared)
+    module.extractOne("a", prepared)
+    module.extractOne("c", prepared)
+    assert (cache.hits, cache.misses, len(cache)) == (1, 3, 2)
+    module.extractOne("b", prepared)
+    assert (cache.hits, cache.misses) == (1, 4)
+
+    now[0] = 10
+    module.extractOne("b", prepared)
+    assert (cache.hits, cache.misses) == (1, 5)
+    now[0] = 15
+    module.extractOne("b", prepared)
+    assert (cache.hits, cache.misses) == (2, 5)
+
+    cache = module.ResultCache(max_memory=2000)
+    prepared.result_cache = cache
+    for i in range(20):
+        module.extract(str(i), prepared)
+        assert cache.memory <= 2000
+    assert 0 < len(cache) < 20
+    module.extract("x" * 5000, prepared)
+    assert cache.memory <= 2000
+
+    # calls with unhashable arguments are not cached
+    module.extractOne(["n", "e", "w"], prepared)
+    module.extractOne("abcd", prepared, scorer=Levenshtein.distance, scorer_kwargs={"weights": [1, 1, 2]})
+    assert cache.hits + cache.misses == 21
+
+    with pytest.raises(ValueError, match="maxsize"):
+        module.ResultCache(maxsize=0)
+    with pytest.raises(ValueError, match="ttl"):
+        module.ResultCache(ttl=0)
+    with pytest.raises(ValueError, match="max_memory"):
+        module.ResultCache(max_memory=-1)
+
+
+def test_result_cache_threads():
+    """
+    a ResultCache shared by multiple threads should provide the same results as uncached calls
+    """
+    from concurrent.futures import ThreadPoolExecutor
+
+    choices = [f"{city} {team}" for city in ("new york", "atlanta", "boston") for team in ("mets", "braves", "sox")]
+    cache = process_cpp.ResultCache(maxsize=8)
+    prepared = process_cpp.PreparedChoices(choices * 100, result_cache=cache)
+    queries = [f"{city} {i % 3}" for i in range(400) for city in ("new york", "boston")]
+
+    with ThreadPoolExecutor(8) as pool:
+        results = list(pool.map(lambda query: process_cpp.extract(query, prepared, limit=3), queries))
+
+    assert results == [process_cpp.extract(query, choices * 100, limit=3) for query in queries]
+    assert cache.hits + cache.misses == len(queries)
+    assert len(cache) <= 8
+
+
+def _string_arrays():
+    """
+    numpy and Arrow string arrays with the list of values they represent
+    """
+    np = pytest.importorskip("numpy")
+    pa = pytest.importorskip("pyarrow")
+
+    words = ["new york mets", "NEW YORK Yankees", "atlanta braves", "Málaga", "Łódź", "東京 tokyo"]
+    words += ["\U0001f600 smile", ""]
+    with_none = [*words[:4], None, *words[4:], None]
+    return [
+        (np.array(words), words),
+        (np.array(words, dtype=">U16"), words),
+        (np.array([x for word in words for x in (word, "-", "-")])[::3], words),
+        (np.array([x.encode() for x in words if x.isascii()]), [x.encode() for x in words if x.isascii()]),
+        (pa.array(with_none), with_none),
+        (pa.array(with_none, type=pa.large_string()), with_none),
+        (pa.array(with_none)[3:], with_none[3:]),
+        (pa.chunked_array([with_none[:5], [], with_none[5:]], type=pa.large_string()), with_none),
+    ]
+
+
+@pytest.mark.parametrize("processor", [None, Processor(strip_accents=True, casefold=True), default_process])
+def test_string_array_choices(processor):
+    """
+    numpy and Arrow string arrays are read in place, which should not affect the results
+    """
+    for array, values in _string_arrays():
+        is_bytes = isinstance(values[0], bytes)
+        if is_bytes and processor is not None:
+            continue
+
+        for text in ("new york", "MALAGA", "tokyo", "\U0001f600"):
+            query = text.encode() if is_bytes else text
+            kwargs = {"processor": processor}
+            assert process.extractOne(query, array, **kwargs) == process.extractOne(query, values, **kwargs)
+            assert process.extract(query, array, limit=None, **kwargs) == process.extract(
+                query, values, limit=None, **kwargs
+            )
+            assert list(process.extract_iter(query, array, **kwargs)) == list(
+                process.extract_iter(query, values, **kwargs)
+            )
+            assert process_cpp.extract(query, array, workers=2, **kwargs) == process.extract(query, values, **kwargs)
+
+        if None not in values:
+            expected = process.cdist(values, values, processor=processor)
+            assert (process.cdist(array, array, processor=processor) == expected).all()
+            expected = process.cpdist(values, values, processor=processor)
+            assert (process.cpdist(array, array, processor=processor) == expected).all()
+
+        prepared = process_cpp.PreparedChoices(array, processor=processor)
+        assert len(prepared) == len(values)
+        assert process_cpp.extract("new york", prepared, processor=processor) == process_cpp.extract(
+            "new york", values, processor=processor
+        )
+
+
+def test_string_array_choices_save(tmp_path):
+    """
+    PreparedChoices created from string arrays can be saved like any other choices
+    """
+    for array, values in _string_arrays():
+        process_cpp.PreparedChoices(array).save(tmp_path / "choices.bin")
+        loaded = process_cpp.PreparedChoices.load(tmp_path / "choices.bin")
+        expected = process_cpp.extract("new york", values, limit=None)
+        assert process_cpp.extract("new york", loaded, limit=None) == expected
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import pytest
+
 from rapidfuzz import utils_cpp, utils_py
 
 
@@ -26,3 +28,69 @@ def test_fullProcess():
     for string, proc_string in zip(mixed_strings, mixed_strings_proc):
         assert utils_cpp.default_process(string) == proc_string
         assert utils_py.default_process(string) == proc_string
+
+
+def test_default_process_batch():
+    np = pytest.importorskip("numpy")
+
+    strings = ["New York Mets!", None, "", " ATLANTA braves ", "Ça va?", "a¬ሴ€耀", "\U0001f600 Smile", "clean"]
+    strings.append(float("nan"))
+    expected = [x if not isinstance(x, str) else utils_py.default_process(x) for x in strings]
+
+    for module in (utils_cpp, utils_py):
+        assert module.default_process_batch(strings) == expected
+        assert module.default_process_batch(iter(strings), workers=-1) == expected
+        assert module.default_process_batch(strings * 20000, workers=2) == expected * 20000
+        assert module.default_process_batch([]) == []
+
+        array = np.array([["New York", "ÇA VA"], ["", "mets!"]])
+        result = module.default_process_batch(array)
+        assert result.dtype == array.dtype
+        assert result.tolist() == [["new york", "ça va"], ["", "mets"]]
+
+        array = np.array(strings, dtype=object)
+        result = module.default_process_batch(array)
+        assert result.dtype == object
+        assert result[:-1].tolist() == expected[:-1]
+
+    assert utils_cpp.default_process_batch([b"New York"]) == [utils_cpp.default_process(b"New York")]
+
+
+def test_processor():
+    strings = [
+        "Straße  de Málaga!",
+        "  ÇA VA? ",
+        "ﬁnal ½ İstanbul",
+        "new_york-mets o'brien",
+        "한국어 \U0001f600 Σίσυφος",
+        "",
+        "\t\n",
+    ]
+    steps = ["strip_accents", "casefold", "lowercase_ascii", "remove_punctuation", "collapse_whitespace", "sort_tokens"]
+
+    for mask in range(1 << len(steps)):
+        kwargs = {step: bool(mask & (1 << i)) for i, step in enumerate(steps)}
+        processor_cpp = utils_cpp.Processor(**kwargs)
+        processor_py = utils_py.Processor(**kwargs)
+        assert repr(processor_cpp) == repr(processor_py)
+        for string in strings:
+            assert processor_cpp(string) == processor_py(string)
+
+    processor = utils_cpp.Processor(strip_accents=True, casefold=True, remove_punctuation=True, sort_tokens=True)
+    assert processor("Straße  de Málaga!") == "de malaga strasse"
+    assert processor("ﬁnal ½ İstanbul") == "1 2 final istanbul"
+    assert utils_cpp.Processor(lowercase_ascii=True)("ÀBC") == "Àbc"
+    assert utils_cpp.Processor(collapse_whitespace=True)("  a \t b  ") == "a b"
+    assert utils_cpp.Processor()("Test") == "Test"
+    assert repr(processor) == "Processor(strip_accents=True, casefold=True, remove_punctuation=True, sort_tokens=True)"
+
+    for module in (utils_cpp, utils_py):
+        processor = module.Processor(strip_accents=True, casefold=True, collapse_whitespace=True)
+        expected = [processor(x) for x in strings]
+        assert processor.batch([*strings, None]) == [*expected, None]
+        assert processor.batch(strings * 10000, workers=2) == expected * 10000
+
+        with pytest.raises(TypeError):
+            processor(b"test")
+        with pytest.raises(TypeError):
+            processor.batch(["test", 1])
@@ -117,7 +117,13 @@ generate(
         "extractOne",
         "extract_iter",
         "cdist",
+        "cdist_iter",
         "cpdist",
+        "PreparedChoices",
+        "MutablePreparedChoices",
+        "QueryCache",
+        "ResultCache",
+        "set_thread_pool",
     ],
 )
 
@@ -126,6 +132,8 @@ generate(
     "rapidfuzz.utils",
     [
         "default_process",
+        "default_process_batch",
+        "Processor",
     ],
 )
 
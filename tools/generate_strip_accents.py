@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+# SPDX-License-Identifier: MIT
+# Copyright (C) 2025 Max Bachmann
+"""
+generate src/rapidfuzz/strip_accents_db.h, which is used by the strip_accents step of utils.Processor.
+
+strip_accents maps every character to its NFKD decomposition without combining characters. Since the
+canonical ordering of NFKD only reorders combining characters, this can be done one character at a time.
+Hangul syllables are decomposed algorithmically and are not part of the tables.
+"""
+
+from __future__ import annotations
+
+import textwrap
+import unicodedata
+from pathlib import Path
+
+HANGUL_START = 0xAC00
+HANGUL_END = 0xD7A4
+
+
+def strip_accents(ch: str) -> str:
+    return "".join(x for x in unicodedata.normalize("NFKD", ch) if not unicodedata.combining(x))
+
+
+def format_array(name: str, values: list[int]) -> str:
+    body = textwrap.fill(", ".join(str(x) for x in values) + ",", width=116)
+    return f"static const uint32_t {name}[] = {{\n{textwrap.indent(body, '    ')}\n}};\n"
+
+
+def main() -> None:
+    keys: list[int] = []
+    index: list[int] = []
+    data: list[int] = []
+    max_length = 0
+    for code in range(0x110000):
+        if HANGUL_START <= code < HANGUL_END:
+            continue
+
+        ch = chr(code)
+        stripped = strip_accents(ch)
+        if stripped == ch:
+            continue
+
+        max_length = max(max_length, len(stripped))
+        keys.append(code)
+        index.append(len(data) << 5 | len(stripped))
+        data.extend(ord(x) for x in stripped)
+
+    assert max_length < 32
+
+    content = f"""/* this file was generated by tools/generate_strip_accents.py using Unicode {unicodedata.unidata_version} */
+#pragma once
+#include <cstdint>
+
+#define STRIP_ACCENTS_MAX_LENGTH {max_length}
+
+/* sorted code points, which are changed by strip_accents */
+{format_array("strip_accents_keys", keys)}
+/* position of the replacement in strip_accents_data << 5 | length of the replacement */
+{format_array("strip_accents_index", index)}
+/* replacements of the code points */
+{format_array("strip_accents_data", data)}"""
+
+    path = Path(__file__).resolve().parent.parent / "src" / "rapidfuzz" / "strip_accents_db.h"
+    path.write_text(content)
+
+
+if __name__ == "__main__":
+    main()